@@ -0,0 +1 @@
+"""Terminal Velocity computational core."""
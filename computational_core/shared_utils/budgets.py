@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+✒ Metadata
+    - Title: Cumulative Budget Exhaustion (Terminal Velocity - v1.0)
+    - File Name: budgets.py
+    - Relative Path: computational_core/shared_utils/budgets.py
+    - Artifact Type: library
+    - Version: 1.0.0
+    - Date: 2026-10-18
+    - Update: Sunday, October 18, 2026
+    - Author: Dennis 'dnoice' Smaltz
+    - A.I. Acknowledgement: Anthropic - Claude Opus 4.5
+    - Signature:  ︻デ═—··· 🎯 = Aim Twice, Shoot Once!
+
+✒ Description:
+    When does a path of annual emissions (or extraction, or loss) use up a fixed
+    budget? Projections are pivoted once into a (scenarios, years) array, their
+    cumulative sums computed once, and the exhaustion year of every budget found
+    with a binary search per scenario — so a grid of hundreds of thresholds costs
+    about as much as one.
+
+✒ Key Features:
+    - Feature 1: Exhaustion indices for shared thresholds via np.searchsorted
+    - Feature 2: Per-row thresholds (e.g. Monte Carlo budget draws) in one pass
+    - Feature 3: Tidy budget × scenario table from a long projections frame
+    - Feature 4: Threshold grids for exhaustion-year curves
+
+✒ Usage Instructions:
+    Annual values must be non-negative so cumulative totals never decrease (the
+    scenario engine floors projections at zero). A budget is exhausted in the
+    first year whose cumulative total reaches it.
+
+✒ Examples:
+    >>> table = budget_exhaustion(projections_df, {"1.5C": 200_000, "2C": 540_000},
+    ...                           value="coal_co2_mt")
+    >>> curve = exhaustion_curve(projections_df, np.linspace(0, 1e6, 501),
+    ...                          value="coal_co2_mt")
+
+✒ Other Important Information:
+    - Dependencies:
+        Required: numpy, pandas
+    - Compatible platforms: Linux, Windows, macOS
+    - Performance notes: O(S × B × log T) for shared thresholds; per-row thresholds
+      are O(S × T × B) comparisons without temporaries beyond one boolean array
+    - Known limitations: Budgets not exhausted within the projection are reported
+      as missing (NA); the caller decides how to label them
+---------
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping, Sequence
+
+import numpy as np
+import pandas as pd
+
+
+# =============================================================================
+# ARRAY CORE
+# =============================================================================
+
+def exhaustion_index(cumulative: np.ndarray, budgets: np.ndarray | Sequence[float]) -> np.ndarray:
+    """
+    Index of the first period whose cumulative total reaches each budget.
+
+    Args:
+        cumulative: (rows, periods) non-decreasing cumulative totals
+        budgets: Shared thresholds, shape (B,), or per-row thresholds, shape
+            (rows, B)
+
+    Returns:
+        Integer array of shape (rows, B); the value ``periods`` means the budget
+        is not exhausted within the path
+    """
+    cumulative = np.atleast_2d(np.asarray(cumulative, dtype=float))
+    budgets = np.asarray(budgets, dtype=float)
+
+    if budgets.ndim <= 1:
+        thresholds = np.atleast_1d(budgets)
+        return np.stack([np.searchsorted(row, thresholds, side="left") for row in cumulative])
+
+    if budgets.shape[0] != cumulative.shape[0]:
+        raise ValueError("Per-row budgets need one row per cumulative path")
+    # Count of periods still below the budget == searchsorted(side="left") per row
+    return np.stack(
+        [(cumulative < budgets[:, [b]]).sum(axis=1) for b in range(budgets.shape[1])],
+        axis=1,
+    )
+
+
+def exhaustion_years(
+    years: np.ndarray | Sequence[int],
+    cumulative: np.ndarray,
+    budgets: np.ndarray | Sequence[float],
+) -> np.ndarray:
+    """
+    Calendar year in which each budget is exhausted.
+
+    Args:
+        years: Period labels, one per cumulative column
+        cumulative: (rows, periods) cumulative totals
+        budgets: Shared (B,) or per-row (rows, B) thresholds
+
+    Returns:
+        Float array of shape (rows, B); NaN where the budget outlasts the path
+    """
+    years = np.append(np.asarray(years, dtype=float), np.nan)
+    return years[exhaustion_index(cumulative, budgets)]
+
+
+def scenario_matrix(
+    projections: pd.DataFrame,
+    scenario: str = "scenario",
+    time: str = "year",
+    value: str = "value",
+) -> tuple[list, np.ndarray, np.ndarray]:
+    """
+    Pivot a long projections frame into a (scenarios, years) array.
+
+    Returns:
+        (scenario names in first-appearance order, years ascending, values)
+    """
+    wide = projections.pivot(index=scenario, columns=time, values=value)
+    names = list(pd.unique(projections[scenario]))
+    wide = wide.reindex(names).sort_index(axis=1)
+    return names, wide.columns.to_numpy(), wide.to_numpy(dtype=float)
+
+
+# =============================================================================
+# TABLES
+# =============================================================================
+
+def budget_exhaustion(
+    projections: pd.DataFrame,
+    budgets: Mapping[str, float],
+    scenario: str = "scenario",
+    time: str = "year",
+    value: str = "value",
+) -> pd.DataFrame:
+    """
+    Exhaustion year and end-of-horizon totals for every budget × scenario.
+
+    Args:
+        projections: Long frame with scenario, time and value columns
+        budgets: Budget name → threshold, in the units of ``value``
+        scenario: Scenario column
+        time: Year column
+        value: Annual value column
+
+    Returns:
+        Frame with budget, scenario, budget_value, exhaust_year (nullable Int64),
+        cumulative (total over the whole projection) and overshoot, budget-major
+    """
+    names, years, values = scenario_matrix(projections, scenario, time, value)
+    cumulative = np.cumsum(values, axis=1)
+    thresholds = np.array(list(budgets.values()), dtype=float)
+    exhausted = exhaustion_years(years, cumulative, thresholds)  # (S, B)
+
+    n_budgets, n_scenarios = len(thresholds), len(names)
+    totals = np.tile(cumulative[:, -1], n_budgets)
+    return pd.DataFrame({
+        "budget": np.repeat(list(budgets), n_scenarios),
+        scenario: np.tile(names, n_budgets),
+        "budget_value": np.repeat(thresholds, n_scenarios),
+        "exhaust_year": pd.array(exhausted.T.ravel(), dtype="Float64").astype("Int64"),
+        "cumulative": totals,
+        "overshoot": totals - np.repeat(thresholds, n_scenarios),
+    })
+
+
+def exhaustion_curve(
+    projections: pd.DataFrame,
+    thresholds: np.ndarray | Sequence[float],
+    scenario: str = "scenario",
+    time: str = "year",
+    value: str = "value",
+) -> pd.DataFrame:
+    """
+    Exhaustion year as a function of budget size, for every scenario.
+
+    Args:
+        projections: Long frame with scenario, time and value columns
+        thresholds: Budget grid, in the units of ``value``
+        scenario: Scenario column
+        time: Year column
+        value: Annual value column
+
+    Returns:
+        Frame with scenario, budget_value and exhaust_year (nullable Int64),
+        scenario-major
+    """
+    names, years, values = scenario_matrix(projections, scenario, time, value)
+    thresholds = np.asarray(thresholds, dtype=float)
+    exhausted = exhaustion_years(years, np.cumsum(values, axis=1), thresholds)
+    return pd.DataFrame({
+        scenario: np.repeat(names, len(thresholds)),
+        "budget_value": np.tile(thresholds, len(names)),
+        "exhaust_year": pd.array(exhausted.ravel(), dtype="Float64").astype("Int64"),
+    })
@@ -0,0 +1,422 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+✒ Metadata
+    - Title: Concurrent Source Downloader (Terminal Velocity - v1.0)
+    - File Name: downloader.py
+    - Relative Path: computational_core/shared_utils/downloader.py
+    - Artifact Type: library
+    - Version: 1.0.0
+    - Date: 2026-10-18
+    - Update: Sunday, October 18, 2026
+    - Author: Dennis 'dnoice' Smaltz
+    - A.I. Acknowledgement: Anthropic - Claude Opus 4.5
+    - Signature:  ︻デ═—··· 🎯 = Aim Twice, Shoot Once!
+
+✒ Description:
+    Fetches many DATA_SOURCES entries at once into the shared raw store. Sources are
+    collected from every mechanism's 01_intake.py (or from one DATA_SOURCES dict),
+    de-duplicated by URL, and downloaded on a thread pool with a per-host connection
+    limit and one pooled keep-alive session per host. A cold intake of the whole vault
+    is bounded by bandwidth rather than by latency times the number of sources.
+
+✒ Key Features:
+    - Feature 1: Source discovery from literal DATA_SOURCES dicts (no script execution)
+    - Feature 2: URL de-duplication across mechanisms (one transfer, many links)
+    - Feature 3: Thread pool with per-host concurrency limits (BoundedSemaphore)
+    - Feature 4: One requests.Session per host with a sized keep-alive connection pool
+    - Feature 5: Live progress line (files done, bytes, MB/s) and a throughput summary
+    - Feature 6: Adoption of existing local raw copies before any network access
+    - Feature 7: Links every blob into each requesting mechanism's datasets/raw/
+
+✒ Usage Instructions:
+    Whole vault (see evidence_vault/download_scripts/fetch_sources.py):
+
+        specs = collect_sources(REPO_ROOT)
+        outcomes = ConcurrentDownloader().run(specs)
+        print_report(outcomes)
+
+    One mechanism's intake:
+
+        specs = sources_from_config(DATA_SOURCES, RAW_DATA_DIR, "A-01")
+        outcomes = ConcurrentDownloader(RAW_STORE).run(specs)
+
+✒ Examples:
+    >>> specs = collect_sources(Path("."), codes=["A-01"])
+    >>> [s.source_name for s in specs]
+    ['owid_co2', 'owid_energy']
+    >>> outcomes = ConcurrentDownloader(max_workers=8, per_host=4).run(specs)
+    >>> outcomes[0].status
+    'downloaded'
+
+✒ Other Important Information:
+    - Dependencies:
+        Required: requests (pooled sessions), shared_utils.raw_store / fetch
+    - Compatible platforms: Linux, Windows, macOS
+    - Performance notes: Downloads are I/O bound, so threads (not processes) are used;
+      hashing happens while streaming and releases the GIL for large chunks
+    - Known limitations: Only http(s) URLs are fetched; placeholder or file URLs in
+      template DATA_SOURCES are ignored
+---------
+"""
+
+from __future__ import annotations
+
+import sys
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TextIO
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from .fingerprint import config_constants
+from .raw_store import RawDataStore
+
+DEFAULT_WORKERS = 8
+DEFAULT_PER_HOST = 4
+PROGRESS_INTERVAL = 2.0
+INTAKE_GLOB = "mechanism_dossiers/*/*/evidence_archive/computations/01_intake.py"
+MB = 1024 * 1024
+
+
+# =============================================================================
+# SOURCE DISCOVERY
+# =============================================================================
+
+@dataclass
+class SourceSpec:
+    """One distinct source URL and every local file that should point at it."""
+
+    url: str
+    source_name: str
+    expected_sha256: str | None = None
+    targets: list[Path] = field(default_factory=list)
+    mechanisms: list[str] = field(default_factory=list)
+    columns: dict[str, str] = field(default_factory=dict)  # union of declared columns
+
+    @property
+    def host(self) -> str:
+        """Network location used for per-host connection limits."""
+        return urlsplit(self.url).netloc
+
+
+def _add_sources(
+    by_url: dict[str, SourceSpec],
+    data_sources: dict,
+    raw_dir: Path,
+    mechanism: str,
+) -> None:
+    """Merge one DATA_SOURCES dict into ``by_url``."""
+    for name, config in data_sources.items():
+        if not isinstance(config, dict):
+            continue
+        url = config.get("url", "")
+        if urlsplit(url).scheme not in ("http", "https"):
+            continue
+        spec = by_url.setdefault(url, SourceSpec(url, name, config.get("sha256")))
+        if config.get("local_file"):
+            spec.targets.append(raw_dir / config["local_file"])
+        if mechanism and mechanism not in spec.mechanisms:
+            spec.mechanisms.append(mechanism)
+        for column, dtype in (config.get("columns") or {}).items():
+            spec.columns.setdefault(column, dtype)
+
+
+def sources_from_config(data_sources: dict, raw_dir: Path, mechanism: str = "") -> list[SourceSpec]:
+    """
+    Build download specs from a single DATA_SOURCES dict.
+
+    Args:
+        data_sources: The mechanism's DATA_SOURCES mapping
+        raw_dir: The mechanism's datasets/raw directory
+        mechanism: Mechanism code for reporting (e.g. "A-01")
+
+    Returns:
+        List of SourceSpec, one per distinct URL
+    """
+    by_url: dict[str, SourceSpec] = {}
+    _add_sources(by_url, data_sources, Path(raw_dir), mechanism)
+    return list(by_url.values())
+
+
+def collect_sources(root: Path, codes: list[str] | None = None) -> list[SourceSpec]:
+    """
+    Gather DATA_SOURCES from every mechanism's intake script.
+
+    DATA_SOURCES is read from the script's AST, so templates and scripts with heavy
+    imports are never executed.
+
+    Args:
+        root: Repository root
+        codes: Optional mechanism codes to keep (e.g. ["A-01", "B-03"])
+
+    Returns:
+        List of SourceSpec, one per distinct URL across all mechanisms
+    """
+    by_url: dict[str, SourceSpec] = {}
+    for intake in sorted(Path(root).glob(INTAKE_GLOB)):
+        code = intake.parents[2].name.split("_", 1)[0]
+        if codes and code not in codes:
+            continue
+        data_sources = config_constants(intake).get("DATA_SOURCES")
+        if isinstance(data_sources, dict):
+            raw_dir = intake.parent.parent / "datasets" / "raw"
+            _add_sources(by_url, data_sources, raw_dir, code)
+    return list(by_url.values())
+
+
+# =============================================================================
+# PROGRESS
+# =============================================================================
+
+class TransferMeter:
+    """Thread-safe byte/file counter with an optional periodic progress line."""
+
+    def __init__(self, total_files: int, stream: TextIO | None = sys.stdout,
+                 interval: float = PROGRESS_INTERVAL):
+        self.total_files = total_files
+        self.stream = stream
+        self.interval = interval
+        self.bytes = 0
+        self.files_done = 0
+        self.started = time.perf_counter()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def add_bytes(self, n: int) -> None:
+        """Count bytes received (called from worker threads while streaming)."""
+        with self._lock:
+            self.bytes += n
+
+    def file_done(self) -> None:
+        """Count one finished source."""
+        with self._lock:
+            self.files_done += 1
+
+    @property
+    def elapsed(self) -> float:
+        """Seconds since the meter started."""
+        return time.perf_counter() - self.started
+
+    def line(self) -> str:
+        """Current progress as a single line."""
+        rate = self.bytes / MB / self.elapsed if self.elapsed > 0 else 0.0
+        return (f"  [{self.files_done}/{self.total_files}] "
+                f"{self.bytes / MB:8.1f} MB  {rate:6.1f} MB/s  {self.elapsed:6.1f}s")
+
+    def _report(self) -> None:
+        while not self._stop.wait(self.interval):
+            print(self.line(), file=self.stream, flush=True)
+
+    def __enter__(self) -> TransferMeter:
+        self.started = time.perf_counter()
+        if self.stream is not None and self.interval > 0:
+            self._thread = threading.Thread(target=self._report, daemon=True)
+            self._thread.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+
+# =============================================================================
+# DOWNLOADER
+# =============================================================================
+
+@dataclass
+class DownloadOutcome:
+    """Result of fetching one source."""
+
+    spec: SourceSpec
+    status: str  # "stored" | "adopted" | "downloaded" | "not_modified" | "failed"
+    sha256: str | None = None
+    size: int = 0
+    bytes_transferred: int = 0
+    seconds: float = 0.0
+    error: str = ""
+
+    @property
+    def ok(self) -> bool:
+        """True unless the fetch failed."""
+        return self.status != "failed"
+
+
+class ConcurrentDownloader:
+    """Fetch many sources into the raw store over pooled, per-host-limited connections."""
+
+    def __init__(
+        self,
+        store: RawDataStore | None = None,
+        max_workers: int = DEFAULT_WORKERS,
+        per_host: int = DEFAULT_PER_HOST,
+        refresh: bool = False,
+        progress: TextIO | None = sys.stdout,
+        progress_interval: float = PROGRESS_INTERVAL,
+    ):
+        """
+        Args:
+            store: Raw store to fill (default: the shared evidence_vault store)
+            max_workers: Total concurrent transfers
+            per_host: Maximum concurrent transfers (and pooled connections) per host
+            refresh: Conditionally re-check sources that are already stored
+            progress: Stream for progress lines (None for silent)
+            progress_interval: Seconds between progress lines (0 disables them)
+        """
+        self.store = store or RawDataStore()
+        self.max_workers = max(1, max_workers)
+        self.per_host = max(1, per_host)
+        self.refresh = refresh
+        self.progress = progress
+        self.progress_interval = progress_interval
+        self._sessions: dict[str, requests.Session] = {}
+        self._slots: dict[str, threading.BoundedSemaphore] = defaultdict(
+            lambda: threading.BoundedSemaphore(self.per_host)
+        )
+        self._lock = threading.Lock()
+        self.elapsed = 0.0
+
+    def session(self, host: str) -> requests.Session:
+        """Keep-alive session for a host, with a pool sized to the per-host limit."""
+        with self._lock:
+            if host not in self._sessions:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.per_host, max_retries=2)
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                self._sessions[host] = session
+            return self._sessions[host]
+
+    def close(self) -> None:
+        """Close all pooled sessions."""
+        with self._lock:
+            for session in self._sessions.values():
+                session.close()
+            self._sessions.clear()
+
+    def _link(self, spec: SourceSpec, digest: str) -> None:
+        for target in spec.targets:
+            self.store.materialize(digest, target)
+
+    def fetch_one(self, spec: SourceSpec, meter: TransferMeter) -> DownloadOutcome:
+        """
+        Fetch (or reuse) one source and link it into every target.
+
+        Args:
+            spec: Source to fetch
+            meter: Shared transfer meter
+
+        Returns:
+            DownloadOutcome (never raises for network or checksum errors)
+        """
+        start = time.perf_counter()
+        received = 0
+
+        def count(n: int) -> None:
+            nonlocal received
+            received += n
+            meter.add_bytes(n)
+
+        try:
+            previous = self.store.lookup(spec.url)
+            local = next((t for t in spec.targets if t.is_file()), None)
+
+            if previous is None and local is not None and not self.refresh:
+                entry = self.store.adopt(spec.url, local, spec.source_name)
+                status = "adopted"
+            elif previous is not None and not self.refresh:
+                entry = previous
+                status = "stored"
+            else:
+                with self._slots[spec.host]:
+                    entry = self.store.fetch(
+                        spec.url,
+                        spec.source_name,
+                        force=self.refresh,
+                        expected_sha256=spec.expected_sha256,
+                        session=self.session(spec.host),
+                        progress=count,
+                    )
+                unchanged = previous is not None and entry.sha256 == previous.sha256
+                status = "not_modified" if unchanged else "downloaded"
+
+            self._link(spec, entry.sha256)
+            return DownloadOutcome(spec, status, entry.sha256, entry.size, received,
+                                   time.perf_counter() - start)
+        except Exception as e:  # noqa: BLE001 - report every failure, keep the pool going
+            return DownloadOutcome(spec, "failed", bytes_transferred=received,
+                                   seconds=time.perf_counter() - start,
+                                   error=f"{type(e).__name__}: {e}")
+        finally:
+            meter.file_done()
+
+    def run(self, specs: list[SourceSpec]) -> list[DownloadOutcome]:
+        """
+        Fetch all sources concurrently.
+
+        Args:
+            specs: Sources to fetch (see collect_sources / sources_from_config)
+
+        Returns:
+            Outcomes in the order of ``specs``
+        """
+        outcomes: dict[int, DownloadOutcome] = {}
+        meter = TransferMeter(len(specs), self.progress, self.progress_interval)
+        try:
+            with meter, ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+                futures = {pool.submit(self.fetch_one, spec, meter): i for i, spec in enumerate(specs)}
+                for future in as_completed(futures):
+                    outcomes[futures[future]] = future.result()
+        finally:
+            self.close()
+        self.elapsed = meter.elapsed
+        return [outcomes[i] for i in range(len(specs))]
+
+
+# =============================================================================
+# REPORTING
+# =============================================================================
+
+def print_report(outcomes: list[DownloadOutcome], wall_seconds: float | None = None,
+                 stream: TextIO = sys.stdout) -> None:
+    """
+    Print a per-source table and aggregate throughput.
+
+    Args:
+        outcomes: Result of ConcurrentDownloader.run()
+        wall_seconds: Elapsed wall time (default: longest single fetch)
+        stream: Output stream
+    """
+    if not outcomes:
+        print("No http(s) sources declared.", file=stream)
+        return
+
+    width = max(len(o.spec.source_name) for o in outcomes)
+    for o in outcomes:
+        rate = o.bytes_transferred / MB / o.seconds if o.seconds > 0 and o.bytes_transferred else 0.0
+        line = (f"  {o.spec.source_name:<{width}}  {o.status:<12} {o.size / MB:8.1f} MB  "
+                f"{o.seconds:6.1f}s  {rate:6.1f} MB/s  {','.join(o.spec.mechanisms)}")
+        print(line, file=stream)
+        if o.error:
+            print(f"      {o.error}", file=stream)
+
+    wall = wall_seconds if wall_seconds is not None else max(o.seconds for o in outcomes)
+    transferred = sum(o.bytes_transferred for o in outcomes)
+    serial = sum(o.seconds for o in outcomes)
+    counts = defaultdict(int)
+    for o in outcomes:
+        counts[o.status] += 1
+    rate = transferred / MB / wall if wall > 0 else 0.0
+
+    print(f"\n  {len(outcomes)} sources: " + ", ".join(f"{n} {s}" for s, n in sorted(counts.items())),
+          file=stream)
+    print(f"  {transferred / MB:.1f} MB transferred in {wall:.1f}s ({rate:.1f} MB/s); "
+          f"serial fetch time {serial:.1f}s", file=stream)
@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+✒ Metadata
+    - Title: Conditional & Resumable HTTP Fetch (Terminal Velocity - v1.0)
+    - File Name: fetch.py
+    - Relative Path: computational_core/shared_utils/fetch.py
+    - Artifact Type: library
+    - Version: 1.0.1
+    - Date: 2026-10-18
+    - Update: Sunday, October 18, 2026
+    - Author: Dennis 'dnoice' Smaltz
+    - A.I. Acknowledgement: Anthropic - Claude Opus 4.5
+    - Signature:  ︻デ═—··· 🎯 = Aim Twice, Shoot Once!
+
+✒ Description:
+    HTTP download layer for dataset intake. Streams response bodies to disk in
+    chunks, revalidates cached copies with ETag / If-Modified-Since so an unchanged
+    source costs one header-only round trip, resumes interrupted downloads with
+    Range requests, and verifies SHA-256 checksums before a file is accepted.
+
+✒ Key Features:
+    - Feature 1: Chunked streaming to a .part file (bounded memory for any file size)
+    - Feature 2: Conditional requests (If-None-Match / If-Modified-Since → 304)
+    - Feature 3: Resume from a partial file with Range + If-Range
+    - Feature 4: Incremental SHA-256 while streaming, optional expected-checksum pin
+    - Feature 5: Content-Length verification against bytes received on the wire
+    - Feature 6: Injectable requests.Session (connection reuse, local stand-in servers)
+    - Feature 7: Atomic promotion of the completed file to its destination
+
+✒ Usage Instructions:
+    First download, then cheap refreshes with the returned validators:
+
+        result = fetch_url(url, dest)
+        later = fetch_url(url, dest, etag=result.etag, last_modified=result.last_modified)
+        if later.status == "not_modified": ...
+
+✒ Examples:
+    >>> fetch_url("http://127.0.0.1:8000/owid-co2-data.csv", Path("/tmp/co2.csv"))
+    FetchResult(status='downloaded', sha256='3f9a...', size=52428800, ...)
+    >>> fetch_url(url, dest, etag='"abc"')
+    FetchResult(status='not_modified', ...)
+    >>> fetch_url(url, dest, expected_sha256="3f9a...")   # raises ChecksumMismatch on drift
+
+✒ Other Important Information:
+    - Dependencies:
+        Required: requests
+    - Compatible platforms: Linux, Windows, macOS
+    - Performance notes: Memory use is one chunk (1 MB) regardless of file size
+    - Requests ask for ``Accept-Encoding: identity`` so Content-Length, Range
+      offsets and checksums all refer to the file's own bytes. A server that
+      compresses anyway is decoded while streaming; its partial files are not
+      resumed, because their offsets would be in compressed bytes
+    - Known limitations: Servers that ignore Range simply restart the transfer
+      (HTTP 200), which is handled but not faster
+---------
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+
+import requests
+
+from .fingerprint import CHUNK_SIZE
+
+DEFAULT_TIMEOUT = 60
+PART_SUFFIX = ".part"
+PART_META_SUFFIX = ".part.json"
+IDENTITY = "identity"
+
+
+class ChecksumMismatch(ValueError):
+    """Downloaded content does not match the expected SHA-256."""
+
+
+@dataclass
+class FetchResult:
+    """Outcome of a fetch: what happened and the validators to use next time."""
+
+    url: str
+    status: str  # "downloaded" | "resumed" | "not_modified"
+    path: Path
+    sha256: str | None = None
+    size: int = 0
+    etag: str | None = None
+    last_modified: str | None = None
+    bytes_transferred: int = 0
+
+
+def _hash_existing(path: Path, hasher: hashlib._Hash) -> int:
+    """Feed an existing partial file into a hasher, returning its size."""
+    size = 0
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+            hasher.update(chunk)
+            size += len(chunk)
+    return size
+
+
+def _read_part_meta(path: Path) -> dict:
+    """Validators recorded when a partial download was started."""
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+
+def _content_encoding(response: requests.Response) -> str:
+    """Content-Encoding of a response ("identity" when none was applied)."""
+    return response.headers.get("Content-Encoding", "").strip().lower() or IDENTITY
+
+
+def fetch_url(
+    url: str,
+    dest: Path,
+    etag: str | None = None,
+    last_modified: str | None = None,
+    expected_sha256: str | None = None,
+    session: requests.Session | None = None,
+    timeout: float = DEFAULT_TIMEOUT,
+    chunk_size: int = CHUNK_SIZE,
+    resume: bool = True,
+    progress: Callable[[int], None] | None = None,
+) -> FetchResult:
+    """
+    Download ``url`` to ``dest`` conditionally, resumably and with verification.
+
+    Args:
+        url: Source URL
+        dest: Final file path (written atomically on success)
+        etag: Validator from a previous download; sent as If-None-Match
+        last_modified: Validator from a previous download; sent as If-Modified-Since
+        expected_sha256: If given, the completed file must have this digest
+        session: Optional requests.Session for connection reuse
+        timeout: Connect/read timeout in seconds
+        chunk_size: Streaming chunk size in bytes
+        resume: Continue from an existing ``dest.part`` with a Range request
+        progress: Optional callable(bytes_in_chunk) invoked while streaming
+
+    Returns:
+        FetchResult; ``status == "not_modified"`` means ``dest`` was left untouched
+
+    Raises:
+        requests.HTTPError: Non-success HTTP status
+        ChecksumMismatch: SHA-256 verification failed (partial discarded) or the
+            body was shorter than Content-Length (partial kept for a resume)
+    """
+    dest = Path(dest)
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    partial = dest.with_name(dest.name + PART_SUFFIX)
+    part_meta = dest.with_name(dest.name + PART_META_SUFFIX)
+    http = session or requests
+
+    # Uncompressed transfer: lengths and Range offsets then count file bytes
+    headers = {"Accept-Encoding": IDENTITY}
+    if etag:
+        headers["If-None-Match"] = etag
+    if last_modified:
+        headers["If-Modified-Since"] = last_modified
+
+    offset = partial.stat().st_size if resume and partial.is_file() else 0
+    meta = _read_part_meta(part_meta) if offset else {}
+    if meta.get("content_encoding", IDENTITY) != IDENTITY:
+        # Decoded bytes of a compressed transfer: no valid Range offset exists
+        offset = 0
+    if offset:
+        headers["Range"] = f"bytes={offset}-"
+        # Only append if the server still has the same representation
+        validator = meta.get("etag") or meta.get("last_modified")
+        if validator:
+            headers["If-Range"] = validator
+
+    with http.get(url, headers=headers, stream=True, timeout=timeout) as response:
+        if response.status_code == 304:
+            return FetchResult(url, "not_modified", dest, etag=etag, last_modified=last_modified)
+
+        encoding = _content_encoding(response)
+        if offset and (response.status_code == 416
+                       or (response.status_code == 206 and encoding != IDENTITY)):
+            # Stale or oversized partial, or a compressed range that cannot be
+            # appended to decoded bytes: start over without a Range
+            partial.unlink(missing_ok=True)
+            part_meta.unlink(missing_ok=True)
+            return fetch_url(url, dest, etag, last_modified, expected_sha256, session,
+                             timeout, chunk_size, resume=False, progress=progress)
+
+        response.raise_for_status()
+
+        new_etag = response.headers.get("ETag")
+        new_last_modified = response.headers.get("Last-Modified")
+        hasher = hashlib.sha256()
+
+        if response.status_code == 206 and offset:
+            status = "resumed"
+            mode = "ab"
+            _hash_existing(partial, hasher)
+        else:
+            status = "downloaded"
+            mode = "wb"
+            offset = 0
+
+        part_meta.write_text(json.dumps({"url": url, "etag": new_etag,
+                                         "last_modified": new_last_modified,
+                                         "content_encoding": encoding}),
+                             encoding="utf-8")
+
+        transferred = 0
+        with open(partial, mode) as f:
+            for chunk in response.iter_content(chunk_size=chunk_size):
+                if not chunk:
+                    continue
+                f.write(chunk)
+                hasher.update(chunk)
+                transferred += len(chunk)
+                if progress:
+                    progress(len(chunk))
+
+        expected_length = response.headers.get("Content-Length")
+        # Content-Length counts the encoded body; iter_content yields decoded bytes
+        received = transferred if encoding == IDENTITY else response.raw.tell()
+
+    if expected_length is not None and received != int(expected_length):
+        if encoding != IDENTITY:
+            partial.unlink(missing_ok=True)
+            part_meta.unlink(missing_ok=True)
+        # Truncated identity transfer: keep the partial so the next call can resume
+        raise ChecksumMismatch(
+            f"{url}: received {received} of {expected_length} bytes"
+        )
+
+    digest = hasher.hexdigest()
+    if expected_sha256 and digest != expected_sha256.lower():
+        partial.unlink(missing_ok=True)
+        part_meta.unlink(missing_ok=True)
+        raise ChecksumMismatch(f"{url}: sha256 {digest} != expected {expected_sha256}")
+
+    os.replace(partial, dest)
+    part_meta.unlink(missing_ok=True)
+
+    return FetchResult(
+        url=url,
+        status=status,
+        path=dest,
+        sha256=digest,
+        size=offset + transferred,
+        etag=new_etag,
+        last_modified=new_last_modified,
+        bytes_transferred=transferred,
+    )
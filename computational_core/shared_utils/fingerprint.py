@@ -0,0 +1,452 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+✒ Metadata
+    - Title: Stage Fingerprints (Terminal Velocity - v1.0)
+    - File Name: fingerprint.py
+    - Relative Path: computational_core/shared_utils/fingerprint.py
+    - Artifact Type: library
+    - Version: 1.1.1
+    - Date: 2026-10-18
+    - Update: Sunday, October 18, 2026
+    - Author: Dennis 'dnoice' Smaltz
+    - A.I. Acknowledgement: Anthropic - Claude Opus 4.5
+    - Signature:  ︻デ═—··· 🎯 = Aim Twice, Shoot Once!
+
+✒ Description:
+    Content fingerprints for pipeline stages. A fingerprint captures everything a
+    stage's results depend on (script source, top-level config constants such as
+    SCENARIOS or CARBON_BUDGETS, the computational_core modules it imports, and the
+    bytes of its input files) plus the files it produced, so an unchanged stage can
+    be skipped on the next run.
+
+✒ Key Features:
+    - Feature 1: SHA-256 content hashing of input and output files
+    - Feature 2: Script hashing on the parsed AST (comment/markdown edits are ignored)
+    - Feature 3: Per-constant hashes for UPPER_CASE config dicts (computed ones by
+                 their expression)
+    - Feature 4: Stat cache (size + mtime) so unchanged files are never re-read
+    - Feature 5: Human-readable staleness reasons ("SCENARIOS changed", ...)
+    - Feature 6: Atomic JSON persistence next to the stage's derived outputs
+    - Feature 7: First-party imports resolved transitively to files, plus data files
+                 they name ("dependency changed: shared_utils/regions.yaml")
+
+✒ Usage Instructions:
+    Compute a fingerprint, compare it with the recorded one, run if stale:
+
+        previous = load_fingerprint(record_path)
+        current = compute_fingerprint("02_analysis", script, inputs, outputs, previous)
+        reasons = stale_reasons(previous, current)
+
+✒ Examples:
+    >>> fp = compute_fingerprint("02_analysis", Path("02_analysis.py"),
+    ...                          [Path("../datasets/processed")], [Path("../datasets/derived")])
+    >>> save_fingerprint(fp, Path("../datasets/derived/02_analysis.fingerprint.json"))
+    >>> stale_reasons(load_fingerprint(...), fp)
+    []
+
+✒ Other Important Information:
+    - Dependencies: hashlib, ast, json (stdlib)
+    - Compatible platforms: Linux, Windows, macOS
+    - Performance notes: Files whose size and mtime match the previous record reuse
+      the recorded digest, so a no-op check costs one stat() per file plus one
+      parse of each imported first-party module to follow its imports
+    - Known limitations: Computed constants are captured by their expression, not
+      their value. Dynamic imports (importlib) and data files named through
+      computed paths are not followed
+---------
+"""
+
+from __future__ import annotations
+
+import ast
+import hashlib
+import json
+import os
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any
+
+FINGERPRINT_VERSION = 3  # 3: computed config constants hashed by expression
+FINGERPRINT_SUFFIX = ".fingerprint.json"
+CHUNK_SIZE = 1024 * 1024
+
+# First-party package whose modules (and the data files next to them) a stage
+# depends on when it imports them, e.g. shared_utils/scenarios.py, regions.yaml
+FIRST_PARTY_PACKAGE = "computational_core"
+PACKAGE_ROOT = Path(__file__).resolve().parents[2]
+
+# Files that are bookkeeping rather than data, never part of a fingerprint
+IGNORED_NAMES = {".gitkeep", ".DS_Store"}
+IGNORED_DIRS = {"__pycache__", ".ipynb_checkpoints"}
+
+
+# =============================================================================
+# HASHING
+# =============================================================================
+
+def file_digest(path: Path, chunk_size: int = CHUNK_SIZE) -> str:
+    """
+    SHA-256 of a file's contents, read in chunks.
+
+    Args:
+        path: File to hash
+        chunk_size: Read size in bytes
+
+    Returns:
+        Hex digest
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def value_digest(value: Any) -> str:
+    """SHA-256 of a JSON-serializable value in canonical (sorted-key) form."""
+    payload = json.dumps(value, sort_keys=True, default=str, separators=(",", ":"))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def source_digest(script: Path) -> str:
+    """
+    SHA-256 of a script's parsed AST.
+
+    Comments (including jupytext markdown cells) and formatting do not affect the
+    digest; any change to code or literal values does.
+    """
+    source = script.read_text(encoding="utf-8")
+    try:
+        tree = ast.parse(source)
+    except SyntaxError:
+        return hashlib.sha256(source.encode("utf-8")).hexdigest()
+    return hashlib.sha256(ast.dump(tree).encode("utf-8")).hexdigest()
+
+
+def config_constants(script: Path) -> dict[str, Any]:
+    """
+    Extract top-level UPPER_CASE constants from a script.
+
+    Literal values are evaluated. Any other expression (a computed path, a call,
+    a literal ``literal_eval`` rejects) maps to the SHA-256 of its AST dump, so an
+    edit to it is still named.
+
+    Args:
+        script: Pipeline script path
+
+    Returns:
+        Dict of constant name -> value or expression digest
+        (e.g. {"SCENARIOS": {...}, "REPO_ROOT": "3f2a..."})
+    """
+    try:
+        tree = ast.parse(script.read_text(encoding="utf-8"))
+    except SyntaxError:
+        return {}
+
+    constants = {}
+    for node in tree.body:
+        if not isinstance(node, ast.Assign) or len(node.targets) != 1:
+            continue
+        target = node.targets[0]
+        if not isinstance(target, ast.Name) or not target.id.isupper():
+            continue
+        try:
+            constants[target.id] = ast.literal_eval(node.value)
+        except (ValueError, TypeError, SyntaxError, MemoryError, RecursionError):
+            constants[target.id] = hashlib.sha256(ast.dump(node.value).encode("utf-8")).hexdigest()
+    return constants
+
+
+# =============================================================================
+# DEPENDENCIES
+# =============================================================================
+
+def _module_file(module: str, root: Path) -> Path | None:
+    """Source file of a dotted module name under ``root`` (module or package)."""
+    base = root.joinpath(*module.split("."))
+    for candidate in (base.with_suffix(".py"), base / "__init__.py"):
+        if candidate.is_file():
+            return candidate
+    return None
+
+
+def _imported_names(tree: ast.AST, module: str, is_package: bool) -> set[str]:
+    """
+    Dotted names a module imports, anywhere in its body.
+
+    ``from pkg import name`` yields both ``pkg`` and ``pkg.name``, since ``name``
+    may be a submodule; names that are not modules simply do not resolve.
+    """
+    package = module if is_package else module.rpartition(".")[0]
+    names = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names.update(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            if node.level:
+                parts = package.split(".") if package else []
+                parts = parts[:len(parts) - (node.level - 1)]
+                base = ".".join(parts + ([node.module] if node.module else []))
+            else:
+                base = node.module or ""
+            names.add(base)
+            names.update(f"{base}.{alias.name}" for alias in node.names)
+    return names
+
+
+def _data_files(tree: ast.AST, path: Path) -> set[Path]:
+    """Files next to a module that it names in a string literal (e.g. "regions.yaml")."""
+    found = set()
+    for node in ast.walk(tree):
+        if (isinstance(node, ast.Constant) and isinstance(node.value, str)
+                and node.value and "/" not in node.value and "\n" not in node.value
+                and not node.value.endswith(".py")):
+            candidate = path.parent / node.value
+            if candidate.is_file():
+                found.add(candidate)
+    return found
+
+
+def module_dependencies(
+    script: Path,
+    package: str = FIRST_PARTY_PACKAGE,
+    root: Path | None = None,
+) -> list[Path]:
+    """
+    First-party modules a script imports, transitively, and the data files they name.
+
+    Args:
+        script: Stage script path
+        package: Top-level package whose modules count as dependencies
+        root: Directory containing ``package`` (default: this repository)
+
+    Returns:
+        Sorted list of module files (including the package ``__init__.py`` files
+        on the way) and data files such as ``shared_utils/regions.yaml``
+    """
+    root = root or PACKAGE_ROOT
+    found: set[Path] = set()
+    queue = [(Path(script), "")]
+    while queue:
+        path, module = queue.pop()
+        try:
+            tree = ast.parse(path.read_text(encoding="utf-8"))
+        except (OSError, SyntaxError, ValueError):
+            continue
+        if module:
+            found |= _data_files(tree, path)
+        for name in _imported_names(tree, module, path.name == "__init__.py"):
+            if name != package and not name.startswith(package + "."):
+                continue
+            parts = name.split(".")
+            for depth in range(1, len(parts) + 1):
+                dotted = ".".join(parts[:depth])
+                dependency = _module_file(dotted, root)
+                if dependency is not None and dependency not in found:
+                    found.add(dependency)
+                    queue.append((dependency, dotted))
+    return sorted(found)
+
+
+# =============================================================================
+# FINGERPRINTS
+# =============================================================================
+
+@dataclass
+class StageFingerprint:
+    """Everything a stage's results depend on, plus what it produced."""
+
+    stage: str
+    script: str
+    config: dict[str, str] = field(default_factory=dict)
+    inputs: dict[str, list] = field(default_factory=dict)   # path -> [size, mtime_ns, sha256]
+    outputs: dict[str, list] = field(default_factory=dict)  # path -> [size, mtime_ns, sha256]
+    dependencies: dict[str, list] = field(default_factory=dict)  # package path -> [size, mtime_ns, sha256]
+    version: int = FINGERPRINT_VERSION
+
+    @property
+    def key(self) -> str:
+        """Digest of the stage's inputs only (stat metadata excluded)."""
+        return value_digest({
+            "script": self.script,
+            "config": self.config,
+            "inputs": {path: entry[2] for path, entry in self.inputs.items()},
+            "dependencies": {path: entry[2] for path, entry in self.dependencies.items()},
+        })
+
+
+def iter_files(paths: list[Path]) -> list[Path]:
+    """Expand files and directories into a sorted list of data files."""
+    files = []
+    for path in paths:
+        if path.is_file():
+            files.append(path)
+        elif path.is_dir():
+            for dirpath, dirnames, filenames in os.walk(path):
+                dirnames[:] = [d for d in dirnames if d not in IGNORED_DIRS]
+                for name in filenames:
+                    if name in IGNORED_NAMES or name.endswith(FINGERPRINT_SUFFIX):
+                        continue
+                    files.append(Path(dirpath) / name)
+    return sorted(set(files))
+
+
+def snapshot_files(
+    paths: list[Path],
+    previous: dict[str, list] | None = None,
+    base: Path | None = None,
+) -> dict[str, list]:
+    """
+    Record size, mtime and content digest for every file under ``paths``.
+
+    Args:
+        paths: Files or directories to snapshot
+        previous: Earlier snapshot; entries with matching size and mtime are reused
+        base: Directory that relative ``paths`` (and the returned keys) refer to
+
+    Returns:
+        Dict of path -> [size, mtime_ns, sha256]
+    """
+    previous = previous or {}
+    base = base or Path(".")
+    snapshot = {}
+    for path in iter_files([base / p for p in paths]):
+        stat = path.stat()
+        key = Path(os.path.relpath(path, base)).as_posix()
+        cached = previous.get(key)
+        if cached and cached[0] == stat.st_size and cached[1] == stat.st_mtime_ns:
+            snapshot[key] = cached
+        else:
+            snapshot[key] = [stat.st_size, stat.st_mtime_ns, file_digest(path)]
+    return snapshot
+
+
+def snapshot_dependencies(
+    files: list[Path],
+    previous: dict[str, list] | None = None,
+    base: Path | None = None,
+) -> dict[str, list]:
+    """
+    Like ``snapshot_files``, for first-party dependencies keyed relative to the package.
+
+    Modules are hashed on their AST (as the stage script is), so comment-only
+    edits do not invalidate every stage; data files are hashed by content.
+    """
+    previous = previous or {}
+    base = base or PACKAGE_ROOT / FIRST_PARTY_PACKAGE
+    snapshot = {}
+    for path in files:
+        stat = path.stat()
+        key = Path(os.path.relpath(path, base)).as_posix()
+        cached = previous.get(key)
+        if cached and cached[0] == stat.st_size and cached[1] == stat.st_mtime_ns:
+            snapshot[key] = cached
+        else:
+            digest = source_digest(path) if path.suffix == ".py" else file_digest(path)
+            snapshot[key] = [stat.st_size, stat.st_mtime_ns, digest]
+    return snapshot
+
+
+def compute_fingerprint(
+    stage: str,
+    script: Path,
+    inputs: list[Path],
+    outputs: list[Path],
+    previous: StageFingerprint | None = None,
+    base: Path | None = None,
+) -> StageFingerprint:
+    """
+    Fingerprint a stage from its script, config constants, first-party
+    dependencies, inputs and outputs.
+
+    Args:
+        stage: Stage name (e.g. "02_analysis")
+        script: Stage script path
+        inputs: Files or directories the stage reads
+        outputs: Files or directories the stage writes
+        previous: Last recorded fingerprint, used as a stat cache
+        base: Directory that relative input/output paths refer to
+
+    Returns:
+        StageFingerprint
+    """
+    return StageFingerprint(
+        stage=stage,
+        script=source_digest(script),
+        config={name: value_digest(value) for name, value in config_constants(script).items()},
+        inputs=snapshot_files(inputs, previous.inputs if previous else None, base),
+        outputs=snapshot_files(outputs, previous.outputs if previous else None, base),
+        dependencies=snapshot_dependencies(module_dependencies(script),
+                                           previous.dependencies if previous else None),
+    )
+
+
+def stale_reasons(previous: StageFingerprint | None, current: StageFingerprint) -> list[str]:
+    """
+    Explain why a stage must re-run; an empty list means it is up to date.
+
+    Args:
+        previous: Recorded fingerprint (None if the stage never ran)
+        current: Freshly computed fingerprint
+
+    Returns:
+        List of human-readable reasons
+    """
+    if previous is None:
+        return ["no previous run recorded"]
+    if previous.version != current.version:
+        return ["fingerprint format changed"]
+
+    reasons = []
+    changed_config = sorted(
+        name for name in set(previous.config) | set(current.config)
+        if previous.config.get(name) != current.config.get(name)
+    )
+    reasons.extend(f"{name} changed" for name in changed_config)
+    if previous.script != current.script and not changed_config:
+        reasons.append("script changed")
+
+    for path in sorted(set(previous.dependencies) | set(current.dependencies)):
+        old, new = previous.dependencies.get(path), current.dependencies.get(path)
+        if old is None:
+            reasons.append(f"new dependency: {path}")
+        elif new is None:
+            reasons.append(f"dependency removed: {path}")
+        elif old[2] != new[2]:
+            reasons.append(f"dependency changed: {path}")
+
+    for path in sorted(set(previous.inputs) | set(current.inputs)):
+        old, new = previous.inputs.get(path), current.inputs.get(path)
+        if old is None:
+            reasons.append(f"new input {path}")
+        elif new is None:
+            reasons.append(f"input removed {path}")
+        elif old[2] != new[2]:
+            reasons.append(f"input changed {path}")
+
+    for path, entry in sorted(previous.outputs.items()):
+        now = current.outputs.get(path)
+        if now is None:
+            reasons.append(f"output missing {path}")
+        elif now[2] != entry[2]:
+            reasons.append(f"output modified {path}")
+
+    return reasons
+
+
+def load_fingerprint(path: Path) -> StageFingerprint | None:
+    """Load a recorded fingerprint, or None if absent or unreadable."""
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+        return StageFingerprint(**data)
+    except (OSError, ValueError, TypeError):
+        return None
+
+
+def save_fingerprint(fingerprint: StageFingerprint, path: Path) -> None:
+    """Write a fingerprint atomically (temp file + rename)."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_text(json.dumps(asdict(fingerprint), indent=2, sort_keys=True), encoding="utf-8")
+    os.replace(tmp, path)
@@ -0,0 +1,408 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+✒ Metadata
+    - Title: Country × Year Panel Store (Terminal Velocity - v1.0)
+    - File Name: panel.py
+    - Relative Path: computational_core/shared_utils/panel.py
+    - Artifact Type: library
+    - Version: 1.3.0
+    - Date: 2026-10-18
+    - Update: Sunday, October 18, 2026
+    - Author: Dennis 'dnoice' Smaltz
+    - A.I. Acknowledgement: Anthropic - Claude Opus 4.5
+    - Signature:  ︻デ═—··· 🎯 = Aim Twice, Shoot Once!
+
+✒ Description:
+    One shared country × year × indicator panel for every mechanism. Countries and
+    years are integer-coded axes common to all sources; each indicator is a dense
+    float array laid out country-major over the full grid (NaN where a source has
+    no value): float64 where the source declares float64, float32 otherwise. The
+    panel is saved as a hive-partitioned Arrow IPC dataset (one partition per
+    source) and memory-mapped on open, so selections are numpy views and
+    combining indicators from different sources is array indexing, not a merge.
+
+    Every build is written to its own directory and published by atomically
+    replacing the ``_current`` pointer file. Panel.open() resolves the pointer
+    once and maps that build's partitions, so a reader never sees a missing
+    store or axes from one build with partitions from another.
+
+✒ Key Features:
+    - Feature 1: Integer country codes (sorted names, ISO codes kept alongside) and a
+      contiguous year axis shared by every indicator
+    - Feature 2: Dense indicator arrays, shape (n_countries, n_years); float64 totals
+      stay float64, everything else is float32
+    - Feature 3: select(indicators, years) returns zero-copy views over the mapped files
+    - Feature 4: Partitioned on disk as source=<name>/part-0.arrow (pyarrow.dataset-readable)
+    - Feature 5: Built from the declared DATA_SOURCES columns of all mechanisms
+    - Feature 6: Build is skipped when the raw blobs and declared columns are unchanged
+    - Feature 7: Concurrent builds (parallel intake stages) serialize on a raw-store lock
+    - Feature 8: Versioned builds behind an atomically swapped pointer; readers pin one
+      build, the previous build is kept until the next one is published
+
+✒ Usage Instructions:
+    Build (done by evidence_vault/download_scripts/fetch_sources.py and by intake
+    stages after downloads):
+
+        build_panel(collect_sources(REPO_ROOT))
+
+    Use from any mechanism:
+
+        panel = Panel.open()
+        sl = panel.select(["coal_co2", "coal_consumption"], years=(1965, 2023))
+        ratio = sl["coal_co2"] / sl["coal_consumption"]      # aligned arrays, no merge
+        china = sl["coal_co2"][panel.code("China")]
+
+✒ Examples:
+    >>> panel = Panel.open()
+    >>> panel.shape
+    (255, 274)
+    >>> sl = panel.select(["coal_co2"], years=(2000, 2023))
+    >>> sl["coal_co2"].shape, sl["coal_co2"].base is not None
+    ((255, 24), True)
+    >>> sl.frame().head()          # long DataFrame when pandas is needed
+
+✒ Other Important Information:
+    - Dependencies:
+        Required: numpy, pandas, pyarrow
+    - Compatible platforms: Linux, Windows, macOS
+    - Storage layout (default evidence_vault/panel, override with TV_PANEL_STORE):
+        panel/_current                             Name of the published build directory
+        panel/build-<id>/_axes.json                Countries, ISO codes, year range, indicators
+        panel/build-<id>/source=<name>/part-0.arrow  country_code, year, <indicators> (float)
+    - Performance notes: Year ranges are contiguous slices (views); selecting a
+      subset of countries uses fancy indexing and therefore copies
+    - Known limitations: An indicator name declared by two sources is taken from the
+      first source (e.g. OWID "population"); integer/categorical columns other than the
+      axes are not stored
+---------
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import shutil
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.ipc as pa_ipc
+
+from .data_utils import read_csv_columns
+from .fingerprint import value_digest
+from .raw_store import RawDataStore
+
+PANEL_VERSION = 2  # 2: float64 indicators kept as declared
+DEFAULT_PANEL = Path(__file__).resolve().parents[2] / "evidence_vault" / "panel"
+PANEL_ENV_VAR = "TV_PANEL_STORE"
+AXES_FILE = "_axes.json"  # "_" prefix: ignored by pyarrow.dataset discovery
+CURRENT_FILE = "_current"  # name of the published build directory
+BUILD_PREFIX = "build-"
+PARTITION_FILE = "part-0.arrow"
+
+# Declared columns that form the axes rather than indicators
+AXIS_COLUMNS = {"country", "iso_code", "year"}
+INDICATOR_DTYPES = {"float32", "float64", "int8", "int16", "int32", "int64",
+                    "Int16", "Int32", "Int64"}
+
+
+def panel_root(root: Path | None = None) -> Path:
+    """Panel directory (argument, $TV_PANEL_STORE, or evidence_vault/panel)."""
+    return Path(root or os.environ.get(PANEL_ENV_VAR) or DEFAULT_PANEL)
+
+
+def current_build(root: Path) -> Path:
+    """Directory of the published build (``root`` itself for an unversioned store)."""
+    try:
+        name = (root / CURRENT_FILE).read_text(encoding="utf-8").strip()
+    except FileNotFoundError:
+        return root
+    return root / name
+
+
+# =============================================================================
+# SELECTIONS
+# =============================================================================
+
+@dataclass
+class PanelSlice:
+    """Indicators over a common country × year window."""
+
+    countries: np.ndarray   # country names, one per row
+    iso_codes: np.ndarray   # ISO 3166-1 alpha-3 (None for aggregates)
+    years: np.ndarray       # one per column
+    data: dict[str, np.ndarray]  # indicator -> (n_countries, n_years) float32 / float64
+
+    def __getitem__(self, indicator: str) -> np.ndarray:
+        return self.data[indicator]
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        """(countries, years)."""
+        return len(self.countries), len(self.years)
+
+    def frame(self, dropna: bool = True) -> pd.DataFrame:
+        """
+        Long country/iso_code/year DataFrame (copies the data).
+
+        Args:
+            dropna: Drop rows where every indicator is missing
+        """
+        n_c, n_y = self.shape
+        df = pd.DataFrame({
+            "country": np.repeat(self.countries, n_y),
+            "iso_code": np.repeat(self.iso_codes, n_y),
+            "year": np.tile(self.years, n_c),
+        })
+        for name, values in self.data.items():
+            df[name] = values.reshape(-1)
+        if dropna and self.data:
+            df = df.dropna(subset=list(self.data), how="all").reset_index(drop=True)
+        return df
+
+
+# =============================================================================
+# PANEL
+# =============================================================================
+
+class Panel:
+    """Memory-mapped, read-only view of a built panel store."""
+
+    def __init__(self, root: Path, axes: dict):
+        self.root = root  # build directory
+        self.axes = axes
+        self.countries = np.array(axes["countries"], dtype=object)
+        self.iso_codes = np.array(axes["iso_codes"], dtype=object)
+        self.year0, self.year1 = axes["years"]
+        self.years = np.arange(self.year0, self.year1 + 1, dtype=np.int16)
+        self.indicators: dict[str, str] = axes["indicators"]  # name -> source
+        self._codes = {name: i for i, name in enumerate(self.countries)}
+        self._tables: dict[str, pa.Table] = {}
+
+    @classmethod
+    def open(cls, root: Path | None = None) -> Panel:
+        """
+        Open the published build (raises FileNotFoundError if none was built).
+
+        Every partition is memory-mapped here, so the panel keeps reading the
+        build it opened even when a newer one is published meanwhile.
+        """
+        build = current_build(panel_root(root))
+        axes = json.loads((build / AXES_FILE).read_text(encoding="utf-8"))
+        panel = cls(build, axes)
+        for source in dict.fromkeys(panel.indicators.values()):
+            panel._table(source)
+        return panel
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        """(countries, years)."""
+        return len(self.countries), len(self.years)
+
+    def code(self, country: str) -> int:
+        """Integer code (row index) of a country or aggregate name."""
+        return self._codes[country]
+
+    def codes(self, countries: list[str]) -> np.ndarray:
+        """Integer codes for several names."""
+        return np.array([self._codes[c] for c in countries], dtype=np.int16)
+
+    def _table(self, source: str) -> pa.Table:
+        if source not in self._tables:
+            path = self.root / f"source={source}" / PARTITION_FILE
+            self._tables[source] = pa_ipc.open_file(pa.memory_map(str(path))).read_all()
+        return self._tables[source]
+
+    def array(self, indicator: str) -> np.ndarray:
+        """Full (n_countries, n_years) array for one indicator, zero-copy and read-only."""
+        if indicator not in self.indicators:
+            raise KeyError(f"Unknown indicator {indicator!r}; panel has {sorted(self.indicators)}")
+        column = self._table(self.indicators[indicator]).column(indicator)
+        return column.chunk(0).to_numpy(zero_copy_only=True).reshape(self.shape)
+
+    def select(
+        self,
+        indicators: list[str],
+        years: tuple[int, int] | range | None = None,
+        countries: list[str] | None = None,
+    ) -> PanelSlice:
+        """
+        Select indicators over a year window.
+
+        Args:
+            indicators: Indicator names (see ``panel.indicators``)
+            years: Inclusive (first, last) pair or a step-1 range; None for all years
+            countries: Optional names to keep (fancy indexing: returns copies)
+
+        Returns:
+            PanelSlice whose arrays are views into the memory-mapped store
+            (unless ``countries`` is given)
+        """
+        if years is None:
+            first, last = self.year0, self.year1
+        elif isinstance(years, range):
+            if years.step != 1:
+                raise ValueError("years range must have step 1")
+            first, last = years.start, years.stop - 1
+        else:
+            first, last = years
+        lo = max(first, self.year0) - self.year0
+        hi = min(last, self.year1) - self.year0 + 1
+        cols = slice(lo, max(lo, hi))
+
+        rows = slice(None) if countries is None else self.codes(countries)
+        data = {name: self.array(name)[rows, cols] for name in indicators}
+        return PanelSlice(self.countries[rows], self.iso_codes[rows], self.years[cols], data)
+
+
+# =============================================================================
+# BUILD
+# =============================================================================
+
+def _indicator_columns(columns: dict[str, str]) -> list[str]:
+    return [c for c, t in columns.items() if c not in AXIS_COLUMNS and t in INDICATOR_DTYPES]
+
+
+def _indicator_dtype(declared: str) -> str:
+    """Stored dtype of an indicator: float64 stays float64, the rest become float32."""
+    return "float64" if declared == "float64" else "float32"
+
+
+def build_panel(
+    specs: list,
+    raw_store: RawDataStore | None = None,
+    root: Path | None = None,
+    force: bool = False,
+) -> Panel | None:
+    """
+    Build (or rebuild) the panel from declared sources that are in the raw store.
+
+    Args:
+        specs: SourceSpec list from downloader.collect_sources(); each spec's
+            ``columns`` must declare "country" and "year"
+        raw_store: Raw store holding the source blobs
+        root: Panel directory
+        force: Rebuild even if inputs are unchanged
+
+    Returns:
+        The opened Panel, or None if no source qualified
+    """
+    raw_store = raw_store or RawDataStore()
+    root = panel_root(root)
+
+    inputs = []
+    for spec in specs:
+        entry = raw_store.lookup(spec.url)
+        if entry is None or not {"country", "year"} <= set(spec.columns):
+            continue
+        if _indicator_columns(spec.columns):
+            inputs.append((spec, entry.sha256))
+    if not inputs:
+        return None
+
+    key = value_digest({
+        "version": PANEL_VERSION,
+        "sources": [[spec.source_name, digest, spec.columns] for spec, digest in inputs],
+    })
+    with raw_store.lock(f"panel:{root.resolve()}"):
+        try:
+            current = json.loads((current_build(root) / AXES_FILE).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            current = {}
+        if current.get("key") == key and not force:
+            return Panel.open(root)
+        return _write_panel(inputs, key, raw_store, root)
+
+
+def _write_panel(inputs: list, key: str, raw_store: RawDataStore, root: Path) -> Panel:
+    """Load the sources, lay out the shared axes and publish a new build under ``root``."""
+    # Load each source (column-pruned, via the columnar cache) and claim indicators
+    frames: dict[str, tuple[pd.DataFrame, dict[str, str]]] = {}
+    claimed: dict[str, str] = {}
+    for spec, digest in inputs:
+        columns = {c: t for c, t in spec.columns.items() if c in AXIS_COLUMNS}
+        columns.update({c: _indicator_dtype(spec.columns[c]) for c in _indicator_columns(spec.columns)})
+        df = read_csv_columns(raw_store.blob_path(digest), columns)
+        df = df[df["country"].notna() & df["year"].notna()]
+        own = [c for c in _indicator_columns(spec.columns) if c in df.columns and c not in claimed]
+        claimed.update(dict.fromkeys(own, spec.source_name))
+        frames[spec.source_name] = (df, {c: columns[c] for c in own})
+
+    # Shared axes: sorted country names, contiguous years
+    iso_by_country: dict[str, str | None] = {}
+    for df, _ in frames.values():
+        if "iso_code" in df.columns:
+            pairs = df[["country", "iso_code"]].dropna().drop_duplicates("country")
+            for country, iso in zip(pairs["country"].astype(str), pairs["iso_code"].astype(str)):
+                iso_by_country.setdefault(country, iso)
+        for country in df["country"].astype(str).unique():
+            iso_by_country.setdefault(country, None)
+    countries = sorted(iso_by_country)
+    year0 = int(min(df["year"].min() for df, _ in frames.values()))
+    year1 = int(max(df["year"].max() for df, _ in frames.values()))
+    n_c, n_y = len(countries), year1 - year0 + 1
+
+    axis_codes = pa.array(np.repeat(np.arange(n_c, dtype=np.int16), n_y))
+    axis_years = pa.array(np.tile(np.arange(year0, year1 + 1, dtype=np.int16), n_c))
+
+    # Unpublished until the pointer names it, so readers never see a partial build
+    build = root / f"{BUILD_PREFIX}{time.time_ns():x}-{key[:12]}"
+    for source, (df, own) in frames.items():
+        rows = pd.Categorical(df["country"].astype(str), categories=countries).codes.astype(np.int64)
+        flat = rows * n_y + (df["year"].to_numpy(dtype=np.int64) - year0)
+        arrays = {"country_code": axis_codes, "year": axis_years}
+        for name, dtype in own.items():
+            values = np.full(n_c * n_y, np.nan, dtype=dtype)
+            values[flat] = df[name].to_numpy(dtype=dtype, na_value=np.nan)
+            arrays[name] = pa.array(values)
+        table = pa.table(arrays)
+        part = build / f"source={source}" / PARTITION_FILE
+        part.parent.mkdir(parents=True)
+        with pa.OSFile(str(part), "wb") as sink, pa_ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+
+    axes = {
+        "version": PANEL_VERSION,
+        "key": key,
+        "built_at": datetime.now().isoformat(timespec="seconds"),
+        "countries": countries,
+        "iso_codes": [iso_by_country[c] for c in countries],
+        "years": [year0, year1],
+        "indicators": claimed,
+        "sources": {spec.source_name: digest for spec, digest in inputs},
+    }
+    (build / AXES_FILE).write_text(json.dumps(axes, indent=1), encoding="utf-8")
+
+    previous = current_build(root)
+    _publish(root, build)
+    _prune(root, keep={build, previous})
+    return Panel.open(root)
+
+
+def _publish(root: Path, build: Path) -> None:
+    """Point ``root`` at ``build`` (os.replace of the pointer file is atomic)."""
+    pointer = root / f"{CURRENT_FILE}.{os.getpid()}.tmp"
+    pointer.write_text(build.name, encoding="utf-8")
+    os.replace(pointer, root / CURRENT_FILE)
+
+
+def _prune(root: Path, keep: set[Path]) -> None:
+    """
+    Remove builds other than ``keep`` and files of the unversioned layout.
+
+    The build published before this one is kept: a reader may have resolved the
+    pointer just before the swap and not mapped its partitions yet. Removal
+    errors (a build still mapped on Windows) are ignored until the next build.
+    """
+    for path in root.iterdir():
+        if path in keep:
+            continue
+        if path.is_dir() and (path.name.startswith(BUILD_PREFIX) or path.name.startswith("source=")):
+            shutil.rmtree(path, ignore_errors=True)
+        elif path.name == AXES_FILE:
+            path.unlink(missing_ok=True)
@@ -0,0 +1,556 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+✒ Metadata
+    - Title: Per-Cell Stage Profiler (Terminal Velocity - v1.0)
+    - File Name: profiling.py
+    - Relative Path: computational_core/shared_utils/profiling.py
+    - Artifact Type: library
+    - Version: 1.0.0
+    - Date: 2026-10-18
+    - Update: Sunday, October 18, 2026
+    - Author: Dennis 'dnoice' Smaltz
+    - A.I. Acknowledgement: Anthropic - Claude Opus 4.5
+    - Signature:  ︻デ═—··· 🎯 = Aim Twice, Shoot Once!
+
+✒ Description:
+    Opt-in profiling of pipeline stages, one record per notebook cell. A stage
+    script is split at its jupytext ``# %%`` markers and executed cell by cell in
+    a real ``__main__`` module (exactly as ``python 02_analysis.py`` would run it),
+    measuring wall time, CPU time and peak memory of every cell, optionally with
+    cProfile or a sampling stack profiler. Records are appended to a shared store
+    (evidence_vault/profiles/) and ranked across every mechanism, so the slowest
+    cells of a full-repository build are one command away.
+
+✒ Key Features:
+    - Feature 1: split_cells(): jupytext percent-format cells, titled by the
+                 nearest markdown heading
+    - Feature 2: Wall, CPU, peak RSS and RSS growth per cell; exact traced peak
+                 with trace_memory (tracemalloc)
+    - Feature 3: Modes: "time" (no overhead), "cprofile" (deterministic, top
+                 functions by self time), "sample" (py-spy style stack sampling)
+    - Feature 4: Sampled stacks also written as folded stacks for flame graphs
+    - Feature 5: profile_report(): ranked cells across mechanisms, latest run of
+                 each stage by default
+    - Feature 6: tools/tv_run.py --profile [MODE] profiles every stage it runs
+
+✒ Usage Instructions:
+    Profile one stage from its computations/ folder:
+
+        $ python -m computational_core.shared_utils.profiling run 02_analysis.py --mode sample
+
+    Profile a whole build, then rank the slowest cells:
+
+        $ python tools/tv_run.py --force --profile cprofile
+        $ python -m computational_core.shared_utils.profiling report --top 25
+
+✒ Examples:
+    >>> cells = split_cells(Path("02_analysis.py").read_text())
+    >>> [c.title for c in cells][:3]
+    ['Setup', '1. Load Processed Data', '2. Data Preparation']
+    >>> profiler = StageProfiler(Path("02_analysis.py"), mode="cprofile")
+    >>> profiler.run()[5].hotspots[0]["frame"]
+    >>> profile_report(top=10)[["mechanism", "stage", "title", "wall_s"]]
+
+✒ Other Important Information:
+    - Dependencies:
+        Required: cProfile, pstats, threading, tracemalloc (stdlib), pandas
+        Optional: resource (peak RSS; not on Windows)
+    - Compatible platforms: Linux, Windows, macOS
+    - Store location overridable via TV_PROFILE_DIR; run ids shared with the
+      provenance recorder (TV_RUN_ID)
+    - Performance notes: "time" adds two clock reads per cell; "sample" costs one
+      stack walk per interval (5 ms default); "cprofile" slows Python-heavy cells
+      several-fold, so compare its timings only with each other
+    - Known limitations: Peak RSS is the process high-water mark, so a cell only
+      shows growth when it raises it; the sampler sees the main thread only
+---------
+"""
+
+from __future__ import annotations
+
+import argparse
+import cProfile
+import json
+import os
+import pstats
+import re
+import sys
+import threading
+import time
+import tracemalloc
+import types
+from collections import Counter
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+import pandas as pd
+
+from .provenance import RESOURCE_AVAILABLE, new_run_id
+
+if RESOURCE_AVAILABLE:
+    import resource
+
+DEFAULT_STORE = Path(__file__).resolve().parents[2] / "evidence_vault" / "profiles"
+STORE_ENV_VAR = "TV_PROFILE_DIR"
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+MODES = ("time", "cprofile", "sample")
+DEFAULT_INTERVAL = 0.005
+DEFAULT_HOTSPOTS = 5
+
+CELL_MARKER = re.compile(r"^# %%(.*)$")
+HEADING = re.compile(r"^#\s*#+\s*(.+?)\s*$")
+
+# ru_maxrss is kilobytes on Linux and bytes on macOS
+_RSS_BYTES = 1 if sys.platform == "darwin" else 1024
+
+
+def _peak_rss_mb() -> float | None:
+    """Process high-water mark in MB."""
+    if not RESOURCE_AVAILABLE:
+        return None
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * _RSS_BYTES / (1024 * 1024)
+
+
+def _frame_label(filename: str, line: int, function: str) -> str:
+    """``function (path:line)`` with repository paths shortened."""
+    if filename == "~":  # cProfile's marker for built-in functions
+        return function
+    if filename.startswith("<"):  # <frozen ...>, <string>
+        return f"{function} ({filename}:{line})"
+    path = Path(filename)
+    try:
+        shown = path.resolve().relative_to(REPO_ROOT).as_posix()
+    except (ValueError, OSError):
+        shown = path.name
+    return f"{function} ({shown}:{line})"
+
+
+# =============================================================================
+# CELLS
+# =============================================================================
+
+@dataclass
+class Cell:
+    """One ``# %%`` block of a jupytext percent-format script."""
+    index: int
+    line: int  # 1-based line of the first source line
+    title: str
+    markdown: bool
+    source: str
+
+
+def split_cells(source: str) -> list[Cell]:
+    """
+    Split a percent-format script into cells.
+
+    Text before the first marker is a cell of its own, "(preamble)" (the module
+    docstring, or the whole of a plain script). Code cells are titled by the last markdown heading above them, falling back
+    to their first code line.
+    """
+    lines = source.splitlines(keepends=True)
+    bounds = [0] + [i for i, text in enumerate(lines) if CELL_MARKER.match(text)] + [len(lines)]
+
+    cells, heading = [], ""
+    for start, end in zip(bounds[:-1], bounds[1:]):
+        if start == end:
+            continue
+        marker = CELL_MARKER.match(lines[start])
+        markdown = bool(marker and "[markdown]" in marker.group(1))
+        body = lines[start + 1:end] if marker else lines[start:end]
+        body_start = start + 2 if marker else start + 1
+
+        if markdown:
+            headings = [m.group(1) for m in map(HEADING.match, body) if m]
+            heading = headings[0] if headings else heading
+            title = heading
+        else:
+            code = [t.strip() for t in body if t.strip() and not t.lstrip().startswith("#")]
+            title = heading or ("(preamble)" if not marker else code[0][:60] if code else "(empty)")
+        cells.append(Cell(len(cells), body_start, title, markdown, "".join(body)))
+    return cells
+
+
+# =============================================================================
+# SAMPLING
+# =============================================================================
+
+class StackSampler:
+    """
+    Background thread that samples the main thread's Python stack.
+
+    Stacks are kept as folded strings (root first, ``;``-separated), the format
+    flame-graph tools and py-spy's ``--format raw`` use.
+
+    Args:
+        interval: Seconds between samples
+        stop_files: Source files whose frames end a stack walk (the code driving
+            the sampled work), so stacks start at the profiled code
+    """
+
+    def __init__(self, interval: float = DEFAULT_INTERVAL, stop_files: Sequence[str] = ()):
+        self.interval = interval
+        self.stop_files = set(stop_files)
+        self.target = threading.main_thread().ident
+        self._counts: Counter[str] = Counter()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="tv-stack-sampler", daemon=True)
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.target)
+            stack = []
+            # Walk from the leaf up to the profiler's own frames (the cell runner)
+            while frame is not None and frame.f_code.co_filename not in self.stop_files:
+                code = frame.f_code
+                stack.append(_frame_label(code.co_filename, frame.f_lineno, code.co_name))
+                frame = frame.f_back
+            if stack:
+                with self._lock:
+                    self._counts[";".join(reversed(stack))] += 1
+
+    def start(self) -> StackSampler:
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._thread.join()
+
+    def take(self) -> Counter[str]:
+        """Samples collected since the previous call."""
+        with self._lock:
+            counts, self._counts = self._counts, Counter()
+        return counts
+
+
+def _sample_hotspots(stacks: Counter[str], top: int) -> list[dict]:
+    """Leaf frames with the most samples."""
+    leaves: Counter[str] = Counter()
+    for stack, count in stacks.items():
+        leaves[stack.rsplit(";", 1)[-1]] += count
+    total = sum(leaves.values()) or 1
+    return [{"frame": frame, "samples": count, "share": round(count / total, 3)}
+            for frame, count in leaves.most_common(top)]
+
+
+def _cprofile_hotspots(profiler: cProfile.Profile, top: int) -> list[dict]:
+    """Functions with the most self time."""
+    stats = pstats.Stats(profiler).stats
+    ranked = sorted(stats.items(), key=lambda item: item[1][2], reverse=True)[:top]
+    return [{"frame": _frame_label(*key), "calls": calls, "self_s": round(tottime, 4),
+             "cumulative_s": round(cumtime, 4)}
+            for key, (_, calls, tottime, cumtime, _) in ranked]
+
+
+# =============================================================================
+# EXECUTION
+# =============================================================================
+
+@dataclass
+class CellProfile:
+    """Measurements of one executed cell."""
+    cell: int
+    line: int
+    title: str
+    status: str  # "ok" | "error"
+    wall_s: float
+    cpu_s: float
+    peak_rss_mb: float | None = None
+    rss_growth_mb: float | None = None
+    traced_peak_mb: float | None = None
+    hotspots: list[dict] = field(default_factory=list)
+
+
+@contextmanager
+def _as_main(path: Path) -> Iterator[types.ModuleType]:
+    """A fresh ``__main__`` module for the script, as ``python script.py`` gets."""
+    module = types.ModuleType("__main__")
+    module.__file__ = str(path)
+    module.__builtins__ = __builtins__
+    saved_main, saved_argv = sys.modules["__main__"], sys.argv
+    sys.modules["__main__"] = module
+    sys.argv = [str(path)]
+    try:
+        yield module
+    finally:
+        sys.modules["__main__"], sys.argv = saved_main, saved_argv
+
+
+class StageProfiler:
+    """
+    Executes a stage script cell by cell and measures every code cell.
+
+    Cells run in the current working directory, in one ``__main__`` namespace,
+    compiled with their real line numbers so tracebacks point into the script.
+    An exception stops the run after its cell is recorded as "error"; the cells
+    measured so far stay in ``cells``.
+
+    Args:
+        script: Stage script (jupytext percent format; plain scripts are one cell)
+        mode: "time", "cprofile" or "sample"
+        trace_memory: Also record the exact traced peak per cell (tracemalloc)
+        interval: Sampling interval in seconds for mode "sample"
+        hotspots: Hotspots kept per cell
+
+    Raises:
+        ValueError: Unknown mode
+    """
+
+    def __init__(
+        self,
+        script: Path,
+        mode: str = "time",
+        trace_memory: bool = False,
+        interval: float = DEFAULT_INTERVAL,
+        hotspots: int = DEFAULT_HOTSPOTS,
+    ):
+        if mode not in MODES:
+            raise ValueError(f"Unknown profiling mode {mode!r}; expected one of {MODES}")
+        self.script = Path(script).resolve()
+        self.mode = mode
+        self.trace_memory = trace_memory
+        self.interval = interval
+        self.hotspots = hotspots
+        self.cells: list[CellProfile] = []
+        self.folded: Counter[str] = Counter()  # folded stacks prefixed by cell (mode "sample")
+
+    def run(self) -> list[CellProfile]:
+        """Execute every code cell; returns (and keeps) their profiles."""
+        cells = [c for c in split_cells(self.script.read_text(encoding="utf-8")) if not c.markdown]
+        sampler = (StackSampler(self.interval, stop_files=[__file__]).start()
+                   if self.mode == "sample" else None)
+        if self.trace_memory:
+            tracemalloc.start()
+
+        try:
+            with _as_main(self.script) as main:
+                for cell in cells:
+                    self._run_cell(cell, main, sampler)
+        finally:
+            if sampler:
+                sampler.stop()
+            if self.trace_memory:
+                tracemalloc.stop()
+        return self.cells
+
+    def _run_cell(self, cell: Cell, main: types.ModuleType, sampler: StackSampler | None) -> None:
+        """Execute one cell and append its profile, even if it raises."""
+        code = compile("\n" * (cell.line - 1) + cell.source, str(self.script), "exec")
+        profiler = cProfile.Profile() if self.mode == "cprofile" else None
+        if sampler:
+            sampler.take()
+        if self.trace_memory:
+            tracemalloc.reset_peak()
+        rss_before = _peak_rss_mb()
+        wall, cpu = time.perf_counter(), time.process_time()
+
+        status = "ok"
+        try:
+            if profiler:
+                profiler.runctx(code, main.__dict__, main.__dict__)
+            else:
+                exec(code, main.__dict__)
+        except BaseException:
+            status = "error"
+            raise
+        finally:
+            wall, cpu = time.perf_counter() - wall, time.process_time() - cpu
+            rss_after = _peak_rss_mb()
+            record = CellProfile(
+                cell.index, cell.line, cell.title, status, round(wall, 6), round(cpu, 6),
+                rss_after, None if rss_after is None else rss_after - rss_before,
+                tracemalloc.get_traced_memory()[1] / (1024 * 1024) if self.trace_memory else None,
+            )
+            if profiler:
+                record.hotspots = _cprofile_hotspots(profiler, self.hotspots)
+            elif sampler:
+                stacks = sampler.take()
+                record.hotspots = _sample_hotspots(stacks, self.hotspots)
+                prefix = f"cell {cell.index}: {cell.title}".replace(";", ",")
+                self.folded.update({f"{prefix};{s}": n for s, n in stacks.items()})
+            self.cells.append(record)
+
+
+# =============================================================================
+# STORE
+# =============================================================================
+
+def profile_store(store: Path | None = None) -> Path:
+    """Root of the profile store (TV_PROFILE_DIR or evidence_vault/profiles)."""
+    return Path(store or os.environ.get(STORE_ENV_VAR) or DEFAULT_STORE)
+
+
+def save_profiles(
+    profiles: Sequence[CellProfile],
+    mechanism: str,
+    stage: str,
+    mode: str,
+    run_id: str | None = None,
+    folded: Counter[str] | None = None,
+    store: Path | None = None,
+) -> Path:
+    """
+    Append cell profiles to ``<store>/<mechanism>/<stage>.jsonl``.
+
+    Folded stacks, if any, go next to it as ``<stage>-<run_id>.folded``.
+
+    Returns:
+        JSONL path
+    """
+    run_id = run_id or new_run_id()
+    folder = profile_store(store) / mechanism
+    folder.mkdir(parents=True, exist_ok=True)
+    path = folder / f"{stage}.jsonl"
+    with open(path, "a", encoding="utf-8") as f:
+        for profile in profiles:
+            record = {"run_id": run_id, "mechanism": mechanism, "stage": stage, "mode": mode,
+                      **asdict(profile)}
+            f.write(json.dumps(record) + "\n")
+    if folded:
+        (folder / f"{stage}-{run_id}.folded").write_text(
+            "".join(f"{stack} {count}\n" for stack, count in folded.most_common()),
+            encoding="utf-8",
+        )
+    return path
+
+
+def load_profiles(store: Path | None = None) -> pd.DataFrame:
+    """Every cell profile in the store."""
+    frames = [pd.read_json(p, orient="records", lines=True, dtype=False, precise_float=True)
+              for p in sorted(profile_store(store).rglob("*.jsonl")) if p.stat().st_size]
+    return pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+
+
+def profile_report(
+    store: Path | None = None,
+    run_id: str | None = None,
+    latest: bool = True,
+    top: int | None = 25,
+    sort: str = "wall_s",
+) -> pd.DataFrame:
+    """
+    Cells ranked by cost across every profiled stage.
+
+    Args:
+        store: Profile store root
+        run_id: Only this run (e.g. one tv_run build)
+        latest: Otherwise keep only the most recent run of each stage
+        top: Number of cells to keep (None for all)
+        sort: Ranking column (wall_s, cpu_s, rss_growth_mb, ...)
+
+    Returns:
+        Frame with rank, mechanism, stage, cell, line, title, wall_s, cpu_s,
+        cpu_pct, peak_rss_mb, rss_growth_mb, stage_share_pct and top hotspot
+    """
+    cells = load_profiles(store)
+    if cells.empty:
+        return cells
+    if run_id is not None:
+        cells = cells[cells["run_id"] == run_id]
+    elif latest:
+        newest = cells.groupby(["mechanism", "stage"])["run_id"].transform("max")
+        cells = cells[cells["run_id"] == newest]
+
+    cells = cells.assign(
+        cpu_pct=(cells["cpu_s"] / cells["wall_s"].where(cells["wall_s"] > 0) * 100).round(0),
+        stage_share_pct=(cells["wall_s"]
+                         / cells.groupby(["run_id", "mechanism", "stage"])["wall_s"].transform("sum")
+                         * 100).round(1),
+        hotspot=cells["hotspots"].map(lambda h: h[0]["frame"] if isinstance(h, list) and h else ""),
+    )
+    ranked = cells.sort_values(sort, ascending=False, kind="stable")
+    ranked = ranked.head(top) if top else ranked
+    ranked.insert(0, "rank", range(1, len(ranked) + 1))
+    columns = ["rank", "mechanism", "stage", "cell", "line", "title", "status", "wall_s", "cpu_s",
+               "cpu_pct", "peak_rss_mb", "rss_growth_mb", "stage_share_pct", "hotspot"]
+    return ranked[columns].reset_index(drop=True)
+
+
+def format_report(report: pd.DataFrame) -> str:
+    """Fixed-width text table of a profile report."""
+    if report.empty:
+        return "No cell profiles recorded"
+    lines = [f"{'#':>3}  {'stage':<24} {'cell':<34} {'wall s':>8} {'cpu %':>6} "
+             f"{'+RSS MB':>8}  hotspot"]
+    for row in report.itertuples(index=False):
+        growth = "" if pd.isna(row.rss_growth_mb) else f"{row.rss_growth_mb:.1f}"
+        cpu = "" if pd.isna(row.cpu_pct) else f"{row.cpu_pct:.0f}"
+        label = f"{row.cell}:{row.title}"[:34]
+        lines.append(f"{row.rank:>3}  {row.mechanism + '/' + row.stage:<24} {label:<34} "
+                     f"{row.wall_s:>8.2f} {cpu:>6} {growth:>8}  {row.hotspot[:60]}")
+    return "\n".join(lines)
+
+
+# =============================================================================
+# CLI INTERFACE
+# =============================================================================
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(
+        prog="python -m computational_core.shared_utils.profiling",
+        description="Profile pipeline stages cell by cell and rank the slowest cells",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="Run and profile one stage script")
+    run.add_argument("script", type=Path, help="Stage script, run from its own folder")
+    run.add_argument("--mode", choices=MODES, default="time", help="Profiler (default: time)")
+    run.add_argument("--trace-memory", action="store_true",
+                     help="Record exact per-cell peak allocations (tracemalloc; slower)")
+    run.add_argument("--interval", type=float, default=DEFAULT_INTERVAL,
+                     help="Sampling interval in seconds for --mode sample")
+    run.add_argument("--mechanism", default=None,
+                     help="Mechanism code to file the profile under (default: from the path)")
+    run.add_argument("--stage", default=None, help="Stage name (default: script stem)")
+    run.add_argument("--store", type=Path, default=None, help="Profile store root")
+
+    report = commands.add_parser("report", help="Rank profiled cells across mechanisms")
+    report.add_argument("--top", type=int, default=25, help="Cells to show (default: 25)")
+    report.add_argument("--sort", default="wall_s", help="Ranking column (default: wall_s)")
+    report.add_argument("--run-id", default=None, help="Only this run")
+    report.add_argument("--all-runs", action="store_true", help="Include earlier runs")
+    report.add_argument("--store", type=Path, default=None, help="Profile store root")
+    return parser.parse_args(argv)
+
+
+def _mechanism_from_path(script: Path) -> str:
+    """Mechanism code from a ``<CODE>_<slug>`` folder above the script."""
+    for part in script.resolve().parts[::-1]:
+        match = re.match(r"^([A-F]-\d{2})_", part)
+        if match:
+            return match.group(1)
+    return "local"
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Main entry point."""
+    args = parse_args(argv)
+
+    if args.command == "report":
+        report = profile_report(args.store, args.run_id, not args.all_runs, args.top, args.sort)
+        print(format_report(report))
+        return 0
+
+    mechanism = args.mechanism or _mechanism_from_path(args.script)
+    stage = args.stage or args.script.stem
+    profiler = StageProfiler(args.script, args.mode, args.trace_memory, args.interval)
+    try:
+        profiler.run()
+    except SystemExit as e:
+        return e.code if isinstance(e.code, int) else 1
+    finally:
+        # Partial profiles of a failing stage are still worth keeping
+        if profiler.cells:
+            save_profiles(profiler.cells, mechanism, stage, args.mode,
+                          folded=profiler.folded, store=args.store)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,377 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+✒ Metadata
+    - Title: Structured Provenance Recorder (Terminal Velocity - v1.0)
+    - File Name: provenance.py
+    - Relative Path: computational_core/shared_utils/provenance.py
+    - Artifact Type: library
+    - Version: 1.0.0
+    - Date: 2026-10-18
+    - Update: Sunday, October 18, 2026
+    - Author: Dennis 'dnoice' Smaltz
+    - A.I. Acknowledgement: Anthropic - Claude Opus 4.5
+    - Signature:  ︻デ═—··· 🎯 = Aim Twice, Shoot Once!
+
+✒ Description:
+    One provenance recorder for every pipeline stage. Events are appended to an
+    in-memory buffer of plain tuples stamped with a monotonic clock; wall-clock
+    timestamps, durations and formatting are derived only when the buffer is
+    read or flushed. Each stage run appends its events to a shared store
+    (evidence_vault/provenance/) as JSONL or Parquet, so the provenance of every
+    mechanism can be loaded into one DataFrame instead of re-parsing each stage's
+    JSON summary.
+
+✒ Key Features:
+    - Feature 1: record() costs one clock read, one getrusage() and a tuple append
+    - Feature 2: Per-event elapsed time, duration since the previous event (or of
+                 a step() block), row count and peak RSS
+    - Feature 3: Silent unless verbose (constructor flag or TV_VERBOSE, which
+                 tools/tv_run.py --verbose sets)
+    - Feature 4: Append-only flush per run: <store>/<mechanism>/<stage>.jsonl, or
+                 <store>/<mechanism>/<stage>/<run_id>.parquet
+    - Feature 5: load_provenance(): every flushed event of every stage in one frame
+    - Feature 6: Runs launched together by tv_run share one run_id (TV_RUN_ID)
+
+✒ Usage Instructions:
+    In a stage script:
+
+        provenance = ProvenanceRecorder(MECHANISM_CODE, "02_analysis")
+        provenance.record("Loaded coal emissions", rows=len(emissions_df))
+        with provenance.step("Monte Carlo budget exhaustion") as step:
+            result = monte_carlo_budgets(...)
+            step.rows = len(result.distribution)
+        ...
+        provenance.flush()
+
+    Durations: record() measures the time since the previous event, which is the
+    work done between two log calls; step() measures its own block.
+
+✒ Examples:
+    >>> events = load_provenance()
+    >>> events.groupby(["mechanism", "stage"])["duration_s"].sum().nlargest(10)
+    >>> events[events["run_id"] == events["run_id"].iloc[-1]]
+
+✒ Other Important Information:
+    - Dependencies:
+        Required: json, os, time (stdlib), pandas
+        Optional: pyarrow (Parquet flush), resource (peak RSS; not on Windows)
+    - Compatible platforms: Linux, Windows, macOS
+    - Store location overridable via TV_PROVENANCE_DIR
+    - Known limitations: Peak RSS is the process high-water mark so far, not the
+      memory of a single step; it is missing on Windows
+---------
+"""
+
+from __future__ import annotations
+
+import atexit
+import json
+import os
+import sys
+import time
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pandas as pd
+
+try:
+    import resource
+    RESOURCE_AVAILABLE = True
+except ImportError:
+    RESOURCE_AVAILABLE = False
+
+try:
+    import pyarrow  # noqa: F401
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+DEFAULT_STORE = Path(__file__).resolve().parents[2] / "evidence_vault" / "provenance"
+STORE_ENV_VAR = "TV_PROVENANCE_DIR"
+VERBOSE_ENV_VAR = "TV_VERBOSE"
+RUN_ID_ENV_VAR = "TV_RUN_ID"
+
+FORMATS = ("jsonl", "parquet")
+# Buffer layout: one tuple per event, in this order
+_FIELDS = ("seq", "kind", "event", "notes", "path", "rows", "t_ns", "duration_ns", "peak_rss")
+
+# ru_maxrss is kilobytes on Linux and bytes on macOS
+_RSS_BYTES = 1 if sys.platform == "darwin" else 1024
+
+
+def _peak_rss() -> int | None:
+    """Peak resident set size of this process in bytes."""
+    if not RESOURCE_AVAILABLE:
+        return None
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * _RSS_BYTES
+
+
+def new_run_id(now: datetime | None = None) -> str:
+    """Run identifier: TV_RUN_ID if set, else local timestamp and process id."""
+    if os.environ.get(RUN_ID_ENV_VAR):
+        return os.environ[RUN_ID_ENV_VAR]
+    return f"{(now or datetime.now()):%Y%m%dT%H%M%S}-{os.getpid()}"
+
+
+def verbose_from_env() -> bool:
+    """Whether TV_VERBOSE asks for events to be echoed."""
+    return os.environ.get(VERBOSE_ENV_VAR, "").lower() in {"1", "true", "yes", "on"}
+
+
+# =============================================================================
+# RECORDER
+# =============================================================================
+
+@dataclass
+class Step:
+    """Mutable handle yielded by ProvenanceRecorder.step()."""
+    notes: str = ""
+    rows: int | None = None
+    path: str | None = None
+
+
+class ProvenanceRecorder:
+    """
+    Buffered, monotonic-clock event log for one run of one pipeline stage.
+
+    Args:
+        mechanism: Mechanism code (e.g. "A-01")
+        stage: Stage name (e.g. "01_intake")
+        store: Root of the provenance store (default: TV_PROVENANCE_DIR or
+            evidence_vault/provenance)
+        verbose: Echo each event as it is recorded (default: TV_VERBOSE)
+        fmt: Flush format, "jsonl" or "parquet"
+        flush_at_exit: Flush unflushed events when the interpreter exits, so a
+            failing stage still leaves its trail
+    """
+
+    def __init__(
+        self,
+        mechanism: str,
+        stage: str,
+        store: Path | None = None,
+        verbose: bool | None = None,
+        fmt: str = "jsonl",
+        flush_at_exit: bool = True,
+    ):
+        if fmt not in FORMATS:
+            raise ValueError(f"Unknown provenance format {fmt!r}; expected one of {FORMATS}")
+        self.mechanism = mechanism
+        self.stage = stage
+        self.store = Path(store or os.environ.get(STORE_ENV_VAR) or DEFAULT_STORE)
+        self.verbose = verbose_from_env() if verbose is None else verbose
+        self.fmt = fmt
+
+        self.started_at = datetime.now()
+        self.run_id = new_run_id(self.started_at)
+        self._t0 = time.perf_counter_ns()
+        self._last = self._t0
+        self._events: list[tuple] = []
+        self._flushed = 0
+
+        if flush_at_exit:
+            atexit.register(self._flush_at_exit)
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    # -------------------------------------------------------------------------
+    # Recording
+    # -------------------------------------------------------------------------
+
+    def record(
+        self,
+        event: str,
+        notes: str = "",
+        rows: int | None = None,
+        kind: str = "action",
+        path: str | Path | None = None,
+        duration_ns: int | None = None,
+    ) -> None:
+        """
+        Append one event.
+
+        Args:
+            event: What happened ("Loaded coal emissions")
+            notes: Free-text detail
+            rows: Row count of the data the event produced, if any
+            kind: Event category ("action", "figure", "table", "error", ...)
+            path: File the event wrote, if any
+            duration_ns: Explicit duration; default is the time since the previous event
+        """
+        now = time.perf_counter_ns()
+        duration = now - self._last if duration_ns is None else duration_ns
+        self._last = now
+        self._events.append((
+            len(self._events), kind, event, notes,
+            None if path is None else str(path),
+            None if rows is None else int(rows),
+            now - self._t0, duration, _peak_rss(),
+        ))
+        if self.verbose:
+            print(f"[{(now - self._t0) / 1e9:8.2f}s] {event}: {notes or path or ''}", flush=True)
+
+    @contextmanager
+    def step(self, event: str, kind: str = "action") -> Iterator[Step]:
+        """
+        Record ``event`` with the duration of the ``with`` block.
+
+        The yielded Step lets the block attach notes, rows and a path.
+        """
+        handle = Step()
+        start = time.perf_counter_ns()
+        try:
+            yield handle
+        finally:
+            self.record(event, handle.notes, handle.rows, kind, handle.path,
+                        duration_ns=time.perf_counter_ns() - start)
+
+    # -------------------------------------------------------------------------
+    # Reading
+    # -------------------------------------------------------------------------
+
+    def entries(self, kinds: Sequence[str] | None = None) -> list[dict]:
+        """
+        Events as JSON-ready dicts (ISO timestamp, seconds, megabytes).
+
+        Args:
+            kinds: Keep only these event kinds (default: all)
+        """
+        entries = []
+        for seq, kind, event, notes, path, rows, t_ns, duration_ns, rss in self._events:
+            if kinds is not None and kind not in kinds:
+                continue
+            entry = {
+                "seq": seq,
+                "timestamp": (self.started_at + timedelta(microseconds=t_ns // 1000)).isoformat(),
+                "kind": kind,
+                "event": event,
+                "notes": notes,
+                "elapsed_s": round(t_ns / 1e9, 6),
+                "duration_s": round(duration_ns / 1e9, 6),
+            }
+            if path is not None:
+                entry["path"] = path
+            if rows is not None:
+                entry["rows"] = rows
+            if rss is not None:
+                entry["peak_rss_mb"] = round(rss / (1024 * 1024), 1)
+            entries.append(entry)
+        return entries
+
+    def to_frame(self, start: int = 0) -> pd.DataFrame:
+        """Events from ``start`` on as a frame with run and stage identifiers."""
+        events = self._events[start:]
+        frame = pd.DataFrame(events, columns=list(_FIELDS))
+        timestamps = pd.Timestamp(self.started_at) + pd.to_timedelta(frame["t_ns"], unit="ns")
+        return pd.DataFrame({
+            "run_id": self.run_id,
+            "mechanism": self.mechanism,
+            "stage": self.stage,
+            "seq": frame["seq"].astype("int64"),
+            "timestamp": timestamps.dt.strftime("%Y-%m-%dT%H:%M:%S.%f"),
+            "kind": frame["kind"],
+            "event": frame["event"],
+            "notes": frame["notes"],
+            "path": frame["path"],
+            "rows": pd.array(frame["rows"], dtype="Int64"),
+            "elapsed_s": frame["t_ns"] / 1e9,
+            "duration_s": frame["duration_ns"] / 1e9,
+            "peak_rss_mb": pd.array(frame["peak_rss"], dtype="Float64") / (1024 * 1024),
+        })
+
+    @property
+    def peak_rss_mb(self) -> float | None:
+        """Process high-water mark now, in MB."""
+        rss = _peak_rss()
+        return None if rss is None else rss / (1024 * 1024)
+
+    # -------------------------------------------------------------------------
+    # Flushing
+    # -------------------------------------------------------------------------
+
+    @property
+    def path(self) -> Path:
+        """File this run flushes to."""
+        base = self.store / self.mechanism
+        if self.fmt == "parquet":
+            return base / self.stage / f"{self.run_id}.parquet"
+        return base / f"{self.stage}.jsonl"
+
+    def flush(self) -> Path | None:
+        """
+        Append events recorded since the last flush to the store.
+
+        JSONL flushes append lines to one file per stage; Parquet flushes rewrite
+        this run's own file with every event so far.
+
+        Returns:
+            Path written, or None if there was nothing new
+
+        Raises:
+            ImportError: Parquet requested without pyarrow
+        """
+        if self._flushed == len(self._events):
+            return None
+        path = self.path
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        if self.fmt == "parquet":
+            if not PYARROW_AVAILABLE:
+                raise ImportError("Parquet provenance needs pyarrow (pip install terminal-velocity[full])")
+            self.to_frame().to_parquet(path, index=False)
+        else:
+            lines = self.to_frame(self._flushed).to_json(orient="records", lines=True)
+            with open(path, "a", encoding="utf-8") as f:
+                f.write(lines if lines.endswith("\n") else lines + "\n")
+
+        self._flushed = len(self._events)
+        return path
+
+    def _flush_at_exit(self) -> None:
+        """atexit hook: never let a provenance write mask the stage's own exit."""
+        try:
+            self.flush()
+        except Exception as e:  # noqa: BLE001
+            print(f"Provenance flush failed: {e}", file=sys.stderr)
+
+
+# =============================================================================
+# QUERYING
+# =============================================================================
+
+def load_provenance(
+    store: Path | None = None,
+    mechanisms: Sequence[str] | None = None,
+) -> pd.DataFrame:
+    """
+    Every flushed event in the store, JSONL and Parquet alike.
+
+    Args:
+        store: Provenance store root (default: TV_PROVENANCE_DIR or
+            evidence_vault/provenance)
+        mechanisms: Restrict to these mechanism codes
+
+    Returns:
+        Frame with run_id, mechanism, stage, seq, timestamp, kind, event, notes,
+        path, rows, elapsed_s, duration_s and peak_rss_mb, ordered by timestamp
+    """
+    store = Path(store or os.environ.get(STORE_ENV_VAR) or DEFAULT_STORE)
+    folders = [store / code for code in mechanisms] if mechanisms else [store]
+
+    frames = []
+    for folder in folders:
+        frames += [pd.read_json(p, orient="records", lines=True, dtype=False)
+                   for p in sorted(folder.rglob("*.jsonl")) if p.stat().st_size]
+        frames += [pd.read_parquet(p) for p in sorted(folder.rglob("*.parquet"))]
+    if not frames:
+        return pd.DataFrame(columns=["run_id", "mechanism", "stage", "seq", "timestamp", "kind",
+                                     "event", "notes", "path", "rows", "elapsed_s",
+                                     "duration_s", "peak_rss_mb"])
+    events = pd.concat(frames, ignore_index=True)
+    events["rows"] = events["rows"].astype("Int64")
+    return events.sort_values(["timestamp", "seq"], kind="stable").reset_index(drop=True)
@@ -0,0 +1,404 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+✒ Metadata
+    - Title: Content-Addressed Raw Data Store (Terminal Velocity - v1.0)
+    - File Name: raw_store.py
+    - Relative Path: computational_core/shared_utils/raw_store.py
+    - Artifact Type: library
+    - Version: 1.1.1
+    - Date: 2026-10-18
+    - Update: Sunday, October 18, 2026
+    - Author: Dennis 'dnoice' Smaltz
+    - A.I. Acknowledgement: Anthropic - Claude Opus 4.5
+    - Signature:  ︻デ═—··· 🎯 = Aim Twice, Shoot Once!
+
+✒ Description:
+    Shared, content-addressed storage for raw source files in evidence_vault/raw_data.
+    Every downloaded file is stored once, keyed by its SHA-256, and an index maps each
+    DATA_SOURCES URL to its blob. Mechanisms get hardlinks (or symlinks) in their own
+    datasets/raw/ folder instead of private copies and private downloads.
+
+✒ Key Features:
+    - Feature 1: Blobs stored once at objects/<ab>/<sha256>, read-only
+    - Feature 2: URL → blob index (one small JSON file per URL, safe for parallel writers)
+    - Feature 3: Hardlink → symlink → copy fallback when materializing into a mechanism
+    - Feature 4: Per-URL lock so concurrent intakes download a shared source only once
+    - Feature 5: Adoption of existing per-mechanism raw copies into the store
+    - Feature 6: Store location overridable via TV_RAW_STORE for tests and CI
+    - Feature 7: Conditional refresh (ETag / Last-Modified) and resumable, checksum-
+      verified downloads via shared_utils.fetch
+
+✒ Usage Instructions:
+    From an intake script:
+
+        store = RawDataStore()
+        entry = store.fetch(config["url"])
+        store.materialize(entry.sha256, RAW_DATA_DIR / config["local_file"])
+
+    Re-check upstream (one conditional request; no transfer if unchanged):
+
+        entry = store.refresh(config["url"])
+
+✒ Examples:
+    >>> store = RawDataStore()
+    >>> entry = store.lookup("https://raw.githubusercontent.com/owid/co2-data/master/owid-co2-data.csv")
+    >>> store.blob_path(entry.sha256)
+    PosixPath('.../evidence_vault/raw_data/objects/3f/3f9a...')
+    >>> store.adopt(url, Path("../datasets/raw/owid_co2_data.csv"))
+
+✒ Other Important Information:
+    - Dependencies:
+        Required: hashlib, json, os, shutil (stdlib)
+        Optional: requests (downloads)
+    - Compatible platforms: Linux, Windows, macOS
+    - Storage layout:
+        raw_data/objects/<ab>/<sha256>   Blob contents (read-only)
+        raw_data/index/<url-hash>.json   URL → sha256, size, provenance
+        raw_data/tmp/                    In-flight (resumable) downloads and locks
+    - Known limitations: Hardlinks require the store and the mechanism to share a
+      filesystem; otherwise a symlink (or, on Windows without privileges, a copy)
+      is used
+---------
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+import stat
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from .fingerprint import file_digest
+
+if TYPE_CHECKING:
+    from .fetch import FetchResult
+
+DEFAULT_STORE = Path(__file__).resolve().parents[2] / "evidence_vault" / "raw_data"
+STORE_ENV_VAR = "TV_RAW_STORE"
+
+LOCK_POLL_SECONDS = 0.25
+LOCK_STALE_SECONDS = 3600
+
+
+@contextmanager
+def file_lock(lock_path: Path) -> Iterator[None]:
+    """
+    Cross-process lock: ``lock_path`` created with O_EXCL, removed on exit.
+
+    A lock file older than LOCK_STALE_SECONDS (a crashed holder) is broken.
+    """
+    lock_path.parent.mkdir(parents=True, exist_ok=True)
+    while True:
+        try:
+            fd = os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            os.close(fd)
+            break
+        except FileExistsError:
+            try:
+                if time.time() - lock_path.stat().st_mtime > LOCK_STALE_SECONDS:
+                    lock_path.unlink()
+                    continue
+            except FileNotFoundError:
+                continue
+            time.sleep(LOCK_POLL_SECONDS)
+    try:
+        yield
+    finally:
+        lock_path.unlink(missing_ok=True)
+
+
+@dataclass
+class IndexEntry:
+    """Index record linking a source URL to its stored blob."""
+
+    url: str
+    sha256: str
+    size: int
+    stored_at: str
+    source_name: str = ""
+    etag: str = ""
+    last_modified: str = ""
+    checked_at: str = ""
+
+
+class RawDataStore:
+    """Content-addressed blob store with a URL index."""
+
+    def __init__(self, root: Path | None = None):
+        self.root = Path(root or os.environ.get(STORE_ENV_VAR) or DEFAULT_STORE)
+        self.objects_dir = self.root / "objects"
+        self.index_dir = self.root / "index"
+        self.tmp_dir = self.root / "tmp"
+
+    # -------------------------------------------------------------------------
+    # Paths
+    # -------------------------------------------------------------------------
+
+    def blob_path(self, digest: str) -> Path:
+        """Location of a blob by its SHA-256."""
+        return self.objects_dir / digest[:2] / digest
+
+    def index_path(self, url: str) -> Path:
+        """Location of the index record for a URL."""
+        key = hashlib.sha256(url.encode("utf-8")).hexdigest()[:32]
+        return self.index_dir / f"{key}.json"
+
+    def has_blob(self, digest: str) -> bool:
+        """True if the blob is present in the store."""
+        return self.blob_path(digest).is_file()
+
+    # -------------------------------------------------------------------------
+    # Index
+    # -------------------------------------------------------------------------
+
+    def lookup(self, url: str) -> IndexEntry | None:
+        """
+        Find the stored blob for a URL.
+
+        Args:
+            url: Source URL as written in DATA_SOURCES
+
+        Returns:
+            IndexEntry, or None if the URL was never stored or its blob is missing
+        """
+        try:
+            data = json.loads(self.index_path(url).read_text(encoding="utf-8"))
+            entry = IndexEntry(**data)
+        except (OSError, ValueError, TypeError):
+            return None
+        return entry if self.has_blob(entry.sha256) else None
+
+    def record(
+        self,
+        url: str,
+        digest: str,
+        source_name: str = "",
+        etag: str | None = None,
+        last_modified: str | None = None,
+    ) -> IndexEntry:
+        """Write (or replace) the index record for a URL."""
+        now = datetime.now().isoformat(timespec="seconds")
+        entry = IndexEntry(
+            url=url,
+            sha256=digest,
+            size=self.blob_path(digest).stat().st_size,
+            stored_at=now,
+            source_name=source_name,
+            etag=etag or "",
+            last_modified=last_modified or "",
+            checked_at=now,
+        )
+        self._write_entry(entry)
+        return entry
+
+    def _write_entry(self, entry: IndexEntry) -> None:
+        """Atomically write an index record."""
+        path = self.index_path(entry.url)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(path.name + f".{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(asdict(entry), indent=2), encoding="utf-8")
+        os.replace(tmp, path)
+
+    def entries(self) -> list[IndexEntry]:
+        """All index records whose blobs are present."""
+        found = []
+        for path in sorted(self.index_dir.glob("*.json")):
+            try:
+                entry = IndexEntry(**json.loads(path.read_text(encoding="utf-8")))
+            except (OSError, ValueError, TypeError):
+                continue
+            if self.has_blob(entry.sha256):
+                found.append(entry)
+        return found
+
+    # -------------------------------------------------------------------------
+    # Blobs
+    # -------------------------------------------------------------------------
+
+    def put_file(self, path: Path, move: bool = False) -> str:
+        """
+        Add a file to the store.
+
+        Args:
+            path: File to store
+            move: Move the file into the store instead of copying it
+
+        Returns:
+            SHA-256 of the stored blob
+        """
+        digest = file_digest(path)
+        blob = self.blob_path(digest)
+        if blob.is_file():
+            if move:
+                path.unlink()
+            return digest
+
+        blob.parent.mkdir(parents=True, exist_ok=True)
+        self.tmp_dir.mkdir(parents=True, exist_ok=True)
+        staging = self.tmp_dir / f"{digest}.{os.getpid()}.staging"
+        if move:
+            shutil.move(str(path), staging)
+        else:
+            shutil.copyfile(path, staging)
+        os.chmod(staging, stat.S_IRUSR | stat.S_IRGRP | stat.S_IROTH)
+        os.replace(staging, blob)
+        return digest
+
+    def materialize(self, digest: str, dest: Path) -> Path:
+        """
+        Expose a blob at ``dest`` without copying it, if the filesystem allows.
+
+        Tries a hardlink, then a symlink, then falls back to a plain copy.
+
+        Args:
+            digest: SHA-256 of the blob
+            dest: Target path inside a mechanism's datasets/raw/
+
+        Returns:
+            The destination path
+        """
+        blob = self.blob_path(digest)
+        if not blob.is_file():
+            raise FileNotFoundError(f"Blob {digest} not in store {self.root}")
+
+        dest = Path(dest)
+        if dest.exists() or dest.is_symlink():
+            if dest.exists() and os.path.samefile(dest, blob):
+                return dest
+            dest.unlink()
+        dest.parent.mkdir(parents=True, exist_ok=True)
+
+        try:
+            os.link(blob, dest)
+        except OSError:
+            try:
+                os.symlink(blob, dest)
+            except OSError:
+                shutil.copyfile(blob, dest)
+        return dest
+
+    def adopt(self, url: str, path: Path, source_name: str = "") -> IndexEntry:
+        """
+        Move an existing per-mechanism raw copy into the store and link it back.
+
+        Args:
+            url: Source URL the file was downloaded from
+            path: Existing local file
+            source_name: Optional DATA_SOURCES key for the index
+
+        Returns:
+            IndexEntry for the adopted blob
+        """
+        digest = self.put_file(path)
+        entry = self.record(url, digest, source_name)
+        self.materialize(digest, path)
+        return entry
+
+    # -------------------------------------------------------------------------
+    # Downloads
+    # -------------------------------------------------------------------------
+
+    @contextmanager
+    def lock(self, url: str) -> Iterator[None]:
+        """Cross-process lock for one URL (lock file created with O_EXCL)."""
+        with file_lock(self.tmp_dir / (self.index_path(url).stem + ".lock")):
+            yield
+
+    def download(
+        self,
+        url: str,
+        previous: IndexEntry | None = None,
+        expected_sha256: str | None = None,
+        session=None,
+        progress: Callable[[int], None] | None = None,
+    ) -> FetchResult:
+        """
+        Stream a URL into the store, revalidating against a previous entry.
+
+        Interrupted transfers leave a partial file in tmp/ that the next call
+        resumes with a Range request.
+
+        Args:
+            url: Source URL
+            previous: Existing index entry whose validators make the request conditional
+            expected_sha256: Optional checksum pin from DATA_SOURCES
+            session: Optional requests.Session for connection reuse
+            progress: Optional callable(bytes_in_chunk) invoked while streaming
+
+        Returns:
+            FetchResult; for new content ``sha256`` names the stored blob
+        """
+        from .fetch import fetch_url
+
+        self.tmp_dir.mkdir(parents=True, exist_ok=True)
+        target = self.tmp_dir / (self.index_path(url).stem + ".download")
+        result = fetch_url(
+            url,
+            target,
+            etag=previous.etag if previous else None,
+            last_modified=previous.last_modified if previous else None,
+            expected_sha256=expected_sha256,
+            session=session,
+            progress=progress,
+        )
+        if result.status != "not_modified":
+            self.put_file(target, move=True)
+        return result
+
+    def fetch(
+        self,
+        url: str,
+        source_name: str = "",
+        force: bool = False,
+        expected_sha256: str | None = None,
+        session=None,
+        progress: Callable[[int], None] | None = None,
+    ) -> IndexEntry:
+        """
+        Return the stored blob for a URL, downloading it once if needed.
+
+        Args:
+            url: Source URL
+            source_name: Optional DATA_SOURCES key for the index
+            force: Re-check upstream even if the URL is already stored; the
+                request is conditional, so unchanged sources are not re-sent
+            expected_sha256: Optional checksum pin from DATA_SOURCES
+            session: Optional requests.Session for connection reuse
+            progress: Optional callable(bytes_in_chunk) invoked while streaming
+
+        Returns:
+            IndexEntry for the stored blob
+        """
+        if not force:
+            entry = self.lookup(url)
+            if entry:
+                return entry
+
+        with self.lock(url):
+            # Another process may have finished the download while we waited
+            entry = self.lookup(url)
+            if entry is not None and not force:
+                return entry
+
+            result = self.download(url, entry, expected_sha256, session, progress)
+            if result.status == "not_modified":
+                entry.checked_at = datetime.now().isoformat(timespec="seconds")
+                self._write_entry(entry)
+                return entry
+
+            if not source_name and entry is not None:
+                source_name = entry.source_name
+            return self.record(url, result.sha256, source_name, result.etag, result.last_modified)
+
+    def refresh(self, url: str, source_name: str = "", **kwargs) -> IndexEntry:
+        """Conditionally re-check a stored URL upstream (see fetch(force=True))."""
+        return self.fetch(url, source_name, force=True, **kwargs)
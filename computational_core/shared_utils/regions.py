@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+✒ Metadata
+    - Title: Region & Aggregate Registry (Terminal Velocity - v1.0)
+    - File Name: regions.py
+    - Relative Path: computational_core/shared_utils/regions.py
+    - Artifact Type: library
+    - Version: 1.1.0
+    - Date: 2026-10-18
+    - Update: Sunday, October 18, 2026
+    - Author: Dennis 'dnoice' Smaltz
+    - A.I. Acknowledgement: Anthropic - Claude Opus 4.5
+    - Signature:  ︻デ═—··· 🎯 = Aim Twice, Shoot Once!
+
+✒ Description:
+    One registry of country groupings for every mechanism. Classification schemes
+    (continent, World Bank income group, EU-27, OECD, plus any scheme a mechanism
+    defines) are keyed by ISO 3166-1 alpha-3 code and compiled to integer codes
+    with sorted categories. Tagging a panel is a categorical map over its distinct
+    ISO codes; aggregating it is a single groupby. The same registry also tells
+    countries from OWID aggregate rows (World, continents, income groups).
+
+✒ Key Features:
+    - Feature 1: Built-in schemes loaded from regions.yaml (continent, income, eu27, oecd)
+    - Feature 2: Mechanism-specific schemes via RegionRegistry.define()
+    - Feature 3: Integer-coded lookup; tagging maps categories, not rows
+    - Feature 4: aggregate(): tag + one groupby over any value columns
+    - Feature 5: is_country(): ISO-based replacement for hand-typed aggregate lists
+    - Feature 6: Registered OWID_ entities (USSR, Yugoslavia, ...) count as
+                 countries, with former states flagged as historical
+
+✒ Usage Instructions:
+    Use the process-wide registry; schemes are compiled once:
+
+        registry = region_registry()
+        df["continent"] = registry.tag(df, "continent")
+        by_income = registry.aggregate(df, "income", ["co2", "population"])
+
+✒ Examples:
+    >>> registry = region_registry()
+    >>> registry.scheme("oecd").groups
+    ['Non-OECD', 'OECD']
+    >>> countries = df[registry.is_country(df["iso_code"])]
+    >>> registry.define("a01_regions", {"China": ["CHN"], "India": ["IND"]}, default="Other")
+
+✒ Other Important Information:
+    - Dependencies:
+        Required: numpy, pandas, pyyaml
+    - Compatible platforms: Linux, Windows, macOS
+    - Membership data: regions.yaml (World Bank income groups as of FY2025)
+    - Known limitations: Rows without an ISO code fall into the scheme's default
+      group, as do registered entities (former states included); memberships
+      are current, not historical
+---------
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import yaml
+
+REGISTRY_PATH = Path(__file__).with_name("regions.yaml")
+
+
+# =============================================================================
+# SCHEMES
+# =============================================================================
+
+@dataclass
+class RegionScheme:
+    """A classification of ISO codes into named groups, compiled to integer codes."""
+    name: str
+    groups: list[str]
+    default: str
+    lookup: pd.Series = field(repr=False)  # ISO code -> group code
+
+    @classmethod
+    def compile(cls, name: str, members: Mapping[str, Sequence[str]], default: str) -> RegionScheme:
+        """
+        Compile ``{group: [iso, ...]}`` into a sorted-category scheme.
+
+        Raises:
+            ValueError: An ISO code is listed in more than one group
+        """
+        groups = sorted(set(members) | {default})
+        position = {group: code for code, group in enumerate(groups)}
+        lookup = {}
+        for group, codes in members.items():
+            for iso in codes:
+                if iso in lookup and lookup[iso] != position[group]:
+                    raise ValueError(f"Scheme {name!r}: {iso} is listed in two groups")
+                lookup[iso] = position[group]
+        series = pd.Series(lookup, dtype=np.int16).sort_index()
+        return cls(name, groups, default, series)
+
+    @property
+    def default_code(self) -> int:
+        """Integer code of the default group."""
+        return self.groups.index(self.default)
+
+    def members(self, group: str) -> list[str]:
+        """ISO codes explicitly assigned to ``group``."""
+        return self.lookup.index[self.lookup == self.groups.index(group)].tolist()
+
+    def codes(self, iso: pd.Series | Sequence[str]) -> np.ndarray:
+        """
+        Integer group code for every ISO code.
+
+        The lookup runs once per distinct code (on the categories of a categorical
+        column), then is expanded to rows with a take.
+        """
+        iso = pd.Series(iso) if not isinstance(iso, pd.Series) else iso
+        categorical = iso.astype("category") if iso.dtype != "category" else iso
+        category_codes = (self.lookup.reindex(categorical.cat.categories.astype(str))
+                          .fillna(self.default_code).to_numpy(dtype=np.int16))
+        row_codes = categorical.cat.codes.to_numpy()
+        return np.where(row_codes >= 0, category_codes[row_codes], self.default_code).astype(np.int16)
+
+    def tag(self, iso: pd.Series | Sequence[str]) -> pd.Categorical:
+        """Group name for every ISO code, as a Categorical with sorted categories."""
+        return pd.Categorical.from_codes(self.codes(iso), categories=self.groups)
+
+
+# =============================================================================
+# REGISTRY
+# =============================================================================
+
+class RegionRegistry:
+    """
+    Named RegionSchemes plus the aggregate-entity rule.
+
+    Args:
+        schemes: Compiled schemes by name
+        aggregate_prefix: Code prefix of aggregate entities (OWID_WRL, OWID_EU27, ...)
+        entities: Countries with prefixed codes outside every scheme,
+            ``{code: {"name": ..., "historical": bool, "until": last year}}``
+    """
+
+    def __init__(
+        self,
+        schemes: Mapping[str, RegionScheme],
+        aggregate_prefix: str = "OWID_",
+        entities: Mapping[str, Mapping] | None = None,
+    ):
+        self.schemes = dict(schemes)
+        self.aggregate_prefix = aggregate_prefix
+        self.entities = dict(entities or {})
+
+    @classmethod
+    def load(cls, path: Path = REGISTRY_PATH) -> RegionRegistry:
+        """Load and compile the schemes in a registry YAML file."""
+        config = yaml.safe_load(Path(path).read_text(encoding="utf-8"))
+        schemes = {
+            name: RegionScheme.compile(name, spec["groups"], spec.get("default", "Other"))
+            for name, spec in config["schemes"].items()
+        }
+        return cls(schemes, config.get("aggregate_prefix", "OWID_"), config.get("entities"))
+
+    @property
+    def known_codes(self) -> set[str]:
+        """Every ISO code listed in any scheme."""
+        return set().union(*(scheme.lookup.index for scheme in self.schemes.values()))
+
+    @property
+    def historical_codes(self) -> set[str]:
+        """Registered entities flagged as former states."""
+        return {code for code, spec in self.entities.items() if spec.get("historical")}
+
+    def scheme(self, name: str) -> RegionScheme:
+        """
+        Look up a scheme by name.
+
+        Raises:
+            KeyError: Unknown scheme (lists the available ones)
+        """
+        if name not in self.schemes:
+            raise KeyError(f"Unknown region scheme {name!r}; available: {sorted(self.schemes)}")
+        return self.schemes[name]
+
+    def define(
+        self,
+        name: str,
+        members: Mapping[str, Sequence[str]],
+        default: str = "Other",
+    ) -> RegionScheme:
+        """
+        Register a mechanism-specific scheme ``{group: [iso, ...]}``.
+
+        Returns:
+            The compiled scheme (also available as ``scheme(name)``)
+        """
+        self.schemes[name] = RegionScheme.compile(name, members, default)
+        return self.schemes[name]
+
+    def is_country(self, iso: pd.Series, historical: bool = True) -> pd.Series:
+        """
+        True for rows of individual countries.
+
+        A row is a country when it has a code that is registered (in a scheme or
+        as an entity) or does not carry the aggregate prefix.
+
+        Args:
+            iso: ISO code per row (missing for most OWID aggregates)
+            historical: Also count former states (USSR, Yugoslavia, ...)
+        """
+        known = self.known_codes | set(self.entities)
+        codes = iso.astype("category") if iso.dtype != "category" else iso
+        categories = codes.cat.categories.astype(str)
+        country = categories.isin(known) | ~categories.str.startswith(self.aggregate_prefix)
+        if not historical:
+            country &= ~categories.isin(self.historical_codes)
+        row_codes = codes.cat.codes.to_numpy()
+        flags = np.where(row_codes >= 0, np.asarray(country)[row_codes], False)
+        return pd.Series(flags, index=iso.index)
+
+    def tag(self, df: pd.DataFrame, scheme: str, iso: str = "iso_code") -> pd.Categorical:
+        """Group of every row of ``df`` under ``scheme``."""
+        return self.scheme(scheme).tag(df[iso])
+
+    def aggregate(
+        self,
+        df: pd.DataFrame,
+        scheme: str,
+        values: Sequence[str],
+        by: Sequence[str] = ("year",),
+        iso: str = "iso_code",
+        how: str = "sum",
+        column: str | None = None,
+    ) -> pd.DataFrame:
+        """
+        Aggregate value columns by scheme group (and ``by``) in one groupby.
+
+        Args:
+            df: Long data with an ISO column
+            scheme: Scheme name
+            values: Columns to aggregate
+            by: Additional grouping columns (e.g. year)
+            iso: ISO code column
+            how: Aggregation passed to ``groupby().agg``
+            column: Name of the group column in the result (default: scheme name)
+
+        Returns:
+            Frame with the group column, ``by`` columns and aggregated values, for
+            observed groups only, sorted by group then ``by``
+        """
+        column = column or scheme
+        tagged = df[[*by, *values]].assign(**{column: self.tag(df, scheme, iso)})
+        return (tagged
+                .groupby([column, *by], observed=True)[list(values)]
+                .agg(how)
+                .reset_index())
+
+
+@lru_cache(maxsize=1)
+def region_registry() -> RegionRegistry:
+    """Process-wide registry loaded from regions.yaml."""
+    return RegionRegistry.load()
@@ -0,0 +1,525 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+✒ Metadata
+    - Title: Parallel Headless Figure Rendering (Terminal Velocity - v1.0)
+    - File Name: rendering.py
+    - Relative Path: computational_core/shared_utils/rendering.py
+    - Artifact Type: library
+    - Version: 1.3.4
+    - Date: 2026-10-18
+    - Update: Sunday, October 18, 2026
+    - Author: Dennis 'dnoice' Smaltz
+    - A.I. Acknowledgement: Anthropic - Claude Opus 4.5
+    - Signature:  ︻デ═—··· 🎯 = Aim Twice, Shoot Once!
+
+✒ Description:
+    Renders figures declared as specs instead of drawn one after another through
+    pyplot. A spec names a builder function, the data slice it draws and the
+    output settings; render_figures() draws every spec on its own
+    object-oriented Figure attached to an Agg canvas (no pyplot state, no GUI
+    backend) and spreads the specs over a process pool. Each result carries the
+    figure's render time, so output stages can report which figures are slow.
+
+    Every spec is fingerprinted from the exact data slice it plots, its style
+    parameters, its builder's source, the source of the builder's module and of
+    viz_utils, the palette values and the matplotlib version. Figures whose
+    fingerprint matches the previous output manifest (and whose files exist)
+    are not rendered again.
+
+    Each figure is drawn once. The full-resolution PNG and the thumbnail are
+    cut from that one Agg canvas buffer (tight-cropped, then downsampled);
+    vector masters (SVG / PDF) are written from the same Figure object, so
+    reports pick the variant they need instead of re-rendering.
+
+✒ Key Features:
+    - Feature 1: FigureSpec — builder, data slice, path, size, DPI, face colour
+    - Feature 2: matplotlib.figure.Figure + FigureCanvasAgg; no pyplot globals,
+                 nothing to close, safe in any worker
+    - Feature 3: Process pool sized to the cores (or TV_RENDER_WORKERS, which
+                 tv_run sets so concurrent mechanisms share the machine)
+    - Feature 4: Per-figure wall and CPU time, worker PID and file size
+    - Feature 5: A failing figure does not stop the others; failures are raised
+                 together after the pool drains
+    - Feature 6: Content fingerprints (data slice, style, builder and module
+                 source, palette, matplotlib version, RENDER_VERSION); unchanged
+                 figures are skipped
+    - Feature 7: Per-spec rcParams (``style``) applied at figure creation
+    - Feature 8: Variants per figure: vector masters (vector/), full PNG and a
+                 PNG / WebP thumbnail (thumbnails/) from one canvas draw
+
+✒ Usage Instructions:
+    Builders take the Figure, its Axes and the spec's data as keyword arguments:
+
+        def build_trend(fig, ax, world):
+            ax.plot(world["year"], world["coal_co2"] / 1000)
+
+        specs = [FigureSpec("fig_01", build_trend, FIGURES_DIR / "fig_01.png",
+                            data={"world": world_df[["year", "coal_co2"]]})]
+        for result in render_figures(specs):
+            print(result.name, f"{result.seconds:.2f}s")
+
+    Skip figures that are unchanged since the last run:
+
+        previous = manifest_fingerprints(FIGURES_DIR / "output_manifest.json")
+        results = render_figures(specs, previous=previous)
+        manifest["figures"] = figure_manifest(results, relative_to=FIGURES_DIR)
+
+    Export every variant, then look them up from reports without rendering:
+
+        FigureSpec(..., vector_formats=("svg", "pdf"), thumbnail_width=320)
+        files = manifest_figure_files(FIGURES_DIR / "output_manifest.json")
+        files["fig_01_global_coal_co2_trend"]["thumbnail"]
+
+✒ Examples:
+    >>> results = render_figures(specs, workers=4)
+    >>> max(results, key=lambda r: r.seconds).name
+    'fig_04_regional_breakdown'
+    >>> [r.name for r in render_figures(specs, previous=previous) if not r.cached]
+    []
+
+✒ Other Important Information:
+    - Dependencies:
+        Required: matplotlib, numpy, pandas, Pillow (a matplotlib dependency)
+    - Compatible platforms: Linux, Windows, macOS
+    - Performance notes: Rendering is CPU-bound text layout and rasterization, so
+      it scales with cores; specs are pickled to the workers, so pass the slice a
+      figure draws rather than whole tables; fingerprinting hashes that slice
+      with pandas' vectorized row hashing, microseconds per thousand rows.
+      Each vector master is one extra vector-backend pass; rasters cost one draw
+    - Known limitations: Builders are sent to workers by reference. Workers are
+      forked only while the calling process runs a single OS thread (fork copies
+      just the calling thread, so locks held by pyarrow or BLAS thread pools
+      would stay locked in the child); otherwise they start through forkserver
+      (POSIX) or spawn (Windows). Then builders must live in an importable
+      module and the calling script must guard its entry point with
+      ``if __name__ == "__main__":``; unguarded scripts check ``fork_safe()``
+      and render with ``workers=1`` instead. The fingerprint covers the
+      builder's module and viz_utils, not other modules it imports; pass what
+      those read as ``style`` or ``data``. Raster variants are cropped to the tight bounding
+      box; figures whose artists overflow the canvas take one extra savefig draw
+      (so nothing is clipped); WebP thumbnails fall back to PNG when
+      Pillow lacks WebP support
+---------
+"""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import inspect
+import io
+import json
+import multiprocessing
+import os
+import time
+import traceback
+from collections.abc import Callable, Mapping, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import matplotlib
+import numpy as np
+import pandas as pd
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+from PIL import Image, features
+
+from . import viz_utils
+
+WORKERS_ENV_VAR = "TV_RENDER_WORKERS"
+# Part of every figure fingerprint: bump whenever export code changes output pixels
+# (2: overflowing artists are no longer clipped by the buffer crop)
+RENDER_VERSION = 2
+DEFAULT_DPI = 150
+DEFAULT_FIGSIZE = (10, 6)
+PAD_INCHES = 0.1  # savefig(bbox_inches="tight") default padding
+VECTOR_DIR = "vector"
+THUMBNAIL_DIR = "thumbnails"
+VECTOR_FORMATS = ("svg", "pdf")
+THUMBNAIL_FORMATS = ("png", "webp")
+
+
+# =============================================================================
+# SPECS AND RESULTS
+# =============================================================================
+
+@dataclass
+class FigureSpec:
+    """
+    One figure to render.
+
+    Args:
+        name: Figure identifier (also the default description)
+        builder: ``builder(fig, ax, **data)`` draws onto a fresh Figure
+        path: Output file; the format follows the suffix
+        data: Keyword arguments for the builder, i.e. the data slice it draws
+        figsize: Figure size in inches
+        dpi: Output resolution
+        facecolor: Saved background colour (None: the Figure's own)
+        description: Provenance label
+        style: rcParams applied while the figure is created and saved (e.g.
+            ``viz_utils.TV_STYLE``); part of the fingerprint
+        vector_formats: Vector masters written next to ``path`` under vector/
+            (any of VECTOR_FORMATS)
+        thumbnail_width: Thumbnail width in pixels under thumbnails/ (None: none)
+        thumbnail_format: "png" or "webp"
+    """
+    name: str
+    builder: Callable[..., Any]
+    path: Path
+    data: Mapping[str, Any] = field(default_factory=dict)
+    figsize: tuple[float, float] = DEFAULT_FIGSIZE
+    dpi: int = DEFAULT_DPI
+    facecolor: str | None = None
+    description: str = ""
+    style: Mapping[str, Any] = field(default_factory=dict)
+    vector_formats: tuple[str, ...] = ()
+    thumbnail_width: int | None = None
+    thumbnail_format: str = "png"
+
+
+@dataclass
+class RenderResult:
+    """Outcome of rendering one spec."""
+    name: str
+    path: Path
+    seconds: float
+    cpu_seconds: float
+    worker: int
+    size_bytes: int = 0
+    error: str | None = None
+    fingerprint: str = ""
+    cached: bool = False
+    files: dict[str, Path] = field(default_factory=dict)  # variant → file
+
+
+class RenderError(RuntimeError):
+    """One or more figures failed; ``results`` holds every outcome."""
+
+    def __init__(self, results: list[RenderResult]):
+        self.results = results
+        failed = [r for r in results if r.error]
+        super().__init__(f"{len(failed)} of {len(results)} figures failed:\n"
+                         + "\n".join(f"  {r.name}: {r.error}" for r in failed))
+
+
+# =============================================================================
+# FINGERPRINTS
+# =============================================================================
+
+def _update_digest(digest, value: Any) -> None:
+    """Feed a data value into a running hash: frames by rows, arrays by bytes."""
+    if isinstance(value, pd.DataFrame):
+        digest.update(json.dumps([list(map(str, value.columns)),
+                                  list(map(str, value.dtypes))]).encode())
+        digest.update(pd.util.hash_pandas_object(value, index=True).to_numpy().tobytes())
+    elif isinstance(value, pd.Series):
+        digest.update(json.dumps([str(value.name), str(value.dtype)]).encode())
+        digest.update(pd.util.hash_pandas_object(value, index=True).to_numpy().tobytes())
+    elif isinstance(value, np.ndarray):
+        digest.update(f"{value.dtype}{value.shape}".encode())
+        digest.update(np.ascontiguousarray(value).tobytes())
+    elif isinstance(value, Mapping):
+        for key in sorted(value, key=str):
+            digest.update(str(key).encode())
+            _update_digest(digest, value[key])
+    elif isinstance(value, (list, tuple)):
+        digest.update(f"[{len(value)}".encode())
+        for item in value:
+            _update_digest(digest, item)
+    else:
+        digest.update(json.dumps(value, sort_keys=True, default=str).encode())
+
+
+def _builder_source(builder: Callable) -> str:
+    """Builder source code, or its qualified name when the source is unavailable."""
+    try:
+        return inspect.getsource(builder)
+    except (OSError, TypeError):
+        return f"{getattr(builder, '__module__', '')}.{getattr(builder, '__qualname__', builder)}"
+
+
+def _module_digest(obj: Any) -> str:
+    """
+    SHA-256 of the source file of the module defining ``obj``.
+
+    Builders read module-level helpers and constants (``_finish``, colour maps)
+    that their own source does not show, so the whole module is hashed.
+    """
+    while isinstance(obj, functools.partial):
+        obj = obj.func
+    try:
+        source = Path(inspect.getsourcefile(obj)).read_bytes()
+    except (OSError, TypeError):
+        source = str(getattr(obj, "__module__", getattr(obj, "__name__", ""))).encode("utf-8")
+    return hashlib.sha256(source).hexdigest()
+
+
+def figure_fingerprint(spec: FigureSpec) -> str:
+    """SHA-256 of everything that determines a figure's pixels (incl. RENDER_VERSION)."""
+    digest = hashlib.sha256()
+    _update_digest(digest, {
+        "render": RENDER_VERSION,
+        "matplotlib": matplotlib.__version__,
+        "builder": _builder_source(spec.builder),
+        "modules": [_module_digest(spec.builder), _module_digest(viz_utils)],
+        "palette": {"colors": viz_utils.COLORS, "series": viz_utils.SERIES_COLORS},
+        "format": Path(spec.path).suffix.lower(),
+        "figsize": list(spec.figsize),
+        "dpi": spec.dpi,
+        "facecolor": spec.facecolor,
+        "style": spec.style,
+        "variants": sorted(export_paths(spec)),
+        "thumbnail": [spec.thumbnail_width, spec.thumbnail_format],
+    })
+    _update_digest(digest, spec.data)
+    return digest.hexdigest()
+
+
+def manifest_fingerprints(manifest_path: Path) -> dict[str, str]:
+    """Figure name → fingerprint from a previous output manifest (empty if none)."""
+    try:
+        figures = json.loads(Path(manifest_path).read_text(encoding="utf-8")).get("figures", {})
+    except (OSError, ValueError):
+        return {}
+    return {name: entry["fingerprint"] for name, entry in figures.items()
+            if isinstance(entry, Mapping) and entry.get("fingerprint")}
+
+
+def figure_manifest(
+    results: Sequence[RenderResult],
+    relative_to: Path | None = None,
+) -> dict[str, dict]:
+    """
+    Manifest entries for rendered figures, keyed by name (feeds the next run's cache).
+
+    Args:
+        results: Outcomes of render_figures()
+        relative_to: Folder the variant ``files`` are stored relative to (the
+            manifest's own folder, so readers elsewhere can resolve them)
+    """
+    def relative(path: Path) -> str:
+        return os.path.relpath(path, relative_to) if relative_to is not None else str(path)
+
+    return {
+        r.name: {
+            "path": str(r.path),
+            "files": {variant: relative(file) for variant, file in r.files.items()},
+            "fingerprint": r.fingerprint,
+            "cached": r.cached,
+            "render_s": round(r.seconds, 4),
+        }
+        for r in results if not r.error
+    }
+
+
+def manifest_figure_files(manifest_path: Path) -> dict[str, dict[str, Path]]:
+    """Figure name → {variant: file} from an output manifest, resolved against its folder."""
+    manifest_path = Path(manifest_path)
+    try:
+        figures = json.loads(manifest_path.read_text(encoding="utf-8")).get("figures", {})
+    except (OSError, ValueError):
+        return {}
+    return {
+        name: {variant: manifest_path.parent / file for variant, file in entry.get("files", {}).items()}
+        for name, entry in figures.items() if isinstance(entry, Mapping)
+    }
+
+
+# =============================================================================
+# RENDERING
+# =============================================================================
+
+def export_paths(spec: FigureSpec) -> dict[str, Path]:
+    """Every file a spec produces: the main output, vector masters and thumbnail."""
+    path = Path(spec.path)
+    files = {path.suffix.lstrip(".").lower() or "png": path}
+    for fmt in spec.vector_formats:
+        if fmt not in VECTOR_FORMATS:
+            raise ValueError(f"{spec.name}: vector format {fmt!r} not in {VECTOR_FORMATS}")
+        files[fmt] = path.parent / VECTOR_DIR / f"{path.stem}.{fmt}"
+    if spec.thumbnail_width:
+        if spec.thumbnail_format not in THUMBNAIL_FORMATS:
+            raise ValueError(f"{spec.name}: thumbnail format {spec.thumbnail_format!r} "
+                             f"not in {THUMBNAIL_FORMATS}")
+        fmt = spec.thumbnail_format if spec.thumbnail_format != "webp" or features.check("webp") else "png"
+        files["thumbnail"] = path.parent / THUMBNAIL_DIR / f"{path.stem}.{fmt}"
+    return files
+
+
+def _tight_pixels(fig: Figure, dpi: int) -> np.ndarray:
+    """
+    Draw the Agg canvas once and crop its RGBA buffer to the padded tight bounding box.
+
+    When artists overflow the canvas (long tick labels, outside legends) the crop
+    would clip them, so the figure is re-drawn once through savefig, which grows
+    the canvas to the tight box instead.
+    """
+    canvas = fig.canvas
+    canvas.draw()
+    pixels = np.asarray(canvas.buffer_rgba())
+    height, width = pixels.shape[:2]
+    bbox = fig.get_tightbbox(canvas.get_renderer()).padded(PAD_INCHES)
+    if bbox.x0 < 0 or bbox.y0 < 0 or bbox.x1 * dpi > width or bbox.y1 * dpi > height:
+        buffer = io.BytesIO()
+        fig.savefig(buffer, format="png", dpi=dpi, bbox_inches="tight", edgecolor="none",
+                    facecolor=fig.get_facecolor())
+        return np.asarray(Image.open(buffer).convert("RGBA"))
+    # Same pixel size as savefig(bbox_inches="tight"), which truncates the bbox size
+    left = round(bbox.x0 * dpi)
+    top = round(height - bbox.y1 * dpi)
+    return pixels[top:top + int(bbox.height * dpi), left:left + int(bbox.width * dpi)]
+
+
+def _write_rasters(pixels: np.ndarray, files: Mapping[str, Path], spec: FigureSpec) -> None:
+    """Full-resolution PNG (if listed) and downsampled thumbnail from one RGBA buffer."""
+    image = Image.fromarray(pixels, "RGBA")
+    if "png" in files:
+        image.save(files["png"], dpi=(spec.dpi, spec.dpi))
+    if "thumbnail" in files:
+        thumb = image.copy()
+        thumb.thumbnail((spec.thumbnail_width, image.height), Image.Resampling.LANCZOS)
+        files["thumbnail"].parent.mkdir(parents=True, exist_ok=True)
+        thumb.save(files["thumbnail"])
+
+
+def render_figure(spec: FigureSpec) -> RenderResult:
+    """
+    Draw one spec once on an object-oriented Figure with an Agg canvas and export it.
+
+    A PNG ``path`` and the thumbnail come from the same canvas buffer; vector
+    masters and non-PNG paths are written with savefig from the same Figure
+    (the thumbnail of a non-PNG path still comes from the canvas buffer).
+    Exceptions from the builder or the writers are captured in ``error``.
+    """
+    start, cpu_start = time.perf_counter(), time.process_time()
+    path = Path(spec.path)
+    files: dict[str, Path] = {}
+    error = None
+    try:
+        files = export_paths(spec)
+        with matplotlib.rc_context(spec.style):
+            fig = Figure(figsize=spec.figsize, dpi=spec.dpi)
+            FigureCanvasAgg(fig)
+            ax = fig.add_subplot()
+            spec.builder(fig, ax, **spec.data)
+            if spec.facecolor:
+                fig.patch.set_facecolor(spec.facecolor)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            if path.suffix.lower() == ".png":
+                _write_rasters(_tight_pixels(fig, spec.dpi), files, spec)
+            else:
+                fig.savefig(path, dpi=spec.dpi, bbox_inches="tight", edgecolor="none",
+                            facecolor=fig.get_facecolor())
+                if "thumbnail" in files:
+                    _write_rasters(_tight_pixels(fig, spec.dpi),
+                                   {"thumbnail": files["thumbnail"]}, spec)
+            for fmt in spec.vector_formats:
+                files[fmt].parent.mkdir(parents=True, exist_ok=True)
+                fig.savefig(files[fmt], format=fmt, bbox_inches="tight", edgecolor="none",
+                            facecolor=fig.get_facecolor())
+    except Exception as e:
+        error = "".join(traceback.format_exception_only(e)).strip()
+    return RenderResult(
+        name=spec.name,
+        path=path,
+        seconds=time.perf_counter() - start,
+        cpu_seconds=time.process_time() - cpu_start,
+        worker=os.getpid(),
+        size_bytes=path.stat().st_size if error is None and path.exists() else 0,
+        error=error,
+        files={} if error else files,
+    )
+
+
+def default_workers(n_specs: int) -> int:
+    """Worker count: TV_RENDER_WORKERS, else one per core, never more than the specs."""
+    configured = os.environ.get(WORKERS_ENV_VAR)
+    workers = int(configured) if configured else (os.cpu_count() or 1)
+    return max(1, min(workers, n_specs))
+
+
+def _thread_count() -> int | None:
+    """OS threads in this process (Linux), or None where they cannot be counted."""
+    try:
+        return len(os.listdir("/proc/self/task"))
+    except OSError:
+        return None
+
+
+def fork_safe() -> bool:
+    """True if render workers can be forked: fork is available and no other thread runs."""
+    return "fork" in multiprocessing.get_all_start_methods() and _thread_count() == 1
+
+
+def pool_context() -> multiprocessing.context.BaseContext:
+    """Start method for the render pool: fork when ``fork_safe()``, else forkserver or spawn."""
+    if fork_safe():
+        return multiprocessing.get_context("fork")
+    methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+
+
+def render_figures(
+    specs: Sequence[FigureSpec],
+    workers: int | None = None,
+    strict: bool = True,
+    previous: Mapping[str, str] | None = None,
+) -> list[RenderResult]:
+    """
+    Render every spec, in a process pool when more than one worker is available.
+
+    Args:
+        specs: Figures to render
+        workers: Processes (default: ``default_workers``); 1 renders in-process.
+            The pool starts through ``pool_context()``
+        strict: Raise RenderError after all specs ran if any failed
+        previous: Figure name → fingerprint of the last run (see
+            ``manifest_fingerprints``); matching figures whose files all exist are
+            skipped. None renders everything
+
+    Returns:
+        RenderResult per spec, in spec order
+    """
+    specs = list(specs)
+    fingerprints = [figure_fingerprint(spec) for spec in specs]
+    previous = previous or {}
+    results: list[RenderResult | None] = [None] * len(specs)
+    stale = []
+    for i, (spec, fingerprint) in enumerate(zip(specs, fingerprints)):
+        path, files = Path(spec.path), export_paths(spec)
+        if previous.get(spec.name) == fingerprint and all(f.is_file() for f in files.values()):
+            results[i] = RenderResult(spec.name, path, 0.0, 0.0, os.getpid(),
+                                      path.stat().st_size, fingerprint=fingerprint, cached=True,
+                                      files=files)
+        else:
+            stale.append(i)
+
+    to_render = [specs[i] for i in stale]
+    workers = (default_workers(len(to_render)) if workers is None
+               else max(1, min(workers, len(to_render))))
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers, mp_context=pool_context()) as pool:
+            rendered = list(pool.map(render_figure, to_render))
+    else:
+        rendered = [render_figure(spec) for spec in to_render]
+    for i, result in zip(stale, rendered):
+        result.fingerprint = fingerprints[i]
+        results[i] = result
+
+    if strict and any(r.error for r in results):
+        raise RenderError(results)
+    return results
+
+
+def format_renders(results: Sequence[RenderResult]) -> str:
+    """Per-figure timing table, slowest first."""
+    lines = [f"{'figure':<36} {'wall s':>7} {'cpu s':>7} {'KB':>8}  worker"]
+    for r in sorted(results, key=lambda r: r.seconds, reverse=True):
+        status = f"  FAILED: {r.error}" if r.error else ("  cached" if r.cached else "")
+        lines.append(f"{r.name:<36} {r.seconds:>7.2f} {r.cpu_seconds:>7.2f} "
+                     f"{r.size_bytes / 1024:>8.1f}  {r.worker}{status}")
+    return "\n".join(lines)
@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+✒ Metadata
+    - Title: Vectorized Scenario Projections (Terminal Velocity - v1.0)
+    - File Name: scenarios.py
+    - Relative Path: computational_core/shared_utils/scenarios.py
+    - Artifact Type: library
+    - Version: 1.0.0
+    - Date: 2026-10-18
+    - Update: Sunday, October 18, 2026
+    - Author: Dennis 'dnoice' Smaltz
+    - A.I. Acknowledgement: Anthropic - Claude Opus 4.5
+    - Signature:  ︻デ═—··· 🎯 = Aim Twice, Shoot Once!
+
+✒ Description:
+    Compound-growth projections for any number of scenarios at once. Each scenario
+    is a piecewise-constant schedule of annual percent changes; all scenarios ×
+    years are evaluated as a single cumulative product over a (scenarios, years)
+    rate matrix, and returned either as an array or as a tidy long frame.
+
+✒ Key Features:
+    - Feature 1: Piecewise rate schedules with any number of switch years
+    - Feature 2: Accepts the existing SCENARIOS config shape (annual_change_pct,
+                 switch_year / post_switch_rate) as well as explicit schedules
+    - Feature 3: Closed-form compounding: base × cumprod(1 + r/100), floored at zero
+    - Feature 4: Scalar or per-scenario base values
+    - Feature 5: Tidy output (scenario, year, value, plus carried config fields)
+
+✒ Usage Instructions:
+    Scenario configs are dicts; the rate in effect from year Y applies to the step
+    from Y to Y + 1. Either
+
+        {"annual_change_pct": 2.0, "switch_year": 2030, "post_switch_rate": -5.0}
+
+    or an explicit schedule (first entry may use None for "from the start"):
+
+        {"schedule": [(None, 2.0), (2030, -5.0), (2040, -9.0)]}
+
+✒ Examples:
+    >>> df = project_scenarios(SCENARIOS, base=latest_global, start_year=2023,
+    ...                        end_year=2050, value="coal_co2_mt",
+    ...                        carry=("description", "color"))
+    >>> values = project(1000.0, [rate_schedule(c) for c in SCENARIOS.values()],
+    ...                  np.arange(2023, 2051))
+    >>> values.shape
+    (4, 28)
+
+✒ Other Important Information:
+    - Dependencies:
+        Required: numpy, pandas
+    - Compatible platforms: Linux, Windows, macOS
+    - Performance notes: O(scenarios × years) in NumPy; 10,000 scenarios × 30 years
+      evaluate in a few milliseconds
+    - Known limitations: Rates are annual and piecewise constant; steps are yearly
+---------
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping, Sequence
+
+import numpy as np
+import pandas as pd
+
+# A schedule is a sorted sequence of (from_year, annual_change_pct); from_year None
+# (or -inf) means "from the start of the projection"
+Schedule = Sequence[tuple[float, float]]
+
+
+# =============================================================================
+# SCHEDULES
+# =============================================================================
+
+def rate_schedule(config: Mapping) -> list[tuple[float, float]]:
+    """
+    Normalize a scenario config into a piecewise rate schedule.
+
+    Args:
+        config: Scenario dict with either ``schedule`` (pairs or a mapping of
+            from_year → percent) or ``annual_change_pct`` plus the optional
+            ``switch_year`` / ``post_switch_rate`` pair
+
+    Returns:
+        Sorted list of (from_year, annual_change_pct), starting at -inf
+    """
+    if "schedule" in config:
+        entries = config["schedule"]
+        pairs = list(entries.items()) if isinstance(entries, Mapping) else list(entries)
+    else:
+        pairs = [(None, config["annual_change_pct"])]
+        if config.get("switch_year") is not None:
+            pairs.append((config["switch_year"], config["post_switch_rate"]))
+
+    schedule = sorted(
+        (-np.inf if year is None else float(year), float(rate)) for year, rate in pairs
+    )
+    if not schedule:
+        raise ValueError("Scenario schedule is empty")
+    if schedule[0][0] != -np.inf:
+        # Before the first switch year nothing changes
+        schedule.insert(0, (-np.inf, 0.0))
+    return schedule
+
+
+def rate_matrix(schedules: Sequence[Schedule], years: Sequence[int]) -> np.ndarray:
+    """
+    Annual percent change for every scenario and projection step.
+
+    Args:
+        schedules: One schedule per scenario (see ``rate_schedule``)
+        years: Projection years, ascending and consecutive
+
+    Returns:
+        Array of shape (len(schedules), len(years) - 1); column j is the rate
+        applied to the step from years[j] to years[j + 1]
+    """
+    step_from = np.asarray(years, dtype=float)[:-1]
+    rates = np.empty((len(schedules), len(step_from)))
+    for i, schedule in enumerate(schedules):
+        starts = np.array([year for year, _ in schedule])
+        values = np.array([rate for _, rate in schedule])
+        rates[i] = values[np.searchsorted(starts, step_from, side="right") - 1]
+    return rates
+
+
+# =============================================================================
+# PROJECTION
+# =============================================================================
+
+def project(
+    base: float | Sequence[float] | np.ndarray,
+    schedules: Sequence[Schedule] | None = None,
+    years: Sequence[int] | None = None,
+    rates: np.ndarray | None = None,
+) -> np.ndarray:
+    """
+    Compound every scenario forward from its base value.
+
+    Pass either ``schedules`` + ``years`` or a precomputed ``rates`` matrix.
+    Growth factors are floored at zero, so a value that reaches zero stays there.
+
+    Args:
+        base: Value in the first projection year (scalar or one per scenario)
+        schedules: Rate schedules, one per scenario
+        years: Projection years, ascending and consecutive
+        rates: (scenarios, steps) matrix of annual percent changes
+
+    Returns:
+        Array of shape (scenarios, steps + 1); column 0 equals ``base``
+    """
+    if rates is None:
+        if schedules is None or years is None:
+            raise ValueError("project() needs either rates or schedules and years")
+        rates = rate_matrix(schedules, years)
+    rates = np.atleast_2d(np.asarray(rates, dtype=float))
+
+    factors = np.ones((rates.shape[0], rates.shape[1] + 1))
+    np.maximum(1.0 + rates / 100.0, 0.0, out=factors[:, 1:])
+    np.cumprod(factors, axis=1, out=factors)
+
+    base = np.asarray(base, dtype=float).reshape(-1, 1)
+    return base * factors
+
+
+def project_scenarios(
+    scenarios: Mapping[str, Mapping],
+    base: float | Mapping[str, float],
+    start_year: int,
+    end_year: int,
+    value: str = "value",
+    carry: Iterable[str] = (),
+) -> pd.DataFrame:
+    """
+    Project a SCENARIOS-style config into a tidy long frame.
+
+    Args:
+        scenarios: Mapping of scenario name → config (see ``rate_schedule``)
+        base: Value in ``start_year``, shared or per scenario name
+        start_year: First projection year (holds the base value)
+        end_year: Last projection year, inclusive
+        value: Name of the projected value column
+        carry: Config keys copied onto every row (e.g. description, color)
+
+    Returns:
+        Frame with columns scenario, year, <value>, *carry — scenario-major,
+        years ascending, unrounded
+    """
+    names = list(scenarios)
+    years = np.arange(int(start_year), int(end_year) + 1)
+    if isinstance(base, Mapping):
+        base = [base[name] for name in names]
+
+    values = project(base, [rate_schedule(scenarios[name]) for name in names], years)
+
+    n_years = len(years)
+    frame = pd.DataFrame({
+        "scenario": np.repeat(names, n_years),
+        "year": np.tile(years, len(names)),
+        value: values.ravel(),
+    })
+    for key in carry:
+        frame[key] = np.repeat([scenarios[name].get(key) for name in names], n_years)
+    return frame
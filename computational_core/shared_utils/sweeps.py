@@ -0,0 +1,510 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+✒ Metadata
+    - Title: Parameter Sweeps & Sensitivity Indices (Terminal Velocity - v1.0)
+    - File Name: sweeps.py
+    - Relative Path: computational_core/shared_utils/sweeps.py
+    - Artifact Type: library
+    - Version: 1.1.0
+    - Date: 2026-10-18
+    - Update: Sunday, October 18, 2026
+    - Author: Dennis 'dnoice' Smaltz
+    - A.I. Acknowledgement: Anthropic - Claude Opus 4.5
+    - Signature:  ︻デ═—··· 🎯 = Aim Twice, Shoot Once!
+
+✒ Description:
+    Replaces the hand-written `for param in param_range: result = model(param)`
+    sensitivity loop of the analysis templates. A SweepRunner evaluates a model
+    over a parameter space — full grid, Latin hypercube or Sobol sequence — in
+    batches, optionally in a process pool, caches every evaluation by a hash of
+    its parameters, and derives one-at-a-time (tornado) and Sobol variance-based
+    sensitivity indices. All evaluated points are written to one parquet file.
+
+✒ Key Features:
+    - Feature 1: Designs: grid, Latin hypercube, Sobol (scipy), one-at-a-time
+    - Feature 2: Vectorized models (arrays in, arrays out) or scalar models
+    - Feature 3: Batched evaluation with an optional process pool
+    - Feature 4: Result cache keyed by model name + model source + context + parameter hash
+    - Feature 5: OAT swings and Sobol first-order / total indices (Saltelli / Jansen)
+    - Feature 6: Seeded designs — identical seeds give identical sweeps
+
+✒ Usage Instructions:
+    Models take parameters as keyword arguments and return a number or a dict of
+    named outputs. With ``vectorized=True`` each keyword is a NumPy array and the
+    outputs must be arrays of the same length.
+
+        runner = SweepRunner(model, {"rate": (-10, 3), "share": (0.3, 0.5)},
+                             name="budget", vectorized=True, seed=7,
+                             cache_path=DERIVED_DIR / "parameter_sweeps.parquet")
+        oat = runner.one_at_a_time(levels=9)
+        sobol = runner.sobol_indices(n=1024)
+        runner.save()
+
+✒ Examples:
+    >>> space = parameter_space({"rate": (-10, 3)}, baseline={"rate": 0.5})
+    >>> points = grid(space, levels=5)
+    >>> runner = SweepRunner(lambda rate: rate ** 2, space, name="square")
+    >>> runner.run(points, design="grid")
+
+✒ Other Important Information:
+    - Dependencies:
+        Required: numpy, pandas
+        Optional: scipy (Sobol sequences), pyarrow (parquet output)
+    - Compatible platforms: Linux, Windows, macOS
+    - Sobol indices need n × (k + 2) evaluations for k parameters; without scipy the
+      base samples come from a Latin hypercube instead of a Sobol sequence
+    - Known limitations: Models run in a process pool must be picklable (module-level
+      functions or functools.partial of one); outputs must be numeric scalars. The
+      cache key covers the model function's own source, not helpers it calls;
+      bump ``version`` when those change
+---------
+"""
+
+from __future__ import annotations
+
+import ast
+import functools
+import hashlib
+import inspect
+import json
+import multiprocessing
+import textwrap
+import time
+from collections.abc import Callable, Mapping
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+try:
+    from scipy.stats import qmc
+    SCIPY_AVAILABLE = True
+except ImportError:
+    SCIPY_AVAILABLE = False
+
+DEFAULT_BATCH_SIZE = 4096
+DEFAULT_OUTPUT = "outcome"
+HASH_COLUMN = "param_hash"
+META_COLUMNS = ["model", "design", HASH_COLUMN]
+DESIGN_COLUMNS = ["varied", "sobol_matrix"]
+
+
+# =============================================================================
+# PARAMETER SPACE
+# =============================================================================
+
+@dataclass(frozen=True)
+class Parameter:
+    """One swept parameter: bounds and the baseline used by OAT sweeps."""
+    name: str
+    low: float
+    high: float
+    baseline: float
+
+    def scale(self, unit: np.ndarray) -> np.ndarray:
+        """Map [0, 1] samples onto [low, high]."""
+        return self.low + unit * (self.high - self.low)
+
+
+def parameter_space(
+    bounds: Mapping[str, tuple[float, float]],
+    baseline: Mapping[str, float] | None = None,
+) -> list[Parameter]:
+    """
+    Build a parameter space from ``{name: (low, high)}``.
+
+    Args:
+        bounds: Lower and upper bound per parameter
+        baseline: Point values (default: midpoint of the bounds)
+
+    Returns:
+        List of Parameter in declaration order
+    """
+    baseline = baseline or {}
+    space = []
+    for name, (low, high) in bounds.items():
+        if not low < high:
+            raise ValueError(f"Parameter {name!r}: low must be below high")
+        space.append(Parameter(name, float(low), float(high),
+                               float(baseline.get(name, (low + high) / 2))))
+    return space
+
+
+# =============================================================================
+# DESIGNS
+# =============================================================================
+
+def _frame(space: list[Parameter], unit: np.ndarray) -> pd.DataFrame:
+    """Scale a (n, k) unit-cube sample into a parameter frame."""
+    return pd.DataFrame({p.name: p.scale(unit[:, i]) for i, p in enumerate(space)})
+
+
+def grid(space: list[Parameter], levels: int = 5) -> pd.DataFrame:
+    """Full factorial grid with ``levels`` evenly spaced values per parameter."""
+    axes = [np.linspace(p.low, p.high, levels) for p in space]
+    mesh = np.meshgrid(*axes, indexing="ij")
+    return pd.DataFrame({p.name: m.ravel() for p, m in zip(space, mesh)})
+
+
+def latin_hypercube_unit(n: int, k: int, rng: np.random.Generator) -> np.ndarray:
+    """Latin hypercube sample of n points in [0, 1]^k (one point per stratum)."""
+    strata = rng.permuted(np.tile(np.arange(n), (k, 1)), axis=1).T
+    return (strata + rng.random((n, k))) / n
+
+
+def latin_hypercube(space: list[Parameter], n: int, seed: int | None = None) -> pd.DataFrame:
+    """Latin hypercube design of ``n`` points."""
+    return _frame(space, latin_hypercube_unit(n, len(space), np.random.default_rng(seed)))
+
+
+def sobol_unit(n: int, k: int, seed: int | None = None) -> np.ndarray:
+    """
+    Scrambled Sobol sequence of n points in [0, 1]^k.
+
+    Raises:
+        ImportError: scipy is not installed
+    """
+    if not SCIPY_AVAILABLE:
+        raise ImportError("Sobol sequences need scipy (pip install terminal-velocity[full])")
+    return qmc.Sobol(d=k, scramble=True, seed=seed).random(n)
+
+
+def sobol(space: list[Parameter], n: int, seed: int | None = None) -> pd.DataFrame:
+    """Sobol low-discrepancy design of ``n`` points (use a power of two)."""
+    return _frame(space, sobol_unit(n, len(space), seed))
+
+
+def one_at_a_time(space: list[Parameter], levels: int = 9) -> pd.DataFrame:
+    """
+    Vary each parameter over ``levels`` values with the others at baseline.
+
+    Returns:
+        Parameter frame with an extra ``varied`` column naming the swept parameter
+    """
+    frames = []
+    for p in space:
+        frame = pd.DataFrame({q.name: np.full(levels, q.baseline) for q in space})
+        frame[p.name] = np.linspace(p.low, p.high, levels)
+        frame["varied"] = p.name
+        frames.append(frame)
+    return pd.concat(frames, ignore_index=True)
+
+
+# =============================================================================
+# EVALUATION
+# =============================================================================
+
+def _as_outputs(result, n: int) -> dict[str, np.ndarray]:
+    """Normalize a model result into {output: array of length n}."""
+    if not isinstance(result, Mapping):
+        result = {DEFAULT_OUTPUT: result}
+    return {name: np.broadcast_to(np.asarray(value, dtype=float), (n,)).copy()
+            for name, value in result.items()}
+
+
+def _evaluate_batch(model: Callable, vectorized: bool, columns: dict[str, np.ndarray]) -> dict:
+    """Evaluate one batch of points; runs in-process or in a worker."""
+    n = len(next(iter(columns.values())))
+    if vectorized:
+        return _as_outputs(model(**columns), n)
+    rows = [_as_outputs(model(**{k: float(v[i]) for k, v in columns.items()}), 1)
+            for i in range(n)]
+    return {name: np.concatenate([row[name] for row in rows]) for name in rows[0]}
+
+
+def _evaluate_batch_star(args: tuple) -> dict:
+    """Process-pool adapter for ``_evaluate_batch``."""
+    return _evaluate_batch(*args)
+
+
+def model_digest(model: Callable) -> str:
+    """
+    SHA-256 of a model function's parsed source (functools.partial unwrapped).
+
+    Comments and formatting do not affect the digest; any change to the body
+    does. Falls back to the qualified name when no source is available.
+    """
+    while isinstance(model, functools.partial):
+        model = model.func
+    try:
+        payload = ast.dump(ast.parse(textwrap.dedent(inspect.getsource(model))))
+    except (OSError, TypeError, SyntaxError):
+        payload = f"{getattr(model, '__module__', '')}.{getattr(model, '__qualname__', model)}"
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def param_hashes(model_key: str, points: pd.DataFrame) -> np.ndarray:
+    """Stable short hash of each parameter row, namespaced by the model key."""
+    names = sorted(points.columns)
+    values = points[names].to_numpy(dtype=float)
+    return np.array([
+        hashlib.sha256(json.dumps([model_key, names, row.tolist()]).encode()).hexdigest()[:16]
+        for row in values
+    ])
+
+
+class SweepRunner:
+    """
+    Batched, cached model evaluation over a parameter space.
+
+    Args:
+        model: Callable taking the parameters as keyword arguments
+        space: Parameter list or ``{name: (low, high)}`` bounds
+        name: Model name stored with every result (part of the cache key)
+        context: Extra values that change the model's results (data vintage, fixed
+            inputs); hashed into the cache key
+        version: Bumped by hand when code the model calls changes (its own
+            source is already part of the cache key)
+        vectorized: Model accepts arrays and returns arrays
+        workers: Processes for batch evaluation; 1 runs in-process
+        batch_size: Points per batch
+        seed: Seed for randomized designs
+        cache_path: Parquet file holding previous results (read on init, written
+            by ``save``)
+    """
+
+    def __init__(
+        self,
+        model: Callable,
+        space: list[Parameter] | Mapping[str, tuple[float, float]],
+        name: str,
+        context: Mapping | None = None,
+        version: str | int | None = None,
+        vectorized: bool = False,
+        workers: int = 1,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        seed: int | None = None,
+        cache_path: Path | None = None,
+    ):
+        self.model = model
+        self.space = space if isinstance(space, list) else parameter_space(space)
+        self.name = name
+        self.model_key = json.dumps([name, dict(context or {}), model_digest(model), version],
+                                    sort_keys=True, default=str)
+        self.vectorized = vectorized
+        self.workers = workers
+        self.batch_size = batch_size
+        self.seed = seed
+        self.cache_path = Path(cache_path) if cache_path else None
+
+        self.evaluations = 0
+        self.cache_hits = 0
+        self.seconds = 0.0
+        self._results: list[pd.DataFrame] = []
+        self._cache = self._load_cache()
+
+    @property
+    def names(self) -> list[str]:
+        """Parameter names in declaration order."""
+        return [p.name for p in self.space]
+
+    def _load_cache(self) -> pd.DataFrame | None:
+        """Previous results for this model, indexed by parameter hash."""
+        if self.cache_path is None or not self.cache_path.exists():
+            return None
+        cached = pd.read_parquet(self.cache_path)
+        cached = cached[cached["model"] == self.name].drop_duplicates(HASH_COLUMN)
+        return cached.set_index(HASH_COLUMN) if len(cached) else None
+
+    def _evaluate(self, points: pd.DataFrame) -> dict[str, np.ndarray]:
+        """Evaluate points in batches, in-process or in a process pool."""
+        columns = {name: points[name].to_numpy(dtype=float) for name in self.names}
+        jobs = [
+            (self.model, self.vectorized,
+             {name: values[start:start + self.batch_size] for name, values in columns.items()})
+            for start in range(0, len(points), self.batch_size)
+        ]
+        if self.workers > 1 and len(jobs) > 1:
+            methods = multiprocessing.get_all_start_methods()
+            context = multiprocessing.get_context("fork" if "fork" in methods else None)
+            with ProcessPoolExecutor(max_workers=self.workers, mp_context=context) as pool:
+                batches = list(pool.map(_evaluate_batch_star, jobs))
+        else:
+            batches = [_evaluate_batch_star(job) for job in jobs]
+        return {name: np.concatenate([b[name] for b in batches]) for name in batches[0]}
+
+    def run(self, points: pd.DataFrame, design: str = "custom") -> pd.DataFrame:
+        """
+        Evaluate the model at every row of ``points``, reusing cached results.
+
+        Args:
+            points: One column per parameter (extra columns are carried through)
+            design: Label stored with the results
+
+        Returns:
+            Frame with model, design, param_hash, the parameters and one column
+            per model output
+        """
+        start = time.perf_counter()
+        points = points.reset_index(drop=True)
+        hashes = param_hashes(self.model_key, points[self.names])
+        result = points.copy()
+
+        cached = np.zeros(len(points), dtype=bool)
+        outputs: dict[str, np.ndarray] = {}
+        if self._cache is not None:
+            positions = self._cache.index.get_indexer(hashes)
+            cached = positions >= 0
+            if cached.any():
+                hits = self._cache.iloc[positions[cached]]
+                for name in hits.columns.difference(META_COLUMNS + self.names + DESIGN_COLUMNS):
+                    outputs[name] = np.full(len(points), np.nan)
+                    outputs[name][cached] = hits[name].to_numpy(dtype=float)
+
+        missing = ~cached
+        if missing.any():
+            fresh = self._evaluate(points[missing])
+            for name, values in fresh.items():
+                outputs.setdefault(name, np.full(len(points), np.nan))[missing] = values
+
+        for name, values in outputs.items():
+            result[name] = values
+        result.insert(0, HASH_COLUMN, hashes)
+        result.insert(0, "design", design)
+        result.insert(0, "model", self.name)
+
+        self.evaluations += int(missing.sum())
+        self.cache_hits += int(cached.sum())
+        self.seconds += time.perf_counter() - start
+        self._results.append(result)
+        return result
+
+    @property
+    def output_names(self) -> list[str]:
+        """Model outputs seen so far."""
+        if not self._results:
+            return []
+        extra = set(META_COLUMNS + self.names + DESIGN_COLUMNS)
+        return [c for c in self._results[-1].columns if c not in extra]
+
+    # -------------------------------------------------------------------------
+    # Designs
+    # -------------------------------------------------------------------------
+
+    def grid(self, levels: int = 5) -> pd.DataFrame:
+        """Evaluate a full factorial grid."""
+        return self.run(grid(self.space, levels), design="grid")
+
+    def latin_hypercube(self, n: int) -> pd.DataFrame:
+        """Evaluate a seeded Latin hypercube design."""
+        return self.run(latin_hypercube(self.space, n, self.seed), design="lhs")
+
+    def sobol(self, n: int) -> pd.DataFrame:
+        """Evaluate a seeded Sobol design (requires scipy)."""
+        return self.run(sobol(self.space, n, self.seed), design="sobol")
+
+    # -------------------------------------------------------------------------
+    # Sensitivity
+    # -------------------------------------------------------------------------
+
+    def one_at_a_time(self, levels: int = 9) -> pd.DataFrame:
+        """
+        One-at-a-time sensitivity (tornado inputs).
+
+        Returns:
+            One row per parameter × output: low / high parameter values, output at
+            low and high, output range, swing (max - min) and rank by swing
+        """
+        evaluated = self.run(one_at_a_time(self.space, levels), design="oat")
+        rows = []
+        for output in self.output_names:
+            for p in self.space:
+                sweep = evaluated[evaluated["varied"] == p.name]
+                values = sweep[output].to_numpy()
+                rows.append({
+                    "output": output,
+                    "parameter": p.name,
+                    "baseline": p.baseline,
+                    "low": p.low,
+                    "high": p.high,
+                    "output_at_low": values[0],
+                    "output_at_high": values[-1],
+                    "output_min": np.nanmin(values),
+                    "output_max": np.nanmax(values),
+                    "swing": np.nanmax(values) - np.nanmin(values),
+                })
+        oat = pd.DataFrame(rows)
+        oat["rank"] = oat.groupby("output")["swing"].rank(ascending=False, method="min").astype(int)
+        return oat.sort_values(["output", "rank"], ignore_index=True)
+
+    def sobol_indices(self, n: int = 1024) -> pd.DataFrame:
+        """
+        Variance-based Sobol indices from n × (k + 2) evaluations.
+
+        Base matrices A and B come from one 2k-dimensional Sobol sample (Latin
+        hypercube without scipy). First-order indices use the Saltelli (2010)
+        estimator, total-order indices the Jansen estimator.
+
+        Returns:
+            One row per parameter × output with S1, ST and the sample size
+        """
+        k = len(self.space)
+        if SCIPY_AVAILABLE:
+            unit = sobol_unit(n, 2 * k, self.seed)
+        else:
+            unit = latin_hypercube_unit(n, 2 * k, np.random.default_rng(self.seed))
+        a, b = unit[:, :k], unit[:, k:]
+
+        blocks = [("A", a), ("B", b)]
+        for i, p in enumerate(self.space):
+            ab = a.copy()
+            ab[:, i] = b[:, i]
+            blocks.append((f"AB_{p.name}", ab))
+        points = pd.concat(
+            [_frame(self.space, block).assign(sobol_matrix=label) for label, block in blocks],
+            ignore_index=True,
+        )
+        evaluated = self.run(points, design="sobol_saltelli")
+
+        rows = []
+        for output in self.output_names:
+            y = evaluated[output].to_numpy().reshape(k + 2, n)
+            f_a, f_b = y[0], y[1]
+            variance = np.var(np.concatenate([f_a, f_b]))
+            for i, p in enumerate(self.space):
+                f_ab = y[i + 2]
+                if variance > 0:
+                    s1 = np.mean(f_b * (f_ab - f_a)) / variance
+                    st = 0.5 * np.mean((f_a - f_ab) ** 2) / variance
+                else:
+                    s1 = st = 0.0
+                rows.append({"output": output, "parameter": p.name,
+                             "S1": s1, "ST": st, "n": n})
+        return pd.DataFrame(rows)
+
+    # -------------------------------------------------------------------------
+    # Output
+    # -------------------------------------------------------------------------
+
+    def results(self) -> pd.DataFrame:
+        """Every point evaluated (or served from cache) in this session."""
+        if not self._results:
+            return pd.DataFrame(columns=META_COLUMNS + self.names)
+        return pd.concat(self._results, ignore_index=True)
+
+    def save(self, path: Path | None = None) -> Path:
+        """
+        Write this session's results to parquet.
+
+        Rows of other models already in the file are kept, so several models can
+        share one parameter_sweeps.parquet.
+
+        Args:
+            path: Destination (default: ``cache_path``)
+
+        Returns:
+            Path written
+        """
+        path = Path(path or self.cache_path)
+        frame = self.results()
+        if path.exists():
+            others = pd.read_parquet(path)
+            others = others[others["model"] != self.name]
+            if len(others):
+                frame = pd.concat([others, frame], ignore_index=True)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        frame.to_parquet(path, index=False)
+        return path
@@ -0,0 +1,551 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+✒ Metadata
+    - Title: Synthesis Extracts (Terminal Velocity - v1.0)
+    - File Name: synthesis.py
+    - Relative Path: computational_core/shared_utils/synthesis.py
+    - Artifact Type: library
+    - Version: 1.0.0
+    - Date: 2026-10-18
+    - Update: Sunday, October 18, 2026
+    - Author: Dennis 'dnoice' Smaltz
+    - A.I. Acknowledgement: Anthropic - Claude Opus 4.5
+    - Signature:  ︻デ═—··· 🎯 = Aim Twice, Shoot Once!
+
+✒ Description:
+    Per-mechanism extracts for the synthesis products (vector reports, executive
+    briefs, connection analyses, intervention assessments). Each mechanism is read
+    on its own: the DOSSIER.md header and executive summary, the headline scalars of
+    analysis_results.json, row counts of the derived datasets, the milestone years
+    of its scenario projections (three columns only), the mechanism codes cited in
+    its connection map, its difficulty score and the exhibit files listed in its
+    output manifest. The extract is a small JSON record cached under
+    synthesis_products/.cache/ and keyed by the content of those inputs, so a
+    rebuild re-reads only the mechanisms that changed.
+
+✒ Key Features:
+    - Feature 1: Streaming mechanism iterator (one mechanism's inputs open at a time)
+    - Feature 2: Markdown read line by line, stopping once the needed section is past
+    - Feature 3: Column-pruned, chunked scenario reads reduced to milestone years
+    - Feature 4: Row counts from parquet metadata or a line scan (no frames built)
+    - Feature 5: Extract cache keyed by input content digests (stat-cached)
+    - Feature 6: Product keys so unchanged reports and briefs are not rewritten
+    - Feature 7: Report tables assembled from extracts only
+
+✒ Usage Instructions:
+    Stream extracts (cached ones are reused) and group them by vector:
+
+        cache = ExtractCache(root / "synthesis_products" / CACHE_DIRNAME)
+        for extract, key, changed in iter_extracts(root, cache):
+            ...
+
+        tables = vector_tables(extracts_of_one_vector)
+
+✒ Examples:
+    >>> source = discover_sources(Path("."), codes=["A-01"])[0]
+    >>> extract = extract_mechanism(source)
+    >>> extract.headline["top_emitter"], extract.scenarios[0]["year"]
+    ('China', 2030)
+
+✒ Other Important Information:
+    - Dependencies:
+        Required: pandas
+        Optional: pyarrow (parquet row counts from metadata)
+    - Compatible platforms: Linux, Windows, macOS
+    - Performance notes: A warm rebuild costs one stat() per input file; only
+      changed mechanisms are parsed, and no mechanism's frames outlive its extract
+    - Template placeholders ("[3-5 sentences ...]") in unwritten dossiers are
+      reported as missing rather than copied into the products
+    - Known limitations: Connections are the mechanism codes cited in the
+      connection_map/ documents; the direction comes from the document name
+---------
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from collections.abc import Iterable, Iterator
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any
+
+import pandas as pd
+
+from .data_utils import DATASET_FORMATS, csv_header
+from .fingerprint import snapshot_files, value_digest
+from .rendering import manifest_figure_files
+
+try:
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+
+# =============================================================================
+# CONSTANTS & CONFIGURATION
+# =============================================================================
+
+EXTRACT_VERSION = 1
+CACHE_DIRNAME = ".cache"
+PRODUCT_KEYS_FILE = "product_keys.json"
+CHUNK_ROWS = 100_000
+
+# Inputs of an extract, relative to the mechanism's dossier folder
+DOSSIER_FILE = "DOSSIER.md"
+RESULTS_FILE = "evidence_archive/datasets/derived/analysis_results.json"
+DERIVED_DIR = "evidence_archive/datasets/derived"
+CONNECTION_DIR = "connection_map"
+DIFFICULTY_FILE = "intervention_assessment/difficulty_score.md"
+FIGURE_MANIFEST = "exhibits/figures/output_manifest.json"
+FIGURES_DIR = "exhibits/figures"
+
+# Scenario projections: one value column besides these, read at milestone years
+SCENARIO_DATASET = "scenario_projections"
+SCENARIO_META_COLUMNS = {"scenario", "description", "color", "year"}
+MILESTONE_YEARS = (2030, 2050)
+
+# connection_map/<relation>_mechanisms.md (cross_vector_links.md → cross_vector)
+CONNECTION_SUFFIXES = ("_mechanisms", "_links")
+CODE_PATTERN = re.compile(r"\b([A-F]-\d{2})\b")
+SCORE_PATTERN = re.compile(r"\*\*Score:\s*(\d+(?:\.\d+)?)\s*/\s*10\*\*")
+FIELD_PATTERN = re.compile(r"^\*\*(Vector|Status|Confidence|Last Updated):\*\*\s*(.*?)\s*$")
+PLACEHOLDER_PREFIX = "["
+
+
+# =============================================================================
+# DATA STRUCTURES
+# =============================================================================
+
+@dataclass
+class MechanismSource:
+    """Where a mechanism's synthesis inputs live."""
+
+    code: str
+    vector: str       # vector folder, e.g. "A_atmospheric"
+    dossier_dir: Path
+
+    @property
+    def inputs(self) -> list[Path]:
+        """Files and folders an extract depends on, relative to the dossier folder."""
+        return [Path(p) for p in (DOSSIER_FILE, DERIVED_DIR, CONNECTION_DIR,
+                                  DIFFICULTY_FILE, FIGURE_MANIFEST)]
+
+
+@dataclass
+class MechanismExtract:
+    """Everything the synthesis products need from one mechanism."""
+
+    code: str
+    vector: str
+    name: str = ""
+    vector_title: str = ""
+    status: str = ""
+    confidence: int = 0
+    last_updated: str = ""
+    summary: str = ""
+    analyzed_at: str = ""
+    headline: dict[str, Any] = field(default_factory=dict)
+    scenarios: list[dict[str, Any]] = field(default_factory=list)
+    datasets: dict[str, int] = field(default_factory=dict)  # derived file → rows
+    connections: list[dict[str, Any]] = field(default_factory=list)
+    difficulty: float | None = None
+    figures: dict[str, dict[str, str]] = field(default_factory=dict)  # name → variant → path
+    dossier: str = ""  # dossier folder relative to the repository root
+
+    @property
+    def documented(self) -> bool:
+        """Whether the dossier has a written executive summary."""
+        return bool(self.summary)
+
+
+@dataclass
+class ExtractCache:
+    """Extracts on disk, one JSON file per mechanism, keyed by input content."""
+
+    directory: Path
+
+    def path(self, code: str) -> Path:
+        """Cache file of one mechanism."""
+        return self.directory / f"{code}.json"
+
+    def load(self, code: str) -> dict[str, Any] | None:
+        """Cached record ({"key", "inputs", "extract"}) or None."""
+        try:
+            record = json.loads(self.path(code).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        return record if record.get("version") == EXTRACT_VERSION else None
+
+    def save(self, key: str, inputs: dict[str, list], extract: MechanismExtract) -> None:
+        """Record an extract with its key and input snapshot (atomic replace)."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        record = {"version": EXTRACT_VERSION, "key": key, "inputs": inputs,
+                  "extract": asdict(extract)}
+        tmp = self.path(extract.code).with_suffix(".tmp")
+        tmp.write_text(json.dumps(record, indent=1, default=str), encoding="utf-8")
+        tmp.replace(self.path(extract.code))
+
+    def product_keys(self) -> dict[str, str]:
+        """Keys of the products last written (e.g. "vector:A", "brief:A-01")."""
+        try:
+            return json.loads((self.directory / PRODUCT_KEYS_FILE).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+
+    def save_product_keys(self, keys: dict[str, str]) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        (self.directory / PRODUCT_KEYS_FILE).write_text(json.dumps(keys, indent=1, sort_keys=True),
+                                                        encoding="utf-8")
+
+
+# =============================================================================
+# DISCOVERY
+# =============================================================================
+
+def discover_sources(
+    root: Path,
+    vectors: Iterable[str] | None = None,
+    codes: Iterable[str] | None = None,
+) -> list[MechanismSource]:
+    """
+    Every mechanism dossier under mechanism_dossiers/, in vector and code order.
+
+    Args:
+        root: Repository root
+        vectors: Optional vector letters to keep (e.g. ["A", "F"])
+        codes: Optional mechanism codes to keep (e.g. ["A-01"])
+    """
+    vectors, codes = set(vectors or ()), set(codes or ())
+    sources = []
+    for dossier in sorted(root.glob(f"mechanism_dossiers/*/*/{DOSSIER_FILE}")):
+        code = dossier.parent.name.split("_", 1)[0]
+        if (vectors and code[0] not in vectors) or (codes and code not in codes):
+            continue
+        sources.append(MechanismSource(code, dossier.parent.parent.name, dossier.parent))
+    return sources
+
+
+# =============================================================================
+# READERS
+# =============================================================================
+
+def _text(lines: list[str]) -> str:
+    """Join a paragraph's lines; template placeholders count as empty."""
+    text = " ".join(line.strip() for line in lines if line.strip())
+    return "" if text.startswith(PLACEHOLDER_PREFIX) else text
+
+
+def read_dossier(path: Path) -> dict[str, Any]:
+    """
+    Name, header fields and executive summary of a DOSSIER.md.
+
+    The file is read line by line and closed as soon as the executive summary
+    ends; the (long) body of the dossier is never loaded.
+    """
+    info: dict[str, Any] = {"name": "", "vector_title": "", "status": "", "confidence": 0,
+                            "last_updated": "", "summary": ""}
+    summary: list[str] | None = None
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if summary is not None:
+                if line.startswith(("---", "## ")):
+                    break
+                summary.append(line)
+            elif line.startswith("## EXECUTIVE SUMMARY"):
+                summary = []
+            elif line.startswith("## ") and not info["name"]:
+                info["name"] = line[3:].strip()
+            elif match := FIELD_PATTERN.match(line.strip()):
+                label, value = match.groups()
+                if label == "Vector":
+                    info["vector_title"] = value
+                elif label == "Status":
+                    info["status"] = value
+                elif label == "Confidence":
+                    info["confidence"] = value.count("★")
+                else:
+                    info["last_updated"] = value
+    info["summary"] = _text(summary or [])
+    return info
+
+
+def read_headline(path: Path) -> tuple[dict[str, Any], str]:
+    """Scalar ``results`` of an analysis_results.json and its run timestamp."""
+    if not path.is_file():
+        return {}, ""
+    with open(path, encoding="utf-8") as f:
+        results = json.load(f)
+    headline = {key: value for key, value in results.get("results", {}).items()
+                if isinstance(value, (int, float, str)) and not isinstance(value, bool)}
+    return headline, results.get("run_timestamp", "")
+
+
+def count_rows(path: Path) -> int:
+    """Data rows of a derived dataset without loading it."""
+    if path.suffix == ".parquet" and PYARROW_AVAILABLE:
+        return pq.ParquetFile(path).metadata.num_rows
+    if path.suffix == ".csv":
+        with open(path, "rb") as f:
+            return max(0, sum(1 for _ in f) - 1)
+    return len(pd.read_parquet(path, columns=[])) if path.suffix == ".parquet" else 0
+
+
+def derived_datasets(derived_dir: Path) -> dict[str, int]:
+    """Row count of every derived dataset, by file name."""
+    if not derived_dir.is_dir():
+        return {}
+    return {path.name: count_rows(path) for path in sorted(derived_dir.iterdir())
+            if path.suffix in DATASET_FORMATS}
+
+
+def _scenario_file(derived_dir: Path) -> Path | None:
+    for suffix in DATASET_FORMATS:
+        path = derived_dir / f"{SCENARIO_DATASET}{suffix}"
+        if path.is_file():
+            return path
+    return None
+
+
+def _columns(path: Path) -> list[str]:
+    """Column names of a dataset from its header or schema."""
+    if path.suffix == ".csv":
+        return csv_header(path)
+    if PYARROW_AVAILABLE:
+        import pyarrow.dataset as pa_ds
+
+        return pa_ds.dataset(path, format=DATASET_FORMATS[path.suffix]).schema.names
+    return list(next(_scenario_frames(path, None)).columns)
+
+
+def _scenario_frames(path: Path, columns: list[str] | None) -> Iterator[pd.DataFrame]:
+    """Scenario projections in chunks, restricted to ``columns``."""
+    if path.suffix == ".csv":
+        yield from pd.read_csv(path, usecols=columns, chunksize=CHUNK_ROWS)
+    elif path.suffix == ".parquet":
+        yield pd.read_parquet(path, columns=columns)
+    else:
+        yield pd.read_feather(path, columns=columns)
+
+
+def scenario_milestones(
+    derived_dir: Path,
+    years: tuple[int, ...] = MILESTONE_YEARS,
+) -> list[dict[str, Any]]:
+    """
+    Each scenario's value at the milestone years and the change from its base year.
+
+    Only the scenario, year and value columns are read, chunk by chunk; rows
+    other than each scenario's first year and the milestones are dropped as
+    they stream past.
+
+    Returns:
+        Records of scenario, metric, base_year, base_value, year, value, change_pct
+    """
+    path = _scenario_file(derived_dir)
+    if path is None:
+        return []
+    header = _columns(path)
+    metrics = [c for c in header if c not in SCENARIO_META_COLUMNS]
+    if not metrics or not {"scenario", "year"} <= set(header):
+        return []
+    metric = metrics[0]
+
+    base: dict[str, tuple[int, float]] = {}
+    at: dict[tuple[str, int], float] = {}
+    for chunk in _scenario_frames(path, ["scenario", "year", metric]):
+        for scenario, group in chunk.groupby("scenario", sort=False):
+            first = group.loc[group["year"].idxmin()]
+            if scenario not in base or first["year"] < base[scenario][0]:
+                base[scenario] = (int(first["year"]), float(first[metric]))
+            for _, row in group[group["year"].isin(years)].iterrows():
+                at[(scenario, int(row["year"]))] = float(row[metric])
+
+    records = []
+    for (scenario, year), value in sorted(at.items()):
+        base_year, base_value = base[scenario]
+        records.append({
+            "scenario": scenario,
+            "metric": metric,
+            "base_year": base_year,
+            "base_value": base_value,
+            "year": year,
+            "value": value,
+            "change_pct": round(100 * (value / base_value - 1), 2) if base_value else None,
+        })
+    return records
+
+
+def relation_name(path: Path) -> str:
+    """``upstream_mechanisms.md`` → ``upstream``; ``cross_vector_links.md`` → ``cross_vector``."""
+    stem = path.stem
+    for suffix in CONNECTION_SUFFIXES:
+        stem = stem.removesuffix(suffix)
+    return stem
+
+
+def read_connections(connection_dir: Path, code: str) -> list[dict[str, Any]]:
+    """Mechanism codes cited in each connection_map document, with mention counts."""
+    if not connection_dir.is_dir():
+        return []
+    links = []
+    for path in sorted(connection_dir.glob("*.md")):
+        counts: dict[str, int] = {}
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                for target in CODE_PATTERN.findall(line):
+                    if target != code:
+                        counts[target] = counts.get(target, 0) + 1
+        relation = relation_name(path)
+        links.extend({"source": code, "target": target, "relation": relation, "mentions": n}
+                     for target, n in sorted(counts.items()))
+    return links
+
+
+def read_difficulty(path: Path) -> float | None:
+    """The ``**Score: N/10**`` of a difficulty_score.md (reading stops at the score)."""
+    if not path.is_file():
+        return None
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if match := SCORE_PATTERN.search(line):
+                return float(match.group(1))
+    return None
+
+
+def exhibit_files(dossier_dir: Path, root: Path) -> dict[str, dict[str, str]]:
+    """
+    Exhibit variants from the output manifest, as paths relative to ``root``.
+
+    Manifests written before variant export (no ``files``) fall back to the PNGs
+    in the figures folder.
+    """
+    figures = manifest_figure_files(dossier_dir / FIGURE_MANIFEST)
+    if not any(figures.values()):
+        figures = {path.stem: {"png": path}
+                   for path in sorted((dossier_dir / FIGURES_DIR).glob("*.png"))}
+    return {
+        name: {variant: Path(path).resolve().relative_to(root.resolve()).as_posix()
+               for variant, path in files.items()}
+        for name, files in figures.items() if files
+    }
+
+
+# =============================================================================
+# EXTRACTION
+# =============================================================================
+
+def extract_mechanism(source: MechanismSource, root: Path | None = None) -> MechanismExtract:
+    """
+    Read one mechanism's synthesis inputs into a MechanismExtract.
+
+    Args:
+        source: Mechanism to read
+        root: Repository root (default: three levels above the dossier folder)
+    """
+    root = root or source.dossier_dir.parents[2]
+    directory = source.dossier_dir
+    headline, analyzed_at = read_headline(directory / RESULTS_FILE)
+    return MechanismExtract(
+        code=source.code,
+        vector=source.vector,
+        **read_dossier(directory / DOSSIER_FILE),
+        analyzed_at=analyzed_at,
+        headline=headline,
+        scenarios=scenario_milestones(directory / DERIVED_DIR),
+        datasets=derived_datasets(directory / DERIVED_DIR),
+        connections=read_connections(directory / CONNECTION_DIR, source.code),
+        difficulty=read_difficulty(directory / DIFFICULTY_FILE),
+        figures=exhibit_files(directory, root),
+        dossier=directory.resolve().relative_to(root.resolve()).as_posix(),
+    )
+
+
+def iter_extracts(
+    root: Path,
+    cache: ExtractCache,
+    vectors: Iterable[str] | None = None,
+    codes: Iterable[str] | None = None,
+    force: bool = False,
+) -> Iterator[tuple[MechanismExtract, str, bool]]:
+    """
+    Stream every mechanism's extract, re-reading only mechanisms whose inputs changed.
+
+    Args:
+        root: Repository root
+        cache: Extract cache
+        vectors: Optional vector letters to keep
+        codes: Optional mechanism codes to keep
+        force: Re-read every mechanism
+
+    Yields:
+        (extract, key, changed) in vector and code order; ``key`` digests the
+        extract's inputs, ``changed`` is False when it came from the cache
+    """
+    for source in discover_sources(root, vectors, codes):
+        cached = cache.load(source.code)
+        inputs = snapshot_files(source.inputs, cached["inputs"] if cached else None,
+                                base=source.dossier_dir)
+        key = value_digest({"version": EXTRACT_VERSION,
+                            "inputs": {path: entry[2] for path, entry in inputs.items()}})
+        if cached and not force and cached["key"] == key:
+            yield MechanismExtract(**cached["extract"]), key, False
+            continue
+        extract = extract_mechanism(source, root)
+        cache.save(key, inputs, extract)
+        yield extract, key, True
+
+
+# =============================================================================
+# REPORT TABLES
+# =============================================================================
+
+def vector_tables(extracts: list[MechanismExtract]) -> dict[str, pd.DataFrame]:
+    """
+    Report tables for one vector, built from its extracts.
+
+    Returns:
+        Dict of table name → frame: mechanisms, headline_metrics,
+        scenario_milestones, datasets, connections
+    """
+    mechanisms = pd.DataFrame([{
+        "code": e.code,
+        "mechanism": e.name,
+        "status": e.status,
+        "confidence": e.confidence,
+        "difficulty": e.difficulty,
+        "documented": e.documented,
+        "derived_datasets": len(e.datasets),
+        "figures": len(e.figures),
+        "connections": len({link["target"] for link in e.connections}),
+        "last_updated": e.last_updated,
+        "analyzed_at": e.analyzed_at,
+    } for e in extracts])
+    headline = pd.DataFrame(
+        [{"code": e.code, "metric": metric, "value": value}
+         for e in extracts for metric, value in e.headline.items()],
+        columns=["code", "metric", "value"],
+    )
+    scenarios = pd.DataFrame(
+        [{"code": e.code, **record} for e in extracts for record in e.scenarios],
+        columns=["code", "scenario", "metric", "base_year", "base_value",
+                 "year", "value", "change_pct"],
+    )
+    datasets = pd.DataFrame(
+        [{"code": e.code, "dataset": name, "rows": rows}
+         for e in extracts for name, rows in e.datasets.items()],
+        columns=["code", "dataset", "rows"],
+    )
+    connections = pd.DataFrame(
+        [link for e in extracts for link in e.connections],
+        columns=["source", "target", "relation", "mentions"],
+    )
+    return {
+        "mechanisms": mechanisms,
+        "headline_metrics": headline,
+        "scenario_milestones": scenarios,
+        "datasets": datasets,
+        "connections": connections,
+    }
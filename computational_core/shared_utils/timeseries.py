@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+✒ Metadata
+    - Title: Panel Time-Series Features (Terminal Velocity - v1.0)
+    - File Name: timeseries.py
+    - Relative Path: computational_core/shared_utils/timeseries.py
+    - Artifact Type: library
+    - Version: 1.0.1
+    - Date: 2026-10-18
+    - Update: Sunday, October 18, 2026
+    - Author: Dennis 'dnoice' Smaltz
+    - A.I. Acknowledgement: Anthropic - Claude Opus 4.5
+    - Signature:  ︻デ═—··· 🎯 = Aim Twice, Shoot Once!
+
+✒ Description:
+    Year-over-year change, differences, rolling statistics and CAGR for every
+    entity of a long panel (country × year, region × year, ...) in one sorted pass.
+    The panel is sorted once by entity and time, group boundaries become an offset
+    array, and every feature is computed on contiguous NumPy arrays with lags and
+    windows clipped at those boundaries — no per-group Python callbacks.
+
+✒ Key Features:
+    - Feature 1: group_starts(): first row of every entity after one sort
+    - Feature 2: lag / diff / pct_change within groups (pandas semantics;
+                 pct_change as ``fill_method=None``)
+    - Feature 3: Rolling sum / mean / std / min / max with min_periods, as an
+                 (rows × window) gather clipped at group starts
+    - Feature 4: CAGR over N rows using the actual time gap
+    - Feature 5: add_time_features(): all of the above for many columns in one step
+
+✒ Usage Instructions:
+    Features follow pandas' groupby conventions: lags are by row within an entity
+    (not by calendar year), missing values propagate, rolling windows count only
+    non-missing observations towards ``min_periods``. pct_change() is a pure lag:
+    it equals ``groupby().pct_change(fill_method=None)``, the only behaviour in
+    pandas 3. pandas 2.x defaults to ``fill_method="pad"``, which forward-fills
+    gaps first and so reports a change across a missing year.
+
+✒ Examples:
+    >>> df = add_time_features(countries_df, entity="country", time="year",
+    ...                        columns=["coal_co2"], rolling_windows=[("mean", 5)],
+    ...                        min_periods=3)
+    >>> df[["coal_co2_yoy_pct", "coal_co2_yoy_abs", "coal_co2_5yr_avg"]]
+
+✒ Other Important Information:
+    - Dependencies:
+        Required: numpy, pandas
+    - Compatible platforms: Linux, Windows, macOS
+    - Performance notes: One O(n log n) sort, then O(n × window) per rolling feature;
+      a full OWID panel (~50k rows) takes a few milliseconds per feature
+    - Output column names: <col>_yoy_pct, <col>_yoy_abs, <col>_<w>yr_<stat>
+      (stat "mean" is written as "avg"), <col>_cagr_<p>yr_pct
+---------
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import numpy as np
+import pandas as pd
+
+ROLLING_STATS = ("sum", "mean", "std", "min", "max")
+ROLLING_SUFFIX = {"mean": "avg"}
+
+
+# =============================================================================
+# GROUP LAYOUT
+# =============================================================================
+
+def group_starts(keys: np.ndarray | pd.Series) -> np.ndarray:
+    """
+    Index of the first row of each row's group, for keys sorted by group.
+
+    Args:
+        keys: Entity labels, already sorted so each entity is contiguous
+
+    Returns:
+        Integer array, one per row: index of the first row of that row's group
+    """
+    codes, _ = pd.factorize(keys, use_na_sentinel=False)
+    n = len(codes)
+    is_start = np.ones(n, dtype=bool)
+    is_start[1:] = codes[1:] != codes[:-1]
+    return np.maximum.accumulate(np.where(is_start, np.arange(n), 0))
+
+
+def _lag_index(starts: np.ndarray, periods: int) -> tuple[np.ndarray, np.ndarray]:
+    """Index ``periods`` rows back and whether it lies inside the same group."""
+    rows = np.arange(len(starts))
+    lagged = rows - periods
+    return np.maximum(lagged, 0), lagged >= starts
+
+
+# =============================================================================
+# ROW-WISE FEATURES
+# =============================================================================
+
+def lag(values: np.ndarray, starts: np.ndarray, periods: int = 1) -> np.ndarray:
+    """Value ``periods`` rows earlier in the same group (NaN at group heads)."""
+    index, valid = _lag_index(starts, periods)
+    return np.where(valid, values[index], np.nan)
+
+
+def diff(values: np.ndarray, starts: np.ndarray, periods: int = 1) -> np.ndarray:
+    """Within-group difference, as ``groupby().diff()``."""
+    return values - lag(values, starts, periods)
+
+
+def pct_change(values: np.ndarray, starts: np.ndarray, periods: int = 1) -> np.ndarray:
+    """
+    Within-group fractional change, as ``groupby().pct_change(fill_method=None)``.
+
+    The change is against the value ``periods`` rows back, missing or not: a
+    missing current or lagged value gives NaN (no forward fill across gaps, unlike
+    pandas 2.x's default ``fill_method="pad"``), and a zero lagged value gives
+    ±inf (or NaN for 0 / 0).
+    """
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return values / lag(values, starts, periods) - 1
+
+
+def cagr(
+    values: np.ndarray,
+    times: np.ndarray,
+    starts: np.ndarray,
+    periods: int,
+) -> np.ndarray:
+    """
+    Compound annual growth rate over the last ``periods`` rows of each group.
+
+    Uses the actual time gap between the two rows, so gaps in the series are
+    annualized correctly. NaN where either end is missing or non-positive.
+    """
+    index, valid = _lag_index(starts, periods)
+    start_value = np.where(valid, values[index], np.nan)
+    span = times - np.where(valid, times[index], np.nan)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ratio = np.where((start_value > 0) & (values > 0), values / start_value, np.nan)
+        return ratio ** (1.0 / span) - 1
+
+
+def rolling(
+    values: np.ndarray,
+    starts: np.ndarray,
+    window: int,
+    stat: str = "mean",
+    min_periods: int | None = None,
+) -> np.ndarray:
+    """
+    Trailing rolling statistic within groups.
+
+    Builds an (rows, window) matrix of the current and previous ``window - 1``
+    values, masks positions before the group start, and reduces across it.
+
+    Args:
+        values: Float values, sorted by group and time
+        starts: Output of ``group_starts``
+        window: Window length in rows
+        stat: One of sum, mean, std (ddof=1), min, max
+        min_periods: Minimum non-missing values (default: ``window``)
+
+    Returns:
+        Float array; NaN where fewer than ``min_periods`` values are available
+    """
+    if stat not in ROLLING_STATS:
+        raise ValueError(f"Unknown rolling statistic {stat!r}; expected one of {ROLLING_STATS}")
+    min_periods = window if min_periods is None else min_periods
+
+    rows = np.arange(len(values))
+    offsets = rows[:, None] - np.arange(window)[None, :]
+    inside = offsets >= starts[:, None]
+    windowed = np.where(inside, values[np.maximum(offsets, 0)], np.nan)
+
+    count = np.sum(~np.isnan(windowed), axis=1)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        if stat == "sum":
+            result = np.nansum(windowed, axis=1)
+        elif stat == "mean":
+            result = np.nansum(windowed, axis=1) / count
+        elif stat == "std":
+            mean = np.nansum(windowed, axis=1) / count
+            squares = np.nansum((windowed - mean[:, None]) ** 2, axis=1)
+            result = np.sqrt(squares / (count - 1))
+        else:
+            filled = np.where(np.isnan(windowed), np.inf if stat == "min" else -np.inf, windowed)
+            result = filled.min(axis=1) if stat == "min" else filled.max(axis=1)
+    return np.where(count >= max(min_periods, 1), result, np.nan)
+
+
+# =============================================================================
+# FRAME API
+# =============================================================================
+
+def add_time_features(
+    df: pd.DataFrame,
+    entity: str = "country",
+    time: str = "year",
+    columns: Sequence[str] = ("value",),
+    yoy_pct: bool = True,
+    yoy_abs: bool = True,
+    rolling_windows: Sequence[tuple[str, int]] = (),
+    min_periods: int | None = None,
+    cagr_periods: Sequence[int] = (),
+) -> pd.DataFrame:
+    """
+    Sort a long panel once and add time-series features for every entity.
+
+    Args:
+        df: Long data with entity, time and the value columns
+        entity: Grouping column
+        time: Time column
+        columns: Value columns to derive features from
+        yoy_pct: Add ``<col>_yoy_pct`` (percent change from the previous row;
+            NaN when either row is missing, see ``pct_change``)
+        yoy_abs: Add ``<col>_yoy_abs`` (difference from the previous row)
+        rolling_windows: (stat, window) pairs, e.g. [("mean", 5), ("std", 10)]
+        min_periods: Minimum observations per rolling window (default: window)
+        cagr_periods: Add ``<col>_cagr_<p>yr_pct`` for each p
+
+    Returns:
+        Copy of ``df`` sorted by entity and time with the feature columns appended
+    """
+    data = df.sort_values([entity, time], kind="stable")
+    starts = group_starts(data[entity])
+    times = data[time].to_numpy(dtype=float)
+
+    features = {}
+    for column in columns:
+        values = data[column].to_numpy(dtype=float)
+        dtype = data[column].dtype if data[column].dtype.kind == "f" else np.float64
+        if yoy_pct:
+            features[f"{column}_yoy_pct"] = (pct_change(values, starts) * 100, dtype)
+        if yoy_abs:
+            features[f"{column}_yoy_abs"] = (diff(values, starts), dtype)
+        for stat, window in rolling_windows:
+            name = f"{column}_{window}yr_{ROLLING_SUFFIX.get(stat, stat)}"
+            features[name] = (rolling(values, starts, window, stat, min_periods), dtype)
+        for periods in cagr_periods:
+            features[f"{column}_cagr_{periods}yr_pct"] = (cagr(values, times, starts, periods) * 100, dtype)
+
+    # Features keep the precision of their source column (e.g. float32 panels)
+    return data.assign(**{name: pd.Series(v.astype(dtype), index=data.index)
+                          for name, (v, dtype) in features.items()})
@@ -0,0 +1,340 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+✒ Metadata
+    - Title: Monte Carlo Uncertainty Propagation (Terminal Velocity - v1.0)
+    - File Name: uncertainty.py
+    - Relative Path: computational_core/shared_utils/uncertainty.py
+    - Artifact Type: library
+    - Version: 1.0.2
+    - Date: 2026-10-18
+    - Update: Sunday, October 18, 2026
+    - Author: Dennis 'dnoice' Smaltz
+    - A.I. Acknowledgement: Anthropic - Claude Opus 4.5
+    - Signature:  ︻デ═—··· 🎯 = Aim Twice, Shoot Once!
+
+✒ Description:
+    Propagates declared parameter uncertainty through scenario projections and
+    carbon budgets. Scenario rates, budgets and shares are sampled from the
+    distributions declared next to their point values, every draw is projected
+    with the vectorized scenario engine, and the result is the distribution of
+    budget-exhaustion years for every budget × scenario pair. Draws are evaluated
+    in NumPy batches, optionally spread over a process pool, and are reproducible
+    from a seed and batch size regardless of worker count.
+
+✒ Key Features:
+    - Feature 1: Declared distributions (fixed, normal, uniform, triangular, lognormal)
+                 centred on the config's point value unless stated otherwise
+    - Feature 2: Per-segment rate uncertainty for piecewise scenario schedules
+    - Feature 3: Budgets sampled as total × share when both are declared
+    - Feature 4: Batched, vectorized draws; optional process pool (workers > 1)
+    - Feature 5: Exhaustion-year distribution and percentile summary frames
+    - Feature 6: Common random numbers — every scenario sees the same budget draws
+
+✒ Usage Instructions:
+    Declare an ``uncertainty`` mapping next to the point values:
+
+        SCENARIOS["accelerated_phaseout"]["uncertainty"] = {
+            "rate": {"dist": "normal", "sd": 1.5},          # every schedule segment
+        }
+        CARBON_BUDGETS["1.5C_50pct"]["uncertainty"] = {
+            "total_budget_gt": {"dist": "triangular", "low": 300, "high": 900},
+            "coal_share": {"dist": "uniform", "low": 0.35, "high": 0.45},
+        }
+
+    then run ``monte_carlo_budgets(SCENARIOS, CARBON_BUDGETS, base, start, end)``.
+
+✒ Examples:
+    >>> mc = monte_carlo_budgets(SCENARIOS, CARBON_BUDGETS, base=15000.0,
+    ...                          start_year=2023, end_year=2100,
+    ...                          draws=100_000, seed=42)
+    >>> mc.summary[["budget", "scenario", "p_exhausted", "p50"]]
+    >>> mc.distribution.query("scenario == 'current_trajectory'")
+
+✒ Other Important Information:
+    - Dependencies:
+        Required: numpy, pandas
+    - Compatible platforms: Linux, Windows, macOS
+    - Performance notes: 100,000 draws × 4 scenarios × 78 years × 2 budgets take about
+      a second in one process; memory is bounded by ``batch_size``
+    - Known limitations: With workers > 1 on platforms without ``fork`` (Windows,
+      macOS default), the calling script must guard its entry point with
+      ``if __name__ == "__main__":``
+---------
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import time
+from collections.abc import Mapping, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+
+import numpy as np
+import pandas as pd
+
+from .budgets import exhaustion_index
+from .scenarios import project, rate_schedule
+
+DEFAULT_DRAWS = 100_000
+DEFAULT_BATCH_SIZE = 25_000
+DEFAULT_PERCENTILES = (5, 25, 50, 75, 95)
+
+
+# =============================================================================
+# DISTRIBUTIONS
+# =============================================================================
+
+def sample(
+    spec: Mapping | None,
+    center: float,
+    size: int,
+    rng: np.random.Generator,
+) -> np.ndarray:
+    """
+    Draw ``size`` values from a declared distribution.
+
+    Args:
+        spec: ``{"dist": name, ...}`` or None for the fixed point value.
+            normal: sd, optional mean / low / high (clipped);
+            uniform: low, high; triangular: low, high, optional mode;
+            lognormal: sigma, optional median; fixed: optional value
+        center: Point value used as mean / mode / median when not given
+        size: Number of draws
+        rng: Random generator
+
+    Returns:
+        Array of ``size`` draws
+
+    Raises:
+        ValueError: Unknown distribution name
+    """
+    dist = (spec or {}).get("dist", "fixed")
+    if dist == "fixed":
+        return np.full(size, float((spec or {}).get("value", center)))
+    if dist == "normal":
+        draws = rng.normal(spec.get("mean", center), spec["sd"], size)
+        if "low" in spec or "high" in spec:
+            np.clip(draws, spec.get("low", -np.inf), spec.get("high", np.inf), out=draws)
+        return draws
+    if dist == "uniform":
+        return rng.uniform(spec["low"], spec["high"], size)
+    if dist == "triangular":
+        return rng.triangular(spec["low"], spec.get("mode", center), spec["high"], size)
+    if dist == "lognormal":
+        return rng.lognormal(np.log(spec.get("median", center)), spec["sigma"], size)
+    raise ValueError(f"Unknown distribution {dist!r}")
+
+
+def sample_rates(
+    config: Mapping,
+    years: np.ndarray,
+    size: int,
+    rng: np.random.Generator,
+) -> np.ndarray:
+    """
+    Draw rate matrices for one scenario.
+
+    Each schedule segment gets its own draw, centred on the segment's point
+    rate; ``uncertainty["rate"]`` is one spec for every declared segment or a
+    list with one spec per segment. The implicit zero-rate segment before the
+    first switch year of a ``schedule`` is never uncertain.
+
+    Args:
+        config: Scenario config (see ``scenarios.rate_schedule``)
+        years: Projection years
+        size: Number of draws
+        rng: Random generator
+
+    Returns:
+        Array of shape (size, len(years) - 1) of annual percent changes
+
+    Raises:
+        ValueError: ``size`` is less than 1
+    """
+    if size < 1:
+        raise ValueError(f"size must be at least 1, got {size}")
+    schedule = rate_schedule(config)
+    spec = config.get("uncertainty", {}).get("rate")
+    # rate_schedule() prepends a zero-rate segment when no entry starts at None
+    declared = len(config["schedule"]) if "schedule" in config else len(schedule)
+    specs = spec if isinstance(spec, Sequence) else [spec] * declared
+    if len(specs) < len(schedule):
+        # Implicit leading zero-rate segment is not uncertain
+        specs = [None] * (len(schedule) - len(specs)) + list(specs)
+
+    starts = np.array([start for start, _ in schedule])
+    segment = np.searchsorted(starts, years[:-1].astype(float), side="right") - 1
+    segment_rates = np.column_stack([
+        sample(seg_spec, rate, size, rng) for seg_spec, (_, rate) in zip(specs, schedule)
+    ])
+    return segment_rates[:, segment]
+
+
+def sample_budget(config: Mapping, size: int, rng: np.random.Generator) -> np.ndarray:
+    """
+    Draw budgets (Gt) for one CARBON_BUDGETS entry.
+
+    Uses ``total_budget_gt × coal_share`` when both are declared, otherwise
+    ``coal_budget_gt``; each quantity is sampled from its ``uncertainty`` spec.
+
+    Args:
+        config: Budget config
+        size: Number of draws
+        rng: Random generator
+
+    Returns:
+        Array of ``size`` budget draws in Gt
+    """
+    specs = config.get("uncertainty", {})
+    if "total_budget_gt" in config and "coal_share" in config:
+        total = sample(specs.get("total_budget_gt"), config["total_budget_gt"], size, rng)
+        share = sample(specs.get("coal_share"), config["coal_share"], size, rng)
+        return total * share
+    return sample(specs.get("coal_budget_gt"), config["coal_budget_gt"], size, rng)
+
+
+# =============================================================================
+# BATCH EVALUATION
+# =============================================================================
+
+def _run_batch(
+    scenarios: Mapping[str, Mapping],
+    budgets: Mapping[str, Mapping],
+    base: float,
+    years: np.ndarray,
+    size: int,
+    seed: np.random.SeedSequence,
+) -> np.ndarray:
+    """
+    Evaluate one batch of draws.
+
+    Returns:
+        Integer counts of shape (budgets, scenarios, len(years) + 1); bin i < len(years)
+        counts draws exhausting the budget in years[i], the last bin draws that
+        never do within the horizon
+    """
+    rng = np.random.default_rng(seed)
+    n_years = len(years)
+
+    rates = [sample_rates(config, years, size, rng) for config in scenarios.values()]
+    budget_mt = [sample_budget(config, size, rng) * 1000 for config in budgets.values()]
+
+    counts = np.zeros((len(budgets), len(scenarios), n_years + 1), dtype=np.int64)
+    for s, scenario_rates in enumerate(rates):
+        cumulative = np.cumsum(project(np.full(size, base), rates=scenario_rates), axis=1)
+        exhausted_at = exhaustion_index(cumulative, np.column_stack(budget_mt))
+        for b in range(len(budget_mt)):
+            counts[b, s] = np.bincount(exhausted_at[:, b], minlength=n_years + 1)
+    return counts
+
+
+def _run_batch_star(args: tuple) -> np.ndarray:
+    """Process-pool adapter for ``_run_batch``."""
+    return _run_batch(*args)
+
+
+# =============================================================================
+# MONTE CARLO DRIVER
+# =============================================================================
+
+@dataclass
+class MonteCarloResult:
+    """Exhaustion-year distributions from a Monte Carlo run."""
+    draws: int
+    seed: int | None
+    start_year: int
+    end_year: int
+    seconds: float
+    distribution: pd.DataFrame = field(repr=False)
+    summary: pd.DataFrame = field(repr=False)
+
+
+def _percentile_year(cdf: np.ndarray, years: np.ndarray, q: float, end_year: int):
+    """Smallest year whose cumulative probability reaches q, else '>end_year'."""
+    hit = np.flatnonzero(cdf >= q / 100 - 1e-12)
+    return int(years[hit[0]]) if len(hit) else f">{end_year}"
+
+
+def monte_carlo_budgets(
+    scenarios: Mapping[str, Mapping],
+    budgets: Mapping[str, Mapping],
+    base: float,
+    start_year: int,
+    end_year: int,
+    draws: int = DEFAULT_DRAWS,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    seed: int | None = None,
+    workers: int = 1,
+    percentiles: Sequence[float] = DEFAULT_PERCENTILES,
+) -> MonteCarloResult:
+    """
+    Sample scenario rates and budgets and tabulate budget-exhaustion years.
+
+    Args:
+        scenarios: SCENARIOS-style configs, optionally with ``uncertainty``
+        budgets: CARBON_BUDGETS-style configs, optionally with ``uncertainty``
+        base: Emissions (Mt) in ``start_year``
+        start_year: First projection year (counts towards the cumulative total)
+        end_year: Horizon; later exhaustion is reported as '>end_year'
+        draws: Total number of draws
+        batch_size: Draws evaluated per vectorized batch
+        seed: Seed for reproducible draws (same seed and batch_size give the same
+            result for any worker count)
+        workers: Processes for batch evaluation; 1 runs in-process
+        percentiles: Exhaustion-year percentiles to report
+
+    Returns:
+        MonteCarloResult with ``distribution`` (one row per budget × scenario ×
+        year) and ``summary`` (one row per budget × scenario)
+    """
+    start = time.perf_counter()
+    years = np.arange(int(start_year), int(end_year) + 1)
+    sizes = [min(batch_size, draws - offset) for offset in range(0, draws, batch_size)]
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    jobs = [(scenarios, budgets, float(base), years, size, s) for size, s in zip(sizes, seeds)]
+
+    if workers > 1 and len(jobs) > 1:
+        methods = multiprocessing.get_all_start_methods()
+        context = multiprocessing.get_context("fork" if "fork" in methods else None)
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+            counts = sum(pool.map(_run_batch_star, jobs))
+    else:
+        counts = sum(_run_batch_star(job) for job in jobs)
+
+    budget_names, scenario_names = list(budgets), list(scenarios)
+    probability = counts[:, :, :-1] / draws
+    cdf = np.cumsum(probability, axis=2)
+
+    distribution = pd.DataFrame({
+        "budget": np.repeat(budget_names, len(scenario_names) * len(years)),
+        "scenario": np.tile(np.repeat(scenario_names, len(years)), len(budget_names)),
+        "exhaust_year": np.tile(years, len(budget_names) * len(scenario_names)),
+        "draws": counts[:, :, :-1].ravel(),
+        "probability": probability.ravel(),
+        "cumulative_probability": cdf.ravel(),
+    })
+
+    rows = []
+    for b, budget in enumerate(budget_names):
+        for s, scenario in enumerate(scenario_names):
+            row = {
+                "budget": budget,
+                "scenario": scenario,
+                "draws": draws,
+                "p_exhausted": round(float(cdf[b, s, -1]), 4),
+            }
+            for q in percentiles:
+                row[f"p{q:g}"] = _percentile_year(cdf[b, s], years, q, end_year)
+            rows.append(row)
+
+    return MonteCarloResult(
+        draws=draws,
+        seed=seed,
+        start_year=int(start_year),
+        end_year=int(end_year),
+        seconds=time.perf_counter() - start,
+        distribution=distribution,
+        summary=pd.DataFrame(rows),
+    )
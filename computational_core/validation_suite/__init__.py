@@ -0,0 +1 @@
+"""Terminal Velocity validation suite."""
@@ -0,0 +1,686 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+✒ Metadata
+    - Title: Pipeline Benchmark Suite (Terminal Velocity - v1.0)
+    - File Name: benchmarks.py
+    - Relative Path: computational_core/validation_suite/benchmarks.py
+    - Artifact Type: CLI
+    - Version: 1.1.0
+    - Date: 2026-10-18
+    - Update: Sunday, October 18, 2026
+    - Author: Dennis 'dnoice' Smaltz
+    - A.I. Acknowledgement: Anthropic - Claude Opus 4.5
+    - Signature:  ︻デ═—··· 🎯 = Aim Twice, Shoot Once!
+
+✒ Description:
+    Times the pipeline's hot paths on synthetic OWID-shaped panels at 1x, 10x and
+    100x scale and compares them with committed baselines. Shared utilities are
+    timed in-process (best of N, traced peak memory from one extra run); the A-01
+    intake, analysis and outputs stages run as separate interpreters in a scratch
+    copy of the mechanism, against a raw store pre-seeded with the fixtures, so
+    nothing touches the network. A run fails when a benchmark is slower or
+    heavier than its baseline beyond the threshold.
+
+✒ Key Features:
+    - Feature 1: Registry of benchmarks (@benchmark) grouped as shared_utils / a01
+    - Feature 2: Offline fixtures generated once per scale (validation_suite.fixtures)
+    - Feature 3: Best-of-N wall time plus median; tracemalloc peak in-process,
+                 child peak RSS (VmHWM; os.wait4 elsewhere) for stages
+    - Feature 4: JSON baselines keyed by "<benchmark>@<scale>x", with machine info
+    - Feature 5: Regression gate: relative threshold and a noise floor scaled to the
+                 run-to-run spread (median minus best)
+    - Feature 6: --update-baseline records the current machine's numbers
+
+✒ Usage Instructions:
+    Run from the repository root:
+
+        $ python -m computational_core.validation_suite.benchmarks
+        $ tv-bench --scales 1 10 100 --only a01_
+        $ tv-bench --update-baseline
+
+✒ Examples:
+    $ tv-bench --list
+    $ tv-bench --scales 10 --only csv_ time_features --repeat 7
+    $ tv-bench --threshold 0.5 --output /tmp/bench.json
+
+✒ Command-Line Arguments:
+    Selection:
+        --scales N [N ...]       Panel scales to run (default: 1 10)
+        --only PATTERN [...]     Run benchmarks whose name contains a pattern
+        --list                   List benchmarks and exit
+
+    Measurement:
+        --repeat N               Override repetitions per benchmark
+        --seed N                 Fixture seed (default: 0)
+        --cache-dir DIR          Fixture and scratch root (default: system temp)
+
+    Baselines:
+        --baseline FILE          Baseline JSON (default: validation_suite/baselines.json)
+        --threshold FRACTION     Allowed slowdown (default: 0.25 = 25%)
+        --memory-threshold F     Allowed memory growth (default: 0.20)
+        --update-baseline        Write the results as the new baseline
+        --output FILE            Also write this run's results as JSON
+
+✒ Other Important Information:
+    - Dependencies:
+        Required: numpy, pandas, matplotlib (A-01 outputs)
+        Optional: pyarrow (CSV fast path, Parquet intermediates), resource
+        (child peak RSS; not on Windows)
+    - Compatible platforms: Linux, macOS (Windows without stage memory)
+    - Performance notes: 1x and 10x take about a minute; 100x writes ~1 GB of
+      fixtures per table and runs for several minutes
+    - In-process peak memory is what tracemalloc sees (Python allocations);
+      Arrow buffers are not counted there, only in the stages' peak RSS
+    - Baselines are machine-specific; a run on a different machine class (CPU
+      architecture and count, Python minor version, numpy / pandas versions)
+      warns and compares anyway, so refresh them with --update-baseline on the
+      reference box. Kernel and Python patch updates keep the class
+    - Exit codes:
+        0 = No regressions (or baseline updated)
+        1 = One or more regressions
+        2 = No benchmark matched the selection
+---------
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Callable
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from functools import cached_property
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from ..shared_utils.budgets import budget_exhaustion, exhaustion_curve
+from ..shared_utils.data_utils import read_csv_columns
+from ..shared_utils.fingerprint import config_constants
+from ..shared_utils.quality import profile_frame
+from ..shared_utils.raw_store import STORE_ENV_VAR, RawDataStore
+from ..shared_utils.regions import region_registry
+from ..shared_utils.scenarios import project, project_scenarios, rate_schedule
+from ..shared_utils.sweeps import SweepRunner, parameter_space
+from ..shared_utils.timeseries import add_time_features
+from ..shared_utils.trends import classify_trends
+from ..shared_utils.uncertainty import monte_carlo_budgets
+from .fixtures import mechanism_workspace, seed_raw_store, write_fixtures
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+BASELINE_PATH = Path(__file__).with_name("baselines.json")
+BASELINE_VERSION = 1
+
+DEFAULT_SCALES = (1, 10)
+ALL_SCALES = (1, 10, 100)
+DEFAULT_REPEAT = 5
+DEFAULT_THRESHOLD = 0.25
+DEFAULT_MEMORY_THRESHOLD = 0.20
+# Differences below these are noise, whatever the ratio
+MIN_SECONDS_DELTA = 0.005
+MIN_MB_DELTA = 5.0
+# ... as are slowdowns within this many run-to-run spreads (median minus best)
+NOISE_SPREADS = 2.0
+
+A01_COMPUTATIONS = (REPO_ROOT / "mechanism_dossiers" / "A_atmospheric" / "A-01_coal_combustion"
+                    / "evidence_archive" / "computations")
+A01_STAGES = ("01_intake", "02_analysis", "03_outputs")
+
+# Runs a stage as __main__ and writes the peak RSS of its own address space
+# (VmHWM, kB) to argv[2]. wait4's ru_maxrss is not enough on Linux: a child
+# started with vfork/posix_spawn inherits the parent's high-water mark at exec.
+STAGE_WRAPPER = """\
+import atexit, os, runpy, sys
+script, peak_file = sys.argv[1:3]
+def report():
+    try:
+        with open("/proc/self/status") as status:
+            kb = next(line.split()[1] for line in status if line.startswith("VmHWM:"))
+    except (OSError, StopIteration):
+        return
+    with open(peak_file, "w") as f:
+        f.write(kb)
+atexit.register(report)
+sys.argv = [script]
+sys.path[0] = os.path.dirname(os.path.abspath(script))
+runpy.run_path(script, run_name="__main__")
+"""
+
+
+# =============================================================================
+# CONTEXT
+# =============================================================================
+
+class BenchContext:
+    """Fixtures and derived inputs for one scale, built lazily and shared."""
+
+    def __init__(self, scale: int, seed: int, cache_dir: Path):
+        self.scale = scale
+        self.seed = seed
+        self.cache_dir = cache_dir
+        self.work_dir = cache_dir / f"work-scale-{scale}"
+
+    @cached_property
+    def files(self) -> dict[str, Path]:
+        """Fixture CSVs for this scale."""
+        return write_fixtures(self.scale, self.cache_dir / "fixtures", self.seed)
+
+    @cached_property
+    def data_sources(self) -> dict:
+        """A-01's DATA_SOURCES, read from the script without running it."""
+        return config_constants(A01_COMPUTATIONS / "01_intake.py")["DATA_SOURCES"]
+
+    @cached_property
+    def co2(self) -> pd.DataFrame:
+        """The co2 fixture as A-01 intake types it."""
+        return read_csv_columns(self.files["owid_co2"], self.data_sources["owid_co2"]["columns"],
+                                cache=False)
+
+    @cached_property
+    def countries(self) -> pd.DataFrame:
+        """Country rows (aggregates removed), as 02_analysis filters them."""
+        registry = region_registry()
+        return self.co2[registry.is_country(self.co2["iso_code"])].reset_index(drop=True)
+
+    @cached_property
+    def featured(self) -> pd.DataFrame:
+        """Countries with the derived metrics 02_analysis adds."""
+        return add_time_features(self.countries, "country", "year", ["coal_co2"],
+                                 rolling_windows=[("mean", 5)], min_periods=3)
+
+    @cached_property
+    def scenarios(self) -> dict:
+        """A-01's SCENARIOS and CARBON_BUDGETS configs."""
+        return config_constants(A01_COMPUTATIONS / "02_analysis.py")
+
+    @cached_property
+    def workspace(self) -> Path:
+        """Scratch copy of A-01 with an offline raw store (TV_RAW_STORE)."""
+        root = self.work_dir / "repo"
+        computations = mechanism_workspace(A01_COMPUTATIONS, root, REPO_ROOT)
+        seed_raw_store(RawDataStore(self.raw_store), self.data_sources, self.files)
+        return computations
+
+    @property
+    def raw_store(self) -> Path:
+        return self.work_dir / "raw_store"
+
+    def stage_env(self) -> dict[str, str]:
+        """Environment for stage subprocesses: offline stores, headless, quiet."""
+        env = os.environ.copy()
+        root = str(self.work_dir / "repo")
+        env["PYTHONPATH"] = os.pathsep.join(filter(None, [root, env.get("PYTHONPATH")]))
+        env["MPLBACKEND"] = "Agg"
+        env[STORE_ENV_VAR] = str(self.raw_store)
+        env["TV_PANEL_STORE"] = str(self.work_dir / "panel")
+        env["TV_PROVENANCE_DIR"] = str(self.work_dir / "provenance")
+        env.pop("TV_VERBOSE", None)
+        return env
+
+
+# =============================================================================
+# REGISTRY
+# =============================================================================
+
+@dataclass
+class Measurement:
+    """Cost of one benchmark execution, when the benchmark measures itself."""
+    seconds: float
+    peak_mb: float | None = None
+
+
+@dataclass
+class Benchmark:
+    """A named hot path: ``setup(context)`` returns the callable to time."""
+    name: str
+    group: str
+    setup: Callable[[BenchContext], Callable[[], object]]
+    repeat: int = DEFAULT_REPEAT
+    scales: tuple[int, ...] = ALL_SCALES
+    description: str = ""
+
+
+BENCHMARKS: dict[str, Benchmark] = {}
+
+
+def benchmark(name: str, group: str = "shared_utils", repeat: int = DEFAULT_REPEAT,
+              scales: tuple[int, ...] = ALL_SCALES):
+    """Register a setup function as a benchmark."""
+    def register(setup: Callable[[BenchContext], Callable[[], object]]):
+        doc = (setup.__doc__ or "").strip().splitlines()
+        BENCHMARKS[name] = Benchmark(name, group, setup, repeat, scales, doc[0] if doc else "")
+        return setup
+    return register
+
+
+# =============================================================================
+# SHARED UTILITY BENCHMARKS
+# =============================================================================
+
+@benchmark("csv_parse")
+def _csv_parse(ctx: BenchContext):
+    """Column-pruned, typed CSV parse of the co2 fixture (no sidecar)."""
+    columns = ctx.data_sources["owid_co2"]["columns"]
+    return lambda: read_csv_columns(ctx.files["owid_co2"], columns, cache=False)
+
+
+@benchmark("csv_sidecar")
+def _csv_sidecar(ctx: BenchContext):
+    """Typed read of the co2 fixture through its warm Arrow sidecar."""
+    columns = ctx.data_sources["owid_co2"]["columns"]
+    read_csv_columns(ctx.files["owid_co2"], columns)  # build the sidecar outside the timing
+    return lambda: read_csv_columns(ctx.files["owid_co2"], columns)
+
+
+@benchmark("quality_profile")
+def _quality_profile(ctx: BenchContext):
+    """One-pass quality profile of the typed co2 table."""
+    return lambda: profile_frame(ctx.co2, "owid_co2")
+
+
+@benchmark("country_filter")
+def _country_filter(ctx: BenchContext):
+    """Aggregate removal via the ISO registry."""
+    registry = region_registry()
+    return lambda: ctx.co2[registry.is_country(ctx.co2["iso_code"])]
+
+
+@benchmark("time_features")
+def _time_features(ctx: BenchContext):
+    """YoY and 5-year rolling features for every country."""
+    return lambda: add_time_features(ctx.countries, "country", "year", ["coal_co2", "co2"],
+                                     rolling_windows=[("mean", 5)], min_periods=3)
+
+
+@benchmark("trend_classify")
+def _trend_classify(ctx: BenchContext):
+    """Peak / decline / plateau classification of every country."""
+    return lambda: classify_trends(ctx.featured, "country", "year", "coal_co2",
+                                   growth="coal_co2_yoy_pct")
+
+
+@benchmark("region_aggregate")
+def _region_aggregate(ctx: BenchContext):
+    """Continent × year sums of four columns."""
+    registry = region_registry()
+    values = ["coal_co2", "oil_co2", "gas_co2", "co2"]
+    return lambda: registry.aggregate(ctx.countries, "continent", values)
+
+
+@benchmark("country_projection")
+def _country_projection(ctx: BenchContext):
+    """Every country's latest value compounded to 2100 under a two-segment schedule."""
+    latest = ctx.countries.groupby("country", observed=True)["coal_co2"].last().fillna(0.0)
+    years = np.arange(2023, 2101)
+    schedule = rate_schedule({"annual_change_pct": 2.0, "switch_year": 2030, "post_switch_rate": -5.0})
+    schedules = [schedule] * len(latest)
+    base = latest.to_numpy()
+    return lambda: project(base, schedules, years)
+
+
+@benchmark("scenario_budgets")
+def _scenario_budgets(ctx: BenchContext):
+    """A-01 scenarios, budget table and a budget-grid curve (grid grows with scale)."""
+    config = ctx.scenarios
+    budgets = {name: c["coal_budget_gt"] * 1000 for name, c in config["CARBON_BUDGETS"].items()}
+    thresholds = np.linspace(0, 2e6, 1000 * ctx.scale)
+
+    def run():
+        projections = project_scenarios(config["SCENARIOS"], 8000.0, 2023, 2100, "coal_co2_mt")
+        budget_exhaustion(projections, budgets, value="coal_co2_mt")
+        return exhaustion_curve(projections, thresholds, value="coal_co2_mt")
+    return run
+
+
+@benchmark("monte_carlo", repeat=3)
+def _monte_carlo(ctx: BenchContext):
+    """Budget-exhaustion Monte Carlo, 10,000 draws per scale unit."""
+    config = ctx.scenarios
+    return lambda: monte_carlo_budgets(config["SCENARIOS"], config["CARBON_BUDGETS"], base=8000.0,
+                                       start_year=2023, end_year=2100, draws=10_000 * ctx.scale,
+                                       seed=20251214)
+
+
+@benchmark("parameter_sweep", repeat=3)
+def _parameter_sweep(ctx: BenchContext):
+    """Uncached Latin hypercube sweep of a vectorized budget model, 1,000 points per scale unit."""
+    space = parameter_space({"rate": (-10.0, 3.0), "budget": (300.0, 900.0)})
+
+    def model(rate, budget):
+        rates = np.repeat(np.asarray(rate)[:, None], 27, axis=1)
+        cumulative = np.cumsum(project(np.full(len(rates), 8000.0), rates=rates), axis=1) / 1000
+        return {"overshoot": cumulative[:, -1] - np.asarray(budget)}
+
+    return lambda: SweepRunner(model, space, "bench", vectorized=True,
+                               seed=1).latin_hypercube(1000 * ctx.scale)
+
+
+# =============================================================================
+# A-01 STAGE BENCHMARKS
+# =============================================================================
+
+def _run_stage(ctx: BenchContext, stage: str) -> Measurement:
+    """Run one A-01 stage script; wall time and the child's own peak RSS."""
+    with tempfile.TemporaryFile() as log, tempfile.TemporaryDirectory() as scratch:
+        peak_file = Path(scratch) / "peak_kb"
+        start = time.perf_counter()
+        proc = subprocess.Popen([sys.executable, "-c", STAGE_WRAPPER, f"{stage}.py", str(peak_file)],
+                                cwd=ctx.workspace, env=ctx.stage_env(), stdout=log,
+                                stderr=subprocess.STDOUT)
+        peak_mb = None
+        if hasattr(os, "wait4"):
+            # Reap the child ourselves: wait4 reports that child's rusage alone
+            _, status, usage = os.wait4(proc.pid, 0)
+            proc.returncode = os.waitstatus_to_exitcode(status)
+            peak_mb = usage.ru_maxrss * (1 if sys.platform == "darwin" else 1024) / (1024 * 1024)
+        else:
+            proc.wait()
+        seconds = time.perf_counter() - start
+        if peak_file.is_file():
+            peak_mb = int(peak_file.read_text()) / 1024
+        if proc.returncode != 0:
+            log.seek(0)
+            tail = "\n".join(log.read().decode(errors="replace").splitlines()[-20:])
+            raise RuntimeError(f"A-01 {stage} failed at scale {ctx.scale}:\n{tail}")
+    return Measurement(seconds, peak_mb)
+
+
+def _stage_benchmark(stage: str):
+    """Setup for one A-01 stage: earlier stages run once, untimed."""
+    def setup(ctx: BenchContext):
+        for earlier in A01_STAGES[:A01_STAGES.index(stage)]:
+            if not ctx.__dict__.get(f"ran_{earlier}"):
+                _run_stage(ctx, earlier)
+                ctx.__dict__[f"ran_{earlier}"] = True
+
+        def run():
+            if stage == "01_intake":
+                # Cold parse every time: drop the Arrow sidecars
+                shutil.rmtree(ctx.raw_store / "columnar", ignore_errors=True)
+            return _run_stage(ctx, stage)
+        return run
+    setup.__doc__ = f"A-01 {stage} as a fresh interpreter on the offline fixtures."
+    return setup
+
+
+for _stage in A01_STAGES:
+    benchmark(f"a01_{_stage.split('_', 1)[1]}", group="a01", repeat=3)(_stage_benchmark(_stage))
+
+
+# =============================================================================
+# MEASUREMENT
+# =============================================================================
+
+@dataclass
+class Result:
+    """Timings and memory of one benchmark at one scale."""
+    benchmark: str
+    group: str
+    scale: int
+    repeat: int
+    seconds: float            # best of ``repeat``
+    median_seconds: float
+    peak_mb: float | None     # traced peak (in-process) or child peak RSS (stages)
+    memory: str               # "traced" | "rss"
+
+    @property
+    def key(self) -> str:
+        return f"{self.benchmark}@{self.scale}x"
+
+
+def measure(bench: Benchmark, ctx: BenchContext, repeat: int | None = None) -> Result:
+    """Time a benchmark ``repeat`` times (after setup) and measure its memory."""
+    run = bench.setup(ctx)
+    repeat = repeat or bench.repeat
+
+    times, peaks = [], []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        outcome = run()
+        elapsed = time.perf_counter() - start
+        if isinstance(outcome, Measurement):
+            times.append(outcome.seconds)
+            peaks.append(outcome.peak_mb)
+        else:
+            times.append(elapsed)
+
+    if peaks:
+        known = [p for p in peaks if p is not None]
+        peak, memory = (max(known) if known else None), "rss"
+    else:
+        tracemalloc.start()
+        run()
+        peak = tracemalloc.get_traced_memory()[1] / (1024 * 1024)
+        tracemalloc.stop()
+        memory = "traced"
+
+    return Result(bench.name, bench.group, ctx.scale, repeat, round(min(times), 6),
+                  round(statistics.median(times), 6), None if peak is None else round(peak, 2),
+                  memory)
+
+
+# =============================================================================
+# BASELINES
+# =============================================================================
+
+def machine_info() -> dict:
+    """What the numbers were measured on."""
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "processor": platform.processor() or platform.machine(),
+        "cpus": os.cpu_count(),
+        "numpy": np.__version__,
+        "pandas": pd.__version__,
+    }
+
+
+def machine_class(info: dict | None = None) -> dict:
+    """
+    The parts of ``machine_info()`` that decide whether baselines are comparable.
+
+    Architecture, core count, Python minor version and library versions; kernel
+    builds and Python patch releases do not move timings beyond the threshold.
+    """
+    info = machine_info() if info is None else info
+    return {
+        "arch": info.get("processor"),
+        "cpus": info.get("cpus"),
+        "python": ".".join(str(info.get("python", "")).split(".")[:2]),
+        "numpy": info.get("numpy"),
+        "pandas": info.get("pandas"),
+    }
+
+
+def load_baseline(path: Path = BASELINE_PATH) -> dict:
+    """Baseline JSON, or an empty one."""
+    try:
+        return json.loads(Path(path).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {"version": BASELINE_VERSION, "machine": {}, "results": {}}
+
+
+def save_baseline(results: list[Result], path: Path = BASELINE_PATH) -> Path:
+    """Merge results into the baseline file (other benchmarks and scales are kept)."""
+    baseline = load_baseline(path)
+    baseline.update(version=BASELINE_VERSION, machine=machine_info(),
+                    updated=datetime.now().isoformat(timespec="seconds"))
+    for result in results:
+        entry = asdict(result)
+        for key in ("benchmark", "scale"):
+            entry.pop(key)
+        baseline.setdefault("results", {})[result.key] = entry
+    baseline["results"] = dict(sorted(baseline["results"].items()))
+    Path(path).write_text(json.dumps(baseline, indent=2) + "\n", encoding="utf-8")
+    return Path(path)
+
+
+@dataclass
+class Comparison:
+    """One result against its baseline."""
+    result: Result
+    baseline: dict | None
+    regressions: list[str] = field(default_factory=list)
+
+    @property
+    def time_ratio(self) -> float | None:
+        if not self.baseline or not self.baseline.get("seconds"):
+            return None
+        return self.result.seconds / self.baseline["seconds"]
+
+
+def compare(
+    results: list[Result],
+    baseline: dict,
+    threshold: float = DEFAULT_THRESHOLD,
+    memory_threshold: float = DEFAULT_MEMORY_THRESHOLD,
+) -> list[Comparison]:
+    """
+    Check every result against the baseline.
+
+    A benchmark regresses when its best time exceeds the baseline by more than
+    ``threshold`` (relative) and by more than the noise floor: ``MIN_SECONDS_DELTA``
+    or ``NOISE_SPREADS`` times the larger run-to-run spread (median minus best)
+    of the two measurements, whichever is greater. Memory regresses beyond
+    ``memory_threshold`` and ``MIN_MB_DELTA``.
+    """
+    comparisons = []
+    for result in results:
+        base = baseline.get("results", {}).get(result.key)
+        comparison = Comparison(result, base)
+        if base:
+            slower = result.seconds - base["seconds"]
+            spread = max(result.median_seconds - result.seconds,
+                         base.get("median_seconds", base["seconds"]) - base["seconds"])
+            noise = max(MIN_SECONDS_DELTA, NOISE_SPREADS * spread)
+            if slower > noise and result.seconds > base["seconds"] * (1 + threshold):
+                comparison.regressions.append(
+                    f"time {base['seconds']:.4f}s -> {result.seconds:.4f}s "
+                    f"(+{slower / base['seconds']:.0%})")
+            if result.peak_mb is not None and base.get("peak_mb") is not None:
+                heavier = result.peak_mb - base["peak_mb"]
+                if heavier > MIN_MB_DELTA and result.peak_mb > base["peak_mb"] * (1 + memory_threshold):
+                    comparison.regressions.append(
+                        f"memory {base['peak_mb']:.1f} MB -> {result.peak_mb:.1f} MB "
+                        f"(+{heavier / base['peak_mb']:.0%})")
+        comparisons.append(comparison)
+    return comparisons
+
+
+def print_comparisons(comparisons: list[Comparison]) -> None:
+    """Results table with the ratio to baseline."""
+    print(f"\n{'benchmark':<28} {'best s':>9} {'median s':>9} {'peak MB':>9} {'vs base':>8}  status")
+    for c in comparisons:
+        r = c.result
+        ratio = "" if c.time_ratio is None else f"{c.time_ratio:.2f}x"
+        peak = "" if r.peak_mb is None else f"{r.peak_mb:.1f}"
+        status = "REGRESSED" if c.regressions else ("ok" if c.baseline else "new")
+        print(f"{r.key:<28} {r.seconds:>9.4f} {r.median_seconds:>9.4f} {peak:>9} {ratio:>8}  {status}")
+        for reason in c.regressions:
+            print(f"    ↳ {reason}")
+
+
+# =============================================================================
+# CLI INTERFACE
+# =============================================================================
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(
+        prog="tv-bench",
+        description="Benchmark pipeline hot paths on synthetic OWID panels against baselines",
+    )
+    select_group = parser.add_argument_group("Selection")
+    select_group.add_argument("--scales", type=int, nargs="+", default=list(DEFAULT_SCALES),
+                              help="Panel scales (default: 1 10; 100 is supported)")
+    select_group.add_argument("--only", nargs="+", default=None, metavar="PATTERN",
+                              help="Run benchmarks whose name contains any pattern")
+    select_group.add_argument("--list", action="store_true", help="List benchmarks and exit")
+
+    measure_group = parser.add_argument_group("Measurement")
+    measure_group.add_argument("--repeat", type=int, default=None,
+                               help="Repetitions per benchmark (default: per benchmark)")
+    measure_group.add_argument("--seed", type=int, default=0, help="Fixture seed (default: 0)")
+    measure_group.add_argument("--cache-dir", type=Path, default=None,
+                               help="Fixture and scratch root (default: <tmp>/tv-bench)")
+
+    baseline_group = parser.add_argument_group("Baselines")
+    baseline_group.add_argument("--baseline", type=Path, default=BASELINE_PATH,
+                                help="Baseline JSON file")
+    baseline_group.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                                help="Allowed slowdown as a fraction (default: 0.25)")
+    baseline_group.add_argument("--memory-threshold", type=float, default=DEFAULT_MEMORY_THRESHOLD,
+                                help="Allowed memory growth as a fraction (default: 0.20)")
+    baseline_group.add_argument("--update-baseline", action="store_true",
+                                help="Record these results as the baseline")
+    baseline_group.add_argument("--output", type=Path, default=None,
+                                help="Also write this run's results to a JSON file")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Main entry point."""
+    args = parse_args(argv)
+
+    selected = [b for b in BENCHMARKS.values()
+                if not args.only or any(p in b.name for p in args.only)]
+    if args.list:
+        for b in BENCHMARKS.values():
+            print(f"  {b.name:<20} {b.group:<13} {b.description}")
+        return 0
+    if not selected:
+        print("No benchmarks matched the selection", file=sys.stderr)
+        return 2
+
+    cache_dir = args.cache_dir or Path(tempfile.gettempdir()) / "tv-bench"
+    # In-process benchmarks write Arrow sidecars; keep them out of evidence_vault/
+    os.environ[STORE_ENV_VAR] = str(cache_dir / "raw_store")
+    baseline = load_baseline(args.baseline)
+    if baseline.get("machine") and machine_class(baseline["machine"]) != machine_class():
+        print("Note: baseline was recorded on a different machine or environment; "
+              "refresh it with --update-baseline on the reference machine")
+
+    results = []
+    for scale in sorted(args.scales):
+        ctx = BenchContext(scale, args.seed, cache_dir)
+        print(f"Scale {scale}x: generating fixtures ...", flush=True)
+        ctx.files  # noqa: B018 - generate once, outside every timing
+        for bench in selected:
+            if scale not in bench.scales:
+                continue
+            print(f"  {bench.name} @ {scale}x", flush=True)
+            results.append(measure(bench, ctx, args.repeat))
+
+    comparisons = compare(results, baseline, args.threshold, args.memory_threshold)
+    print_comparisons(comparisons)
+
+    if args.output:
+        args.output.write_text(json.dumps({"machine": machine_info(),
+                                           "results": [asdict(r) for r in results]}, indent=2),
+                               encoding="utf-8")
+    if args.update_baseline:
+        print(f"\nBaseline updated: {save_baseline(results, args.baseline)}")
+        return 0
+
+    regressed = [c for c in comparisons if c.regressions]
+    if regressed:
+        print(f"\n{len(regressed)} regression(s) beyond {args.threshold:.0%} time / "
+              f"{args.memory_threshold:.0%} memory")
+        return 1
+    print("\nNo regressions")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,358 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+✒ Metadata
+    - Title: Synthetic OWID Fixtures (Terminal Velocity - v1.0)
+    - File Name: fixtures.py
+    - Relative Path: computational_core/validation_suite/fixtures.py
+    - Artifact Type: library
+    - Version: 1.1.0
+    - Date: 2026-10-18
+    - Update: Sunday, October 18, 2026
+    - Author: Dennis 'dnoice' Smaltz
+    - A.I. Acknowledgement: Anthropic - Claude Opus 4.5
+    - Signature:  ︻デ═—··· 🎯 = Aim Twice, Shoot Once!
+
+✒ Description:
+    Generated stand-ins for the Our World in Data CO2 and energy tables, so the
+    benchmark suite runs offline and at any size. Panels have OWID's shape: one
+    row per entity and year, real ISO codes (plus "Synthetic NNNNN" countries
+    beyond 1x), OWID's own country codes (USSR, Yugoslavia, ... whose rows end
+    when the state dissolved), OWID aggregate rows (World, continents, income
+    groups), series
+    that start at different years, and filler columns a column-pruned reader has
+    to skip. Fixtures are written once per (scale, seed) and reused.
+
+✒ Key Features:
+    - Feature 1: synthetic_co2() / synthetic_energy(): OWID-shaped frames at any scale
+    - Feature 2: Scale multiplies entities (1x ≈ the real table's ~44k rows)
+    - Feature 3: write_fixtures(): cached CSVs under <cache>/v<version>-scale-<n>-seed-<s>/
+    - Feature 4: seed_raw_store(): fixtures indexed under real DATA_SOURCES URLs, so
+                 intake stages resolve them from the raw store without a network
+    - Feature 5: mechanism_workspace(): a throwaway copy of a mechanism's
+                 computations/ folder at the depth its scripts expect
+
+✒ Usage Instructions:
+        files = write_fixtures(scale=10, cache_dir=Path("/tmp/tv-bench"))
+        store = seed_raw_store(RawDataStore(tmp / "raw_store"), A01_SOURCES, files)
+
+✒ Examples:
+    >>> df = synthetic_co2(scale=1)
+    >>> df["country"].nunique(), len(df)
+    (250, 43405)
+
+✒ Other Important Information:
+    - Dependencies:
+        Required: numpy, pandas
+        Optional: pyarrow (faster CSV writing for large scales)
+    - Compatible platforms: Linux, Windows, macOS
+    - Fixture sizes: 1x ≈ 10 MB per table, 10x ≈ 100 MB, 100x ≈ 1 GB
+    - Known limitations: Values are plausible in magnitude and shape only; the
+      fixtures exercise code paths and data volume, not findings
+---------
+"""
+
+from __future__ import annotations
+
+import shutil
+from collections.abc import Mapping
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from ..shared_utils.raw_store import RawDataStore
+from ..shared_utils.regions import region_registry
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+FIXTURE_VERSION = 2
+FIRST_YEAR, LAST_YEAR = 1850, 2023
+BASE_ENTITIES = 250  # entities per table at scale 1, aggregates included
+FILLER_COLUMNS = {"owid_co2": 20, "owid_energy": 30}
+
+# Named countries the mechanisms refer to; other registered ISO codes get
+# "Country <ISO>" names, and entities beyond the registry "Synthetic NNNNN"
+COUNTRY_NAMES = {
+    "CHN": "China", "IND": "India", "USA": "United States", "DEU": "Germany",
+    "POL": "Poland", "JPN": "Japan", "KOR": "South Korea", "IDN": "Indonesia",
+    "ZAF": "South Africa", "RUS": "Russia", "AUS": "Australia", "VNM": "Vietnam",
+    "TUR": "Turkey", "GBR": "United Kingdom", "FRA": "France", "ITA": "Italy",
+    "ESP": "Spain", "BRA": "Brazil", "MEX": "Mexico", "CAN": "Canada",
+}
+AGGREGATE_SCHEMES = ("continent", "income")
+
+
+# =============================================================================
+# ENTITIES
+# =============================================================================
+
+def fixture_entities(scale: int = 1) -> pd.DataFrame:
+    """
+    Countries of a fixture panel: registered ISO codes first, then the registry's
+    OWID-coded entities, then synthetic ones.
+
+    Returns:
+        Frame with country and iso_code, ``BASE_ENTITIES * scale`` minus the
+        aggregate rows long
+    """
+    registry = region_registry()
+    n_aggregates = 1 + sum(len(registry.scheme(s).groups) - 1 for s in AGGREGATE_SCHEMES)
+    n_countries = BASE_ENTITIES * scale - n_aggregates
+
+    known = sorted(c for c in registry.known_codes if not c.startswith(registry.aggregate_prefix))
+    iso = known[:n_countries - len(registry.entities)]
+    names = [COUNTRY_NAMES.get(code, f"Country {code}") for code in iso]
+    iso += list(registry.entities)
+    names += [spec["name"] for spec in registry.entities.values()]
+    extra = n_countries - len(iso)
+    iso += [f"S{i:05d}" for i in range(extra)]
+    names += [f"Synthetic {i:05d}" for i in range(extra)]
+    return pd.DataFrame({"country": names, "iso_code": iso})
+
+
+def _dissolved(iso: list[str], years: np.ndarray) -> np.ndarray:
+    """(entities, years) mask of the years after a former state's last one."""
+    entities = region_registry().entities
+    last = np.array([entities.get(code, {}).get("until", LAST_YEAR) for code in iso])
+    return years[None, :] > last[:, None]
+
+
+def _aggregate_rows(values: dict[str, np.ndarray], iso: list[str]) -> tuple[list, list, dict]:
+    """World plus continent and income-group sums of the additive columns."""
+    registry = region_registry()
+    names, codes, sums = ["World"], ["OWID_WRL"], {k: [v.sum(axis=0)] for k, v in values.items()}
+    for scheme_name in AGGREGATE_SCHEMES:
+        scheme = registry.scheme(scheme_name)
+        group_codes = scheme.codes(pd.Series(iso))
+        for code, group in enumerate(scheme.groups):
+            if group == scheme.default:
+                continue
+            members = group_codes == code
+            names.append(group if scheme_name == "continent" else f"{group} countries")
+            codes.append("")  # OWID aggregates other than World carry no ISO code
+            for key, array in values.items():
+                sums[key].append(array[members].sum(axis=0))
+    return names, codes, {k: np.stack(v) for k, v in sums.items()}
+
+
+def _long(entities: list[str], iso: list[str], years: np.ndarray, columns: dict) -> pd.DataFrame:
+    """(entities, years) arrays into an OWID-style long frame, without dissolved years."""
+    n, t = len(entities), len(years)
+    frame = pd.DataFrame({
+        "country": np.repeat(entities, t),
+        "iso_code": np.repeat(iso, t),
+        "year": np.tile(years, n),
+    })
+    for name, array in columns.items():
+        frame[name] = np.round(array.ravel(), 3)
+    frame["iso_code"] = frame["iso_code"].replace("", np.nan)
+    return frame[~_dissolved(iso, years).ravel()].reset_index(drop=True)
+
+
+def _curves(rng: np.random.Generator, n: int, years: np.ndarray, scale_mean: float,
+            peak: tuple[float, float], width: tuple[float, float]) -> np.ndarray:
+    """Bell-shaped emission paths with country-specific size, peak and noise."""
+    size = rng.lognormal(scale_mean, 2.0, n)[:, None]
+    centre = rng.uniform(*peak, n)[:, None]
+    spread = rng.uniform(*width, n)[:, None]
+    shape = np.exp(-0.5 * ((years[None, :] - centre) / spread) ** 2)
+    return size * shape * rng.lognormal(0.0, 0.05, (n, len(years)))
+
+
+def _with_filler(frame: pd.DataFrame, count: int, rng: np.random.Generator) -> pd.DataFrame:
+    """Append undeclared columns, as the real tables carry dozens of them."""
+    filler = rng.random((len(frame), count)).round(4)
+    return pd.concat([frame, pd.DataFrame(filler, columns=[f"extra_{i}" for i in range(count)],
+                                          index=frame.index)], axis=1)
+
+
+# =============================================================================
+# TABLES
+# =============================================================================
+
+def synthetic_co2(scale: int = 1, seed: int = 0) -> pd.DataFrame:
+    """
+    OWID co2-data shaped table.
+
+    Args:
+        scale: Entity multiplier (1 ≈ the real table)
+        seed: Random seed
+
+    Returns:
+        Long frame with every column A-01 declares for owid_co2, plus filler
+    """
+    rng = np.random.default_rng(seed)
+    entities = fixture_entities(scale)
+    years = np.arange(FIRST_YEAR, LAST_YEAR + 1)
+    n = len(entities)
+
+    coal = _curves(rng, n, years, 1.0, (1960, 2040), (20, 45))
+    oil = _curves(rng, n, years, 1.0, (1990, 2050), (25, 50))
+    gas = _curves(rng, n, years, 0.5, (2000, 2060), (25, 50))
+    started = years[None, :] >= rng.integers(FIRST_YEAR, 1960, n)[:, None]
+    coal, oil, gas = (np.where(started, a, np.nan) for a in (coal, oil, gas))
+    population = (rng.lognormal(15.0, 1.5, n)[:, None]
+                  * np.exp(rng.uniform(0.005, 0.02, n)[:, None] * (years - FIRST_YEAR)))
+
+    additive = {"population": population, "co2": np.nansum([coal, oil, gas], axis=0),
+                "coal_co2": coal, "oil_co2": oil, "gas_co2": gas}
+    gone = _dissolved(entities["iso_code"].tolist(), years)
+    additive = {key: np.where(gone, 0.0, array) for key, array in additive.items()}
+    agg_names, agg_codes, agg = _aggregate_rows(additive, entities["iso_code"].tolist())
+    names = agg_names + entities["country"].tolist()
+    codes = agg_codes + entities["iso_code"].tolist()
+    table = {key: np.vstack([agg[key], additive[key]]) for key in additive}
+
+    co2 = table["co2"]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        previous = np.c_[np.full(len(co2), np.nan), co2[:, :-1]]
+        table.update({
+            "co2_per_capita": co2 * 1e6 / table["population"],
+            "co2_growth_prct": (co2 / previous - 1) * 100,
+            "co2_growth_abs": co2 - previous,
+            "coal_co2_per_capita": table["coal_co2"] * 1e6 / table["population"],
+            "share_global_co2": co2 / co2[0] * 100,
+            "cumulative_co2": np.nancumsum(co2, axis=1),
+            "cumulative_coal_co2": np.nancumsum(table["coal_co2"], axis=1),
+        })
+    frame = _long(names, codes, years, table)
+    return _with_filler(frame, FILLER_COLUMNS["owid_co2"], rng)
+
+
+def synthetic_energy(scale: int = 1, seed: int = 0) -> pd.DataFrame:
+    """
+    OWID energy-data shaped table (coal consumption series start in 1965).
+
+    Args:
+        scale: Entity multiplier (1 ≈ the real table)
+        seed: Random seed (a different stream from ``synthetic_co2``)
+
+    Returns:
+        Long frame with every column A-01 declares for owid_energy, plus filler
+    """
+    rng = np.random.default_rng(seed + 1)
+    entities = fixture_entities(scale)
+    years = np.arange(FIRST_YEAR, LAST_YEAR + 1)
+    n = len(entities)
+    reported = years[None, :] >= 1965
+
+    coal = np.where(reported, _curves(rng, n, years, 3.0, (1970, 2040), (20, 45)), np.nan)
+    other = _curves(rng, n, years, 4.0, (2000, 2080), (30, 60))
+    primary = np.where(reported, coal + other, np.nan)
+    generation = np.where(reported, primary * rng.uniform(0.25, 0.45, n)[:, None], np.nan)
+    coal_power = generation * rng.uniform(0.0, 0.7, n)[:, None]
+    population = (rng.lognormal(15.0, 1.5, n)[:, None]
+                  * np.exp(rng.uniform(0.005, 0.02, n)[:, None] * (years - FIRST_YEAR)))
+
+    additive = {
+        "population": population, "primary_energy_consumption": primary,
+        "coal_consumption": coal, "coal_electricity": coal_power,
+        "coal_production": coal * rng.uniform(0.0, 1.5, n)[:, None],
+        "electricity_generation": generation, "electricity_demand": generation * 0.98,
+    }
+    gone = _dissolved(entities["iso_code"].tolist(), years)
+    additive = {key: np.where(gone, 0.0, array) for key, array in additive.items()}
+    agg_names, agg_codes, agg = _aggregate_rows(additive, entities["iso_code"].tolist())
+    names = agg_names + entities["country"].tolist()
+    codes = agg_codes + entities["iso_code"].tolist()
+    table = {key: np.vstack([agg[key], additive[key]]) for key in additive}
+    with np.errstate(divide="ignore", invalid="ignore"):
+        table["coal_share_energy"] = table["coal_consumption"] / table["primary_energy_consumption"] * 100
+        table["coal_share_elec"] = table["coal_electricity"] / table["electricity_generation"] * 100
+    frame = _long(names, codes, years, table)
+    return _with_filler(frame, FILLER_COLUMNS["owid_energy"], rng)
+
+
+FIXTURE_TABLES = {"owid_co2": synthetic_co2, "owid_energy": synthetic_energy}
+
+
+# =============================================================================
+# FILES
+# =============================================================================
+
+def _write_csv(frame: pd.DataFrame, path: Path) -> None:
+    """CSV with empty cells for missing values, as OWID publishes."""
+    tmp = path.with_name(path.name + ".tmp")
+    if PYARROW_AVAILABLE:
+        pa_csv.write_csv(pa.Table.from_pandas(frame, preserve_index=False), tmp)
+    else:
+        frame.to_csv(tmp, index=False)
+    tmp.replace(path)
+
+
+def write_fixtures(scale: int, cache_dir: Path, seed: int = 0) -> dict[str, Path]:
+    """
+    Generate (or reuse) the fixture CSVs for one scale.
+
+    Args:
+        scale: Entity multiplier
+        cache_dir: Root for generated fixtures
+        seed: Random seed
+
+    Returns:
+        Source name → CSV path
+    """
+    folder = Path(cache_dir) / f"v{FIXTURE_VERSION}-scale-{scale}-seed-{seed}"
+    folder.mkdir(parents=True, exist_ok=True)
+    files = {}
+    for name, generate in FIXTURE_TABLES.items():
+        path = folder / f"{name}.csv"
+        if not path.is_file():
+            _write_csv(generate(scale, seed), path)
+        files[name] = path
+    return files
+
+
+def seed_raw_store(
+    store: RawDataStore,
+    data_sources: Mapping[str, Mapping],
+    files: Mapping[str, Path],
+) -> RawDataStore:
+    """
+    Index fixture files under the URLs of a DATA_SOURCES config.
+
+    Intake stages then find every source already stored and never open a
+    connection. Sources without a fixture are left out (and would be fetched).
+    """
+    for name, config in data_sources.items():
+        if name in files:
+            digest = store.put_file(files[name])
+            store.record(config["url"], digest, name)
+    return store
+
+
+def mechanism_workspace(computations: Path, dest_root: Path, repo_root: Path) -> Path:
+    """
+    Copy a mechanism's stage scripts into a scratch tree at the same depth.
+
+    Scripts locate the repository as ``Path.cwd().parents[4]`` and
+    ``load_dataset`` finds mechanisms next to the imported package, so the copy
+    keeps the ``mechanism_dossiers/<vector>/<mechanism>/evidence_archive/computations``
+    layout and gets its own ``computational_core``; put ``dest_root`` on
+    PYTHONPATH when running the stages.
+
+    Returns:
+        The copied computations/ folder
+    """
+    relative = computations.resolve().relative_to(repo_root.resolve())
+    target = dest_root / relative
+    if target.exists():
+        shutil.rmtree(target.parent.parent)  # <mechanism>/ of the previous copy
+    target.mkdir(parents=True)
+    package = dest_root / "computational_core"
+    if package.exists():
+        shutil.rmtree(package)
+    shutil.copytree(repo_root / "computational_core", package,
+                    ignore=shutil.ignore_patterns("__pycache__"))
+    for script in computations.glob("[0-9][0-9]_*.py"):
+        shutil.copy2(script, target / script.name)
+    for folder in ("../datasets/raw", "../datasets/processed", "../datasets/derived",
+                   "../../exhibits/figures", "../../exhibits/tables"):
+        (target / folder).mkdir(parents=True, exist_ok=True)
+    return target
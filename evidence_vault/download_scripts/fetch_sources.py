@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+✒ Metadata
+    - Title: Vault Source Fetcher (Terminal Velocity - v1.0)
+    - File Name: fetch_sources.py
+    - Relative Path: evidence_vault/download_scripts/fetch_sources.py
+    - Artifact Type: CLI
+    - Version: 1.1.0
+    - Date: 2026-10-18
+    - Update: Sunday, October 18, 2026
+    - Author: Dennis 'dnoice' Smaltz
+    - A.I. Acknowledgement: Anthropic - Claude Opus 4.5
+    - Signature:  ︻デ═—··· 🎯 = Aim Twice, Shoot Once!
+
+✒ Description:
+    Downloads every DATA_SOURCES entry declared by the mechanism intake scripts into
+    the shared raw store, concurrently, and links each source into the datasets/raw/
+    folder of every mechanism that uses it. It then (re)builds the shared country ×
+    year panel from the declared columns of every stored source. tv_run executes this
+    script once before any intake stage, so intakes start with a warm store.
+
+✒ Key Features:
+    - Feature 1: One pass over all mechanisms (or the tv_run selection via TV_MECHANISMS)
+    - Feature 2: Concurrent, per-host-limited, keep-alive downloads (shared_utils.downloader)
+    - Feature 3: Conditional refresh of stored sources with --refresh
+    - Feature 4: Per-source status table and aggregate throughput report
+    - Feature 5: Shared panel store rebuild (skipped when nothing changed)
+
+✒ Usage Instructions:
+    Run from anywhere; paths resolve from this file's location:
+
+        $ python evidence_vault/download_scripts/fetch_sources.py
+
+✒ Examples:
+    $ python evidence_vault/download_scripts/fetch_sources.py
+    $ python evidence_vault/download_scripts/fetch_sources.py --mechanisms A-01 A-02
+    $ python evidence_vault/download_scripts/fetch_sources.py --jobs 16 --per-host 6
+    $ python evidence_vault/download_scripts/fetch_sources.py --refresh
+    $ python evidence_vault/download_scripts/fetch_sources.py --dry-run
+
+✒ Command-Line Arguments:
+    --mechanisms, -m         Mechanism codes (default: $TV_MECHANISMS, else all)
+    --jobs, -j N             Concurrent transfers (default: 8)
+    --per-host N             Concurrent transfers per host (default: 4)
+    --refresh, -r            Re-check stored sources upstream (conditional requests)
+    --dry-run, -n            List the sources without fetching
+    --quiet, -q              No progress lines; summary only
+    --no-panel               Skip the panel store rebuild
+
+✒ Other Important Information:
+    - Dependencies:
+        Required: requests, pyarrow (panel)
+    - Compatible platforms: Linux, Windows, macOS
+    - Exit codes:
+        0: All sources available
+        1: One or more sources failed to download
+---------
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from computational_core.shared_utils.downloader import (  # noqa: E402
+    DEFAULT_PER_HOST,
+    DEFAULT_WORKERS,
+    ConcurrentDownloader,
+    collect_sources,
+    print_report,
+)
+from computational_core.shared_utils.panel import build_panel  # noqa: E402
+
+MECHANISMS_ENV_VAR = "TV_MECHANISMS"
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Fetch all mechanism DATA_SOURCES into the shared raw store",
+    )
+    parser.add_argument("--mechanisms", "-m", nargs="+", metavar="CODE",
+                        help="Mechanism codes (default: $TV_MECHANISMS, else all)")
+    parser.add_argument("--jobs", "-j", type=int, default=DEFAULT_WORKERS,
+                        help=f"Concurrent transfers (default: {DEFAULT_WORKERS})")
+    parser.add_argument("--per-host", type=int, default=DEFAULT_PER_HOST,
+                        help=f"Concurrent transfers per host (default: {DEFAULT_PER_HOST})")
+    parser.add_argument("--refresh", "-r", action="store_true",
+                        help="Re-check stored sources upstream")
+    parser.add_argument("--dry-run", "-n", action="store_true",
+                        help="List the sources without fetching")
+    parser.add_argument("--quiet", "-q", action="store_true",
+                        help="No progress lines; summary only")
+    parser.add_argument("--no-panel", action="store_true",
+                        help="Skip the panel store rebuild")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Main entry point."""
+    args = parse_args(argv)
+    codes = args.mechanisms
+    if codes is None and os.environ.get(MECHANISMS_ENV_VAR):
+        codes = os.environ[MECHANISMS_ENV_VAR].split(",")
+
+    specs = collect_sources(REPO_ROOT, codes)
+    if args.dry_run or not specs:
+        for spec in specs:
+            print(f"  {spec.source_name:<24} {spec.host:<32} {','.join(spec.mechanisms)}")
+        print(f"{len(specs)} distinct sources")
+        return 0
+
+    downloader = ConcurrentDownloader(
+        max_workers=args.jobs,
+        per_host=args.per_host,
+        refresh=args.refresh,
+        progress=None if args.quiet else sys.stdout,
+    )
+    start = time.perf_counter()
+    outcomes = downloader.run(specs)
+    print_report(outcomes, time.perf_counter() - start)
+
+    if not args.no_panel:
+        # The panel spans every mechanism's sources, not just the current selection
+        start = time.perf_counter()
+        panel = build_panel(collect_sources(REPO_ROOT))
+        if panel is not None:
+            n_c, n_y = panel.shape
+            print(f"\nPanel: {len(panel.indicators)} indicators × {n_c} countries × "
+                  f"{n_y} years ({time.perf_counter() - start:.2f}s) → {panel.root}")
+
+    return 0 if all(o.ok for o in outcomes) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
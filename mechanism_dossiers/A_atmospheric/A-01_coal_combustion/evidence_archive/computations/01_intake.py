@@ -6,9 +6,9 @@ Metadata
     - File Name: 01_intake.py
     - Relative Path: mechanism_dossiers/A_atmospheric/A-01_coal_combustion/evidence_archive/computations/01_intake.py
     - Artifact Type: script
-    - Version: 1.1.0
+    - Version: 1.8.1
     - Date: 2025-12-14
-    - Update: Sunday, December 14, 2025
+    - Update: Sunday, October 18, 2026
     - Author: Dennis 'dnoice' Smaltz
     - A.I. Acknowledgement: Anthropic - Claude Opus 4.5
     - Signature:  ︻デ═—··· 🎯 = Aim Twice, Shoot Once!
@@ -26,8 +26,18 @@ Key Features:
     - Feature 4: Air pollution mortality data
     - Feature 5: Schema validation against expected column structures
     - Feature 6: Unit conversion and standardization (Mt CO2, TWh)
-    - Feature 7: Data provenance logging with timestamps
+    - Feature 7: Structured provenance events (timings, rows, peak RSS)
     - Feature 8: Parquet export for efficient downstream analysis
+    - Feature 9: Shared content-addressed raw store (evidence_vault/raw_data), linked
+      into ../datasets/raw/ so each source is downloaded once per repository
+    - Feature 10: Conditional refresh (ETag / Last-Modified), resumable downloads and
+      optional SHA-256 pins (DATA_SOURCES[...]["sha256"])
+    - Feature 11: Concurrent source downloads over pooled keep-alive connections
+    - Feature 12: Column-pruned, dtype-declared CSV parsing (pyarrow; float64 totals,
+      float32 rates and shares, int16, categorical) from DATA_SOURCES[...]["columns"],
+      cached as a memory-mapped Arrow sidecar keyed by the raw file hash
+    - Feature 13: Shared country × year panel (shared_utils.panel) rebuilt after
+      downloads when a stored source changed; 02_analysis reads it
 
 Usage Instructions:
     Run as Jupyter notebook (via jupytext) or as standalone script:
@@ -39,7 +49,9 @@ Usage Instructions:
         $ python 01_intake.py
 
     Outputs will be written to:
-        - ../datasets/raw/*.csv (original downloads)
+        - ../../../../../evidence_vault/raw_data/objects/ (original downloads, by SHA-256)
+        - ../datasets/raw/*.csv (links to the shared raw store)
+        - ../../../../../evidence_vault/panel/ (shared panel, TV_PANEL_STORE)
         - ../datasets/processed/coal_emissions.parquet
         - ../datasets/processed/coal_consumption.parquet
         - ../datasets/processed/air_pollution_deaths.parquet
@@ -92,36 +104,46 @@ Other Important Information:
 
 # %%
 import pandas as pd
-import requests
+import sys
 from pathlib import Path
 from datetime import datetime
 import json
 
+# Make computational_core importable when run from this folder
+REPO_ROOT = Path.cwd().resolve().parents[4]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from computational_core.shared_utils.downloader import (
+    ConcurrentDownloader,
+    collect_sources,
+    print_report,
+    sources_from_config,
+)
+from computational_core.shared_utils.data_utils import read_csv_columns
+from computational_core.shared_utils.panel import build_panel
+from computational_core.shared_utils.provenance import ProvenanceRecorder
+from computational_core.shared_utils.quality import data_dictionary, profile_frame
+from computational_core.shared_utils.raw_store import RawDataStore
+
 # Configuration
 MECHANISM_CODE = "A-01"
 RAW_DATA_DIR = Path("../datasets/raw")
 PROCESSED_DIR = Path("../datasets/processed")
 DERIVED_DIR = Path("../datasets/derived")
 
+# Shared raw store (evidence_vault/raw_data): one copy of each source per repository
+RAW_STORE = RawDataStore()
+
 # Ensure directories exist
 RAW_DATA_DIR.mkdir(parents=True, exist_ok=True)
 PROCESSED_DIR.mkdir(parents=True, exist_ok=True)
 DERIVED_DIR.mkdir(parents=True, exist_ok=True)
 
-# Provenance log
-provenance_log = []
-
-def log_action(action: str, notes: str = ""):
-    """Log an action with timestamp for provenance tracking."""
-    entry = {
-        "timestamp": datetime.now().isoformat(),
-        "action": action,
-        "notes": notes
-    }
-    provenance_log.append(entry)
-    print(f"[{entry['timestamp']}] {action}: {notes}")
+# Provenance log (buffered; echoed only in verbose runs, flushed to the shared store)
+provenance = ProvenanceRecorder(MECHANISM_CODE, "01_intake")
 
-log_action("Pipeline started", f"Mechanism {MECHANISM_CODE}")
+provenance.record("Pipeline started", f"Mechanism {MECHANISM_CODE}")
 
 # %% [markdown]
 # ## 1. Data Source Configuration
@@ -137,7 +159,18 @@ DATA_SOURCES = {
         "license": "CC-BY 4.0",
         "citation": "Global Carbon Project via Our World in Data",
         "local_file": "owid_co2_data.csv",
-        "key_columns": ["country", "year", "co2", "coal_co2", "co2_per_capita"]
+        "key_columns": ["country", "year", "co2", "coal_co2", "co2_per_capita"],
+        # Only these columns are parsed, straight into these dtypes: float64 for
+        # totals and cumulative sums (World cumulative CO2 is ~1.8e6 Mt, population
+        # ~8e9; float32 keeps 7 significant digits), float32 for rates and shares
+        "columns": {
+            "country": "category", "iso_code": "category", "year": "int16",
+            "population": "float64", "co2": "float64", "coal_co2": "float64",
+            "oil_co2": "float64", "gas_co2": "float64", "co2_per_capita": "float32",
+            "co2_growth_prct": "float32", "co2_growth_abs": "float64",
+            "coal_co2_per_capita": "float32", "share_global_co2": "float32",
+            "cumulative_co2": "float64", "cumulative_coal_co2": "float64",
+        },
     },
     "owid_energy": {
         "url": "https://raw.githubusercontent.com/owid/energy-data/master/owid-energy-data.csv",
@@ -145,8 +178,16 @@ DATA_SOURCES = {
         "license": "CC-BY 4.0",
         "citation": "Energy Institute Statistical Review via Our World in Data",
         "local_file": "owid_energy_data.csv",
-        "key_columns": ["country", "year", "coal_consumption", "coal_share_energy", "coal_electricity"]
-    }
+        "key_columns": ["country", "year", "coal_consumption", "coal_share_energy", "coal_electricity"],
+        "columns": {
+            "country": "category", "iso_code": "category", "year": "int16",
+            "population": "float64", "primary_energy_consumption": "float64",
+            "coal_consumption": "float64", "coal_share_energy": "float32",
+            "coal_share_elec": "float32", "coal_electricity": "float64",
+            "coal_production": "float64", "electricity_generation": "float64",
+            "electricity_demand": "float64",
+        },
+    },
 }
 
 # Display source configuration
@@ -157,50 +198,41 @@ for name, config in DATA_SOURCES.items():
 # %% [markdown]
 # ## 2. Data Acquisition
 #
-# Download raw datasets from authoritative sources.
+# Fetch raw datasets into the shared raw store and link them into `../datasets/raw/`.
+# Sources already stored by any mechanism are reused without a download; missing
+# sources are downloaded concurrently.
 
 # %%
-def download_dataset(source_name: str, config: dict, force: bool = False) -> Path:
-    """
-    Download a dataset from URL to local raw directory.
+# Set True to re-check stored sources upstream (conditional requests: an unchanged
+# source costs one header-only round trip and is not transferred again)
+REFRESH_SOURCES = False
 
-    Args:
-        source_name: Identifier for the data source
-        config: Configuration dict with url, local_file, etc.
-        force: If True, re-download even if file exists
-
-    Returns:
-        Path to downloaded file
-    """
-    local_path = RAW_DATA_DIR / config["local_file"]
+# All sources are fetched concurrently over pooled keep-alive connections
+downloader = ConcurrentDownloader(RAW_STORE, refresh=REFRESH_SOURCES)
+outcomes = downloader.run(sources_from_config(DATA_SOURCES, RAW_DATA_DIR, MECHANISM_CODE))
 
-    if local_path.exists() and not force:
-        log_action(f"Using cached {source_name}", str(local_path))
-        return local_path
-
-    log_action(f"Downloading {source_name}", config["url"])
-
-    try:
-        response = requests.get(config["url"], timeout=60)
-        response.raise_for_status()
-
-        local_path.write_bytes(response.content)
-
-        size_mb = len(response.content) / (1024 * 1024)
-        log_action(f"Downloaded {source_name}", f"{size_mb:.2f} MB saved to {local_path}")
-
-        return local_path
-
-    except requests.RequestException as e:
-        log_action(f"ERROR downloading {source_name}", str(e))
-        raise
-
-# Download all configured sources
 downloaded_files = {}
-for name, config in DATA_SOURCES.items():
-    downloaded_files[name] = download_dataset(name, config)
-
-print(f"\nDownloaded {len(downloaded_files)} datasets to {RAW_DATA_DIR}")
+raw_blobs = {}
+for outcome in outcomes:
+    name = outcome.spec.source_name
+    if not outcome.ok:
+        provenance.record(f"ERROR downloading {name}", outcome.error, kind="error")
+        raise RuntimeError(f"Could not fetch {name}: {outcome.error}")
+
+    size_mb = outcome.size / (1024 * 1024)
+    provenance.record(f"{outcome.status.replace('_', ' ').capitalize()}: {name}",
+                      f"{size_mb:.2f} MB, sha256 {outcome.sha256[:12]}, {outcome.seconds:.1f}s")
+    downloaded_files[name] = outcome.spec.targets[0]
+    raw_blobs[name] = outcome.sha256
+
+print_report(outcomes, downloader.elapsed)
+print(f"\nLinked {len(downloaded_files)} datasets into {RAW_DATA_DIR}")
+
+# Shared country × year panel over every mechanism's stored sources (a no-op when
+# no stored source or declared column changed since the last build)
+panel = build_panel(collect_sources(REPO_ROOT), RAW_STORE)
+provenance.record("Panel ready", f"{len(panel.indicators)} indicators, "
+                  f"{panel.shape[0]} countries × {panel.shape[1]} years", path=panel.root)
 
 # %% [markdown]
 # ## 3. Schema Validation
@@ -223,11 +255,12 @@ def validate_schema(df: pd.DataFrame, expected_columns: list, source_name: str)
     missing = [col for col in expected_columns if col not in df.columns]
 
     if missing:
-        log_action(f"Schema validation FAILED for {source_name}", f"Missing: {missing}")
+        provenance.record(f"Schema validation FAILED for {source_name}", f"Missing: {missing}",
+                          kind="error")
         raise ValueError(f"Missing columns in {source_name}: {missing}")
 
-    log_action(f"Schema validation passed for {source_name}",
-               f"{len(expected_columns)} required columns found")
+    provenance.record(f"Schema validation passed for {source_name}",
+                      f"{len(expected_columns)} required columns found")
     return True
 
 # Load and validate each dataset
@@ -236,9 +269,13 @@ raw_data = {}
 for name, config in DATA_SOURCES.items():
     file_path = downloaded_files[name]
 
-    # Load CSV
-    df = pd.read_csv(file_path)
-    log_action(f"Loaded {name}", f"{len(df):,} rows, {len(df.columns)} columns")
+    # Load only the declared columns, already typed (memory-mapped Arrow sidecar
+    # after the first parse of this raw file)
+    with provenance.step(f"Loaded {name}") as step:
+        df = read_csv_columns(file_path, config["columns"])
+        memory_mb = df.memory_usage(deep=True).sum() / (1024 * 1024)
+        step.rows = len(df)
+        step.notes = f"{len(df.columns)} columns, {memory_mb:.1f} MB"
 
     # Validate schema
     validate_schema(df, config["key_columns"], name)
@@ -274,23 +311,21 @@ available_co2_cols = [c for c in co2_columns if c in co2_df.columns]
 coal_emissions = co2_df[available_co2_cols].copy()
 
 # Filter to valid years (1900+) and non-null countries
+# (numeric columns are already float64/float32/int16, as declared in DATA_SOURCES)
 coal_emissions = coal_emissions[
     (coal_emissions["year"] >= 1900) &
     (coal_emissions["country"].notna())
 ]
 
-# Convert CO2 values to numeric, coercing errors
-numeric_cols = [c for c in coal_emissions.columns if c not in ["country", "iso_code"]]
-for col in numeric_cols:
-    coal_emissions[col] = pd.to_numeric(coal_emissions[col], errors="coerce")
-
 # Add metadata columns
 coal_emissions["source"] = "Global Carbon Project via OWID"
 coal_emissions["unit_co2"] = "million tonnes CO2"
 coal_emissions["access_date"] = datetime.now().strftime("%Y-%m-%d")
 
-log_action("Processed coal emissions",
-           f"{len(coal_emissions):,} rows, {coal_emissions['year'].min()}-{coal_emissions['year'].max()}")
+provenance.record("Processed coal emissions",
+                  f"{len(coal_emissions):,} rows, "
+                  f"{coal_emissions['year'].min()}-{coal_emissions['year'].max()}",
+                  rows=len(coal_emissions))
 
 # Display sample
 print("\nCoal emissions sample (top 5 emitters, latest year):")
@@ -327,18 +362,15 @@ coal_consumption = coal_consumption[
     (coal_consumption["country"].notna())
 ]
 
-# Convert to numeric
-numeric_cols = [c for c in coal_consumption.columns if c not in ["country", "iso_code"]]
-for col in numeric_cols:
-    coal_consumption[col] = pd.to_numeric(coal_consumption[col], errors="coerce")
-
 # Add metadata
 coal_consumption["source"] = "Energy Institute Statistical Review via OWID"
 coal_consumption["unit_consumption"] = "TWh"
 coal_consumption["access_date"] = datetime.now().strftime("%Y-%m-%d")
 
-log_action("Processed coal consumption",
-           f"{len(coal_consumption):,} rows, {coal_consumption['year'].min()}-{coal_consumption['year'].max()}")
+provenance.record("Processed coal consumption",
+                  f"{len(coal_consumption):,} rows, "
+                  f"{coal_consumption['year'].min()}-{coal_consumption['year'].max()}",
+                  rows=len(coal_consumption))
 
 # Display sample
 print("\nCoal consumption sample (top 5 consumers, latest year):")
@@ -353,53 +385,23 @@ print(top_consumers.to_string(index=False))
 # Identify and flag potential data quality issues.
 
 # %%
-def data_quality_report(df: pd.DataFrame, name: str) -> dict:
-    """
-    Generate data quality metrics for a dataframe.
-
-    Args:
-        df: DataFrame to analyze
-        name: Dataset name for reporting
-
-    Returns:
-        Dict with quality metrics
-    """
-    report = {
-        "dataset": name,
-        "total_rows": len(df),
-        "total_columns": len(df.columns),
-        "null_counts": df.isnull().sum().to_dict(),
-        "null_percentages": (df.isnull().sum() / len(df) * 100).round(2).to_dict(),
-        "duplicates": df.duplicated().sum(),
-        "memory_mb": df.memory_usage(deep=True).sum() / (1024 * 1024)
-    }
-
-    # Year coverage
-    if "year" in df.columns:
-        report["year_range"] = f"{int(df['year'].min())}-{int(df['year'].max())}"
-        report["year_gaps"] = sorted(set(range(int(df['year'].min()), int(df['year'].max()) + 1)) -
-                                     set(df['year'].dropna().astype(int).unique()))
-
-    # Country coverage
-    if "country" in df.columns:
-        report["unique_countries"] = df["country"].nunique()
-
-    return report
-
-# Generate quality reports
+# Profile each dataset once; the profiles also feed the data dictionary
+profiles = {}
 quality_reports = {}
 for name, df in [("coal_emissions", coal_emissions), ("coal_consumption", coal_consumption)]:
-    quality_reports[name] = data_quality_report(df, name)
+    profiles[name] = profile_frame(df, name, entity="country", time="year")
+    quality_reports[name] = profiles[name].report()
 
     print(f"\n{name.upper()} Quality Report:")
     print(f"  Rows: {quality_reports[name]['total_rows']:,}")
     print(f"  Columns: {quality_reports[name]['total_columns']}")
     print(f"  Duplicates: {quality_reports[name]['duplicates']}")
     print(f"  Year range: {quality_reports[name].get('year_range', 'N/A')}")
-    print(f"  Countries: {quality_reports[name].get('unique_countries', 'N/A')}")
+    print(f"  Countries: {quality_reports[name].get('unique_entities', 'N/A')} "
+          f"({quality_reports[name].get('entities_with_gaps', 0)} with year gaps)")
     print(f"  Memory: {quality_reports[name]['memory_mb']:.2f} MB")
 
-log_action("Data quality checks complete", f"{len(quality_reports)} datasets analyzed")
+provenance.record("Data quality checks complete", f"{len(quality_reports)} datasets analyzed")
 
 # %% [markdown]
 # ## 7. Export Processed Data
@@ -411,10 +413,10 @@ log_action("Data quality checks complete", f"{len(quality_reports)} datasets ana
 try:
     import pyarrow
     USE_PARQUET = True
-    log_action("Parquet support available", "Using pyarrow")
+    provenance.record("Parquet support available", "Using pyarrow")
 except ImportError:
     USE_PARQUET = False
-    log_action("Parquet not available", "Falling back to CSV")
+    provenance.record("Parquet not available", "Falling back to CSV")
 
 # Export coal emissions
 if USE_PARQUET:
@@ -423,7 +425,7 @@ if USE_PARQUET:
 else:
     emissions_path = PROCESSED_DIR / "coal_emissions.csv"
     coal_emissions.to_csv(emissions_path, index=False)
-log_action("Exported coal emissions", str(emissions_path))
+provenance.record("Exported coal emissions", path=emissions_path, rows=len(coal_emissions))
 
 # Export coal consumption
 if USE_PARQUET:
@@ -432,7 +434,8 @@ if USE_PARQUET:
 else:
     consumption_path = PROCESSED_DIR / "coal_consumption.csv"
     coal_consumption.to_csv(consumption_path, index=False)
-log_action("Exported coal consumption", str(consumption_path))
+provenance.record("Exported coal consumption", path=consumption_path,
+                  rows=len(coal_consumption))
 
 # Display file sizes
 for path in [emissions_path, consumption_path]:
@@ -445,72 +448,43 @@ for path in [emissions_path, consumption_path]:
 # Create documentation for all processed datasets.
 
 # %%
-def generate_data_dictionary(datasets: dict) -> pd.DataFrame:
-    """
-    Generate a combined data dictionary for all datasets.
-
-    Args:
-        datasets: Dict of {name: dataframe}
-
-    Returns:
-        DataFrame with column metadata
-    """
-    records = []
-
-    column_descriptions = {
-        "country": "Country or region name",
-        "iso_code": "ISO 3166-1 alpha-3 country code",
-        "year": "Calendar year",
-        "population": "Population count",
-        "co2": "Total CO2 emissions (million tonnes)",
-        "coal_co2": "CO2 emissions from coal (million tonnes)",
-        "oil_co2": "CO2 emissions from oil (million tonnes)",
-        "gas_co2": "CO2 emissions from gas (million tonnes)",
-        "co2_per_capita": "CO2 emissions per capita (tonnes)",
-        "coal_co2_per_capita": "Coal CO2 per capita (tonnes)",
-        "co2_growth_prct": "Year-over-year CO2 growth (%)",
-        "co2_growth_abs": "Year-over-year CO2 growth (million tonnes)",
-        "share_global_co2": "Share of global CO2 emissions (%)",
-        "cumulative_co2": "Cumulative CO2 emissions since 1750",
-        "cumulative_coal_co2": "Cumulative coal CO2 since 1750",
-        "primary_energy_consumption": "Primary energy consumption (TWh)",
-        "coal_consumption": "Coal consumption (TWh)",
-        "coal_share_energy": "Coal share of primary energy (%)",
-        "coal_share_elec": "Coal share of electricity (%)",
-        "coal_electricity": "Electricity from coal (TWh)",
-        "coal_production": "Coal production (TWh equivalent)",
-        "electricity_generation": "Total electricity generation (TWh)",
-        "electricity_demand": "Total electricity demand (TWh)",
-        "source": "Data source attribution",
-        "unit_co2": "Unit for CO2 values",
-        "unit_consumption": "Unit for consumption values",
-        "access_date": "Date data was accessed"
-    }
-
-    for dataset_name, df in datasets.items():
-        for col in df.columns:
-            records.append({
-                "dataset": dataset_name,
-                "column": col,
-                "dtype": str(df[col].dtype),
-                "non_null_count": df[col].notna().sum(),
-                "null_count": df[col].isna().sum(),
-                "null_pct": round(df[col].isna().sum() / len(df) * 100, 2),
-                "unique_values": df[col].nunique(),
-                "description": column_descriptions.get(col, "")
-            })
-
-    return pd.DataFrame(records)
+COLUMN_DESCRIPTIONS = {
+    "country": "Country or region name",
+    "iso_code": "ISO 3166-1 alpha-3 country code",
+    "year": "Calendar year",
+    "population": "Population count",
+    "co2": "Total CO2 emissions (million tonnes)",
+    "coal_co2": "CO2 emissions from coal (million tonnes)",
+    "oil_co2": "CO2 emissions from oil (million tonnes)",
+    "gas_co2": "CO2 emissions from gas (million tonnes)",
+    "co2_per_capita": "CO2 emissions per capita (tonnes)",
+    "coal_co2_per_capita": "Coal CO2 per capita (tonnes)",
+    "co2_growth_prct": "Year-over-year CO2 growth (%)",
+    "co2_growth_abs": "Year-over-year CO2 growth (million tonnes)",
+    "share_global_co2": "Share of global CO2 emissions (%)",
+    "cumulative_co2": "Cumulative CO2 emissions since 1750",
+    "cumulative_coal_co2": "Cumulative coal CO2 since 1750",
+    "primary_energy_consumption": "Primary energy consumption (TWh)",
+    "coal_consumption": "Coal consumption (TWh)",
+    "coal_share_energy": "Coal share of primary energy (%)",
+    "coal_share_elec": "Coal share of electricity (%)",
+    "coal_electricity": "Electricity from coal (TWh)",
+    "coal_production": "Coal production (TWh equivalent)",
+    "electricity_generation": "Total electricity generation (TWh)",
+    "electricity_demand": "Total electricity demand (TWh)",
+    "source": "Data source attribution",
+    "unit_co2": "Unit for CO2 values",
+    "unit_consumption": "Unit for consumption values",
+    "access_date": "Date data was accessed"
+}
 
 # Generate and save data dictionary
-data_dict = generate_data_dictionary({
-    "coal_emissions": coal_emissions,
-    "coal_consumption": coal_consumption
-})
+data_dict = data_dictionary(profiles.values(), descriptions=COLUMN_DESCRIPTIONS)
 
 dict_path = DERIVED_DIR / "data_dictionary.csv"
 data_dict.to_csv(dict_path, index=False)
-log_action("Generated data dictionary", f"{len(data_dict)} columns documented")
+provenance.record("Generated data dictionary", f"{len(data_dict)} columns documented",
+                  path=dict_path)
 
 print(f"\nData dictionary saved to: {dict_path}")
 print(f"Columns documented: {len(data_dict)}")
@@ -529,11 +503,13 @@ with open(provenance_path, "w") as f:
         "pipeline": "01_intake",
         "run_timestamp": datetime.now().isoformat(),
         "data_sources": DATA_SOURCES,
+        "raw_blobs": raw_blobs,
         "quality_reports": quality_reports,
-        "actions": provenance_log
+        "actions": provenance.entries()
     }, f, indent=2, default=str)
 
-log_action("Saved provenance log", str(provenance_path))
+provenance.record("Saved provenance log", path=provenance_path)
+events_path = provenance.flush()
 
 # %% [markdown]
 # ## 10. Summary
@@ -544,7 +520,7 @@ log_action("Saved provenance log", str(provenance_path))
 print("\n" + "="*60)
 print(f"INTAKE COMPLETE: {MECHANISM_CODE} - Coal Combustion Chain")
 print("="*60)
-print(f"\nRaw data downloaded to: {RAW_DATA_DIR}")
+print(f"\nRaw data linked into: {RAW_DATA_DIR} (store: {RAW_STORE.root})")
 for f in RAW_DATA_DIR.glob("*.csv"):
     print(f"  - {f.name}")
 
@@ -558,7 +534,7 @@ for f in DERIVED_DIR.glob("*"):
     if f.is_file():
         print(f"  - {f.name}")
 
-print(f"\nTotal actions logged: {len(provenance_log)}")
+print(f"\nTotal actions logged: {len(provenance)} (appended to {events_path})")
 print(f"Pipeline finished at: {datetime.now().isoformat()}")
 
 # %% [markdown]
@@ -568,3 +544,10 @@ print(f"Pipeline finished at: {datetime.now().isoformat()}")
 # |--------|-----------|-------|
 # | Created | 2025-12-14 | Initial template with docstring header |
 # | Updated | 2025-12-14 | Implemented OWID data acquisition pipeline |
+# | Updated | 2026-10-18 | Raw downloads moved to the shared content-addressed store |
+# | Updated | 2026-10-18 | Sources fetched concurrently (shared_utils.downloader) |
+# | Updated | 2026-10-18 | Declared columns/dtypes; CSVs parsed column-pruned with pyarrow |
+# | Updated | 2026-10-18 | Quality report and data dictionary from one profile (shared_utils.quality) |
+# | Updated | 2026-10-18 | Structured provenance events (shared_utils.provenance) |
+# | Updated | 2026-10-18 | Builds the shared country × year panel (shared_utils.panel) |
+# | Updated | 2026-10-18 | Totals and cumulative columns declared float64; float32 kept for rates and shares |
@@ -6,9 +6,9 @@ Metadata
     - File Name: 02_analysis.py
     - Relative Path: mechanism_dossiers/A_atmospheric/A-01_coal_combustion/evidence_archive/computations/02_analysis.py
     - Artifact Type: script
-    - Version: 1.1.0
+    - Version: 1.11.0
     - Date: 2025-12-14
-    - Update: Sunday, December 14, 2025
+    - Update: Sunday, October 18, 2026
     - Author: Dennis 'dnoice' Smaltz
     - A.I. Acknowledgement: Anthropic - Claude Opus 4.5
     - Signature:  ︻デ═—··· 🎯 = Aim Twice, Shoot Once!
@@ -23,10 +23,10 @@ Key Features:
     - Feature 2: Year-over-year growth rate computation
     - Feature 3: Regional aggregation and comparison (Top 10 emitters)
     - Feature 4: Baseline, accelerated phaseout, and delayed action scenarios
-    - Feature 5: Carbon budget analysis and remaining timeline
+    - Feature 5: Carbon budget analysis and remaining timeline (with Monte Carlo bands)
     - Feature 6: Historical trend decomposition (peak years, growth phases)
     - Feature 7: Attribution analysis (country/region shares)
-    - Feature 8: Reproducible analysis with provenance logging
+    - Feature 8: Reproducible analysis with structured provenance events
 
 Usage Instructions:
     Run after 01_intake.py has generated processed data:
@@ -40,12 +40,19 @@ Usage Instructions:
     Inputs:
         - ../datasets/processed/coal_emissions.parquet
         - ../datasets/processed/coal_consumption.parquet
+        - Shared panel (shared_utils.panel, built by 01_intake.py): World coal CO2
 
     Outputs:
         - ../datasets/derived/analysis_results.csv
         - ../datasets/derived/country_rankings.csv
         - ../datasets/derived/scenario_projections.csv
         - ../datasets/derived/trend_analysis.csv
+        - ../datasets/derived/trend_analysis_all_countries.csv
+        - ../datasets/derived/budget_exhaustion_percentiles.csv
+        - ../datasets/derived/budget_exhaustion_distribution.csv
+        - ../datasets/derived/parameter_sweeps.parquet
+        - ../datasets/derived/sensitivity_oat.csv
+        - ../datasets/derived/sensitivity_sobol.csv
 
 Examples:
     $ python 02_analysis.py
@@ -91,9 +98,27 @@ Other Important Information:
 # %%
 import pandas as pd
 import numpy as np
+import sys
 from pathlib import Path
 from datetime import datetime
 import json
+from functools import partial
+
+# Make computational_core importable when run from this folder
+REPO_ROOT = Path.cwd().resolve().parents[4]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from computational_core.shared_utils.budgets import budget_exhaustion
+from computational_core.shared_utils.data_utils import load_dataset
+from computational_core.shared_utils.panel import Panel
+from computational_core.shared_utils.provenance import ProvenanceRecorder
+from computational_core.shared_utils.regions import region_registry
+from computational_core.shared_utils.scenarios import project, project_scenarios
+from computational_core.shared_utils.sweeps import SweepRunner, parameter_space
+from computational_core.shared_utils.timeseries import add_time_features
+from computational_core.shared_utils.trends import classify_trends
+from computational_core.shared_utils.uncertainty import monte_carlo_budgets
 
 MECHANISM_CODE = "A-01"
 PROCESSED_DIR = Path("../datasets/processed")
@@ -102,51 +127,30 @@ DERIVED_DIR = Path("../datasets/derived")
 # Ensure output directory exists
 DERIVED_DIR.mkdir(parents=True, exist_ok=True)
 
-# Analysis log
-analysis_log = []
+# Analysis log (buffered; echoed only in verbose runs, flushed to the shared store)
+provenance = ProvenanceRecorder(MECHANISM_CODE, "02_analysis")
 
-def log_analysis(step: str, result: str = ""):
-    """Log an analysis step with timestamp."""
-    entry = {
-        "timestamp": datetime.now().isoformat(),
-        "step": step,
-        "result": result
-    }
-    analysis_log.append(entry)
-    print(f"[{entry['timestamp'][:19]}] {step}: {result}")
-
-log_analysis("Analysis started", f"Mechanism {MECHANISM_CODE}")
+provenance.record("Analysis started", f"Mechanism {MECHANISM_CODE}")
 
 # %% [markdown]
 # ## 1. Load Processed Data
 
 # %%
-# Load emissions data (prefer parquet, fallback to CSV)
-emissions_parquet = PROCESSED_DIR / "coal_emissions.parquet"
-emissions_csv = PROCESSED_DIR / "coal_emissions.csv"
-
-if emissions_parquet.exists():
-    emissions_df = pd.read_parquet(emissions_parquet)
-    log_analysis("Loaded coal emissions (parquet)", f"{len(emissions_df):,} rows")
-elif emissions_csv.exists():
-    emissions_df = pd.read_csv(emissions_csv)
-    log_analysis("Loaded coal emissions (CSV)", f"{len(emissions_df):,} rows")
-else:
-    log_analysis("ERROR", f"Emissions file not found")
+# Load emissions data (parquet or CSV, whichever 01_intake.py wrote)
+try:
+    emissions_df = load_dataset(MECHANISM_CODE, "processed/coal_emissions")
+    provenance.record("Loaded coal emissions", f"{len(emissions_df):,} rows", rows=len(emissions_df))
+except FileNotFoundError:
+    provenance.record("ERROR", "Emissions file not found", kind="error")
     raise FileNotFoundError(f"Run 01_intake.py first")
 
-# Load consumption data (prefer parquet, fallback to CSV)
-consumption_parquet = PROCESSED_DIR / "coal_consumption.parquet"
-consumption_csv = PROCESSED_DIR / "coal_consumption.csv"
-
-if consumption_parquet.exists():
-    consumption_df = pd.read_parquet(consumption_parquet)
-    log_analysis("Loaded coal consumption (parquet)", f"{len(consumption_df):,} rows")
-elif consumption_csv.exists():
-    consumption_df = pd.read_csv(consumption_csv)
-    log_analysis("Loaded coal consumption (CSV)", f"{len(consumption_df):,} rows")
-else:
-    log_analysis("WARNING", f"Consumption file not found")
+# Load consumption data
+try:
+    consumption_df = load_dataset(MECHANISM_CODE, "processed/coal_consumption")
+    provenance.record("Loaded coal consumption", f"{len(consumption_df):,} rows",
+                      rows=len(consumption_df))
+except FileNotFoundError:
+    provenance.record("WARNING", "Consumption file not found", kind="warning")
     consumption_df = None
 
 # Display data overview
@@ -159,27 +163,28 @@ print(f"Countries: {emissions_df['country'].nunique()}")
 # Remove aggregate regions for proper analysis.
 
 # %%
-# Aggregates to exclude from country-level analysis
-AGGREGATE_REGIONS = [
-    "World", "Africa", "Asia", "Europe", "North America", "South America",
-    "Oceania", "Antarctica", "European Union (27)", "European Union (28)",
-    "High-income countries", "Low-income countries", "Lower-middle-income countries",
-    "Upper-middle-income countries", "Asia (excl. China and India)",
-    "Europe (excl. EU-27)", "Europe (excl. EU-28)", "North America (excl. USA)",
-    "OECD", "Non-OECD"
-]
-
-# Filter to countries only (has iso_code and not in aggregates)
-countries_df = emissions_df[
-    (emissions_df["iso_code"].notna()) &
-    (~emissions_df["country"].isin(AGGREGATE_REGIONS))
-].copy()
-
-log_analysis("Filtered to countries", f"{countries_df['country'].nunique()} countries")
-
-# Keep world aggregate for reference
-world_df = emissions_df[emissions_df["country"] == "World"].copy()
-log_analysis("World data extracted", f"{len(world_df)} years")
+# Filter to countries only: aggregates (World, continents, income groups) have no
+# ISO code or an unregistered OWID_ code; former states (USSR, Yugoslavia,
+# Czechoslovakia) are registered and count for the years they existed
+registry = region_registry()
+countries_df = emissions_df[registry.is_country(emissions_df["iso_code"])].copy()
+
+provenance.record("Filtered to countries", f"{countries_df['country'].nunique()} countries")
+
+# World series from the shared panel: the year window is a view of the
+# memory-mapped store and the World row is one index, not a filter
+try:
+    panel = Panel.open()
+except FileNotFoundError:
+    provenance.record("ERROR", "Panel not built", kind="error")
+    raise FileNotFoundError("Run 01_intake.py first")
+window = panel.select(["coal_co2"], years=(int(emissions_df["year"].min()),
+                                           int(emissions_df["year"].max())))
+global_coal = pd.DataFrame({
+    "year": window.years,
+    "coal_co2": window["coal_co2"][panel.code("World")],
+}).dropna()
+provenance.record("World data extracted", f"{len(global_coal)} years")
 
 # %% [markdown]
 # ## 3. Derived Metrics
@@ -187,25 +192,15 @@ log_analysis("World data extracted", f"{len(world_df)} years")
 # Calculate per-capita emissions, growth rates, and shares.
 
 # %%
-# Calculate year-over-year changes for each country
-countries_df = countries_df.sort_values(["country", "year"])
-
-# Year-over-year percentage change in coal CO2
-countries_df["coal_co2_yoy_pct"] = (
-    countries_df.groupby("country")["coal_co2"]
-    .pct_change() * 100
-)
-
-# Year-over-year absolute change
-countries_df["coal_co2_yoy_abs"] = (
-    countries_df.groupby("country")["coal_co2"]
-    .diff()
-)
-
-# 5-year rolling average (smoothed trend)
-countries_df["coal_co2_5yr_avg"] = (
-    countries_df.groupby("country")["coal_co2"]
-    .transform(lambda x: x.rolling(5, min_periods=3).mean())
+# YoY % change, YoY absolute change and 5-year rolling average (min 3 years)
+# for every country in one sorted pass
+countries_df = add_time_features(
+    countries_df,
+    entity="country",
+    time="year",
+    columns=["coal_co2"],
+    rolling_windows=[("mean", 5)],
+    min_periods=3,
 )
 
 # Coal share of total CO2
@@ -213,8 +208,8 @@ countries_df["coal_share_of_co2"] = (
     countries_df["coal_co2"] / countries_df["co2"] * 100
 ).round(2)
 
-log_analysis("Computed derived metrics",
-             "YoY change, 5yr avg, coal share of CO2")
+provenance.record("Computed derived metrics",
+                  "YoY change, 5yr avg, coal share of CO2")
 
 # Display sample of derived metrics
 print("\nDerived metrics sample (China, recent years):")
@@ -244,14 +239,14 @@ latest_rankings["coal_co2_pct_global"] = (
     latest_rankings["coal_co2"] / latest_rankings["coal_co2"].sum() * 100
 ).round(2)
 
-log_analysis(f"Latest year rankings ({latest_year})", f"Top 20 countries")
+provenance.record(f"Latest year rankings ({latest_year})", f"Top 20 countries")
 
 print(f"\nTop 10 Coal CO2 Emitters ({latest_year}):")
 print(latest_rankings[["rank", "country", "coal_co2", "coal_co2_pct_global"]].head(10).to_string(index=False))
 
 # Cumulative emissions rankings
 cumulative_rankings = (countries_df
-    .groupby(["country", "iso_code"])
+    .groupby(["country", "iso_code"], observed=True)
     .agg({
         "coal_co2": "sum",
         "co2": "sum",
@@ -264,7 +259,7 @@ cumulative_rankings.columns = ["country", "iso_code", "cumulative_coal_co2",
 cumulative_rankings = cumulative_rankings.nlargest(20, "cumulative_coal_co2")
 cumulative_rankings["rank"] = range(1, len(cumulative_rankings) + 1)
 
-log_analysis("Cumulative rankings computed", "Historical attribution")
+provenance.record("Cumulative rankings computed", "Historical attribution")
 
 print(f"\nTop 10 Cumulative Coal CO2 Emitters (All Time):")
 print(cumulative_rankings[["rank", "country", "cumulative_coal_co2"]].head(10).to_string(index=False))
@@ -275,75 +270,18 @@ print(cumulative_rankings[["rank", "country", "cumulative_coal_co2"]].head(10).t
 # Identify peak years, growth phases, and decline patterns.
 
 # %%
-def analyze_country_trend(df: pd.DataFrame, country: str) -> dict:
-    """
-    Analyze emissions trend for a single country.
-
-    Args:
-        df: Country-filtered emissions dataframe
-        country: Country name
-
-    Returns:
-        Dict with trend analysis results
-    """
-    country_data = df[df["country"] == country].sort_values("year")
-
-    if len(country_data) < 10:
-        return None
-
-    coal_co2 = country_data["coal_co2"].dropna()
-
-    if len(coal_co2) < 5:
-        return None
-
-    # Find peak year
-    peak_idx = coal_co2.idxmax()
-    peak_year = country_data.loc[peak_idx, "year"]
-    peak_value = coal_co2.max()
+# Classify every country in one grouped pass (peak, change from peak, recent trend)
+all_trends_df = classify_trends(countries_df, entity="country", time="year",
+                                value="coal_co2", growth="coal_co2_yoy_pct")
 
-    # Current value
-    latest_year = country_data["year"].max()
-    latest_value = country_data[country_data["year"] == latest_year]["coal_co2"].values[0]
-
-    # Change from peak
-    change_from_peak = ((latest_value - peak_value) / peak_value * 100) if peak_value > 0 else 0
-
-    # Recent trend (last 5 years average growth)
-    recent_data = country_data[country_data["year"] >= latest_year - 5]["coal_co2_yoy_pct"].dropna()
-    recent_trend = recent_data.mean() if len(recent_data) > 0 else 0
-
-    # Classify trend
-    if change_from_peak < -20 and peak_year < latest_year - 5:
-        status = "Declining"
-    elif recent_trend > 2:
-        status = "Growing"
-    elif recent_trend < -2:
-        status = "Recent decline"
-    else:
-        status = "Plateau"
-
-    return {
-        "country": country,
-        "peak_year": int(peak_year),
-        "peak_coal_co2": round(peak_value, 2),
-        "latest_year": int(latest_year),
-        "latest_coal_co2": round(latest_value, 2) if pd.notna(latest_value) else None,
-        "change_from_peak_pct": round(change_from_peak, 1),
-        "recent_trend_pct": round(recent_trend, 1),
-        "status": status
-    }
-
-# Analyze top 20 emitters
+# Top 20 emitters, in ranking order, for the exhibits
 top_countries = latest_rankings["country"].tolist()
-trend_analysis = []
-
-for country in top_countries:
-    result = analyze_country_trend(countries_df, country)
-    if result:
-        trend_analysis.append(result)
-
-trend_df = pd.DataFrame(trend_analysis)
-log_analysis("Trend analysis complete", f"{len(trend_df)} countries analyzed")
+trend_df = (all_trends_df.set_index("country")
+            .reindex(top_countries)
+            .dropna(subset=["status"])
+            .reset_index())
+provenance.record("Trend analysis complete",
+                  f"{len(all_trends_df)} countries classified, {len(trend_df)} top emitters reported")
 
 print("\nTrend Analysis (Top Emitters):")
 print(trend_df[["country", "peak_year", "status", "change_from_peak_pct"]].to_string(index=False))
@@ -358,68 +296,51 @@ print(trend_df[["country", "peak_year", "status", "change_from_peak_pct"]].to_st
 # 1.5C with 50% probability: ~500 Gt CO2 remaining from 2020
 # Current annual emissions: ~40 Gt CO2 total, ~15 Gt from coal
 
-# Get global coal CO2 trend
-global_coal = world_df[["year", "coal_co2"]].dropna().copy()
+# Global coal CO2 trend (World row of the panel, section 2)
 latest_global = global_coal[global_coal["year"] == global_coal["year"].max()]["coal_co2"].values[0]
 
-log_analysis("Global coal CO2 (latest)", f"{latest_global:.0f} Mt CO2")
+provenance.record("Global coal CO2 (latest)", f"{latest_global:.0f} Mt CO2")
 
 # Define scenarios
 SCENARIOS = {
     "current_trajectory": {
         "description": "Current policies trajectory (+0.5%/yr)",
         "annual_change_pct": 0.5,
+        "uncertainty": {"rate": {"dist": "normal", "sd": 1.0}},  # pp/yr, per segment
         "color": "#ff9e54"  # Burnt Orange - damage
     },
     "accelerated_phaseout": {
         "description": "1.5C-aligned phaseout (-7%/yr)",
         "annual_change_pct": -7.0,
+        "uncertainty": {"rate": {"dist": "normal", "sd": 2.0}},
         "color": "#44cca4"  # Teal - solutions
     },
     "delayed_action": {
         "description": "Delayed action (+2%/yr until 2030, then -5%/yr)",
-        "annual_change_pct": 2.0,  # Initial rate
-        "switch_year": 2030,
-        "post_switch_rate": -5.0,
+        "schedule": [(None, 2.0), (2030, -5.0)],  # %/yr in effect from each year
+        "uncertainty": {"rate": [{"dist": "normal", "sd": 1.0}, {"dist": "normal", "sd": 2.0}]},
         "color": "#ffd144"  # Gold - caution
     },
     "net_zero_2050": {
         "description": "Net zero by 2050 (-4.3%/yr)",
         "annual_change_pct": -4.3,
+        "uncertainty": {"rate": {"dist": "normal", "sd": 1.5}},
         "color": "#46ff84"  # Electric Green
     }
 }
 
-# Project scenarios
-projection_years = list(range(int(global_coal["year"].max()), 2051))
-projections = []
-
-for scenario_name, config in SCENARIOS.items():
-    current_value = latest_global
-
-    for i, year in enumerate(projection_years):
-        if i == 0:
-            projected = current_value
-        else:
-            # Handle delayed action scenario
-            if scenario_name == "delayed_action" and year > config.get("switch_year", 9999):
-                rate = config["post_switch_rate"]
-            else:
-                rate = config["annual_change_pct"]
-
-            projected = projected * (1 + rate / 100)
-            projected = max(0, projected)  # Can't go negative
-
-        projections.append({
-            "scenario": scenario_name,
-            "description": config["description"],
-            "year": year,
-            "coal_co2_mt": round(projected, 1),
-            "color": config["color"]
-        })
-
-projections_df = pd.DataFrame(projections)
-log_analysis("Scenario projections computed", f"{len(SCENARIOS)} scenarios to 2050")
+# Project scenarios: all scenarios x years as one compounding array
+projections_df = project_scenarios(
+    SCENARIOS,
+    base=latest_global,
+    start_year=int(global_coal["year"].max()),
+    end_year=2050,
+    value="coal_co2_mt",
+    carry=("description", "color"),
+)
+projections_df["coal_co2_mt"] = projections_df["coal_co2_mt"].round(1)
+projections_df = projections_df[["scenario", "description", "year", "coal_co2_mt", "color"]]
+provenance.record("Scenario projections computed", f"{len(SCENARIOS)} scenarios to 2050")
 
 # Summary: Years to zero emissions by scenario
 print("\nScenario Projections Summary:")
@@ -447,54 +368,128 @@ CARBON_BUDGETS = {
         "total_budget_gt": 500,
         "coal_share": 0.40,
         "coal_budget_gt": 200,
-        "description": "1.5°C with 50% probability"
+        "description": "1.5°C with 50% probability",
+        # AR6 likelihood range (83%-17%) and coal share of energy CO2
+        "uncertainty": {
+            "total_budget_gt": {"dist": "triangular", "low": 300, "high": 900},
+            "coal_share": {"dist": "uniform", "low": 0.35, "high": 0.45},
+        },
     },
     "2C_50pct": {
         "total_budget_gt": 1350,
         "coal_share": 0.40,
         "coal_budget_gt": 540,
-        "description": "2°C with 50% probability"
+        "description": "2°C with 50% probability",
+        "uncertainty": {
+            "total_budget_gt": {"dist": "triangular", "low": 900, "high": 2300},
+            "coal_share": {"dist": "uniform", "low": 0.35, "high": 0.45},
+        },
     }
 }
 
-# Calculate cumulative emissions from latest year for each scenario
-budget_analysis = []
+# Cumulative emissions once per scenario; exhaustion years for all budgets at once
+budget_df = budget_exhaustion(
+    projections_df,
+    {name: config["coal_budget_gt"] * 1000 for name, config in CARBON_BUDGETS.items()},  # Mt
+    value="coal_co2_mt",
+)
+budget_df["budget_description"] = budget_df["budget"].map(
+    {name: config["description"] for name, config in CARBON_BUDGETS.items()})
+budget_df["coal_budget_gt"] = budget_df["budget"].map(
+    {name: config["coal_budget_gt"] for name, config in CARBON_BUDGETS.items()})
+budget_df["exhaust_year"] = budget_df["exhaust_year"].astype(object).where(
+    budget_df["exhaust_year"].notna(), ">2050")
+budget_df["cumulative_by_2050_gt"] = (budget_df["cumulative"] / 1000).round(1)
+budget_df["budget_overshoot_gt"] = (budget_df["cumulative"] / 1000 - budget_df["coal_budget_gt"]).round(1)
+budget_df = budget_df[["budget", "budget_description", "coal_budget_gt", "scenario",
+                       "exhaust_year", "cumulative_by_2050_gt", "budget_overshoot_gt"]]
+provenance.record("Carbon budget analysis complete", f"{len(budget_df)} combinations analyzed")
+
+print("\nCarbon Budget Analysis:")
+print(budget_df[["budget", "scenario", "exhaust_year", "budget_overshoot_gt"]].to_string(index=False))
+
+# %% [markdown]
+# ### Monte Carlo Uncertainty
+#
+# Sample scenario rates, budgets and coal share from the declared `uncertainty`
+# distributions and tabulate when each budget is exhausted.
 
-for budget_name, budget_config in CARBON_BUDGETS.items():
-    coal_budget_mt = budget_config["coal_budget_gt"] * 1000  # Convert to Mt
+# %%
+MONTE_CARLO_DRAWS = 100_000
+MONTE_CARLO_SEED = 20251214
+MONTE_CARLO_END_YEAR = 2100
+MONTE_CARLO_WORKERS = 1  # > 1 spreads batches over a process pool
+
+monte_carlo = monte_carlo_budgets(
+    SCENARIOS,
+    CARBON_BUDGETS,
+    base=latest_global,
+    start_year=int(global_coal["year"].max()),
+    end_year=MONTE_CARLO_END_YEAR,
+    draws=MONTE_CARLO_DRAWS,
+    seed=MONTE_CARLO_SEED,
+    workers=MONTE_CARLO_WORKERS,
+)
+exhaustion_summary_df = monte_carlo.summary
+exhaustion_distribution_df = monte_carlo.distribution
 
-    for scenario_name in SCENARIOS:
-        scenario_data = projections_df[projections_df["scenario"] == scenario_name].copy()
+provenance.record("Monte Carlo budget exhaustion",
+                  f"{monte_carlo.draws:,} draws in {monte_carlo.seconds:.2f}s")
 
-        # Calculate cumulative from projection start
-        scenario_data = scenario_data.sort_values("year")
-        scenario_data["cumulative_mt"] = scenario_data["coal_co2_mt"].cumsum()
+print("\nBudget Exhaustion Year (Monte Carlo percentiles):")
+print(exhaustion_summary_df.drop(columns="draws").to_string(index=False))
 
-        # Find year budget is exhausted
-        exhausted_year = scenario_data[scenario_data["cumulative_mt"] >= coal_budget_mt]
-        if len(exhausted_year) > 0:
-            exhaust_year = exhausted_year["year"].min()
-        else:
-            exhaust_year = ">2050"
+# %% [markdown]
+# ### Sensitivity Tests
+#
+# Which of growth rate, total budget and coal share moves the 2050 outcome most?
+# One-at-a-time swings (tornado inputs) and Sobol variance indices.
 
-        # Total emissions by 2050
-        total_by_2050 = scenario_data[scenario_data["year"] <= 2050]["coal_co2_mt"].sum()
+# %%
+SWEEP_SEED = 20251214
+SWEEP_HORIZON_YEAR = 2050
+SWEEP_SPACE = parameter_space(
+    {"annual_change_pct": (-10.0, 3.0), "total_budget_gt": (300.0, 900.0), "coal_share": (0.35, 0.45)},
+    baseline={"annual_change_pct": 0.5, "total_budget_gt": 500.0, "coal_share": 0.40},
+)
 
-        budget_analysis.append({
-            "budget": budget_name,
-            "budget_description": budget_config["description"],
-            "coal_budget_gt": budget_config["coal_budget_gt"],
-            "scenario": scenario_name,
-            "exhaust_year": exhaust_year,
-            "cumulative_by_2050_gt": round(total_by_2050 / 1000, 1),
-            "budget_overshoot_gt": round((total_by_2050 / 1000) - budget_config["coal_budget_gt"], 1)
-        })
 
-budget_df = pd.DataFrame(budget_analysis)
-log_analysis("Carbon budget analysis complete", f"{len(budget_df)} combinations analyzed")
+def budget_model(annual_change_pct, total_budget_gt, coal_share, base_mt, start_year, horizon_year):
+    """Cumulative coal CO2, budget overshoot and exhaustion year for constant-rate paths."""
+    n_steps = horizon_year - start_year
+    rates = np.repeat(np.asarray(annual_change_pct, dtype=float)[:, None], n_steps, axis=1)
+    cumulative_gt = np.cumsum(project(np.full(len(rates), base_mt), rates=rates), axis=1) / 1000
+    budget_gt = np.asarray(total_budget_gt) * np.asarray(coal_share)
+    return {
+        "cumulative_by_2050_gt": cumulative_gt[:, -1],
+        "budget_overshoot_gt": cumulative_gt[:, -1] - budget_gt,
+        # horizon_year + 1 when the budget lasts past the horizon
+        "exhaust_year": start_year + (cumulative_gt < budget_gt[:, None]).sum(axis=1),
+    }
 
-print("\nCarbon Budget Analysis:")
-print(budget_df[["budget", "scenario", "exhaust_year", "budget_overshoot_gt"]].to_string(index=False))
+
+projection_start = int(global_coal["year"].max())
+sweep = SweepRunner(
+    partial(budget_model, base_mt=latest_global, start_year=projection_start,
+            horizon_year=SWEEP_HORIZON_YEAR),
+    SWEEP_SPACE,
+    name="budget_model",
+    context={"base_mt": latest_global, "start_year": projection_start,
+             "horizon_year": SWEEP_HORIZON_YEAR},
+    vectorized=True,
+    seed=SWEEP_SEED,
+    cache_path=DERIVED_DIR / "parameter_sweeps.parquet",
+)
+sensitivity_oat_df = sweep.one_at_a_time(levels=9)
+sensitivity_sobol_df = sweep.sobol_indices(n=1024)
+sweep.latin_hypercube(256)
+
+provenance.record("Parameter sweeps complete",
+                  f"{sweep.evaluations:,} evaluations, {sweep.cache_hits:,} cached, {sweep.seconds:.2f}s")
+
+print("\nSensitivity (Sobol indices, 2050 overshoot):")
+print(sensitivity_sobol_df[sensitivity_sobol_df["output"] == "budget_overshoot_gt"]
+      .round(3).to_string(index=False))
 
 # %% [markdown]
 # ## 8. Regional Aggregation
@@ -502,42 +497,27 @@ print(budget_df[["budget", "scenario", "exhaust_year", "budget_overshoot_gt"]].t
 # Group countries into regions for comparison.
 
 # %%
-# Define regions (simplified)
+# Define regions (simplified) by ISO code; everything else is "Other"
 REGIONS = {
-    "China": ["China"],
-    "India": ["India"],
-    "United States": ["United States"],
-    "European Union": ["Germany", "Poland", "Italy", "France", "Spain", "Netherlands",
-                       "Belgium", "Czech Republic", "Greece", "Austria", "Romania",
-                       "Bulgaria", "Hungary", "Portugal", "Sweden", "Finland"],
-    "Rest of Asia": ["Japan", "South Korea", "Indonesia", "Vietnam", "Taiwan",
-                     "Thailand", "Malaysia", "Philippines", "Pakistan", "Bangladesh"],
-    "Other": []  # Catchall
+    "China": ["CHN"],
+    "India": ["IND"],
+    "United States": ["USA"],
+    "European Union": ["DEU", "POL", "ITA", "FRA", "ESP", "NLD", "BEL", "CZE", "GRC",
+                       "AUT", "ROU", "BGR", "HUN", "PRT", "SWE", "FIN"],
+    "Rest of Asia": ["JPN", "KOR", "IDN", "VNM", "TWN", "THA", "MYS", "PHL", "PAK", "BGD"],
 }
-
-def assign_region(country: str) -> str:
-    """Assign a country to a region."""
-    for region, countries in REGIONS.items():
-        if country in countries:
-            return region
-    return "Other"
+registry.define("a01_regions", REGIONS, default="Other")
 
 # Add region column
-countries_df["region"] = countries_df["country"].apply(assign_region)
+countries_df["region"] = registry.tag(countries_df, "a01_regions")
 
 # Aggregate by region and year
-regional_df = (countries_df
-    .groupby(["region", "year"])
-    .agg({
-        "coal_co2": "sum",
-        "co2": "sum",
-        "population": "sum"
-    })
-    .reset_index())
+regional_df = registry.aggregate(countries_df, "a01_regions",
+                                 ["coal_co2", "co2", "population"], column="region")
 
 regional_df["coal_share_of_co2"] = (regional_df["coal_co2"] / regional_df["co2"] * 100).round(2)
 
-log_analysis("Regional aggregation complete", f"{regional_df['region'].nunique()} regions")
+provenance.record("Regional aggregation complete", f"{regional_df['region'].nunique()} regions")
 
 # Latest year regional breakdown
 regional_latest = regional_df[regional_df["year"] == latest_year].sort_values("coal_co2", ascending=False)
@@ -568,27 +548,40 @@ combined_rankings = latest_rankings.merge(
     how="left"
 )
 combined_rankings.to_csv(rankings_path, index=False)
-log_analysis("Exported country rankings", str(rankings_path))
+provenance.record("Exported country rankings", path=rankings_path)
 
 # Export trend analysis
 trend_path = DERIVED_DIR / "trend_analysis.csv"
 trend_df.to_csv(trend_path, index=False)
-log_analysis("Exported trend analysis", str(trend_path))
+all_trends_df.to_csv(DERIVED_DIR / "trend_analysis_all_countries.csv", index=False)
+provenance.record("Exported trend analysis", path=trend_path)
 
 # Export scenario projections
 projections_path = DERIVED_DIR / "scenario_projections.csv"
 projections_df.to_csv(projections_path, index=False)
-log_analysis("Exported scenario projections", str(projections_path))
+provenance.record("Exported scenario projections", path=projections_path)
 
 # Export carbon budget analysis
 budget_path = DERIVED_DIR / "carbon_budget_analysis.csv"
 budget_df.to_csv(budget_path, index=False)
-log_analysis("Exported carbon budget analysis", str(budget_path))
+provenance.record("Exported carbon budget analysis", path=budget_path)
+
+# Export Monte Carlo exhaustion-year percentiles and distribution
+exhaustion_path = DERIVED_DIR / "budget_exhaustion_percentiles.csv"
+exhaustion_summary_df.to_csv(exhaustion_path, index=False)
+exhaustion_distribution_df.to_csv(DERIVED_DIR / "budget_exhaustion_distribution.csv", index=False)
+provenance.record("Exported budget exhaustion distributions", path=exhaustion_path)
+
+# Export parameter sweeps and sensitivity indices
+sweeps_path = sweep.save()
+sensitivity_oat_df.to_csv(DERIVED_DIR / "sensitivity_oat.csv", index=False)
+sensitivity_sobol_df.to_csv(DERIVED_DIR / "sensitivity_sobol.csv", index=False)
+provenance.record("Exported parameter sweeps", path=sweeps_path)
 
 # Export regional data
 regional_path = DERIVED_DIR / "regional_emissions.csv"
 regional_df.to_csv(regional_path, index=False)
-log_analysis("Exported regional emissions", str(regional_path))
+provenance.record("Exported regional emissions", path=regional_path)
 
 # Export analysis summary
 summary_path = DERIVED_DIR / "analysis_results.json"
@@ -600,10 +593,11 @@ with open(summary_path, "w") as f:
         "results": analysis_results,
         "scenarios": {k: v["description"] for k, v in SCENARIOS.items()},
         "carbon_budgets": CARBON_BUDGETS,
-        "analysis_log": analysis_log
+        "analysis_log": provenance.entries()
     }, f, indent=2, default=str)
 
-log_analysis("Exported analysis summary", str(summary_path))
+provenance.record("Exported analysis summary", path=summary_path)
+events_path = provenance.flush()
 
 # %% [markdown]
 # ## 10. Summary
@@ -632,7 +626,7 @@ for f in DERIVED_DIR.glob("*.csv"):
 for f in DERIVED_DIR.glob("*.json"):
     print(f"  - {f.name}")
 
-print(f"\nAnalysis steps logged: {len(analysis_log)}")
+print(f"\nAnalysis steps logged: {len(provenance)} (appended to {events_path})")
 print(f"Pipeline finished at: {datetime.now().isoformat()}")
 
 # %% [markdown]
@@ -642,3 +636,14 @@ print(f"Pipeline finished at: {datetime.now().isoformat()}")
 # |--------|-----------|-------|
 # | Created | 2025-12-14 | Initial template |
 # | Updated | 2025-12-14 | Implemented full analysis pipeline |
+# | Updated | 2026-10-18 | Country groupbys use observed=True (categorical country columns) |
+# | Updated | 2026-10-18 | Inputs loaded with shared_utils.data_utils.load_dataset |
+# | Updated | 2026-10-18 | Trend analysis vectorized (shared_utils.trends), all countries classified |
+# | Updated | 2026-10-18 | Scenarios projected with shared_utils.scenarios (piecewise schedules) |
+# | Updated | 2026-10-18 | Monte Carlo budget-exhaustion distributions (shared_utils.uncertainty) |
+# | Updated | 2026-10-18 | Parameter sweeps, OAT and Sobol sensitivity (shared_utils.sweeps) |
+# | Updated | 2026-10-18 | Budget exhaustion via cumulative arrays (shared_utils.budgets) |
+# | Updated | 2026-10-18 | Derived metrics via shared_utils.timeseries (one sorted pass) |
+# | Updated | 2026-10-18 | Country filter and regions via shared_utils.regions (ISO-keyed) |
+# | Updated | 2026-10-18 | Structured provenance events (shared_utils.provenance) |
+# | Updated | 2026-10-18 | World series selected from the shared panel (shared_utils.panel) |
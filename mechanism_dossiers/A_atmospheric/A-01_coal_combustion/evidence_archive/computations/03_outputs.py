@@ -6,9 +6,9 @@ Metadata
     - File Name: 03_outputs.py
     - Relative Path: mechanism_dossiers/A_atmospheric/A-01_coal_combustion/evidence_archive/computations/03_outputs.py
     - Artifact Type: script
-    - Version: 1.1.0
+    - Version: 1.7.2
     - Date: 2025-12-14
-    - Update: Sunday, December 14, 2025
+    - Update: Sunday, October 18, 2026
     - Author: Dennis 'dnoice' Smaltz
     - A.I. Acknowledgement: Anthropic - Claude Opus 4.5
     - Signature:  ︻デ═—··· 🎯 = Aim Twice, Shoot Once!
@@ -24,9 +24,14 @@ Key Features:
     - Feature 3: Regional breakdown stacked area charts
     - Feature 4: Scenario projection comparison charts
     - Feature 5: Carbon budget countdown visualization
-    - Feature 6: Terminal Velocity color palette integration
-    - Feature 7: Publication-quality PNG export (150 DPI)
+    - Feature 6: Terminal Velocity style and chart builders (shared_utils.viz_utils)
+    - Feature 7: Publication-quality PNG export (150 DPI), figures declared as specs
+                 and rendered headless in a process pool
     - Feature 8: Output manifest generation for provenance tracking
+    - Feature 9: Figure cache: unchanged figures (data slice, style, builder and
+                 module source, palette, matplotlib version) are not re-rendered
+    - Feature 10: Exhibit variants from one draw: SVG / PDF vector masters,
+                  full-resolution PNG and a WebP dossier-index thumbnail
 
 Usage Instructions:
     Run after 02_analysis.py has generated derived results:
@@ -51,6 +56,9 @@ Examples:
 
 Other Important Information:
     - Dependencies: pandas, matplotlib, seaborn (see environment.yml)
+    - Figures render in parallel (TV_RENDER_WORKERS or one worker per core) when
+      workers can be forked safely; otherwise in-process, since this script has no
+      ``if __name__ == "__main__":`` guard for forkserver / spawn workers
     - Compatible platforms: Linux, Windows, macOS
     - Color palette: Terminal Velocity standard (all hex codes end in "4")
     - Output format: PNG figures (150 DPI), CSV tables
@@ -88,86 +96,71 @@ Other Important Information:
 
 # %%
 import pandas as pd
-import matplotlib.pyplot as plt
-import matplotlib.ticker as mticker
+import sys
 from pathlib import Path
 from datetime import datetime
 import json
 
+# Make computational_core importable when run from this folder
+REPO_ROOT = Path.cwd().resolve().parents[4]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from computational_core.shared_utils.data_utils import load_dataset
+from computational_core.shared_utils.provenance import ProvenanceRecorder
+from computational_core.shared_utils.rendering import (
+    FigureSpec,
+    figure_manifest,
+    fork_safe,
+    format_renders,
+    manifest_fingerprints,
+    render_figures,
+)
+from computational_core.shared_utils.viz_utils import (
+    COLORS,
+    TV_STYLE,
+    ranked_bar,
+    scenario_fan,
+    stacked_area,
+    trend_line,
+)
+
 MECHANISM_CODE = "A-01"
 PROCESSED_DIR = Path("../datasets/processed")
 DERIVED_DIR = Path("../datasets/derived")
 FIGURES_DIR = Path("../../exhibits/figures")
 TABLES_DIR = Path("../../exhibits/tables")
+MANIFEST_PATH = FIGURES_DIR / "output_manifest.json"
 
 # Ensure output directories exist
 FIGURES_DIR.mkdir(parents=True, exist_ok=True)
 TABLES_DIR.mkdir(parents=True, exist_ok=True)
 
-# Terminal Velocity color palette
-# All colors end in "4" - the harmonic signature
-COLORS = {
-    "primary": "#2e3c44",      # Deep Slate - Background, authority
-    "secondary": "#ff9e54",    # Burnt Orange - Damage, urgency
-    "tertiary": "#46ff84",     # Electric Green - Data, evidence
-    "accent": "#f5f5f4",       # Soft White - Text, contrast
-    "highlight": "#ffd144",    # Gold - Uncertainty, caution
-    "success": "#44cca4",      # Teal - Solutions, leverage points
-}
-
-# Extended palette for multi-series charts
-SERIES_COLORS = [
-    "#ff9e54",  # Burnt Orange
-    "#46ff84",  # Electric Green
-    "#44cca4",  # Teal
-    "#ffd144",  # Gold
-    "#f5f5f4",  # Soft White
-    "#8b9a94",  # Muted green-gray
-]
-
 # Figure settings
 FIG_DPI = 150
 FIG_SIZE_STANDARD = (10, 6)
 FIG_SIZE_WIDE = (12, 6)
 FIG_SIZE_TALL = (10, 8)
+VECTOR_FORMATS = ("svg", "pdf")  # masters under figures/vector/
+THUMBNAIL_WIDTH = 320            # px, dossier-index thumbnails under figures/thumbnails/
+THUMBNAIL_FORMAT = "webp"
 
-# Output log
-output_log = []
-
-def log_output(artifact_type: str, path: str, description: str = ""):
-    """Log an output artifact."""
-    entry = {
-        "timestamp": datetime.now().isoformat(),
-        "type": artifact_type,
-        "path": str(path),
-        "description": description
-    }
-    output_log.append(entry)
-    print(f"[{entry['timestamp'][:19]}] {artifact_type}: {path}")
-
-def apply_tv_style(ax, fig, title: str = ""):
-    """Apply Terminal Velocity visual style to a matplotlib axes."""
-    # Background colors
-    ax.set_facecolor(COLORS["primary"])
-    fig.patch.set_facecolor(COLORS["primary"])
+# Output log (buffered; echoed only in verbose runs, flushed to the shared store)
+provenance = ProvenanceRecorder(MECHANISM_CODE, "03_outputs")
+ARTIFACT_KINDS = ("figure", "table")
 
-    # Text colors
-    ax.tick_params(colors=COLORS["accent"], which="both")
-    ax.xaxis.label.set_color(COLORS["accent"])
-    ax.yaxis.label.set_color(COLORS["accent"])
+# Figures are declared by the figure cells and rendered together in section 8
+FIGURE_SPECS: list[FigureSpec] = []
 
-    if title:
-        ax.set_title(title, fontsize=14, fontweight="bold", color=COLORS["accent"])
 
-    # Spine colors
-    for spine in ax.spines.values():
-        spine.set_color(COLORS["accent"])
-        spine.set_alpha(0.3)
+def declare_figure(name: str, builder, description: str, figsize=FIG_SIZE_STANDARD, **data):
+    """Queue a figure: ``builder(fig, ax, **data)`` draws it in the Terminal Velocity style."""
+    FIGURE_SPECS.append(FigureSpec(name, builder, FIGURES_DIR / f"{name}.png", data=data,
+                                   figsize=figsize, dpi=FIG_DPI, description=description,
+                                   style=TV_STYLE, vector_formats=VECTOR_FORMATS,
+                                   thumbnail_width=THUMBNAIL_WIDTH,
+                                   thumbnail_format=THUMBNAIL_FORMAT))
 
-    # Grid
-    ax.grid(True, alpha=0.2, color=COLORS["accent"])
-
-    return ax
 
 print("Terminal Velocity Output Pipeline initialized")
 print(f"Figures will be saved to: {FIGURES_DIR.absolute()}")
@@ -177,48 +170,40 @@ print(f"Tables will be saved to: {TABLES_DIR.absolute()}")
 # ## 1. Load Analysis Results
 
 # %%
-# Load processed emissions data (prefer parquet, fallback to CSV)
-emissions_parquet = PROCESSED_DIR / "coal_emissions.parquet"
-emissions_csv = PROCESSED_DIR / "coal_emissions.csv"
-
-if emissions_parquet.exists():
-    emissions_df = pd.read_parquet(emissions_parquet)
-    print(f"Loaded emissions (parquet): {len(emissions_df):,} rows")
-elif emissions_csv.exists():
-    emissions_df = pd.read_csv(emissions_csv)
-    print(f"Loaded emissions (CSV): {len(emissions_df):,} rows")
-else:
+# Load processed emissions data (parquet or CSV, whichever 01_intake.py wrote)
+try:
+    emissions_df = load_dataset(MECHANISM_CODE, "processed/coal_emissions")
+    print(f"Loaded emissions: {len(emissions_df):,} rows")
+except FileNotFoundError:
     raise FileNotFoundError(f"Run 01_intake.py first")
 
+
+def load_derived(name: str) -> pd.DataFrame | None:
+    """Load a 02_analysis.py output, or None if it has not been produced."""
+    try:
+        return load_dataset(MECHANISM_CODE, f"derived/{name}")
+    except FileNotFoundError:
+        return None
+
+
 # Load derived analysis results
-rankings_path = DERIVED_DIR / "country_rankings.csv"
-if rankings_path.exists():
-    rankings_df = pd.read_csv(rankings_path)
+rankings_df = load_derived("country_rankings")
+if rankings_df is not None:
     print(f"Loaded rankings: {len(rankings_df)} countries")
 else:
     print("Warning: country_rankings.csv not found - run 02_analysis.py")
-    rankings_df = None
 
-trend_path = DERIVED_DIR / "trend_analysis.csv"
-if trend_path.exists():
-    trend_df = pd.read_csv(trend_path)
+trend_df = load_derived("trend_analysis")
+if trend_df is not None:
     print(f"Loaded trend analysis: {len(trend_df)} countries")
-else:
-    trend_df = None
 
-projections_path = DERIVED_DIR / "scenario_projections.csv"
-if projections_path.exists():
-    projections_df = pd.read_csv(projections_path)
+projections_df = load_derived("scenario_projections")
+if projections_df is not None:
     print(f"Loaded projections: {len(projections_df)} data points")
-else:
-    projections_df = None
 
-regional_path = DERIVED_DIR / "regional_emissions.csv"
-if regional_path.exists():
-    regional_df = pd.read_csv(regional_path)
+regional_df = load_derived("regional_emissions")
+if regional_df is not None:
     print(f"Loaded regional data: {len(regional_df)} rows")
-else:
-    regional_df = None
 
 # Extract World data for global trend
 world_df = emissions_df[emissions_df["country"] == "World"].copy()
@@ -228,140 +213,57 @@ print(f"World data: {len(world_df)} years")
 # ## 2. Figure: Global Coal CO2 Trend
 
 # %%
-# Create global trend figure
-fig, ax = plt.subplots(figsize=FIG_SIZE_STANDARD)
-
 # Filter to years with data
-world_trend = world_df[world_df["coal_co2"].notna()].sort_values("year")
-
-# Plot main trend line
-ax.plot(world_trend["year"], world_trend["coal_co2"] / 1000,  # Convert to Gt
-        color=COLORS["secondary"], lw=2.5, label="Coal CO2")
-
-# Add markers for key years
-key_years = [1990, 2000, 2010, 2020]
-for year in key_years:
-    year_data = world_trend[world_trend["year"] == year]
-    if len(year_data) > 0:
-        value = year_data["coal_co2"].values[0] / 1000
-        ax.scatter(year, value, color=COLORS["tertiary"], s=50, zorder=5)
-        ax.annotate(f"{value:.1f}", (year, value), textcoords="offset points",
-                    xytext=(0, 10), ha="center", fontsize=9, color=COLORS["accent"])
-
-# Apply Terminal Velocity style
-apply_tv_style(ax, fig, "Global Coal CO2 Emissions (1900-Present)")
-ax.set_xlabel("Year", fontsize=11)
-ax.set_ylabel("CO2 Emissions (Gt CO2/year)", fontsize=11)
-ax.set_xlim(1900, world_trend["year"].max() + 2)
-ax.set_ylim(0, None)
-
-# Add legend
-ax.legend(loc="upper left", facecolor=COLORS["primary"], edgecolor=COLORS["accent"],
-          labelcolor=COLORS["accent"])
-
-# Save figure
-fig_path = FIGURES_DIR / "fig_01_global_coal_co2_trend.png"
-fig.savefig(fig_path, dpi=FIG_DPI, bbox_inches="tight",
-            facecolor=COLORS["primary"], edgecolor="none")
-plt.close()
-
-log_output("figure", fig_path, "Global coal CO2 emissions time series")
+world_trend = world_df.loc[world_df["coal_co2"].notna(), ["year", "coal_co2"]].sort_values("year")
+declare_figure("fig_01_global_coal_co2_trend", trend_line,
+               "Global coal CO2 emissions time series",
+               data=world_trend, x="year", y="coal_co2", scale=1e-3, label="Coal CO2",
+               markers=[1990, 2000, 2010, 2020],  # key years
+               title="Global Coal CO2 Emissions (1900-Present)",
+               ylabel="CO2 Emissions (Gt CO2/year)",
+               xlim=(1900, world_trend["year"].max() + 2))
 
 # %% [markdown]
 # ## 3. Figure: Top Emitters Bar Chart
 
 # %%
 if rankings_df is not None:
-    fig, ax = plt.subplots(figsize=FIG_SIZE_STANDARD)
-
     # Get top 10 emitters
-    top10 = rankings_df.nlargest(10, "coal_co2")
-
-    # Create horizontal bar chart
-    bars = ax.barh(range(len(top10)), top10["coal_co2"] / 1000,
-                   color=COLORS["secondary"], edgecolor=COLORS["accent"], linewidth=0.5)
-
-    # Add value labels
-    for i, (idx, row) in enumerate(top10.iterrows()):
-        value = row["coal_co2"] / 1000
-        ax.text(value + 0.1, i, f"{value:.1f} Gt", va="center",
-                fontsize=9, color=COLORS["accent"])
-
-    # Country labels
-    ax.set_yticks(range(len(top10)))
-    ax.set_yticklabels(top10["country"])
-    ax.invert_yaxis()  # Highest at top
-
-    # Apply style
-    apply_tv_style(ax, fig, f"Top 10 Coal CO2 Emitters ({int(top10['year'].iloc[0])})")
-    ax.set_xlabel("Coal CO2 Emissions (Gt CO2/year)", fontsize=11)
-
-    # Save
-    fig_path = FIGURES_DIR / "fig_02_top_emitters_current.png"
-    fig.savefig(fig_path, dpi=FIG_DPI, bbox_inches="tight",
-                facecolor=COLORS["primary"], edgecolor="none")
-    plt.close()
-
-    log_output("figure", fig_path, "Top 10 coal CO2 emitters bar chart")
+    top10 = rankings_df.nlargest(10, "coal_co2")[["country", "year", "coal_co2"]]
+    declare_figure("fig_02_top_emitters_current", ranked_bar,
+                   "Top 10 coal CO2 emitters bar chart",
+                   data=top10, label="country", value="coal_co2", scale=1e-3,
+                   value_fmt="{:.1f} Gt",
+                   title=f"Top 10 Coal CO2 Emitters ({int(top10['year'].iloc[0])})",
+                   xlabel="Coal CO2 Emissions (Gt CO2/year)")
 
 # %% [markdown]
 # ## 4. Figure: Scenario Projections
 
 # %%
-if projections_df is not None:
-    fig, ax = plt.subplots(figsize=FIG_SIZE_WIDE)
-
-    # Get unique scenarios
-    scenarios = projections_df["scenario"].unique()
-
-    # Color mapping for scenarios
-    scenario_colors = {
-        "current_trajectory": COLORS["secondary"],      # Orange - damage
-        "delayed_action": COLORS["highlight"],          # Gold - caution
-        "net_zero_2050": COLORS["tertiary"],           # Green - evidence
-        "accelerated_phaseout": COLORS["success"],     # Teal - solutions
-    }
+# Color mapping for scenarios
+SCENARIO_COLORS = {
+    "current_trajectory": COLORS["secondary"],      # Orange - damage
+    "delayed_action": COLORS["highlight"],          # Gold - caution
+    "net_zero_2050": COLORS["tertiary"],           # Green - evidence
+    "accelerated_phaseout": COLORS["success"],     # Teal - solutions
+}
 
-    # Plot each scenario
-    for scenario in scenarios:
-        scenario_data = projections_df[projections_df["scenario"] == scenario]
-        color = scenario_colors.get(scenario, COLORS["accent"])
-        label = scenario.replace("_", " ").title()
-        ax.plot(scenario_data["year"], scenario_data["coal_co2_mt"] / 1000,
-                color=color, lw=2, label=label)
-
-    # Add reference lines
-    ax.axhline(y=0, color=COLORS["accent"], linestyle="--", alpha=0.3, lw=1)
-    ax.axvline(x=2030, color=COLORS["accent"], linestyle=":", alpha=0.3, lw=1)
-    ax.text(2030, ax.get_ylim()[1] * 0.95, "2030", color=COLORS["accent"],
-            fontsize=9, ha="center", alpha=0.7)
-
-    # Apply style
-    apply_tv_style(ax, fig, "Coal CO2 Emission Scenarios (2024-2050)")
-    ax.set_xlabel("Year", fontsize=11)
-    ax.set_ylabel("Coal CO2 Emissions (Gt CO2/year)", fontsize=11)
-    ax.set_xlim(projections_df["year"].min(), 2050)
-    ax.set_ylim(0, None)
-
-    # Legend
-    ax.legend(loc="upper right", facecolor=COLORS["primary"], edgecolor=COLORS["accent"],
-              labelcolor=COLORS["accent"], fontsize=9)
-
-    # Save
-    fig_path = FIGURES_DIR / "fig_03_scenario_projections.png"
-    fig.savefig(fig_path, dpi=FIG_DPI, bbox_inches="tight",
-                facecolor=COLORS["primary"], edgecolor="none")
-    plt.close()
-
-    log_output("figure", fig_path, "Scenario projections comparison")
+if projections_df is not None:
+    declare_figure("fig_03_scenario_projections", scenario_fan,
+                   "Scenario projections comparison", figsize=FIG_SIZE_WIDE,
+                   projections=projections_df[["scenario", "year", "coal_co2_mt"]],
+                   value="coal_co2_mt", scale=1e-3, colors=SCENARIO_COLORS,
+                   reference_years=[2030],
+                   title="Coal CO2 Emission Scenarios (2024-2050)",
+                   ylabel="Coal CO2 Emissions (Gt CO2/year)",
+                   xlim=(projections_df["year"].min(), 2050))
 
 # %% [markdown]
 # ## 5. Figure: Regional Breakdown Over Time
 
 # %%
 if regional_df is not None:
-    fig, ax = plt.subplots(figsize=FIG_SIZE_WIDE)
-
     # Filter to recent decades and main regions
     recent_regional = regional_df[regional_df["year"] >= 1990].copy()
 
@@ -373,73 +275,46 @@ if regional_df is not None:
     col_order = pivot_df.loc[latest_year].sort_values(ascending=False).index.tolist()
     pivot_df = pivot_df[col_order]
 
-    # Create stacked area chart
-    colors = [COLORS["secondary"], COLORS["tertiary"], COLORS["success"],
-              COLORS["highlight"], COLORS["accent"], "#8b9a94"]
-
-    ax.stackplot(pivot_df.index, [pivot_df[col] / 1000 for col in pivot_df.columns],
-                 labels=pivot_df.columns, colors=colors[:len(pivot_df.columns)], alpha=0.8)
-
-    # Apply style
-    apply_tv_style(ax, fig, "Regional Coal CO2 Emissions (1990-Present)")
-    ax.set_xlabel("Year", fontsize=11)
-    ax.set_ylabel("Coal CO2 Emissions (Gt CO2/year)", fontsize=11)
-    ax.set_xlim(1990, pivot_df.index.max())
-    ax.set_ylim(0, None)
-
-    # Legend (outside plot)
-    ax.legend(loc="upper left", facecolor=COLORS["primary"], edgecolor=COLORS["accent"],
-              labelcolor=COLORS["accent"], fontsize=8)
-
-    # Save
-    fig_path = FIGURES_DIR / "fig_04_regional_breakdown.png"
-    fig.savefig(fig_path, dpi=FIG_DPI, bbox_inches="tight",
-                facecolor=COLORS["primary"], edgecolor="none")
-    plt.close()
-
-    log_output("figure", fig_path, "Regional coal CO2 stacked area chart")
+    declare_figure("fig_04_regional_breakdown", stacked_area,
+                   "Regional coal CO2 stacked area chart", figsize=FIG_SIZE_WIDE,
+                   wide=pivot_df, scale=1e-3,
+                   title="Regional Coal CO2 Emissions (1990-Present)",
+                   ylabel="Coal CO2 Emissions (Gt CO2/year)", legend_fontsize=8)
 
 # %% [markdown]
 # ## 6. Figure: Trend Status Summary
 
 # %%
-if trend_df is not None:
-    fig, ax = plt.subplots(figsize=(8, 6))
+# Color mapping for status
+STATUS_COLORS = {
+    "Growing": COLORS["secondary"],        # Orange - damage
+    "Plateau": COLORS["highlight"],        # Gold - caution
+    "Recent decline": COLORS["tertiary"],  # Green - evidence
+    "Declining": COLORS["success"],        # Teal - solutions
+}
 
-    # Count countries by status
-    status_counts = trend_df["status"].value_counts()
-
-    # Color mapping for status
-    status_colors = {
-        "Growing": COLORS["secondary"],        # Orange - damage
-        "Plateau": COLORS["highlight"],        # Gold - caution
-        "Recent decline": COLORS["tertiary"],  # Green - evidence
-        "Declining": COLORS["success"],        # Teal - solutions
-    }
 
+def build_trend_status(fig, ax, status_counts, status_colors):
+    """Pie of countries by trend status."""
     colors = [status_colors.get(s, COLORS["accent"]) for s in status_counts.index]
 
     # Create pie chart
     wedges, texts, autotexts = ax.pie(status_counts.values, labels=status_counts.index,
                                        autopct="%1.0f%%", colors=colors,
-                                       textprops={"color": COLORS["accent"]},
                                        wedgeprops={"edgecolor": COLORS["primary"], "linewidth": 2})
 
     for autotext in autotexts:
         autotext.set_color(COLORS["primary"])
         autotext.set_fontweight("bold")
 
-    ax.set_title("Coal CO2 Emission Trends\n(Top 20 Emitters)", fontsize=14,
-                 fontweight="bold", color=COLORS["accent"])
-    fig.patch.set_facecolor(COLORS["primary"])
+    ax.set_title("Coal CO2 Emission Trends\n(Top 20 Emitters)")
 
-    # Save
-    fig_path = FIGURES_DIR / "fig_05_trend_status.png"
-    fig.savefig(fig_path, dpi=FIG_DPI, bbox_inches="tight",
-                facecolor=COLORS["primary"], edgecolor="none")
-    plt.close()
 
-    log_output("figure", fig_path, "Trend status pie chart")
+if trend_df is not None:
+    # Count countries by status
+    declare_figure("fig_05_trend_status", build_trend_status, "Trend status pie chart",
+                   figsize=(8, 6), status_counts=trend_df["status"].value_counts(),
+                   status_colors=STATUS_COLORS)
 
 # %% [markdown]
 # ## 7. Figure: China vs Rest of World
@@ -462,38 +337,46 @@ china_data = china_data[china_data["year"].isin(years_both)]
 other_data = other_data[other_data["year"].isin(years_both)]
 
 if len(china_data) > 0 and len(other_data) > 0:
-    fig, ax = plt.subplots(figsize=FIG_SIZE_STANDARD)
-
-    # Filter to recent decades
-    china_recent = china_data[china_data["year"] >= 1990].sort_values("year")
-    other_recent = other_data[other_data["year"] >= 1990].sort_values("year")
+    # Filter to recent decades, one column per layer
+    china_vs_world = pd.DataFrame({
+        "China": china_data.loc[china_data["year"] >= 1990].set_index("year")["coal_co2"],
+        "Rest of World": other_data.loc[other_data["year"] >= 1990].set_index("year")["coal_co2"],
+    }).sort_index()
+    declare_figure("fig_06_china_vs_world", stacked_area,
+                   "China vs Rest of World stacked area",
+                   wide=china_vs_world, scale=1e-3, alpha=0.7,
+                   colors=[COLORS["secondary"], COLORS["success"]],
+                   title="China vs Rest of World Coal CO2",
+                   ylabel="Coal CO2 Emissions (Gt CO2/year)")
 
-    ax.fill_between(china_recent["year"], 0, china_recent["coal_co2"] / 1000,
-                    color=COLORS["secondary"], alpha=0.7, label="China")
-    ax.fill_between(other_recent["year"], china_recent["coal_co2"] / 1000,
-                    (china_recent["coal_co2"].values + other_recent["coal_co2"].values) / 1000,
-                    color=COLORS["success"], alpha=0.7, label="Rest of World")
+# %% [markdown]
+# ## 8. Render Figures
+#
+# Every declared figure is drawn on its own Agg-backed Figure in a process pool
+# when workers can be forked (no native threads running yet); forkserver / spawn
+# workers would re-run this unguarded script, so otherwise figures render in-process.
+# Figures whose data slice, style, builder and matplotlib version match the
+# fingerprint in the previous output manifest are kept as they are.
 
-    # Apply style
-    apply_tv_style(ax, fig, "China vs Rest of World Coal CO2")
-    ax.set_xlabel("Year", fontsize=11)
-    ax.set_ylabel("Coal CO2 Emissions (Gt CO2/year)", fontsize=11)
-    ax.set_xlim(1990, china_recent["year"].max())
-    ax.set_ylim(0, None)
+# %%
+FIGURE_WORKERS = None  # None: TV_RENDER_WORKERS or one per core; 1 renders in-process
+FIGURE_CACHE = True    # False re-renders every figure
 
-    ax.legend(loc="upper left", facecolor=COLORS["primary"], edgecolor=COLORS["accent"],
-              labelcolor=COLORS["accent"])
+if not fork_safe():
+    FIGURE_WORKERS = 1
 
-    # Save
-    fig_path = FIGURES_DIR / "fig_06_china_vs_world.png"
-    fig.savefig(fig_path, dpi=FIG_DPI, bbox_inches="tight",
-                facecolor=COLORS["primary"], edgecolor="none")
-    plt.close()
+previous_fingerprints = manifest_fingerprints(MANIFEST_PATH) if FIGURE_CACHE else None
+render_results = render_figures(FIGURE_SPECS, workers=FIGURE_WORKERS, previous=previous_fingerprints)
+for spec, result in zip(FIGURE_SPECS, render_results):
+    provenance.record(spec.description, "cached (fingerprint unchanged)" if result.cached else "",
+                      kind="figure", path=result.path, duration_ns=int(result.seconds * 1e9))
 
-    log_output("figure", fig_path, "China vs Rest of World stacked area")
+n_cached = sum(r.cached for r in render_results)
+print(f"\nRendered {len(render_results) - n_cached} figures ({n_cached} unchanged):")
+print(format_renders(render_results))
 
 # %% [markdown]
-# ## 8. Export Summary Tables
+# ## 9. Export Summary Tables
 
 # %%
 # Table 1: Top emitters summary
@@ -504,7 +387,7 @@ if rankings_df is not None:
     top_emitters_table.columns = ["Rank", "Country", "Coal CO2 (Mt)", "Total CO2 (Mt)",
                                   "Coal % of Total", "% of Global Coal CO2"]
     top_emitters_table.to_csv(table_path, index=False)
-    log_output("table", table_path, "Top emitters summary table")
+    provenance.record("Top emitters summary table", kind="table", path=table_path)
 
 # Table 2: Trend analysis summary
 if trend_df is not None:
@@ -514,7 +397,7 @@ if trend_df is not None:
     trend_table.columns = ["Country", "Peak Year", "Peak Coal CO2 (Mt)",
                            "Latest Coal CO2 (Mt)", "Change from Peak (%)", "Status"]
     trend_table.to_csv(table_path, index=False)
-    log_output("table", table_path, "Trend analysis summary table")
+    provenance.record("Trend analysis summary table", kind="table", path=table_path)
 
 # Table 3: Scenario comparison (2030 and 2050)
 if projections_df is not None:
@@ -536,10 +419,10 @@ if projections_df is not None:
         })
 
     pd.DataFrame(scenario_summary).to_csv(table_path, index=False)
-    log_output("table", table_path, "Scenario comparison table")
+    provenance.record("Scenario comparison table", kind="table", path=table_path)
 
 # %% [markdown]
-# ## 9. Output Manifest
+# ## 10. Output Manifest
 
 # %%
 # Generate output manifest
@@ -549,22 +432,25 @@ manifest = {
     "generated_at": datetime.now().isoformat(),
     "figures_dir": str(FIGURES_DIR.absolute()),
     "tables_dir": str(TABLES_DIR.absolute()),
-    "artifacts": output_log,
+    "artifacts": provenance.entries(ARTIFACT_KINDS),
+    "figures": figure_manifest(render_results, relative_to=MANIFEST_PATH.parent),
     "color_palette": COLORS,
     "settings": {
         "dpi": FIG_DPI,
         "fig_size_standard": FIG_SIZE_STANDARD,
+        "vector_formats": VECTOR_FORMATS,
+        "thumbnail_width": THUMBNAIL_WIDTH,
     }
 }
 
-manifest_path = FIGURES_DIR / "output_manifest.json"
-with open(manifest_path, "w") as f:
+with open(MANIFEST_PATH, "w") as f:
     json.dump(manifest, f, indent=2)
 
-log_output("manifest", manifest_path, "Output manifest with provenance")
+provenance.record("Output manifest with provenance", kind="manifest", path=MANIFEST_PATH)
+events_path = provenance.flush()
 
 # %% [markdown]
-# ## 10. Summary
+# ## 11. Summary
 
 # %%
 print("\n" + "="*60)
@@ -580,7 +466,7 @@ print(f"\nTables generated ({TABLES_DIR}):")
 for f in sorted(TABLES_DIR.glob("*.csv")):
     print(f"  - {f.name}")
 
-print(f"\nTotal artifacts: {len(output_log)}")
+print(f"\nTotal artifacts: {len(provenance.entries(ARTIFACT_KINDS))} (events appended to {events_path})")
 print(f"Pipeline finished at: {datetime.now().isoformat()}")
 
 # %% [markdown]
@@ -27,9 +27,17 @@
 
 # %%
 import pandas as pd
-import matplotlib.pyplot as plt
+import sys
 from pathlib import Path
 
+# Make computational_core importable when run from this folder
+REPO_ROOT = Path.cwd().resolve().parents[4]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+# Terminal Velocity palette and matplotlib style (rcParams applied at figure creation)
+from computational_core.shared_utils.viz_utils import COLORS, TV_STYLE
+
 MECHANISM_CODE = "A-03"
 DERIVED_DIR = Path("../datasets/derived")
 FIGURES_DIR = Path("../../exhibits/figures")
@@ -38,17 +46,6 @@ TABLES_DIR = Path("../../exhibits/tables")
 FIGURES_DIR.mkdir(parents=True, exist_ok=True)
 TABLES_DIR.mkdir(parents=True, exist_ok=True)
 
-# Style configuration
-plt.style.use("seaborn-v0_8-whitegrid")
-COLORS = {
-    "primary": "#2e3c44",
-    "secondary": "#ff9e54",
-    "tertiary": "#46ff84",
-    "accent": "#f5f5f4",
-    "highlight": "#ffd144",
-    "success": "#44cca4",
-}
-
 # %% [markdown]
 # ## 1. Load Analysis Results
 
@@ -62,14 +59,18 @@ print("Load analysis results")
 # ## 2. Figure: Main Trend
 
 # %%
-# TODO: Create primary figure
-# fig, ax = plt.subplots(figsize=(10, 6))
-# ax.plot(results["year"], results["value"], color=COLORS["alert"], lw=2)
-# ax.set_title(f"Cement Process Emissions: Primary Trend")
-# ax.set_xlabel("Year")
-# ax.set_ylabel("Value")
-# fig.savefig(FIGURES_DIR / "fig_01_trend.png", dpi=150, bbox_inches="tight")
-# plt.close()
+# TODO: Declare figures as specs; they render together, headless, in a process pool
+# from computational_core.shared_utils.rendering import FigureSpec, render_figures
+# from computational_core.shared_utils.viz_utils import trend_line
+#
+# figure_specs = [
+#     FigureSpec("fig_01_trend", trend_line, FIGURES_DIR / "fig_01_trend.png", style=TV_STYLE,
+#                data={"data": results[["year", "value"]], "x": "year", "y": "value",
+#                      "color": COLORS["secondary"], "ylabel": "Value",
+#                      "title": "Cement Process Emissions: Primary Trend"}),
+# ]
+# for result in render_figures(figure_specs):
+#     print(f"{result.name}: {result.seconds:.2f}s")
 
 print("Figure generation step")
 
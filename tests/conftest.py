@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+✒ Metadata
+    - Title: Test Suite Configuration (Terminal Velocity - v1.0)
+    - File Name: conftest.py
+    - Relative Path: tests/conftest.py
+    - Artifact Type: tests
+    - Version: 1.0.0
+    - Date: 2026-10-18
+    - Update: Sunday, October 18, 2026
+    - Author: Dennis 'dnoice' Smaltz
+    - A.I. Acknowledgement: Anthropic - Claude Opus 4.5
+    - Signature:  ︻デ═—··· 🎯 = Aim Twice, Shoot Once!
+
+✒ Description:
+    Shared pytest fixtures. Every test runs with the raw store, panel store and
+    provenance directory redirected to its own temporary directory, so nothing
+    is written under evidence_vault/ and nothing touches the network.
+---------
+"""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from computational_core.shared_utils.raw_store import STORE_ENV_VAR, RawDataStore  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def isolated_stores(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Point every store a pipeline module writes to at the test's tmp_path."""
+    monkeypatch.setenv(STORE_ENV_VAR, str(tmp_path / "raw_store"))
+    monkeypatch.setenv("TV_PANEL_STORE", str(tmp_path / "panel"))
+    monkeypatch.setenv("TV_PROVENANCE_DIR", str(tmp_path / "provenance"))
+    monkeypatch.setenv("MPLBACKEND", "Agg")
+    monkeypatch.delenv("TV_VERBOSE", raising=False)
+    return tmp_path
+
+
+@pytest.fixture
+def raw_store(tmp_path: Path) -> RawDataStore:
+    """Empty content-addressed store under tmp_path."""
+    return RawDataStore(tmp_path / "raw_store")
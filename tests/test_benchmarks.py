@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+✒ Metadata
+    - Title: Benchmark Regression Gate (Terminal Velocity - v1.0)
+    - File Name: test_benchmarks.py
+    - Relative Path: tests/test_benchmarks.py
+    - Artifact Type: tests
+    - Version: 1.1.0
+    - Date: 2026-10-18
+    - Update: Sunday, October 18, 2026
+    - Author: Dennis 'dnoice' Smaltz
+    - A.I. Acknowledgement: Anthropic - Claude Opus 4.5
+    - Signature:  ︻デ═—··· 🎯 = Aim Twice, Shoot Once!
+
+✒ Description:
+    Runs every 1x benchmark of validation_suite.benchmarks and compares it with
+    the committed baselines.json using the CLI's thresholds. Baselines are
+    machine-specific: on another machine class (architecture, cores, Python
+    minor version, numpy / pandas) the benchmarks still run (so a broken hot
+    path fails), but the timing and memory gate is skipped. A benchmark over
+    the threshold is measured once more before it fails. The gate's noise
+    floor follows each benchmark's run-to-run spread.
+---------
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from computational_core.validation_suite.benchmarks import (
+    BENCHMARKS,
+    DEFAULT_MEMORY_THRESHOLD,
+    DEFAULT_THRESHOLD,
+    BenchContext,
+    Result,
+    compare,
+    load_baseline,
+    machine_class,
+    machine_info,
+    measure,
+)
+
+SCALE = 1
+
+
+@pytest.fixture(scope="module")
+def context(tmp_path_factory) -> BenchContext:
+    """1x fixtures, generated once for the whole module."""
+    return BenchContext(SCALE, seed=0, cache_dir=tmp_path_factory.mktemp("tv-bench"))
+
+
+@pytest.fixture(scope="module")
+def baseline() -> dict:
+    return load_baseline()
+
+
+@pytest.mark.parametrize("name", [n for n, b in BENCHMARKS.items() if SCALE in b.scales])
+def test_benchmark_within_baseline(name, context, baseline, tmp_path, monkeypatch):
+    # In-process benchmarks write Arrow sidecars under the raw store
+    monkeypatch.setenv("TV_RAW_STORE", str(context.cache_dir / "raw_store"))
+    result = measure(BENCHMARKS[name], context)
+    assert result.seconds > 0
+
+    [comparison] = compare([result], baseline, DEFAULT_THRESHOLD, DEFAULT_MEMORY_THRESHOLD)
+    if comparison.baseline is None:
+        pytest.fail(f"{result.key} has no baseline; run tv-bench --update-baseline")
+    if machine_class(baseline.get("machine", {})) != machine_class():
+        pytest.skip("baselines.json was recorded on a different machine class")
+    if comparison.regressions:
+        # One re-measurement before failing: a single noisy run is not a regression
+        [comparison] = compare([measure(BENCHMARKS[name], context)], baseline,
+                               DEFAULT_THRESHOLD, DEFAULT_MEMORY_THRESHOLD)
+    assert not comparison.regressions, f"{result.key}: {'; '.join(comparison.regressions)}"
+
+
+def test_machine_class_ignores_kernel_and_patch_release():
+    info = machine_info()
+    updated = {**info, "platform": info["platform"] + "-patched",
+               "python": info["python"].rsplit(".", 1)[0] + ".99"}
+
+    assert machine_class(updated) == machine_class()
+    assert machine_class({**info, "cpus": (info["cpus"] or 1) + 1}) != machine_class()
+
+
+@pytest.mark.parametrize("best, median, regressed", [
+    (0.0222, 0.0260, False),  # +39% on a 20 ms benchmark, within two spreads
+    (0.0320, 0.0340, True),   # 2x
+])
+def test_noise_floor_follows_run_to_run_spread(best, median, regressed):
+    baseline = {"results": {"country_filter@10x": {"seconds": 0.0160, "median_seconds": 0.0210}}}
+    result = Result("country_filter", "shared_utils", 10, 5, best, median, None, "traced")
+
+    [comparison] = compare([result], baseline, DEFAULT_THRESHOLD, DEFAULT_MEMORY_THRESHOLD)
+    assert bool(comparison.regressions) == regressed
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+✒ Metadata
+    - Title: Columnar Cache Tests (Terminal Velocity - v1.0)
+    - File Name: test_data_utils.py
+    - Relative Path: tests/test_data_utils.py
+    - Artifact Type: tests
+    - Version: 1.0.0
+    - Date: 2026-10-18
+    - Update: Sunday, October 18, 2026
+    - Author: Dennis 'dnoice' Smaltz
+    - A.I. Acknowledgement: Anthropic - Claude Opus 4.5
+    - Signature:  ︻デ═—··· 🎯 = Aim Twice, Shoot Once!
+
+✒ Description:
+    raw_digest()'s stat index under concurrent writers: updates wait for the
+    index lock, and parallel processes hashing different files keep every
+    entry. columnar_sidecar() reads match a plain CSV parse.
+---------
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import multiprocessing
+import threading
+import time
+
+import pandas as pd
+import pytest
+
+from computational_core.shared_utils import raw_store as raw_store_module
+from computational_core.shared_utils.data_utils import (
+    STAT_INDEX,
+    columnar_sidecar,
+    raw_digest,
+    read_csv_columns,
+)
+from computational_core.shared_utils.raw_store import file_lock
+
+
+def write_csvs(folder, count):
+    folder.mkdir(parents=True, exist_ok=True)
+    paths = []
+    for i in range(count):
+        path = folder / f"source_{i}.csv"
+        path.write_text(f"country,year,coal_co2\nC{i},2023,{i}.5\n", encoding="utf-8")
+        paths.append(path)
+    return paths
+
+
+def digest_all(paths, cache_dir):
+    for path in paths:
+        raw_digest(path, cache_dir)
+
+
+def test_index_update_waits_for_the_lock(tmp_path, monkeypatch):
+    monkeypatch.setattr(raw_store_module, "LOCK_POLL_SECONDS", 0.01)
+    [path] = write_csvs(tmp_path / "raw", 1)
+    cache_dir = tmp_path / "columnar"
+    index_path = cache_dir / STAT_INDEX
+
+    with file_lock(cache_dir / f"{STAT_INDEX}.lock"):
+        worker = threading.Thread(target=raw_digest, args=(path, cache_dir))
+        worker.start()
+        time.sleep(0.2)
+        assert worker.is_alive()
+        assert not index_path.exists()
+    worker.join()
+
+    [digest] = json.loads(index_path.read_text(encoding="utf-8")).values()
+    assert digest == hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+@pytest.mark.skipif("fork" not in multiprocessing.get_all_start_methods(), reason="needs fork")
+def test_parallel_writers_keep_every_entry(tmp_path):
+    cache_dir = tmp_path / "columnar"
+    batches = [write_csvs(tmp_path / f"raw_{w}", 25) for w in range(4)]
+
+    context = multiprocessing.get_context("fork")
+    workers = [context.Process(target=digest_all, args=(paths, cache_dir)) for paths in batches]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+    assert all(worker.exitcode == 0 for worker in workers)
+    assert len(json.loads((cache_dir / STAT_INDEX).read_text(encoding="utf-8"))) == 100
+    assert not list(cache_dir.glob("*.lock"))
+
+
+def test_sidecar_read_matches_csv(tmp_path):
+    [path] = write_csvs(tmp_path / "raw", 1)
+    columns = {"country": "category", "year": "int16", "coal_co2": "float32"}
+
+    cached = read_csv_columns(path, columns)
+    assert columnar_sidecar(path).is_file()
+    plain = read_csv_columns(path, columns, cache=False)
+    pd.testing.assert_frame_equal(cached, plain)
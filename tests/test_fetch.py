@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+✒ Metadata
+    - Title: Conditional & Resumable Fetch Tests (Terminal Velocity - v1.0)
+    - File Name: test_fetch.py
+    - Relative Path: tests/test_fetch.py
+    - Artifact Type: tests
+    - Version: 1.0.0
+    - Date: 2026-10-18
+    - Update: Sunday, October 18, 2026
+    - Author: Dennis 'dnoice' Smaltz
+    - A.I. Acknowledgement: Anthropic - Claude Opus 4.5
+    - Signature:  ︻デ═—··· 🎯 = Aim Twice, Shoot Once!
+
+✒ Description:
+    fetch_url() and RawDataStore.fetch() against a local http.server stand-in:
+    full download (200), revalidation (304), resume (206), unsatisfiable range
+    (416), checksum pins, and servers that gzip the body with or without being
+    asked to.
+---------
+"""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+from computational_core.shared_utils.fetch import ChecksumMismatch, fetch_url
+
+BODY = b"country,year,coal_co2\n" + b"".join(
+    f"Country {i},{1900 + i % 124},{i * 1.5:.1f}\n".encode() for i in range(5000))
+ETAG = '"v1-' + hashlib.sha256(BODY).hexdigest()[:12] + '"'
+
+
+class StandIn(BaseHTTPRequestHandler):
+    """Serves BODY with ETag, Range and (optionally) gzip like a CDN would."""
+
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        server = self.server
+        server.requests.append(dict(self.headers))
+        body, etag = server.body, server.etag
+
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        accepts_gzip = "gzip" in self.headers.get("Accept-Encoding", "")
+        if server.gzip == "always" or (server.gzip == "negotiate" and accepts_gzip):
+            payload = gzip.compress(body)
+            self.send_response(200)
+            self.send_header("Content-Encoding", "gzip")
+            self.send_header("ETag", etag)
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+            return
+
+        status, start = 200, 0
+        byte_range = self.headers.get("Range")
+        if_range = self.headers.get("If-Range")
+        if byte_range and (if_range is None or if_range == etag):
+            start = int(byte_range.removeprefix("bytes=").rstrip("-"))
+            if start >= len(body):
+                self.send_response(416)
+                self.send_header("Content-Range", f"bytes */{len(body)}")
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            status = 206
+
+        payload = body[start:]
+        self.send_response(status)
+        self.send_header("ETag", etag)
+        self.send_header("Content-Length", str(len(payload)))
+        if status == 206:
+            self.send_header("Content-Range", f"bytes {start}-{len(body) - 1}/{len(body)}")
+        self.end_headers()
+        if server.truncate_next:
+            server.truncate_next = False
+            self.wfile.write(payload[:len(payload) // 3])
+            self.wfile.flush()
+            self.close_connection = True
+            return
+        self.wfile.write(payload)
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), StandIn)
+    httpd.body, httpd.etag = BODY, ETAG
+    httpd.gzip, httpd.truncate_next = "never", False
+    httpd.requests = []
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    httpd.url = f"http://127.0.0.1:{httpd.server_address[1]}/owid-co2-data.csv"
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.fixture
+def dest(tmp_path):
+    return tmp_path / "raw" / "owid-co2-data.csv"
+
+
+def test_download_200(server, dest):
+    result = fetch_url(server.url, dest)
+
+    assert result.status == "downloaded"
+    assert dest.read_bytes() == BODY
+    assert result.sha256 == hashlib.sha256(BODY).hexdigest()
+    assert result.size == result.bytes_transferred == len(BODY)
+    assert result.etag == ETAG
+    assert server.requests[0]["Accept-Encoding"] == "identity"
+    assert not dest.with_name(dest.name + ".part").exists()
+
+
+def test_revalidation_304(server, dest):
+    first = fetch_url(server.url, dest)
+    second = fetch_url(server.url, dest, etag=first.etag)
+
+    assert second.status == "not_modified"
+    assert second.bytes_transferred == 0
+    assert server.requests[1]["If-None-Match"] == ETAG
+    assert dest.read_bytes() == BODY
+
+
+def test_truncated_transfer_resumes_with_206(server, dest):
+    server.truncate_next = True
+    with pytest.raises((requests.RequestException, ChecksumMismatch)):
+        fetch_url(server.url, dest, chunk_size=4096)
+    partial = dest.with_name(dest.name + ".part")
+    kept = partial.stat().st_size
+    assert 0 < kept < len(BODY)
+
+    result = fetch_url(server.url, dest)
+    assert result.status == "resumed"
+    assert server.requests[-1]["Range"] == f"bytes={kept}-"
+    assert server.requests[-1]["If-Range"] == ETAG
+    assert result.bytes_transferred == len(BODY) - kept
+    assert dest.read_bytes() == BODY
+    assert result.sha256 == hashlib.sha256(BODY).hexdigest()
+
+
+def test_changed_representation_restarts(server, dest):
+    server.truncate_next = True
+    with pytest.raises((requests.RequestException, ChecksumMismatch)):
+        fetch_url(server.url, dest, chunk_size=4096)
+    server.body, server.etag = BODY.upper(), '"v2"'
+
+    result = fetch_url(server.url, dest)
+    assert result.status == "downloaded"  # If-Range mismatch: full 200
+    assert dest.read_bytes() == BODY.upper()
+
+
+def test_unsatisfiable_range_416_starts_over(server, dest):
+    partial = dest.with_name(dest.name + ".part")
+    partial.parent.mkdir(parents=True)
+    partial.write_bytes(BODY + b"stale tail")
+
+    result = fetch_url(server.url, dest)
+    assert [r.get("Range") for r in server.requests] == [f"bytes={len(BODY) + 10}-", None]
+    assert result.status == "downloaded"
+    assert dest.read_bytes() == BODY
+
+
+def test_checksum_mismatch_discards_partial(server, dest):
+    with pytest.raises(ChecksumMismatch, match="sha256"):
+        fetch_url(server.url, dest, expected_sha256="0" * 64)
+    assert not dest.exists()
+    assert not dest.with_name(dest.name + ".part").exists()
+
+    pinned = fetch_url(server.url, dest, expected_sha256=hashlib.sha256(BODY).hexdigest().upper())
+    assert pinned.status == "downloaded"
+
+
+@pytest.mark.parametrize("mode", ["negotiate", "always"])
+def test_gzip_body(server, dest, mode):
+    # "negotiate" only compresses when asked; "always" ignores Accept-Encoding
+    server.gzip = mode
+    result = fetch_url(server.url, dest)
+
+    assert result.status == "downloaded"
+    assert dest.read_bytes() == BODY
+    assert result.sha256 == hashlib.sha256(BODY).hexdigest()
+
+
+def test_gzip_partial_is_not_resumed(server, dest):
+    server.gzip = "always"
+    partial = dest.with_name(dest.name + ".part")
+    partial.parent.mkdir(parents=True)
+    partial.write_bytes(BODY[:100])
+    dest.with_name(dest.name + ".part.json").write_text('{"content_encoding": "gzip"}')
+
+    result = fetch_url(server.url, dest)
+    assert "Range" not in server.requests[0]
+    assert dest.read_bytes() == BODY
+    assert result.status == "downloaded"
+
+
+def test_raw_store_fetch_and_refresh(server, raw_store):
+    with requests.Session() as session:
+        entry = raw_store.fetch(server.url, "owid_co2", session=session)
+        assert raw_store.blob_path(entry.sha256).read_bytes() == BODY
+        assert entry.etag == ETAG
+
+        refreshed = raw_store.refresh(server.url, session=session)
+    assert refreshed.sha256 == entry.sha256
+    assert server.requests[-1]["If-None-Match"] == ETAG
+    assert len(server.requests) == 2
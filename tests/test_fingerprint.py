@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+✒ Metadata
+    - Title: Stage Fingerprint Tests (Terminal Velocity - v1.0)
+    - File Name: test_fingerprint.py
+    - Relative Path: tests/test_fingerprint.py
+    - Artifact Type: tests
+    - Version: 1.0.1
+    - Date: 2026-10-18
+    - Update: Sunday, October 18, 2026
+    - Author: Dennis 'dnoice' Smaltz
+    - A.I. Acknowledgement: Anthropic - Claude Opus 4.5
+    - Signature:  ︻デ═—··· 🎯 = Aim Twice, Shoot Once!
+
+✒ Description:
+    Script, config-constant, first-party dependency, input and output changes
+    each make a stage stale with the right reason; comment edits and untouched
+    files do not.
+---------
+"""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+from computational_core.shared_utils import fingerprint as fingerprint_module
+from computational_core.shared_utils.fingerprint import (
+    compute_fingerprint,
+    config_constants,
+    load_fingerprint,
+    save_fingerprint,
+    source_digest,
+    stale_reasons,
+)
+
+SCRIPT = '''\
+# %% [markdown]
+# Stage under test
+SCENARIOS = {"baseline": {"annual_change_pct": 0.5}}
+THRESHOLD = 3
+RUN_AT = __import__("time").time()
+
+print(SCENARIOS, THRESHOLD)
+'''
+
+
+@pytest.fixture
+def stage(tmp_path: Path) -> Path:
+    """A stage directory with a script, one input and one output."""
+    (tmp_path / "stage.py").write_text(SCRIPT, encoding="utf-8")
+    (tmp_path / "raw").mkdir()
+    (tmp_path / "raw" / "data.csv").write_text("year,value\n2023,1\n", encoding="utf-8")
+    (tmp_path / "derived").mkdir()
+    (tmp_path / "derived" / "out.csv").write_text("year,value\n2024,2\n", encoding="utf-8")
+    return tmp_path
+
+
+def fingerprint(stage: Path, previous=None):
+    return compute_fingerprint("stage", stage / "stage.py", [Path("raw")], [Path("derived")],
+                               previous, base=stage)
+
+
+def test_config_constants_evaluate_literals_and_hash_the_rest(stage):
+    constants = config_constants(stage / "stage.py")
+
+    assert constants["SCENARIOS"] == {"baseline": {"annual_change_pct": 0.5}}
+    assert constants["THRESHOLD"] == 3
+    assert isinstance(constants["RUN_AT"], str) and len(constants["RUN_AT"]) == 64
+
+
+@pytest.mark.parametrize("error", [TypeError, SyntaxError, MemoryError, RecursionError])
+def test_literal_eval_failures_fall_back_to_expression_digest(stage, monkeypatch, error):
+    def failing(node):
+        raise error("unusual constant")
+
+    monkeypatch.setattr(fingerprint_module.ast, "literal_eval", failing)
+    constants = config_constants(stage / "stage.py")
+    assert sorted(constants) == ["RUN_AT", "SCENARIOS", "THRESHOLD"]
+    assert len(set(constants.values())) == 3
+
+
+def test_computed_constant_edit_is_named(stage):
+    first = fingerprint(stage)
+    script = stage / "stage.py"
+    # {[1]: 2} is literal syntax that literal_eval rejects with TypeError
+    script.write_text(SCRIPT + "LOOKUP = {[1]: 2}\n", encoding="utf-8")
+    second = fingerprint(stage, first)
+    script.write_text(SCRIPT + "LOOKUP = {[1]: 3}\n", encoding="utf-8")
+
+    assert stale_reasons(second, fingerprint(stage, second)) == ["LOOKUP changed"]
+
+
+def test_comment_edits_do_not_change_source_digest(stage):
+    script = stage / "stage.py"
+    before = source_digest(script)
+    script.write_text(SCRIPT.replace("# Stage under test", "# Reworded markdown cell"),
+                      encoding="utf-8")
+    assert source_digest(script) == before
+
+
+def test_unchanged_stage_is_fresh(stage):
+    first = fingerprint(stage)
+    assert stale_reasons(None, first) == ["no previous run recorded"]
+    assert stale_reasons(first, fingerprint(stage, first)) == []
+
+
+def test_config_change_is_named(stage):
+    first = fingerprint(stage)
+    script = stage / "stage.py"
+    script.write_text(SCRIPT.replace("0.5", "-7.0"), encoding="utf-8")
+
+    assert stale_reasons(first, fingerprint(stage, first)) == ["SCENARIOS changed"]
+
+
+def test_code_change_is_script_changed(stage):
+    first = fingerprint(stage)
+    (stage / "stage.py").write_text(SCRIPT + "print('extra')\n", encoding="utf-8")
+
+    assert stale_reasons(first, fingerprint(stage, first)) == ["script changed"]
+
+
+def test_input_changes(stage):
+    first = fingerprint(stage)
+    (stage / "raw" / "data.csv").write_text("year,value\n2023,9\n", encoding="utf-8")
+    (stage / "raw" / "extra.csv").write_text("x\n", encoding="utf-8")
+
+    assert stale_reasons(first, fingerprint(stage, first)) == [
+        "input changed raw/data.csv",
+        "new input raw/extra.csv",
+    ]
+
+
+def test_output_tampering(stage):
+    first = fingerprint(stage)
+    (stage / "derived" / "out.csv").unlink()
+
+    assert stale_reasons(first, fingerprint(stage, first)) == ["output missing derived/out.csv"]
+
+
+def test_stat_cache_skips_rehash(stage, monkeypatch):
+    first = fingerprint(stage)
+
+    def fail(path, *args, **kwargs):
+        raise AssertionError(f"re-hashed {path}")
+
+    monkeypatch.setattr(fingerprint_module, "file_digest", fail)
+    assert fingerprint(stage, first).inputs == first.inputs
+
+    # A touched file (new mtime) is hashed again
+    data = stage / "raw" / "data.csv"
+    os.utime(data, ns=(data.stat().st_atime_ns, data.stat().st_mtime_ns + 10**9))
+    with pytest.raises(AssertionError, match="re-hashed"):
+        fingerprint(stage, first)
+
+
+def test_key_ignores_stat_metadata(stage):
+    first = fingerprint(stage)
+    data = stage / "raw" / "data.csv"
+    os.utime(data, ns=(data.stat().st_atime_ns, data.stat().st_mtime_ns + 10**9))
+
+    assert fingerprint(stage, first).key == first.key
+
+
+def test_save_and_load_roundtrip(stage):
+    first = fingerprint(stage)
+    record = stage / "derived" / "stage.fingerprint.json"
+    save_fingerprint(first, record)
+
+    assert load_fingerprint(record) == first
+    assert load_fingerprint(stage / "missing.json") is None
+    # The record itself is not an output of the stage
+    assert "derived/stage.fingerprint.json" not in fingerprint(stage, first).outputs
+
+
+# =============================================================================
+# FIRST-PARTY DEPENDENCIES
+# =============================================================================
+
+PACKAGE = {
+    "__init__.py": '"""Package."""\n',
+    "shared_utils/__init__.py": "",
+    "shared_utils/scenarios.py": "from .budgets import exhaust\n\ndef project():\n    return exhaust()\n",
+    "shared_utils/budgets.py": "def exhaust():\n    return 1\n",
+    "shared_utils/regions.py": ('from pathlib import Path\n'
+                                'REGISTRY_PATH = Path(__file__).with_name("regions.yaml")\n'),
+    "shared_utils/regions.yaml": "aggregate_prefix: OWID_\n",
+    "shared_utils/unused.py": "VALUE = 1\n",
+}
+IMPORTING_SCRIPT = """\
+import numpy as np
+from computational_core.shared_utils.scenarios import project
+from computational_core.shared_utils import regions
+"""
+
+
+@pytest.fixture
+def package_stage(stage, tmp_path, monkeypatch):
+    """The stage, importing from a throwaway computational_core package."""
+    root = tmp_path / "repo"
+    for name, source in PACKAGE.items():
+        path = root / "computational_core" / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(source, encoding="utf-8")
+    monkeypatch.setattr(fingerprint_module, "PACKAGE_ROOT", root)
+    (stage / "stage.py").write_text(IMPORTING_SCRIPT + SCRIPT, encoding="utf-8")
+    return stage
+
+
+def test_module_dependencies_are_transitive(package_stage, tmp_path):
+    package = tmp_path / "repo" / "computational_core"
+    found = fingerprint_module.module_dependencies(package_stage / "stage.py")
+
+    assert [p.relative_to(package).as_posix() for p in found] == [
+        "__init__.py",
+        "shared_utils/__init__.py",
+        "shared_utils/budgets.py",
+        "shared_utils/regions.py",
+        "shared_utils/regions.yaml",
+        "shared_utils/scenarios.py",
+    ]
+
+
+@pytest.mark.parametrize(("name", "edit"), [
+    ("shared_utils/budgets.py", "def exhaust():\n    return 2\n"),
+    ("shared_utils/regions.yaml", "aggregate_prefix: AGG_\n"),
+])
+def test_dependency_change_is_named(package_stage, tmp_path, name, edit):
+    first = fingerprint(package_stage)
+    (tmp_path / "repo" / "computational_core" / name).write_text(edit, encoding="utf-8")
+
+    current = fingerprint(package_stage, first)
+    assert stale_reasons(first, current) == [f"dependency changed: {name}"]
+    assert current.key != first.key
+
+
+def test_dependency_comment_edit_is_ignored(package_stage, tmp_path):
+    first = fingerprint(package_stage)
+    module = tmp_path / "repo" / "computational_core" / "shared_utils" / "scenarios.py"
+    module.write_text("# Reworded comment\n" + PACKAGE["shared_utils/scenarios.py"], encoding="utf-8")
+
+    assert stale_reasons(first, fingerprint(package_stage, first)) == []
+
+
+def test_new_dependency_is_named(package_stage, tmp_path):
+    first = fingerprint(package_stage)
+    script = package_stage / "stage.py"
+    script.write_text("from computational_core.shared_utils import unused\n"
+                      + script.read_text(encoding="utf-8"), encoding="utf-8")
+
+    assert "new dependency: shared_utils/unused.py" in stale_reasons(first, fingerprint(package_stage, first))
+
+
+def test_older_fingerprint_format_reruns(stage):
+    first = fingerprint(stage)
+    first.version = fingerprint_module.FINGERPRINT_VERSION - 1
+
+    assert stale_reasons(first, fingerprint(stage, first)) == ["fingerprint format changed"]
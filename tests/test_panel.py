@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+✒ Metadata
+    - Title: Country × Year Panel Tests (Terminal Velocity - v1.0)
+    - File Name: test_panel.py
+    - Relative Path: tests/test_panel.py
+    - Artifact Type: tests
+    - Version: 1.1.1
+    - Date: 2026-10-18
+    - Update: Sunday, October 18, 2026
+    - Author: Dennis 'dnoice' Smaltz
+    - A.I. Acknowledgement: Anthropic - Claude Opus 4.5
+    - Signature:  ︻デ═—··· 🎯 = Aim Twice, Shoot Once!
+
+✒ Description:
+    build_panel() on the fixture tables seeded into a raw store: select() over a
+    year window returns views of the memory-mapped arrays, a country subset
+    returns copies, values match the source rows in their declared precision
+    (float64 totals, float32 shares), and an unchanged build is skipped.
+    Rebuilds publish a new build directory behind the pointer file while open
+    panels keep reading the build they opened.
+---------
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from computational_core.shared_utils.data_utils import read_csv_columns
+from computational_core.shared_utils.downloader import sources_from_config
+from computational_core.shared_utils.fingerprint import config_constants
+from computational_core.shared_utils.panel import CURRENT_FILE, Panel, build_panel
+from computational_core.validation_suite.benchmarks import A01_COMPUTATIONS
+from computational_core.validation_suite.fixtures import seed_raw_store, write_fixtures
+
+
+@pytest.fixture
+def data_sources() -> dict:
+    return config_constants(A01_COMPUTATIONS / "01_intake.py")["DATA_SOURCES"]
+
+
+@pytest.fixture
+def specs(raw_store, data_sources, tmp_path) -> list:
+    files = write_fixtures(1, tmp_path / "fixtures")
+    seed_raw_store(raw_store, data_sources, files)
+    return sources_from_config(data_sources, tmp_path / "raw", "A-01")
+
+
+@pytest.fixture
+def panel(specs, raw_store, tmp_path) -> Panel:
+    return build_panel(specs, raw_store, tmp_path / "panel")
+
+
+def test_year_window_is_a_view_of_the_mapped_store(panel):
+    window = panel.select(["coal_co2", "coal_consumption"], years=(1965, 2023))
+
+    for name in ("coal_co2", "coal_consumption"):
+        assert np.shares_memory(window[name], panel.array(name))
+        assert not window[name].flags.writeable
+    assert window.shape == (panel.shape[0], 2023 - 1965 + 1)
+    assert window.years[0] == 1965
+
+
+def test_country_subset_is_a_copy(panel):
+    subset = panel.select(["coal_co2"], years=(2000, 2023), countries=["World", "China"])
+
+    assert not np.shares_memory(subset["coal_co2"], panel.array("coal_co2"))
+    assert subset.countries.tolist() == ["World", "China"]
+
+
+def test_values_match_source_rows(panel, data_sources, raw_store):
+    columns = data_sources["owid_co2"]["columns"]
+    blob = raw_store.blob_path(raw_store.lookup(data_sources["owid_co2"]["url"]).sha256)
+    source = read_csv_columns(blob, columns)
+    world = source[source["country"] == "World"].set_index("year")["coal_co2"]
+
+    window = panel.select(["coal_co2"], years=(1900, 2023))
+    row = window["coal_co2"][panel.code("World")]
+    assert row.dtype == np.float64
+    np.testing.assert_array_equal(row, world.loc[1900:2023].to_numpy(dtype=np.float64))
+    assert panel.indicators["coal_co2"] == "owid_co2"
+    assert panel.array("share_global_co2").dtype == np.float32
+
+
+def test_unchanged_inputs_skip_the_build(panel, specs, raw_store, tmp_path):
+    again = build_panel(specs, raw_store, tmp_path / "panel")
+
+    assert again.axes["built_at"] == panel.axes["built_at"]
+    assert again.axes["key"] == panel.axes["key"]
+
+
+def test_open_panel_keeps_its_build_across_rebuilds(panel, specs, raw_store, tmp_path):
+    root = tmp_path / "panel"
+    before = panel.select(["coal_co2"])["coal_co2"].copy()
+
+    rebuilt = build_panel(specs, raw_store, root, force=True)
+    assert rebuilt.root != panel.root
+    assert (root / CURRENT_FILE).read_text(encoding="utf-8") == rebuilt.root.name
+    assert Panel.open(root).axes["built_at"] == rebuilt.axes["built_at"]
+    # The earlier reader is pinned to its own build
+    np.testing.assert_array_equal(panel.select(["coal_co2"])["coal_co2"], before)
+
+    build_panel(specs, raw_store, root, force=True)
+    # Only the published build and the one before it are kept
+    assert sorted(p.name for p in root.iterdir()) == sorted(
+        [CURRENT_FILE, rebuilt.root.name, Panel.open(root).root.name])
+    np.testing.assert_array_equal(panel.select(["coal_co2"])["coal_co2"], before)
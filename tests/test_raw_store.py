@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+✒ Metadata
+    - Title: Raw Data Store Tests (Terminal Velocity - v1.0)
+    - File Name: test_raw_store.py
+    - Relative Path: tests/test_raw_store.py
+    - Artifact Type: tests
+    - Version: 1.0.0
+    - Date: 2026-10-18
+    - Update: Sunday, October 18, 2026
+    - Author: Dennis 'dnoice' Smaltz
+    - A.I. Acknowledgement: Anthropic - Claude Opus 4.5
+    - Signature:  ︻デ═—··· 🎯 = Aim Twice, Shoot Once!
+
+✒ Description:
+    Content addressing, the URL index, zero-copy materialization, adoption of
+    existing per-mechanism copies and the cross-process download lock.
+---------
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import stat
+import threading
+import time
+
+import pytest
+
+from computational_core.shared_utils import raw_store as raw_store_module
+from computational_core.shared_utils.raw_store import RawDataStore
+
+URL = "https://example.org/owid-co2-data.csv"
+PAYLOAD = b"country,year,co2\nWorld,2023,37791.6\n"
+
+
+@pytest.fixture
+def source_file(tmp_path):
+    path = tmp_path / "download.csv"
+    path.write_bytes(PAYLOAD)
+    return path
+
+
+def test_put_file_is_content_addressed(raw_store, source_file):
+    digest = raw_store.put_file(source_file)
+
+    assert digest == hashlib.sha256(PAYLOAD).hexdigest()
+    blob = raw_store.blob_path(digest)
+    assert blob.read_bytes() == PAYLOAD
+    assert blob.parent.name == digest[:2]
+    assert not blob.stat().st_mode & stat.S_IWUSR  # blobs are read-only
+    assert source_file.exists()
+
+
+def test_put_file_twice_stores_one_blob(raw_store, source_file, tmp_path):
+    copy = tmp_path / "copy.csv"
+    copy.write_bytes(PAYLOAD)
+
+    first = raw_store.put_file(source_file)
+    second = raw_store.put_file(copy, move=True)
+
+    assert first == second
+    assert not copy.exists()
+    assert len(list(raw_store.objects_dir.rglob("*"))) == 2  # one prefix dir, one blob
+
+
+def test_record_and_lookup(raw_store, source_file):
+    digest = raw_store.put_file(source_file)
+    entry = raw_store.record(URL, digest, "owid_co2", etag='"abc"', last_modified="Sat, 01 Jan 2000")
+
+    found = raw_store.lookup(URL)
+    assert found == entry
+    assert found.size == len(PAYLOAD)
+    assert found.etag == '"abc"'
+    assert [e.url for e in raw_store.entries()] == [URL]
+    assert raw_store.lookup("https://example.org/other.csv") is None
+
+
+def test_lookup_ignores_index_without_blob(raw_store, source_file):
+    digest = raw_store.put_file(source_file)
+    raw_store.record(URL, digest)
+    blob = raw_store.blob_path(digest)
+    blob.chmod(0o600)
+    blob.unlink()
+
+    assert raw_store.lookup(URL) is None
+    assert raw_store.entries() == []
+
+
+def test_materialize_links_blob(raw_store, source_file, tmp_path):
+    digest = raw_store.put_file(source_file)
+    dest = tmp_path / "mechanism" / "datasets" / "raw" / "owid-co2-data.csv"
+
+    raw_store.materialize(digest, dest)
+    assert dest.read_bytes() == PAYLOAD
+    assert os.path.samefile(dest, raw_store.blob_path(digest))
+
+    # A second call is a no-op, a stale file at dest is replaced
+    raw_store.materialize(digest, dest)
+    dest.unlink()
+    dest.write_bytes(b"stale")
+    raw_store.materialize(digest, dest)
+    assert dest.read_bytes() == PAYLOAD
+
+
+def test_materialize_missing_blob(raw_store, tmp_path):
+    with pytest.raises(FileNotFoundError):
+        raw_store.materialize("0" * 64, tmp_path / "out.csv")
+
+
+def test_adopt_moves_copy_into_store(raw_store, source_file):
+    entry = raw_store.adopt(URL, source_file, "owid_co2")
+
+    assert entry.source_name == "owid_co2"
+    assert source_file.read_bytes() == PAYLOAD
+    assert os.path.samefile(source_file, raw_store.blob_path(entry.sha256))
+
+
+def test_fetch_serves_stored_url_without_network(raw_store, source_file):
+    entry = raw_store.adopt(URL, source_file)
+    # Already indexed: served from the store without a request
+    assert raw_store.fetch(URL) == entry
+
+
+def test_lock_is_exclusive(raw_store, monkeypatch):
+    monkeypatch.setattr(raw_store_module, "LOCK_POLL_SECONDS", 0.01)
+    events = []
+
+    def holder():
+        with raw_store.lock(URL):
+            events.append("a-in")
+            time.sleep(0.2)
+            events.append("a-out")
+
+    thread = threading.Thread(target=holder)
+    thread.start()
+    while not events:
+        time.sleep(0.01)
+    with raw_store.lock(URL):
+        events.append("b-in")
+    thread.join()
+
+    assert events == ["a-in", "a-out", "b-in"]
+    assert not list(raw_store.tmp_dir.glob("*.lock"))
+
+
+def test_stale_lock_is_broken(raw_store, monkeypatch):
+    monkeypatch.setattr(raw_store_module, "LOCK_STALE_SECONDS", 60)
+    raw_store.tmp_dir.mkdir(parents=True)
+    lock_path = raw_store.tmp_dir / (raw_store.index_path(URL).stem + ".lock")
+    lock_path.touch()
+    old = time.time() - 120
+    os.utime(lock_path, (old, old))
+
+    with raw_store.lock(URL):
+        assert lock_path.exists()
+    assert not lock_path.exists()
+
+
+def test_store_root_from_environment(tmp_path, monkeypatch):
+    monkeypatch.setenv(raw_store_module.STORE_ENV_VAR, str(tmp_path / "elsewhere"))
+    assert RawDataStore().root == tmp_path / "elsewhere"
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+✒ Metadata
+    - Title: Region Registry Tests (Terminal Velocity - v1.0)
+    - File Name: test_regions.py
+    - Relative Path: tests/test_regions.py
+    - Artifact Type: tests
+    - Version: 1.0.0
+    - Date: 2026-10-18
+    - Update: Sunday, October 18, 2026
+    - Author: Dennis 'dnoice' Smaltz
+    - A.I. Acknowledgement: Anthropic - Claude Opus 4.5
+    - Signature:  ︻デ═—··· 🎯 = Aim Twice, Shoot Once!
+
+✒ Description:
+    is_country() against the baseline A-01 rule (an ISO code and not a named
+    aggregate) on OWID-style rows, former states included; tag() and
+    aggregate() on the built-in schemes.
+---------
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+from computational_core.shared_utils.regions import region_registry
+from computational_core.validation_suite.fixtures import synthetic_co2
+
+# Hand-typed aggregate list of the baseline A-01 analysis stage
+AGGREGATE_REGIONS = [
+    "World", "Africa", "Asia", "Europe", "North America", "South America",
+    "Oceania", "Antarctica", "European Union (27)", "European Union (28)",
+    "High-income countries", "Low-income countries", "Lower-middle-income countries",
+    "Upper-middle-income countries", "Asia (excl. China and India)",
+    "Europe (excl. EU-27)", "Europe (excl. EU-28)", "North America (excl. USA)",
+    "OECD", "Non-OECD"
+]
+
+ROWS = pd.DataFrame({
+    "country": ["World", "Asia", "High-income countries", "China", "Kosovo",
+                "USSR", "Czechoslovakia", "Yugoslavia", "Northern Cyprus",
+                "International shipping"],
+    "iso_code": ["OWID_WRL", None, None, "CHN", "OWID_KOS",
+                 "OWID_USS", "OWID_CZS", "OWID_YGS", "OWID_CYN", None],
+})
+
+
+def baseline_is_country(df: pd.DataFrame) -> pd.Series:
+    return df["iso_code"].notna() & ~df["country"].isin(AGGREGATE_REGIONS)
+
+
+def test_is_country_matches_baseline_rule():
+    flags = region_registry().is_country(ROWS["iso_code"])
+
+    assert flags.tolist() == baseline_is_country(ROWS).tolist()
+    assert ROWS["country"][flags].tolist() == [
+        "China", "Kosovo", "USSR", "Czechoslovakia", "Yugoslavia", "Northern Cyprus"]
+
+
+def test_former_states_can_be_excluded():
+    flags = region_registry().is_country(ROWS["iso_code"], historical=False)
+
+    assert ROWS["country"][flags].tolist() == ["China", "Kosovo", "Northern Cyprus"]
+    assert region_registry().historical_codes == {"OWID_USS", "OWID_CZS", "OWID_YGS"}
+
+
+def test_unregistered_prefixed_code_is_an_aggregate():
+    flags = region_registry().is_country(pd.Series(["OWID_EU27", "OWID_WRL", "DEU"]))
+    assert flags.tolist() == [False, False, True]
+
+
+def test_fixture_countries_match_baseline_rule():
+    df = synthetic_co2(scale=1)
+    flags = region_registry().is_country(df["iso_code"])
+
+    assert flags.equals(baseline_is_country(df))
+    assert {"USSR", "Czechoslovakia", "Yugoslavia"} <= set(df["country"][flags])
+    # Former states have no rows after they dissolved
+    assert df.loc[df["country"] == "USSR", "year"].max() == 1991
+
+
+def test_tag_and_aggregate():
+    registry = region_registry()
+    df = pd.DataFrame({
+        "iso_code": ["CHN", "IND", "DEU", "OWID_USS", None],
+        "year": [2023] * 5,
+        "co2": [1.0, 2.0, 4.0, 8.0, 16.0],
+    })
+
+    assert list(registry.tag(df, "continent")) == ["Asia", "Asia", "Europe", "Other", "Other"]
+    totals = registry.aggregate(df, "continent", ["co2"])
+    assert dict(zip(totals["continent"], totals["co2"])) == {"Asia": 3.0, "Europe": 4.0, "Other": 24.0}
+    assert np.array_equal(registry.scheme("oecd").codes(df["iso_code"]), [0, 0, 1, 0, 0])
@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+✒ Metadata
+    - Title: Figure Rendering Cache Tests (Terminal Velocity - v1.0)
+    - File Name: test_rendering.py
+    - Relative Path: tests/test_rendering.py
+    - Artifact Type: tests
+    - Version: 1.0.3
+    - Date: 2026-10-18
+    - Update: Sunday, October 18, 2026
+    - Author: Dennis 'dnoice' Smaltz
+    - A.I. Acknowledgement: Anthropic - Claude Opus 4.5
+    - Signature:  ︻デ═—··· 🎯 = Aim Twice, Shoot Once!
+
+✒ Description:
+    Fingerprint-based skipping in render_figures: unchanged figures are cache
+    hits, and data, style or builder changes, edits elsewhere in the builder's
+    module, palette changes and missing files are misses.
+    Thumbnails are written (and cached) whatever the main output format. Render
+    workers are not forked while other threads run.
+---------
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import json
+import os
+import threading
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from computational_core.shared_utils import viz_utils
+from computational_core.shared_utils.rendering import (
+    FigureSpec,
+    export_paths,
+    figure_manifest,
+    manifest_fingerprints,
+    pool_context,
+    render_figures,
+)
+
+
+def line_chart(fig, ax, years, values):
+    ax.plot(years, values)
+    ax.set_title("Coal CO2")
+
+
+def bar_chart(fig, ax, years, values):
+    ax.bar(years, values)
+
+
+BUILDERS = '''\
+def _finish(ax):
+    ax.set_title("Coal CO2")
+
+
+def line_chart(fig, ax, years, values):
+    ax.plot(years, values)
+    _finish(ax)
+'''
+
+
+def load_builder(path, source):
+    """Import ``line_chart`` from a fresh module written to ``path``."""
+    path.write_text(source, encoding="utf-8")
+    module_spec = importlib.util.spec_from_file_location(f"builders_{abs(hash(source))}", path)
+    module = importlib.util.module_from_spec(module_spec)
+    module_spec.loader.exec_module(module)
+    return module.line_chart
+
+
+@pytest.fixture
+def spec(tmp_path):
+    years = np.arange(2000, 2024)
+    return FigureSpec("coal_trend", line_chart, tmp_path / "figures" / "coal_trend.png",
+                      data={"years": years, "values": np.linspace(1.0, 2.0, len(years))},
+                      figsize=(4, 3), dpi=50)
+
+
+def rerender(specs, first, tmp_path):
+    """Round-trip the previous run through a manifest, as the pipeline does."""
+    manifest = tmp_path / "figures" / "figure_manifest.json"
+    figures = figure_manifest(first, relative_to=manifest.parent)
+    manifest.write_text(json.dumps({"figures": figures}), encoding="utf-8")
+    return render_figures(specs, workers=1, previous=manifest_fingerprints(manifest))
+
+
+def test_first_render_writes_files(spec):
+    [result] = render_figures([spec], workers=1)
+
+    assert not result.cached
+    assert result.error is None
+    assert result.path.is_file() and result.size_bytes > 0
+    assert result.fingerprint
+
+
+def test_unchanged_figure_is_cache_hit(spec, tmp_path):
+    first = render_figures([spec], workers=1)
+    mtime = spec.path.stat().st_mtime_ns
+
+    [again] = rerender([spec], first, tmp_path)
+    assert again.cached
+    assert again.fingerprint == first[0].fingerprint
+    assert spec.path.stat().st_mtime_ns == mtime
+
+
+@pytest.mark.parametrize("change", ["data", "style", "builder", "dpi"])
+def test_changed_figure_is_cache_miss(spec, tmp_path, change):
+    first = render_figures([spec], workers=1)
+    if change == "data":
+        spec.data = {**spec.data, "values": spec.data["values"] * 2}
+    elif change == "style":
+        spec.style = {"axes.grid": True}
+    elif change == "builder":
+        spec.builder = bar_chart
+    else:
+        spec.dpi = 60
+
+    [again] = rerender([spec], first, tmp_path)
+    assert not again.cached
+    assert again.fingerprint != first[0].fingerprint
+
+
+def test_missing_file_is_cache_miss(spec, tmp_path):
+    spec.vector_formats = ("svg",)
+    first = render_figures([spec], workers=1)
+    export_paths(spec)["svg"].unlink()
+
+    [again] = rerender([spec], first, tmp_path)
+    assert not again.cached
+    assert export_paths(spec)["svg"].is_file()
+
+
+def test_only_stale_figures_render(spec, tmp_path):
+    other = FigureSpec("coal_bars", bar_chart, tmp_path / "figures" / "coal_bars.png",
+                       data=spec.data, figsize=(4, 3), dpi=50)
+    first = render_figures([spec, other], workers=1)
+    other.data = {**other.data, "values": other.data["values"] + 1}
+
+    results = rerender([spec, other], first, tmp_path)
+    assert [r.cached for r in results] == [True, False]
+
+
+@pytest.mark.parametrize("suffix", [".png", ".jpg", ".pdf"])
+def test_thumbnail_for_any_main_format(spec, tmp_path, suffix):
+    spec.path = spec.path.with_suffix(suffix)
+    spec.thumbnail_width = 80
+    first = render_figures([spec], workers=1)
+
+    thumbnail = export_paths(spec)["thumbnail"]
+    assert first[0].error is None
+    assert thumbnail.is_file()
+    assert Image.open(thumbnail).width == 80
+    [again] = rerender([spec], first, tmp_path)
+    assert again.cached
+
+
+def test_helper_edit_in_builder_module_is_cache_miss(spec, tmp_path):
+    spec.builder = load_builder(tmp_path / "builders.py", BUILDERS)
+    first = render_figures([spec], workers=1)
+    # The builder itself is unchanged; only the helper it calls differs
+    spec.builder = load_builder(tmp_path / "builders.py",
+                                BUILDERS.replace('"Coal CO2"', '"Coal CO2 (Gt)"'))
+
+    [again] = rerender([spec], first, tmp_path)
+    assert not again.cached
+
+
+def test_palette_change_is_cache_miss(spec, tmp_path, monkeypatch):
+    first = render_figures([spec], workers=1)
+    monkeypatch.setitem(viz_utils.COLORS, "tertiary", "#44ff84")
+
+    [again] = rerender([spec], first, tmp_path)
+    assert not again.cached
+
+
+def test_workers_are_not_forked_beside_other_threads(spec, tmp_path):
+    other = FigureSpec("coal_bars", bar_chart, tmp_path / "figures" / "coal_bars.png",
+                       data=spec.data, figsize=(4, 3), dpi=50)
+    stop = threading.Event()
+    thread = threading.Thread(target=stop.wait)
+    thread.start()
+    try:
+        assert pool_context().get_start_method() != "fork"
+        results = render_figures([spec, other], workers=2)
+    finally:
+        stop.set()
+        thread.join()
+
+    assert [r.error for r in results] == [None, None]
+    assert all(r.worker != os.getpid() and r.path.is_file() for r in results)
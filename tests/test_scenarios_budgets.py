@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+✒ Metadata
+    - Title: Scenario & Budget Equivalence Tests (Terminal Velocity - v1.0)
+    - File Name: test_scenarios_budgets.py
+    - Relative Path: tests/test_scenarios_budgets.py
+    - Artifact Type: tests
+    - Version: 1.0.0
+    - Date: 2026-10-18
+    - Update: Sunday, October 18, 2026
+    - Author: Dennis 'dnoice' Smaltz
+    - A.I. Acknowledgement: Anthropic - Claude Opus 4.5
+    - Signature:  ︻デ═—··· 🎯 = Aim Twice, Shoot Once!
+
+✒ Description:
+    The vectorized projections and budget tables against the per-year loops
+    A-01 02_analysis used before shared_utils.scenarios / budgets existed.
+---------
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from computational_core.shared_utils.budgets import (
+    budget_exhaustion,
+    exhaustion_curve,
+    exhaustion_index,
+)
+from computational_core.shared_utils.scenarios import project, project_scenarios, rate_schedule
+
+# A-01's scenarios in the original (switch_year / post_switch_rate) form
+SCENARIOS = {
+    "current_trajectory": {"annual_change_pct": 0.5},
+    "accelerated_phaseout": {"annual_change_pct": -7.0},
+    "delayed_action": {"annual_change_pct": 2.0, "switch_year": 2030, "post_switch_rate": -5.0},
+    "net_zero_2050": {"annual_change_pct": -4.3},
+    "collapse": {"annual_change_pct": -150.0},
+}
+BUDGETS_MT = {"1.5C_50pct": 200_000.0, "2C_50pct": 540_000.0, "tiny": 5_000.0}
+BASE_MT, START, END = 15_000.0, 2023, 2050
+
+
+def loop_projections(scenarios, base, start, end):
+    """Per-year loop from A-01 02_analysis before the vectorized rewrite (unrounded)."""
+    rows = []
+    for name, config in scenarios.items():
+        projected = base
+        for i, year in enumerate(range(start, end + 1)):
+            if i > 0:
+                if year > config.get("switch_year", 9999):
+                    rate = config["post_switch_rate"]
+                else:
+                    rate = config["annual_change_pct"]
+                projected = max(0, projected * (1 + rate / 100))
+            rows.append({"scenario": name, "year": year, "coal_co2_mt": projected})
+    return pd.DataFrame(rows)
+
+
+def loop_budgets(projections, budgets):
+    """Per budget × scenario filter loop from A-01 02_analysis (exhaust year or None)."""
+    rows = []
+    for budget, threshold in budgets.items():
+        for name in pd.unique(projections["scenario"]):
+            data = projections[projections["scenario"] == name].sort_values("year").copy()
+            data["cumulative_mt"] = data["coal_co2_mt"].cumsum()
+            exhausted = data[data["cumulative_mt"] >= threshold]
+            rows.append({
+                "budget": budget,
+                "scenario": name,
+                "exhaust_year": exhausted["year"].min() if len(exhausted) else None,
+                "cumulative": data["coal_co2_mt"].sum(),
+            })
+    return pd.DataFrame(rows)
+
+
+@pytest.fixture(scope="module")
+def projections():
+    return project_scenarios(SCENARIOS, BASE_MT, START, END, "coal_co2_mt")
+
+
+def test_projections_match_loop(projections):
+    expected = loop_projections(SCENARIOS, BASE_MT, START, END)
+
+    pd.testing.assert_frame_equal(projections[["scenario", "year"]], expected[["scenario", "year"]],
+                                  check_dtype=False)
+    np.testing.assert_allclose(projections["coal_co2_mt"], expected["coal_co2_mt"], rtol=1e-12)
+
+
+def test_growth_floors_at_zero(projections):
+    collapse = projections.loc[projections["scenario"] == "collapse", "coal_co2_mt"]
+    assert collapse.iloc[0] == BASE_MT
+    assert (collapse.iloc[1:] == 0).all()
+
+
+def test_schedule_form_equals_switch_form():
+    switch = rate_schedule(SCENARIOS["delayed_action"])
+    schedule = rate_schedule({"schedule": [(None, 2.0), (2030, -5.0)]})
+    mapping = rate_schedule({"schedule": {2030: -5.0, None: 2.0}})
+    assert switch == schedule == mapping
+
+
+def test_budget_table_matches_loop(projections):
+    table = budget_exhaustion(projections, BUDGETS_MT, value="coal_co2_mt")
+    expected = loop_budgets(projections, BUDGETS_MT)
+
+    assert table["budget"].tolist() == expected["budget"].tolist()
+    assert table["scenario"].tolist() == expected["scenario"].tolist()
+    got_years = [None if pd.isna(y) else int(y) for y in table["exhaust_year"]]
+    want_years = [None if pd.isna(y) else int(y) for y in expected["exhaust_year"]]
+    assert got_years == want_years
+    assert any(y is None for y in got_years) and any(y is not None for y in got_years)
+    np.testing.assert_allclose(table["cumulative"], expected["cumulative"], rtol=1e-12)
+    np.testing.assert_allclose(table["overshoot"], table["cumulative"] - table["budget_value"])
+
+
+def test_curve_matches_loop_on_every_threshold(projections):
+    thresholds = np.linspace(0, 600_000, 61)
+    curve = exhaustion_curve(projections, thresholds, value="coal_co2_mt")
+    expected = loop_budgets(projections, {i: t for i, t in enumerate(thresholds)})
+    # The loop is budget-major, the curve scenario-major
+    order = np.arange(len(expected)).reshape(len(thresholds), len(SCENARIOS)).T.ravel()
+    expected = expected.iloc[order]
+
+    assert curve["scenario"].tolist() == expected["scenario"].tolist()
+    np.testing.assert_array_equal(curve["budget_value"], np.tile(thresholds, len(SCENARIOS)))
+    got = [None if pd.isna(y) else int(y) for y in curve["exhaust_year"]]
+    want = [None if pd.isna(y) else int(y) for y in expected["exhaust_year"]]
+    assert got == want
+
+
+def test_exhaustion_index_per_row_budgets():
+    cumulative = np.array([[1.0, 3.0, 6.0], [2.0, 2.0, 2.0]])
+    shared = exhaustion_index(cumulative, [3.0, 10.0])
+    per_row = exhaustion_index(cumulative, np.array([[3.0, 10.0], [3.0, 10.0]]))
+
+    np.testing.assert_array_equal(shared, [[1, 3], [3, 3]])
+    np.testing.assert_array_equal(per_row, shared)
+    with pytest.raises(ValueError, match="one row per"):
+        exhaustion_index(cumulative, np.ones((3, 2)))
+
+
+def test_project_needs_rates_or_schedules():
+    with pytest.raises(ValueError):
+        project(1.0)
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+✒ Metadata
+    - Title: Parameter Sweep Tests (Terminal Velocity - v1.0)
+    - File Name: test_sweeps.py
+    - Relative Path: tests/test_sweeps.py
+    - Artifact Type: tests
+    - Version: 1.0.0
+    - Date: 2026-10-18
+    - Update: Sunday, October 18, 2026
+    - Author: Dennis 'dnoice' Smaltz
+    - A.I. Acknowledgement: Anthropic - Claude Opus 4.5
+    - Signature:  ︻デ═—··· 🎯 = Aim Twice, Shoot Once!
+
+✒ Description:
+    SweepRunner's on-disk result cache: a rerun of the same model is served from
+    parameter_sweeps.parquet, while an edited model body, a changed context or a
+    bumped version re-evaluates every point. Comment edits keep the cache.
+---------
+"""
+
+from __future__ import annotations
+
+import functools
+import importlib.util
+
+import numpy as np
+import pytest
+
+from computational_core.shared_utils.sweeps import SweepRunner, grid, parameter_space
+
+MODEL = '''\
+import numpy as np
+
+
+def budget_model(rate, share, base):
+    """Toy vectorized model."""
+    return {"overshoot": base * (1 + rate / 100) * share}
+'''
+
+SPACE = parameter_space({"rate": (-10.0, 3.0), "share": (0.35, 0.45)})
+
+
+def load_model(path, source):
+    """Import ``budget_model`` from a fresh module written to ``path``."""
+    path.write_text(source, encoding="utf-8")
+    spec = importlib.util.spec_from_file_location(f"sweep_model_{abs(hash(source))}", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return functools.partial(module.budget_model, base=100.0)
+
+
+def sweep(model, cache, **kwargs) -> SweepRunner:
+    runner = SweepRunner(model, SPACE, name="budget_model", context={"base": 100.0},
+                         vectorized=True, cache_path=cache, **kwargs)
+    runner.run(grid(SPACE, levels=4), design="grid")
+    runner.save()
+    return runner
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return tmp_path / "derived" / "parameter_sweeps.parquet"
+
+
+def test_same_model_is_served_from_cache(tmp_path, cache):
+    model = load_model(tmp_path / "model.py", MODEL)
+    first = sweep(model, cache)
+    again = sweep(model, cache)
+
+    assert (first.evaluations, first.cache_hits) == (16, 0)
+    assert (again.evaluations, again.cache_hits) == (0, 16)
+    np.testing.assert_array_equal(again.results()["overshoot"], first.results()["overshoot"])
+
+
+def test_edited_model_is_a_cache_miss(tmp_path, cache):
+    sweep(load_model(tmp_path / "model.py", MODEL), cache)
+    edited = load_model(tmp_path / "model.py", MODEL.replace("* share", "* share * 2"))
+
+    runner = sweep(edited, cache)
+    assert (runner.evaluations, runner.cache_hits) == (16, 0)
+    points = runner.results()
+    np.testing.assert_allclose(points["overshoot"],
+                               200.0 * (1 + points["rate"] / 100) * points["share"])
+
+
+def test_comment_edit_keeps_the_cache(tmp_path, cache):
+    sweep(load_model(tmp_path / "model.py", MODEL), cache)
+    commented = load_model(tmp_path / "model.py",
+                           MODEL.replace("    return", "    # Same maths\n    return"))
+
+    assert sweep(commented, cache).cache_hits == 16
+
+
+@pytest.mark.parametrize("change", [{"version": 2}, {"context": {"base": 110.0}}])
+def test_version_or_context_change_is_a_cache_miss(tmp_path, cache, change):
+    model = load_model(tmp_path / "model.py", MODEL)
+    sweep(model, cache)
+    options = {"context": {"base": 100.0}, **change}
+
+    runner = SweepRunner(model, SPACE, name="budget_model", vectorized=True,
+                         cache_path=cache, **options)
+    runner.run(grid(SPACE, levels=4))
+    assert runner.cache_hits == 0
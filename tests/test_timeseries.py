@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+✒ Metadata
+    - Title: Panel Time-Series Feature Tests (Terminal Velocity - v1.0)
+    - File Name: test_timeseries.py
+    - Relative Path: tests/test_timeseries.py
+    - Artifact Type: tests
+    - Version: 1.0.0
+    - Date: 2026-10-18
+    - Update: Sunday, October 18, 2026
+    - Author: Dennis 'dnoice' Smaltz
+    - A.I. Acknowledgement: Anthropic - Claude Opus 4.5
+    - Signature:  ︻デ═—··· 🎯 = Aim Twice, Shoot Once!
+
+✒ Description:
+    add_time_features() against pandas groupby on an unsorted panel with gaps,
+    zeros and single-row groups: pct_change is groupby().pct_change(fill_method=None)
+    on every pandas version, diff and rolling match groupby().diff() and
+    groupby().rolling().
+---------
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from computational_core.shared_utils.timeseries import add_time_features, group_starts, pct_change
+
+
+@pytest.fixture
+def panel() -> pd.DataFrame:
+    rng = np.random.default_rng(7)
+    frames = []
+    for i, n in enumerate([30, 1, 12, 25]):
+        values = rng.lognormal(2.0, 1.0, n)
+        values[rng.random(n) < 0.2] = np.nan  # reporting gaps
+        values[rng.random(n) < 0.05] = 0.0
+        frames.append(pd.DataFrame({"country": f"C{i}", "year": np.arange(2000, 2000 + n),
+                                    "coal_co2": values}))
+    return pd.concat(frames).sample(frac=1.0, random_state=1).reset_index(drop=True)
+
+
+def test_pct_change_is_fill_method_none(panel):
+    df = add_time_features(panel, columns=["coal_co2"], yoy_abs=False)
+    expected = df.groupby("country")["coal_co2"].pct_change(fill_method=None) * 100
+
+    np.testing.assert_allclose(df["coal_co2_yoy_pct"], expected, equal_nan=True)
+
+
+def test_gap_is_not_bridged():
+    # pandas 2.x's default fill_method="pad" would report the last row as +100%
+    starts = group_starts(np.zeros(3))
+    values = np.array([1.0, np.nan, 2.0])
+
+    assert np.isnan(pct_change(values, starts)).all()
+
+
+def test_diff_and_rolling_match_groupby(panel):
+    df = add_time_features(panel, columns=["coal_co2"], yoy_pct=False,
+                           rolling_windows=[("mean", 5), ("std", 4), ("max", 3)], min_periods=2)
+    grouped = df.groupby("country")["coal_co2"]
+
+    np.testing.assert_allclose(df["coal_co2_yoy_abs"], grouped.diff(), equal_nan=True)
+    for stat, window, column in [("mean", 5, "coal_co2_5yr_avg"), ("std", 4, "coal_co2_4yr_std"),
+                                 ("max", 3, "coal_co2_3yr_max")]:
+        expected = getattr(grouped.rolling(window, min_periods=2), stat)().reset_index(level=0, drop=True)
+        np.testing.assert_allclose(df[column], expected.loc[df.index], equal_nan=True, atol=1e-9)
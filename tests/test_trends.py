@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+✒ Metadata
+    - Title: Trend Classification Tests (Terminal Velocity - v1.0)
+    - File Name: test_trends.py
+    - Relative Path: tests/test_trends.py
+    - Artifact Type: tests
+    - Version: 1.0.0
+    - Date: 2026-10-18
+    - Update: Sunday, October 18, 2026
+    - Author: Dennis 'dnoice' Smaltz
+    - A.I. Acknowledgement: Anthropic - Claude Opus 4.5
+    - Signature:  ︻デ═—··· 🎯 = Aim Twice, Shoot Once!
+
+✒ Description:
+    classify_trends() computes YoY growth as groupby().pct_change(fill_method=None),
+    the same series add_time_features() precomputes, so a reporting gap is not
+    bridged into a jump on pandas 2.x either.
+---------
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+from computational_core.shared_utils.timeseries import add_time_features
+from computational_core.shared_utils.trends import STATUS_PLATEAU, classify_trends
+
+
+def test_gap_is_not_bridged_into_growth():
+    # fill_method="pad" would read 2022 as +100% and call the country Growing
+    values = [10.0] * 11 + [np.nan, 20.0, 20.0]
+    df = pd.DataFrame({"country": "C0", "year": np.arange(2010, 2024), "coal_co2": values})
+
+    [row] = classify_trends(df).to_dict("records")
+    assert row["recent_trend_pct"] == 0.0
+    assert row["status"] == STATUS_PLATEAU
+
+
+def test_computed_growth_matches_time_features():
+    rng = np.random.default_rng(3)
+    frames = []
+    for i in range(6):
+        values = rng.lognormal(2.0, 0.5, 20)
+        values[rng.random(20) < 0.2] = np.nan
+        frames.append(pd.DataFrame({"country": f"C{i}", "year": np.arange(2004, 2024),
+                                    "coal_co2": values}))
+    df = pd.concat(frames, ignore_index=True)
+    features = add_time_features(df, columns=["coal_co2"], yoy_abs=False)
+
+    pd.testing.assert_frame_equal(classify_trends(df),
+                                  classify_trends(features, growth="coal_co2_yoy_pct"))
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+✒ Metadata
+    - Title: Pipeline Runner Tests (Terminal Velocity - v1.0)
+    - File Name: test_tv_run.py
+    - Relative Path: tests/test_tv_run.py
+    - Artifact Type: tests
+    - Version: 1.0.0
+    - Date: 2026-10-18
+    - Update: Sunday, October 18, 2026
+    - Author: Dennis 'dnoice' Smaltz
+    - A.I. Acknowledgement: Anthropic - Claude Opus 4.5
+    - Signature:  ︻デ═—··· 🎯 = Aim Twice, Shoot Once!
+
+✒ Description:
+    tv_run scheduling on throwaway mechanisms: a stage that outlives --timeout
+    fails with its partial output, its dependents are skipped, and the rest of
+    the graph still runs.
+---------
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from tools.tv_run import PipelineRunner, build_graph, discover_mechanisms, run_stage
+
+QUICK = 'print("{name} done")\n'
+SLOW = 'import time\nprint("loading", flush=True)\ntime.sleep(30)\nprint("never")\n'
+
+
+def make_mechanism(root: Path, code: str, stages: dict[str, str]) -> Path:
+    computations = (root / "mechanism_dossiers" / "A_atmospheric" / f"{code}_test"
+                    / "evidence_archive" / "computations")
+    computations.mkdir(parents=True)
+    for name, source in stages.items():
+        (computations / f"{name}.py").write_text(source.format(name=name), encoding="utf-8")
+    return computations
+
+
+def test_timed_out_stage_fails_without_aborting_the_run(tmp_path):
+    make_mechanism(tmp_path, "A-98", {"01_intake": SLOW, "02_analysis": QUICK})
+    make_mechanism(tmp_path, "A-99", {"01_intake": QUICK, "02_analysis": QUICK})
+    graph = build_graph(tmp_path, discover_mechanisms(tmp_path))
+
+    results = PipelineRunner(tmp_path, graph, jobs=1, timeout=1, quiet=True).run()
+
+    slow = results["A-98/01_intake"]
+    assert slow.status == "failed"
+    assert slow.returncode is None
+    assert "loading" in slow.output
+    assert "Timed out after 1s" in slow.output
+    assert results["A-98/02_analysis"].status == "skipped"
+    assert results["A-99/01_intake"].status == "ok"
+    assert results["A-99/02_analysis"].status == "ok"
+    assert "02_analysis done" in results["A-99/02_analysis"].output
+
+
+def test_unchanged_stage_is_cached(tmp_path):
+    make_mechanism(tmp_path, "A-99", {"01_intake": QUICK})
+    stage = build_graph(tmp_path, discover_mechanisms(tmp_path))["A-99/01_intake"]
+
+    first = run_stage(stage, tmp_path)
+    assert first.status == "ok"
+    assert first.reasons == ["no previous run recorded"]
+    assert run_stage(stage, tmp_path).status == "cached"
+    assert run_stage(stage, tmp_path, force=True).reasons == ["forced"]
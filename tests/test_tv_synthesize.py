@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+✒ Metadata
+    - Title: Synthesis Builder Tests (Terminal Velocity - v1.0)
+    - File Name: test_tv_synthesize.py
+    - Relative Path: tests/test_tv_synthesize.py
+    - Artifact Type: tests
+    - Version: 1.0.0
+    - Date: 2026-10-18
+    - Update: Sunday, October 18, 2026
+    - Author: Dennis 'dnoice' Smaltz
+    - A.I. Acknowledgement: Anthropic - Claude Opus 4.5
+    - Signature:  ︻デ═—··· 🎯 = Aim Twice, Shoot Once!
+
+✒ Description:
+    tv_synthesize on throwaway dossiers: a change to one mechanism re-reads that
+    mechanism only and rewrites its brief and its vector report, and a vector
+    report whose figure failed is rebuilt by the next run.
+---------
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+import tools.tv_synthesize as tv_synthesize
+from tools.tv_synthesize import PRODUCTS_DIR, VECTOR_REPORTS, synthesize
+
+DOSSIER = """\
+# MECHANISM DOSSIER: {code}
+
+## {name}
+
+**Vector:** {vector}
+**Status:** Active
+**Confidence:** ★★★☆☆
+
+---
+
+## EXECUTIVE SUMMARY
+
+{summary}
+
+---
+"""
+
+
+def make_dossier(root: Path, folder: str, code: str, summary: str, score: int) -> Path:
+    dossier = root / "mechanism_dossiers" / folder / f"{code}_test"
+    (dossier / "intervention_assessment").mkdir(parents=True)
+    (dossier / "DOSSIER.md").write_text(
+        DOSSIER.format(code=code, name=f"Mechanism {code}", vector=folder, summary=summary),
+        encoding="utf-8")
+    (dossier / "intervention_assessment" / "difficulty_score.md").write_text(
+        f"**Score: {score}/10**\n", encoding="utf-8")
+    return dossier
+
+
+@pytest.fixture
+def root(tmp_path) -> Path:
+    make_dossier(tmp_path, "A_atmospheric", "A-01", "Coal burns.", 7)
+    make_dossier(tmp_path, "A_atmospheric", "A-02", "Gas leaks.", 5)
+    make_dossier(tmp_path, "B_biological", "B-01", "Forests fall.", 6)
+    return tmp_path
+
+
+def report(root: Path, vector: str) -> Path:
+    return root / PRODUCTS_DIR / VECTOR_REPORTS / vector / "report.md"
+
+
+def test_one_changed_mechanism_rewrites_its_products_only(root):
+    first = synthesize(root, workers=1, quiet=True)
+    assert (first.mechanisms, first.extracted, first.failed) == (3, 3, 0)
+    other = report(root, "B_biological").stat().st_mtime_ns
+
+    dossier = root / "mechanism_dossiers" / "A_atmospheric" / "A-02_test" / "DOSSIER.md"
+    dossier.write_text(dossier.read_text(encoding="utf-8").replace("Gas leaks.", "Methane leaks."),
+                       encoding="utf-8")
+    again = synthesize(root, workers=1, quiet=True)
+
+    # Rewritten: A-02's brief and the A report. Unchanged: the other two briefs,
+    # the B report and both cross-mechanism products
+    assert (again.extracted, again.written, again.unchanged) == (1, 2, 5)
+    assert "Methane leaks." in report(root, "A_atmospheric").read_text(encoding="utf-8")
+    assert report(root, "B_biological").stat().st_mtime_ns == other
+
+
+def test_report_with_failed_figure_is_rebuilt(root, monkeypatch):
+    def broken(fig, ax, **data):
+        raise RuntimeError("no ink")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(tv_synthesize, "ranked_bar", broken)
+        failed = synthesize(root, workers=1, quiet=True)
+    assert failed.failed == 2  # one difficulty figure per vector
+
+    retry = synthesize(root, workers=1, quiet=True)
+    assert retry.failed == 0
+    assert (retry.extracted, retry.written, retry.figures_rendered) == (0, 2, 2)
+    assert "fig_difficulty_scores" in report(root, "A_atmospheric").read_text(encoding="utf-8")
+
+    settled = synthesize(root, workers=1, quiet=True)
+    assert (settled.written, settled.figures_rendered) == (0, 0)
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+✒ Metadata
+    - Title: Monte Carlo Rate Sampling Tests (Terminal Velocity - v1.0)
+    - File Name: test_uncertainty.py
+    - Relative Path: tests/test_uncertainty.py
+    - Artifact Type: tests
+    - Version: 1.0.0
+    - Date: 2026-10-18
+    - Update: Sunday, October 18, 2026
+    - Author: Dennis 'dnoice' Smaltz
+    - A.I. Acknowledgement: Anthropic - Claude Opus 4.5
+    - Signature:  ︻デ═—··· 🎯 = Aim Twice, Shoot Once!
+
+✒ Description:
+    sample_rates() on piecewise schedules: a single rate spec applies to the
+    declared segments only, so the years before the first switch year stay at
+    exactly zero change, and an empty draw count is rejected.
+---------
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from computational_core.shared_utils.uncertainty import sample_rates
+
+YEARS = np.arange(2023, 2041)
+SPEC = {"dist": "normal", "sd": 1.5}
+
+
+@pytest.mark.parametrize("schedule", [[(2030, -5.0)], {2030: -5.0}])
+def test_single_spec_leaves_implicit_segment_fixed(schedule):
+    config = {"schedule": schedule, "uncertainty": {"rate": SPEC}}
+    rates = sample_rates(config, YEARS, 500, np.random.default_rng(0))
+
+    before = YEARS[:-1] < 2030
+    assert (rates[:, before] == 0.0).all()
+    assert rates[:, ~before].std() > 1.0
+    assert rates[:, ~before].mean() == pytest.approx(-5.0, abs=0.2)
+
+
+def test_single_spec_covers_every_declared_segment():
+    config = {"schedule": [(None, 2.0), (2030, -5.0)], "uncertainty": {"rate": SPEC}}
+    rates = sample_rates(config, YEARS, 500, np.random.default_rng(0))
+
+    before = YEARS[:-1] < 2030
+    assert rates[:, before].std() > 1.0
+    assert rates[:, ~before].std() > 1.0
+
+
+def test_spec_list_is_aligned_to_declared_segments():
+    config = {"schedule": [(2030, -5.0), (2035, -8.0)],
+              "uncertainty": {"rate": [None, SPEC]}}
+    rates = sample_rates(config, YEARS, 500, np.random.default_rng(0))
+
+    steps = YEARS[:-1]
+    assert (rates[:, steps < 2030] == 0.0).all()
+    assert (rates[:, (steps >= 2030) & (steps < 2035)] == -5.0).all()
+    assert rates[:, steps >= 2035].std() > 1.0
+
+
+@pytest.mark.parametrize("size", [0, -1])
+def test_empty_draw_count_is_rejected(size):
+    config = {"annual_change_pct": 0.5, "uncertainty": {"rate": SPEC}}
+    with pytest.raises(ValueError, match="size"):
+        sample_rates(config, YEARS, size, np.random.default_rng(0))
@@ -0,0 +1,694 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+✒ Metadata
+    - Title: Terminal Velocity Pipeline Runner (TV-Framework Edition - v1.0)
+    - File Name: tv_run.py
+    - Relative Path: tools/tv_run.py
+    - Artifact Type: CLI
+    - Version: 1.0.2
+    - Date: 2026-10-18
+    - Update: Sunday, October 18, 2026
+    - Author: Dennis 'dnoice' Smaltz
+    - A.I. Acknowledgement: Anthropic - Claude Opus 4.5
+    - Signature:  ︻デ═—··· 🎯 = Aim Twice, Shoot Once!
+
+✒ Description:
+    Discovers every mechanism pipeline under mechanism_dossiers/, builds a dependency
+    graph of their computation stages (intake → analysis → outputs, plus any shared
+    download scripts in evidence_vault/download_scripts/), and executes independent
+    stages concurrently in a pool of worker processes sized to the machine.
+
+✒ Key Features:
+    - Feature 1: Automatic discovery of all NN_*.py stages in every computations/ folder
+    - Feature 2: Per-mechanism stage chains ordered by their numeric prefix
+    - Feature 3: Shared download scripts run once, before any intake stage
+    - Feature 4: Bounded worker pool (defaults to the machine's CPU count)
+    - Feature 5: Critical-path scheduling (longest remaining chain starts first)
+    - Feature 6: Failure isolation (only dependents of a failed stage are skipped)
+    - Feature 7: Headless execution (Agg backend, repository root on PYTHONPATH)
+    - Feature 8: Dry-run plan preview and per-run timing summary
+    - Feature 9: Incremental runs: stages whose script, config constants and input
+      files are unchanged (content-hashed) are skipped
+    - Feature 10: Opt-in per-cell profiling (--profile) with a ranked report of the
+      slowest cells across every mechanism
+    - Feature 11: Figure rendering pools sized so concurrent output stages share the
+      cores (TV_RENDER_WORKERS)
+
+✒ Usage Instructions:
+    Run from the repository root (or anywhere, with --root):
+
+    Full rebuild of every mechanism:
+        $ python tools/tv_run.py
+
+    Preview the execution plan:
+        $ python tools/tv_run.py --dry-run
+
+✒ Examples:
+    $ python tools/tv_run.py
+    $ python tools/tv_run.py --vectors A B
+    $ python tools/tv_run.py --mechanisms A-01 F-10
+    $ python tools/tv_run.py --jobs 4 --verbose
+    $ python tools/tv_run.py --dry-run
+    $ python tools/tv_run.py --mechanisms A-01 --force
+    $ python tools/tv_run.py --log-dir /tmp/tv-logs
+    $ python tools/tv_run.py --force --profile sample
+    $ tv-run --vectors A --quiet
+
+✒ Command-Line Arguments:
+    Selection:
+        --vectors, -V            Vectors to run (A B C D E F). Default: all
+        --mechanisms, -m         Mechanism codes to run (e.g. A-01 F-10)
+        --root DIR               Repository root (default: parent of tools/)
+
+    Execution:
+        --jobs, -j N             Concurrent stages (default: CPU count)
+        --timeout SECONDS        Per-stage timeout (default: none)
+        --force, -f              Re-run stages even when their fingerprint matches
+        --dry-run, -n            Print the stage graph without running it
+        --profile [MODE]         Profile every stage per # %% cell: time (default),
+                                 cprofile or sample; prints the slowest cells
+
+    Output Control:
+        --log-dir DIR            Write each stage's stdout/stderr to DIR
+        --verbose, -v            Echo stage output after each stage finishes
+        --quiet, -q              Suppress all output except errors
+
+✒ Other Important Information:
+    - Dependencies:
+        Required: argparse, concurrent.futures, subprocess (stdlib)
+    - Compatible platforms: Linux, macOS, Windows
+    - Performance notes: Each stage runs in its own interpreter, so a full rebuild
+      takes roughly as long as the slowest mechanism chain given enough cores
+    - Fingerprints: Written to datasets/derived/<stage>.fingerprint.json after each
+      successful run of 01_intake, 02_analysis and 03_outputs
+    - 02_analysis also fingerprints the shared panel store (evidence_vault/panel or
+      TV_PANEL_STORE), so a rebuilt panel re-runs it
+    - Shared download scripts receive the selected mechanism codes in TV_MECHANISMS
+    - All stages of one run share a provenance run id (TV_RUN_ID); --verbose also
+      sets TV_VERBOSE so stages echo their provenance events
+    - Known limitations: Stages are ordered by filename prefix only; data
+      dependencies between different mechanisms are not inferred
+    - Exit codes:
+        0 = All stages succeeded
+        1 = One or more stages failed or were skipped
+        2 = No stages matched the selection
+---------
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import subprocess
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from pathlib import Path
+
+DEFAULT_ROOT = Path(__file__).resolve().parent.parent
+if str(DEFAULT_ROOT) not in sys.path:
+    sys.path.insert(0, str(DEFAULT_ROOT))
+
+from computational_core.shared_utils.fingerprint import (  # noqa: E402
+    FINGERPRINT_SUFFIX,
+    StageFingerprint,
+    compute_fingerprint,
+    load_fingerprint,
+    save_fingerprint,
+    stale_reasons,
+)
+from computational_core.shared_utils.panel import panel_root  # noqa: E402
+from computational_core.shared_utils.profiling import (  # noqa: E402
+    MODES as PROFILE_MODES,
+    format_report,
+    profile_report,
+)
+from computational_core.shared_utils.provenance import (  # noqa: E402
+    RUN_ID_ENV_VAR,
+    VERBOSE_ENV_VAR,
+    new_run_id,
+)
+from computational_core.shared_utils.rendering import (  # noqa: E402
+    WORKERS_ENV_VAR as RENDER_WORKERS_ENV_VAR,
+)
+
+
+# =============================================================================
+# CONSTANTS & CONFIGURATION
+# =============================================================================
+
+VERSION = "1.0.2"
+PROGRAM_NAME = "tv_run"
+SIGNATURE = "︻デ═—··· 🎯 = Aim Twice, Shoot Once!"
+
+STAGE_GLOB = "[0-9][0-9]_*.py"
+SHARED_DOWNLOADS_DIR = Path("evidence_vault") / "download_scripts"
+SHARED_PREFIX = "vault"
+PROFILER_MODULE = "computational_core.shared_utils.profiling"
+PROFILE_REPORT_ROWS = 15
+# Selected mechanism codes, exported so shared download scripts fetch only their sources
+MECHANISMS_ENV_VAR = "TV_MECHANISMS"
+
+VECTOR_CODES = ["A", "B", "C", "D", "E", "F"]
+
+# What each standard stage reads and writes, relative to its computations/ folder
+# (the shared panel store is absolute). Stages not listed here have no
+# fingerprint and always run.
+STAGE_IO: dict[str, dict[str, list[str]]] = {
+    "01_intake": {
+        "inputs": ["../datasets/raw"],
+        "outputs": ["../datasets/processed"],
+    },
+    "02_analysis": {
+        "inputs": ["../datasets/processed", str(panel_root())],
+        "outputs": ["../datasets/derived"],
+    },
+    "03_outputs": {
+        "inputs": ["../datasets/processed", "../datasets/derived"],
+        "outputs": ["../../exhibits"],
+    },
+}
+FINGERPRINT_DIR = "../datasets/derived"
+DONE_STATUSES = {"ok", "cached"}
+
+
+# =============================================================================
+# STAGE GRAPH
+# =============================================================================
+
+@dataclass
+class Stage:
+    """A single runnable pipeline script and the stages it waits on."""
+
+    key: str
+    script: Path
+    mechanism: str | None = None
+    deps: list[str] = field(default_factory=list)
+
+    @property
+    def name(self) -> str:
+        """Script stem, e.g. ``02_analysis``."""
+        return self.script.stem
+
+    @property
+    def cwd(self) -> Path:
+        """Scripts resolve their ``../datasets`` paths relative to their own folder."""
+        return self.script.parent
+
+    @property
+    def io(self) -> dict[str, list[str]] | None:
+        """Declared inputs/outputs for fingerprinting, if this is a standard stage."""
+        return STAGE_IO.get(self.name) if self.mechanism else None
+
+    @property
+    def fingerprint_path(self) -> Path:
+        """Where this stage's fingerprint is recorded."""
+        return self.cwd / FINGERPRINT_DIR / f"{self.name}{FINGERPRINT_SUFFIX}"
+
+
+@dataclass
+class StageResult:
+    """Outcome of running (or skipping) a stage."""
+
+    key: str
+    status: str  # "ok" | "cached" | "failed" | "skipped"
+    seconds: float = 0.0
+    returncode: int | None = None
+    output: str = ""
+    reasons: list[str] = field(default_factory=list)
+
+
+def discover_mechanisms(
+    root: Path,
+    vectors: list[str] | None = None,
+    codes: list[str] | None = None,
+) -> list[tuple[str, Path]]:
+    """
+    Find every mechanism computations directory under mechanism_dossiers/.
+
+    Args:
+        root: Repository root
+        vectors: Optional vector letters to keep (e.g. ["A", "F"])
+        codes: Optional mechanism codes to keep (e.g. ["A-01"])
+
+    Returns:
+        Sorted list of (mechanism code, computations directory)
+    """
+    found = []
+    for comp_dir in sorted(root.glob("mechanism_dossiers/*/*/evidence_archive/computations")):
+        code = comp_dir.parents[1].name.split("_", 1)[0]
+        if vectors and code[0] not in vectors:
+            continue
+        if codes and code not in codes:
+            continue
+        found.append((code, comp_dir))
+    return found
+
+
+def build_graph(root: Path, mechanisms: list[tuple[str, Path]]) -> dict[str, Stage]:
+    """
+    Build the stage dependency graph.
+
+    Shared download scripts become root stages that every mechanism's first stage
+    depends on; within a mechanism each stage depends on the one before it.
+
+    Args:
+        root: Repository root
+        mechanisms: Output of discover_mechanisms()
+
+    Returns:
+        Dict of stage key -> Stage, in insertion (topological) order
+    """
+    graph: dict[str, Stage] = {}
+
+    shared_keys = []
+    shared_dir = root / SHARED_DOWNLOADS_DIR
+    if mechanisms and shared_dir.is_dir():
+        for script in sorted(shared_dir.glob("*.py")):
+            if script.name.startswith("_"):
+                continue
+            stage = Stage(key=f"{SHARED_PREFIX}/{script.stem}", script=script)
+            graph[stage.key] = stage
+            shared_keys.append(stage.key)
+
+    for code, comp_dir in mechanisms:
+        previous = None
+        for script in sorted(comp_dir.glob(STAGE_GLOB)):
+            deps = [previous] if previous else list(shared_keys)
+            stage = Stage(key=f"{code}/{script.stem}", script=script, mechanism=code, deps=deps)
+            graph[stage.key] = stage
+            previous = stage.key
+
+    return graph
+
+
+def critical_path_lengths(graph: dict[str, Stage]) -> dict[str, int]:
+    """Number of stages on the longest chain starting at each stage (inclusive)."""
+    dependents: dict[str, list[str]] = {key: [] for key in graph}
+    for stage in graph.values():
+        for dep in stage.deps:
+            dependents[dep].append(stage.key)
+
+    lengths: dict[str, int] = {}
+    for key in reversed(list(graph)):
+        lengths[key] = 1 + max((lengths[d] for d in dependents[key]), default=0)
+    return lengths
+
+
+# =============================================================================
+# EXECUTION
+# =============================================================================
+
+def fingerprint_stage(stage: Stage, previous: StageFingerprint | None = None) -> StageFingerprint:
+    """Compute the current fingerprint of a standard stage."""
+    return compute_fingerprint(
+        stage.name,
+        stage.script,
+        [Path(p) for p in stage.io["inputs"]],
+        [Path(p) for p in stage.io["outputs"]],
+        previous=previous,
+        base=stage.cwd,
+    )
+
+
+def _decode_stream(stream: str | bytes | None) -> str:
+    """Captured output of a timed-out process as text."""
+    if stream is None:
+        return ""
+    return stream.decode(errors="replace") if isinstance(stream, bytes) else stream
+
+
+def run_stage(
+    stage: Stage,
+    root: Path,
+    timeout: float | None = None,
+    force: bool = False,
+    profile: str | None = None,
+) -> StageResult:
+    """
+    Run one stage script in a fresh interpreter, unless its fingerprint is current.
+
+    Args:
+        stage: Stage to execute
+        root: Repository root (prepended to PYTHONPATH)
+        timeout: Optional timeout in seconds
+        force: Run even if the recorded fingerprint matches
+        profile: Profiling mode; the script then runs cell by cell under the
+            profiler, which files one record per cell
+
+    Returns:
+        StageResult with status, duration, captured output and re-run reasons
+    """
+    start = time.perf_counter()
+
+    reasons = []
+    previous = None
+    if stage.io:
+        previous = load_fingerprint(stage.fingerprint_path)
+        current = fingerprint_stage(stage, previous)
+        reasons = stale_reasons(previous, current)
+        if not reasons and not force:
+            return StageResult(stage.key, "cached", time.perf_counter() - start)
+        if force:
+            reasons = reasons or ["forced"]
+
+    env = os.environ.copy()
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(root), env.get("PYTHONPATH")]))
+    env.setdefault("MPLBACKEND", "Agg")
+
+    command = [sys.executable, stage.script.name]
+    if profile:
+        command = [sys.executable, "-m", PROFILER_MODULE, "run", stage.script.name,
+                   "--mode", profile, "--mechanism", stage.mechanism or SHARED_PREFIX,
+                   "--stage", stage.name]
+
+    try:
+        proc = subprocess.run(
+            command,
+            cwd=stage.cwd,
+            env=env,
+            capture_output=True,
+            text=True,
+            timeout=timeout,
+        )
+    except subprocess.TimeoutExpired as e:
+        # On POSIX the partial streams are bytes (or None) even with text=True
+        output = _decode_stream(e.stdout) + _decode_stream(e.stderr)
+        return StageResult(stage.key, "failed", time.perf_counter() - start, None,
+                           output + f"\nTimed out after {timeout}s", reasons)
+
+    status = "ok" if proc.returncode == 0 else "failed"
+    if status == "ok" and stage.io:
+        # Record the post-run state: intake populates its own raw inputs
+        save_fingerprint(fingerprint_stage(stage, previous), stage.fingerprint_path)
+
+    return StageResult(stage.key, status, time.perf_counter() - start,
+                       proc.returncode, proc.stdout + proc.stderr, reasons)
+
+
+class PipelineRunner:
+    """Schedules a stage graph onto a bounded pool of worker processes."""
+
+    def __init__(
+        self,
+        root: Path,
+        graph: dict[str, Stage],
+        jobs: int | None = None,
+        timeout: float | None = None,
+        force: bool = False,
+        profile: str | None = None,
+        log_dir: Path | None = None,
+        verbose: bool = False,
+        quiet: bool = False,
+    ):
+        self.root = root
+        self.graph = graph
+        self.jobs = max(1, jobs or os.cpu_count() or 1)
+        self.timeout = timeout
+        self.force = force
+        self.profile = profile
+        self.log_dir = log_dir
+        self.verbose = verbose
+        self.quiet = quiet
+
+        self.results: dict[str, StageResult] = {}
+        self.priority = critical_path_lengths(graph)
+
+    def log(self, message: str, level: str = "info") -> None:
+        """Log a message based on verbosity settings."""
+        if self.quiet and level != "error":
+            return
+        if not self.verbose and level == "debug":
+            return
+        print(message, file=sys.stderr if level == "error" else sys.stdout, flush=True)
+
+    def _ready(self, pending: set[str]) -> list[str]:
+        """Pending stages whose dependencies all succeeded, longest chain first."""
+        ready = [
+            key for key in pending
+            if all(self.results.get(d) and self.results[d].status in DONE_STATUSES
+                   for d in self.graph[key].deps)
+        ]
+        return sorted(ready, key=lambda k: (-self.priority[k], k))
+
+    def _skip_blocked(self, pending: set[str]) -> None:
+        """Mark stages downstream of a failure as skipped, transitively."""
+        changed = True
+        while changed:
+            changed = False
+            for key in sorted(pending):
+                blocked = [d for d in self.graph[key].deps
+                           if d in self.results and self.results[d].status not in DONE_STATUSES]
+                if blocked:
+                    self.results[key] = StageResult(key, "skipped",
+                                                    output=f"Blocked by {', '.join(blocked)}")
+                    pending.discard(key)
+                    self.log(f"  ○ {key} skipped (blocked by {', '.join(blocked)})", "debug")
+                    changed = True
+
+    def _record(self, result: StageResult) -> None:
+        """Store a finished result, write its log, and report it."""
+        self.results[result.key] = result
+
+        if self.log_dir:
+            self.log_dir.mkdir(parents=True, exist_ok=True)
+            log_path = self.log_dir / f"{result.key.replace('/', '__')}.log"
+            log_path.write_text(result.output, encoding="utf-8")
+
+        if result.status == "cached":
+            self.log(f"  = {result.key} unchanged", "debug")
+        elif result.status == "ok":
+            because = f" [{'; '.join(result.reasons[:3])}]" if result.reasons else ""
+            self.log(f"  ✓ {result.key} ({result.seconds:.1f}s){because}")
+            if self.verbose and result.output.strip():
+                self.log(result.output.rstrip(), "debug")
+        else:
+            self.log(f"  ✗ {result.key} failed (exit {result.returncode}, "
+                     f"{result.seconds:.1f}s)", "error")
+            tail = "\n".join(result.output.rstrip().splitlines()[-20:])
+            if tail:
+                self.log(tail, "error")
+
+    def run(self) -> dict[str, StageResult]:
+        """Execute the whole graph and return results keyed by stage."""
+        pending = set(self.graph)
+        running: dict[Future, str] = {}
+
+        with ThreadPoolExecutor(max_workers=self.jobs) as pool:
+            while pending or running:
+                for key in self._ready(pending):
+                    if len(running) >= self.jobs:
+                        break
+                    pending.discard(key)
+                    self.log(f"  → {key}", "debug")
+                    future = pool.submit(run_stage, self.graph[key], self.root,
+                                         self.timeout, self.force, self.profile)
+                    running[future] = key
+
+                if not running:
+                    # Nothing runnable is left; the rest is blocked by failures
+                    self._skip_blocked(pending)
+                    break
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    running.pop(future)
+                    self._record(future.result())
+                self._skip_blocked(pending)
+
+        return self.results
+
+
+# =============================================================================
+# REPORTING
+# =============================================================================
+
+def print_plan(graph: dict[str, Stage], jobs: int) -> None:
+    """Print the stage graph for --dry-run."""
+    lengths = critical_path_lengths(graph)
+    mechanisms = {s.mechanism for s in graph.values() if s.mechanism}
+    print(f"Execution plan: {len(graph)} stages across {len(mechanisms)} mechanisms, "
+          f"{jobs} workers")
+    print(f"Critical path: {max(lengths.values(), default=0)} stages")
+    for stage in graph.values():
+        deps = ", ".join(stage.deps) if stage.deps else "-"
+        print(f"  {stage.key:<32} after: {deps}")
+
+
+def print_summary(results: dict[str, StageResult], wall_seconds: float, jobs: int) -> None:
+    """Print a run summary with counts and the serial-vs-parallel timing."""
+    counts = {status: 0 for status in ("ok", "cached", "failed", "skipped")}
+    for result in results.values():
+        counts[result.status] = counts.get(result.status, 0) + 1
+    serial = sum(r.seconds for r in results.values())
+
+    print("")
+    print(f"Stages: {counts['ok']} ran, {counts['cached']} unchanged, "
+          f"{counts['failed']} failed, {counts['skipped']} skipped")
+    print(f"Wall time: {wall_seconds:.1f}s with {jobs} workers "
+          f"(serial stage time {serial:.1f}s)")
+
+    slowest = sorted(results.values(), key=lambda r: r.seconds, reverse=True)[:5]
+    if slowest and slowest[0].seconds > 0:
+        print("Slowest stages:")
+        for result in slowest:
+            print(f"  {result.key:<32} {result.seconds:7.1f}s  {result.status}")
+
+
+# =============================================================================
+# CLI INTERFACE
+# =============================================================================
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(
+        prog=PROGRAM_NAME,
+        description="Run Terminal Velocity mechanism pipelines as a parallel stage graph",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=f"""
+Examples:
+  %(prog)s
+  %(prog)s --vectors A B
+  %(prog)s --mechanisms A-01 --verbose
+  %(prog)s --dry-run
+
+{SIGNATURE}
+        """,
+    )
+
+    select_group = parser.add_argument_group("Selection")
+    select_group.add_argument(
+        "--vectors", "-V",
+        nargs="+",
+        choices=VECTOR_CODES,
+        default=None,
+        help="Space-separated list of vectors to run (default: all)",
+    )
+    select_group.add_argument(
+        "--mechanisms", "-m",
+        nargs="+",
+        metavar="CODE",
+        default=None,
+        help="Mechanism codes to run (e.g. A-01 F-10)",
+    )
+    select_group.add_argument(
+        "--root",
+        type=Path,
+        default=DEFAULT_ROOT,
+        help="Repository root (default: parent of tools/)",
+    )
+
+    exec_group = parser.add_argument_group("Execution")
+    exec_group.add_argument(
+        "--jobs", "-j",
+        type=int,
+        default=None,
+        help="Number of stages to run concurrently (default: CPU count)",
+    )
+    exec_group.add_argument(
+        "--timeout",
+        type=float,
+        default=None,
+        help="Per-stage timeout in seconds",
+    )
+    exec_group.add_argument(
+        "--force", "-f",
+        action="store_true",
+        help="Re-run stages even when their inputs are unchanged",
+    )
+    exec_group.add_argument(
+        "--dry-run", "-n",
+        action="store_true",
+        help="Print the stage graph without running anything",
+    )
+
+    exec_group.add_argument(
+        "--profile",
+        nargs="?",
+        const="time",
+        choices=PROFILE_MODES,
+        default=None,
+        metavar="MODE",
+        help="Profile each stage per # %%%% cell (time, cprofile, sample; default: time)",
+    )
+
+    output_group = parser.add_argument_group("Output Control")
+    output_group.add_argument(
+        "--log-dir",
+        type=Path,
+        default=None,
+        help="Write each stage's output to a log file in this directory",
+    )
+    output_group.add_argument(
+        "--verbose", "-v",
+        action="store_true",
+        help="Echo stage output after each stage completes",
+    )
+    output_group.add_argument(
+        "--quiet", "-q",
+        action="store_true",
+        help="Suppress all output except errors",
+    )
+
+    parser.add_argument(
+        "--version",
+        action="version",
+        version=f"%(prog)s {VERSION}",
+    )
+
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Main entry point."""
+    args = parse_args(argv)
+    root = args.root.resolve()
+
+    mechanisms = discover_mechanisms(root, args.vectors, args.mechanisms)
+    graph = build_graph(root, mechanisms)
+    os.environ[MECHANISMS_ENV_VAR] = ",".join(code for code, _ in mechanisms)
+    os.environ.setdefault(RUN_ID_ENV_VAR, new_run_id())
+    if args.verbose:
+        os.environ[VERBOSE_ENV_VAR] = "1"
+    if not graph:
+        print("No pipeline stages matched the selection", file=sys.stderr)
+        return 2
+
+    jobs = max(1, args.jobs or os.cpu_count() or 1)
+    # Output stages of concurrently running mechanisms share the cores for rendering
+    concurrent = max(1, min(jobs, len(mechanisms)))
+    os.environ.setdefault(RENDER_WORKERS_ENV_VAR, str(max(1, (os.cpu_count() or 1) // concurrent)))
+    if args.dry_run:
+        print_plan(graph, jobs)
+        return 0
+
+    runner = PipelineRunner(
+        root=root,
+        graph=graph,
+        jobs=jobs,
+        timeout=args.timeout,
+        force=args.force,
+        profile=args.profile,
+        log_dir=args.log_dir,
+        verbose=args.verbose,
+        quiet=args.quiet,
+    )
+    runner.log(f"Running {len(graph)} stages across {len(mechanisms)} mechanisms "
+               f"({jobs} workers)")
+
+    start = time.perf_counter()
+    results = runner.run()
+    if not args.quiet:
+        print_summary(results, time.perf_counter() - start, jobs)
+        if args.profile:
+            print("\nSlowest cells:")
+            print(format_report(profile_report(run_id=os.environ[RUN_ID_ENV_VAR],
+                                               top=PROFILE_REPORT_ROWS)))
+
+    return 0 if all(r.status in DONE_STATUSES for r in results.values()) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -694,13 +694,11 @@ def get_notebook_intake_template(mechanism: dict[str, Any]) -> str:
         # TODO: Save cleaned data
         # df_clean.to_parquet(PROCESSED_DIR / "clean_dataset.parquet", index=False)
         # 
-        # # Generate data dictionary
-        # data_dict = pd.DataFrame({{
-        #     "column": df_clean.columns,
-        #     "dtype": df_clean.dtypes.astype(str),
-        #     "non_null_count": df_clean.count(),
-        #     "description": ["TODO"] * len(df_clean.columns)
-        # }})
+        # # Quality report and data dictionary from one profile
+        # from computational_core.shared_utils.quality import data_dictionary, profile_frame
+        # profile = profile_frame(df_clean, "clean_dataset", entity="country", time="year")
+        # quality_report = profile.report()
+        # data_dict = data_dictionary([profile], descriptions={{"value": "TODO"}})
         # data_dict.to_csv(DERIVED_DIR / "data_dictionary.csv", index=False)
 
         print(f"[{{datetime.now()}}] Intake complete for {mechanism['code']}")
@@ -782,11 +780,14 @@ def get_notebook_analysis_template(mechanism: dict[str, Any]) -> str:
 
         # %%
         # TODO: Implement scenarios
+        # from computational_core.shared_utils.scenarios import project_scenarios
         # scenarios = {{
-        #     "baseline": {{"growth_rate": 0.02}},
-        #     "accelerated": {{"growth_rate": 0.05}},
-        #     "mitigation": {{"growth_rate": -0.01}},
+        #     "baseline": {{"annual_change_pct": 2.0}},
+        #     "accelerated": {{"annual_change_pct": 5.0}},
+        #     "mitigation": {{"schedule": [(None, 2.0), (2030, -1.0)]}},
         # }}
+        # projections = project_scenarios(scenarios, base=latest_value,
+        #                                 start_year=latest_year, end_year=2050)
 
         print("Scenario step - implement projections")
 
@@ -797,12 +798,12 @@ def get_notebook_analysis_template(mechanism: dict[str, Any]) -> str:
 
         # %%
         # TODO: Parameter sweeps
-        # param_range = np.linspace(0.01, 0.10, 10)
-        # results = []
-        # for param in param_range:
-        #     result = model(param)
-        #     results.append({{"param": param, "outcome": result}})
-        # sensitivity_df = pd.DataFrame(results)
+        # from computational_core.shared_utils.sweeps import SweepRunner
+        # sweep = SweepRunner(model, {{"param": (0.01, 0.10)}}, name="model", seed=42,
+        #                     cache_path=DERIVED_DIR / "parameter_sweeps.parquet")
+        # sensitivity_df = sweep.one_at_a_time(levels=10)
+        # sobol_df = sweep.sobol_indices(n=1024)
+        # sweep.save()
 
         print("Sensitivity step - implement parameter sweeps")
 
@@ -850,9 +851,17 @@ def get_notebook_outputs_template(mechanism: dict[str, Any]) -> str:
 
         # %%
         import pandas as pd
-        import matplotlib.pyplot as plt
+        import sys
         from pathlib import Path
 
+        # Make computational_core importable when run from this folder
+        REPO_ROOT = Path.cwd().resolve().parents[4]
+        if str(REPO_ROOT) not in sys.path:
+            sys.path.insert(0, str(REPO_ROOT))
+
+        # Terminal Velocity palette and matplotlib style (rcParams applied at figure creation)
+        from computational_core.shared_utils.viz_utils import COLORS, TV_STYLE
+
         MECHANISM_CODE = "{mechanism['code']}"
         DERIVED_DIR = Path("../datasets/derived")
         FIGURES_DIR = Path("../../exhibits/figures")
@@ -861,17 +870,6 @@ def get_notebook_outputs_template(mechanism: dict[str, Any]) -> str:
         FIGURES_DIR.mkdir(parents=True, exist_ok=True)
         TABLES_DIR.mkdir(parents=True, exist_ok=True)
 
-        # Style configuration
-        plt.style.use("seaborn-v0_8-whitegrid")
-        COLORS = {{
-            "primary": "#2e3c44",
-            "secondary": "#ff9e54",
-            "tertiary": "#46ff84",
-            "accent": "#f5f5f4",
-            "highlight": "#ffd144",
-            "success": "#44cca4",
-        }}
-
         # %% [markdown]
         # ## 1. Load Analysis Results
 
@@ -885,14 +883,18 @@ def get_notebook_outputs_template(mechanism: dict[str, Any]) -> str:
         # ## 2. Figure: Main Trend
 
         # %%
-        # TODO: Create primary figure
-        # fig, ax = plt.subplots(figsize=(10, 6))
-        # ax.plot(results["year"], results["value"], color=COLORS["alert"], lw=2)
-        # ax.set_title(f"{mechanism['name']}: Primary Trend")
-        # ax.set_xlabel("Year")
-        # ax.set_ylabel("Value")
-        # fig.savefig(FIGURES_DIR / "fig_01_trend.png", dpi=150, bbox_inches="tight")
-        # plt.close()
+        # TODO: Declare figures as specs; they render together, headless, in a process pool
+        # from computational_core.shared_utils.rendering import FigureSpec, render_figures
+        # from computational_core.shared_utils.viz_utils import trend_line
+        #
+        # figure_specs = [
+        #     FigureSpec("fig_01_trend", trend_line, FIGURES_DIR / "fig_01_trend.png", style=TV_STYLE,
+        #                data={{"data": results[["year", "value"]], "x": "year", "y": "value",
+        #                      "color": COLORS["secondary"], "ylabel": "Value",
+        #                      "title": "{mechanism['name']}: Primary Trend"}}),
+        # ]
+        # for result in render_figures(figure_specs):
+        #     print(f"{{result.name}}: {{result.seconds:.2f}}s")
 
         print("Figure generation step")
 
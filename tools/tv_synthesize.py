@@ -0,0 +1,619 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+✒ Metadata
+    - Title: Terminal Velocity Synthesis Builder (TV-Framework Edition - v1.0)
+    - File Name: tv_synthesize.py
+    - Relative Path: tools/tv_synthesize.py
+    - Artifact Type: CLI
+    - Version: 1.0.1
+    - Date: 2026-10-18
+    - Update: Sunday, October 18, 2026
+    - Author: Dennis 'dnoice' Smaltz
+    - A.I. Acknowledgement: Anthropic - Claude Opus 4.5
+    - Signature:  ︻デ═—··· 🎯 = Aim Twice, Shoot Once!
+
+✒ Description:
+    Builds the synthesis products from the mechanism dossiers: one report per damage
+    vector (tables, figures, summaries), one executive brief per mechanism, the
+    cross-mechanism connection analysis and the intervention difficulty ranking.
+    Mechanisms are streamed one at a time through cached extracts
+    (computational_core.shared_utils.synthesis), so only the mechanisms whose
+    inputs changed are read again and only the products that depend on them are
+    rewritten.
+
+✒ Key Features:
+    - Feature 1: Vector reports: synthesis_products/vector_reports/<vector>/ with
+      report.md, tables/*.csv and figures rendered through shared_utils.rendering
+    - Feature 2: Executive briefs: synthesis_products/executive_briefs/<code>.md,
+      linking the dossier's existing exhibit thumbnails (nothing is re-rendered)
+    - Feature 3: Connection analyses: cited-mechanism edge list, vector-to-vector
+      link counts and the most-cited mechanisms
+    - Feature 4: Intervention assessments: mechanisms ranked by difficulty score
+    - Feature 5: Incremental rebuilds: per-mechanism extract cache plus product keys,
+      so a change to one mechanism rewrites one brief and one vector report
+    - Feature 6: Figure cache: unchanged report figures keep their files
+
+✒ Usage Instructions:
+    Run from the repository root (or anywhere, with --root), after the mechanism
+    pipelines (tools/tv_run.py):
+
+        $ python tools/tv_synthesize.py
+
+✒ Examples:
+    $ python tools/tv_synthesize.py
+    $ python tools/tv_synthesize.py --vectors A F
+    $ python tools/tv_synthesize.py --force
+    $ tv-synthesize --quiet
+
+✒ Command-Line Arguments:
+    --vectors, -V            Vectors whose reports and briefs are rebuilt (default: all)
+    --root DIR               Repository root (default: parent of tools/)
+    --force, -f              Re-read every mechanism and rewrite every product
+    --workers N              Figure render processes (default: TV_RENDER_WORKERS / cores)
+    --quiet, -q              Suppress all output except errors
+
+✒ Other Important Information:
+    - Dependencies:
+        Required: pandas, matplotlib (figures), argparse (stdlib)
+    - Compatible platforms: Linux, macOS, Windows
+    - Performance notes: A rebuild with no changed mechanism reads no dossier, no
+      dataset and renders nothing (one stat() per input file)
+    - The extract cache and product keys live in synthesis_products/.cache/ (not
+      committed); deleting it forces a full rebuild
+    - A vector report with a failed figure keeps its previous product key, so the
+      next run rebuilds it instead of reporting it unchanged
+    - Connection analyses and intervention assessments always cover every vector;
+      --vectors only limits which vector reports and briefs are rebuilt
+    - Exit codes:
+        0 = All products written (or unchanged)
+        1 = One or more report figures failed to render
+        2 = No mechanism dossiers found
+---------
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import time
+from dataclasses import dataclass
+from itertools import groupby
+from pathlib import Path
+
+import pandas as pd
+
+DEFAULT_ROOT = Path(__file__).resolve().parent.parent
+if str(DEFAULT_ROOT) not in sys.path:
+    sys.path.insert(0, str(DEFAULT_ROOT))
+
+from computational_core.shared_utils.fingerprint import value_digest  # noqa: E402
+from computational_core.shared_utils.rendering import (  # noqa: E402
+    FigureSpec,
+    figure_manifest,
+    manifest_fingerprints,
+    render_figures,
+)
+from computational_core.shared_utils.synthesis import (  # noqa: E402
+    CACHE_DIRNAME,
+    ExtractCache,
+    MechanismExtract,
+    iter_extracts,
+    vector_tables,
+)
+from computational_core.shared_utils.viz_utils import (  # noqa: E402
+    COLORS,
+    TV_STYLE,
+    ranked_bar,
+)
+
+
+# =============================================================================
+# CONSTANTS & CONFIGURATION
+# =============================================================================
+
+VERSION = "1.0.1"
+PROGRAM_NAME = "tv_synthesize"
+SIGNATURE = "︻デ═—··· 🎯 = Aim Twice, Shoot Once!"
+
+VECTOR_CODES = ["A", "B", "C", "D", "E", "F"]
+PRODUCTS_DIR = Path("synthesis_products")
+VECTOR_REPORTS = "vector_reports"
+EXECUTIVE_BRIEFS = "executive_briefs"
+CONNECTION_ANALYSES = "connection_analyses"
+INTERVENTION_ASSESSMENTS = "intervention_assessments"
+
+# Bump to rewrite every product after a change to the layouts below
+REPORT_VERSION = 1
+GENERATED_NOTE = "<!-- Generated by tools/tv_synthesize.py from the mechanism dossiers; do not edit. -->"
+MISSING_SUMMARY = "_Executive summary not yet written._"
+
+FIG_DPI = 150
+FIG_WIDTH = 10
+BAR_HEIGHT = 0.4  # inches per bar in ranked charts
+VECTOR_FORMATS = ("svg",)
+THUMBNAIL_WIDTH = 320
+MOST_CITED_ROWS = 15
+
+
+@dataclass
+class SynthesisSummary:
+    """What one build did."""
+
+    mechanisms: int = 0
+    extracted: int = 0
+    written: int = 0
+    unchanged: int = 0
+    figures_rendered: int = 0
+    figures_cached: int = 0
+    failed: int = 0
+
+
+# =============================================================================
+# MARKDOWN HELPERS
+# =============================================================================
+
+def markdown_table(df: pd.DataFrame, floatfmt: str = "{:,.2f}") -> str:
+    """Pipe table of a frame (no index); floats formatted, missing values blank."""
+    def cell(value) -> str:
+        if value is None or (isinstance(value, float) and pd.isna(value)):
+            return ""
+        if isinstance(value, float):
+            return floatfmt.format(value)
+        return str(value).replace("|", "\\|")
+
+    lines = ["| " + " | ".join(map(str, df.columns)) + " |",
+             "|" + "|".join("---" for _ in df.columns) + "|"]
+    lines += ["| " + " | ".join(cell(v) for v in row) + " |"
+              for row in df.itertuples(index=False)]
+    return "\n".join(lines)
+
+
+def titled(df: pd.DataFrame) -> pd.DataFrame:
+    """Column names as table headings (``change_pct`` → ``Change Pct``)."""
+    return df.rename(columns=lambda column: column.replace("_", " ").title())
+
+
+def stars(confidence: int) -> str:
+    """★★★☆☆ rendering of a 0-5 confidence rating."""
+    return "★" * confidence + "☆" * (5 - confidence)
+
+
+def relative_link(target: str, root: Path, from_dir: Path) -> str:
+    """Path of a root-relative file as seen from ``from_dir`` (POSIX separators)."""
+    return Path(os.path.relpath(root / target, from_dir)).as_posix()
+
+
+def write_text(path: Path, text: str) -> None:
+    """Write a product file with exactly one trailing newline."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text.rstrip() + "\n", encoding="utf-8")
+
+
+# =============================================================================
+# EXECUTIVE BRIEFS
+# =============================================================================
+
+def brief_markdown(extract: MechanismExtract, root: Path, brief_dir: Path) -> str:
+    """Executive brief of one mechanism, linking its exhibits' existing thumbnails."""
+    e = extract
+    lines = [
+        GENERATED_NOTE, "",
+        f"# EXECUTIVE BRIEF: {e.code} - {e.name}", "",
+        f"**Vector:** {e.vector_title}  ",
+        f"**Status:** {e.status}  ",
+        f"**Confidence:** {stars(e.confidence)}  ",
+        f"**Difficulty:** {f'{e.difficulty:g}/10' if e.difficulty is not None else 'not scored'}  ",
+        f"**Dossier:** [{e.code}]({relative_link(e.dossier + '/DOSSIER.md', root, brief_dir)})", "",
+        "## Summary", "",
+        e.summary or MISSING_SUMMARY, "",
+    ]
+    if e.headline:
+        lines += ["## Key Numbers", "",
+                  markdown_table(pd.DataFrame(list(e.headline.items()), columns=["Metric", "Value"])),
+                  ""]
+    if e.scenarios:
+        scenarios = pd.DataFrame(e.scenarios)
+        lines += ["## Scenario Milestones", "",
+                  markdown_table(scenarios[["scenario", "year", "value", "change_pct"]].rename(
+                      columns={"scenario": "Scenario", "year": "Year", "value": scenarios["metric"][0],
+                               "change_pct": f"Change vs {scenarios['base_year'][0]} (%)"})),
+                  ""]
+    if e.connections:
+        lines += ["## Connections", ""]
+        for relation, links in groupby(e.connections, key=lambda link: link["relation"]):
+            targets = ", ".join(link["target"] for link in links)
+            lines.append(f"- **{relation.replace('_', ' ').title()}:** {targets}")
+        lines.append("")
+    if e.figures:
+        lines += ["## Exhibits", ""]
+        for name, files in e.figures.items():
+            full = files.get("png") or next(iter(files.values()))
+            preview = files.get("thumbnail", full)
+            lines.append(f"[![{name}]({relative_link(preview, root, brief_dir)})]"
+                         f"({relative_link(full, root, brief_dir)})")
+        lines.append("")
+    return "\n".join(lines)
+
+
+# =============================================================================
+# VECTOR REPORTS
+# =============================================================================
+
+def _bar_height(rows: int) -> float:
+    """Figure height that keeps bar thickness constant across row counts."""
+    return max(3.0, BAR_HEIGHT * rows + 1.5)
+
+
+def vector_figure_specs(
+    tables: dict[str, pd.DataFrame],
+    figures_dir: Path,
+) -> list[FigureSpec]:
+    """Report figures for one vector (only those with data)."""
+    specs = []
+
+    def declare(name: str, rows: int, description: str, **data) -> None:
+        specs.append(FigureSpec(name, ranked_bar, figures_dir / f"{name}.png", data=data,
+                                figsize=(FIG_WIDTH, _bar_height(rows)), dpi=FIG_DPI,
+                                description=description, style=TV_STYLE,
+                                vector_formats=VECTOR_FORMATS, thumbnail_width=THUMBNAIL_WIDTH))
+
+    scenarios = tables["scenario_milestones"].dropna(subset=["change_pct"])
+    if not scenarios.empty:
+        year = int(scenarios["year"].max())
+        final = scenarios[scenarios["year"] == year].assign(
+            label=lambda df: df["code"] + "  " + df["scenario"].str.replace("_", " ").str.title()
+        ).sort_values("change_pct", ascending=False)[["label", "change_pct"]]
+        declare(f"fig_scenario_change_{year}", len(final),
+                f"Scenario change by {year} relative to each base year",
+                data=final.reset_index(drop=True), label="label", value="change_pct",
+                value_fmt="{:+.0f}%", color=COLORS["secondary"],
+                title=f"Projected Change by {year} (vs Base Year)", xlabel="Change (%)")
+
+    scored = tables["mechanisms"].dropna(subset=["difficulty"])
+    if not scored.empty:
+        ranked = scored.assign(label=lambda df: df["code"] + "  " + df["mechanism"]) \
+            .sort_values("difficulty", ascending=False)[["label", "difficulty"]]
+        declare("fig_difficulty_scores", len(ranked), "Intervention difficulty by mechanism",
+                data=ranked.reset_index(drop=True), label="label", value="difficulty",
+                value_fmt="{:.0f}/10", color=COLORS["primary"],
+                title="Intervention Difficulty", xlabel="Difficulty (0-10)")
+    return specs
+
+
+def report_markdown(
+    vector: str,
+    extracts: list[MechanismExtract],
+    tables: dict[str, pd.DataFrame],
+    figure_files: dict[str, dict[str, Path]],
+    report_dir: Path,
+    root: Path,
+) -> str:
+    """Vector report text: overview, tables, figures and each mechanism's summary."""
+    title = next((e.vector_title for e in extracts if e.vector_title), vector)
+    mechanisms = tables["mechanisms"]
+    documented = int(mechanisms["documented"].sum())
+    with_data = int((mechanisms["derived_datasets"] > 0).sum())
+    lines = [
+        GENERATED_NOTE, "",
+        f"# VECTOR REPORT: {vector[0]} - {title}", "",
+        f"{len(extracts)} mechanisms; {documented} with a written executive summary, "
+        f"{with_data} with derived datasets.", "",
+        "## Mechanisms", "",
+        markdown_table(titled(mechanisms.assign(confidence=mechanisms["confidence"].map(stars))[
+            ["code", "mechanism", "status", "confidence", "difficulty",
+             "derived_datasets", "figures", "connections"]
+        ]), floatfmt="{:g}"),
+        "",
+    ]
+    if not tables["headline_metrics"].empty:
+        lines += ["## Headline Metrics", "",
+                  markdown_table(titled(tables["headline_metrics"])), ""]
+    if not tables["scenario_milestones"].empty:
+        lines += ["## Scenario Milestones", "",
+                  markdown_table(titled(tables["scenario_milestones"][
+                      ["code", "scenario", "metric", "base_year", "year", "value", "change_pct"]
+                  ])), ""]
+    if figure_files:
+        lines += ["## Figures", ""]
+        for name, files in figure_files.items():
+            png = Path(os.path.relpath(files["png"], report_dir)).as_posix()
+            line = f"![{name}]({png})"
+            if "svg" in files:
+                line += f"  \n[vector]({Path(os.path.relpath(files['svg'], report_dir)).as_posix()})"
+            lines += [line, ""]
+    connections = tables["connections"]
+    if not connections.empty:
+        counts = connections.groupby("relation")["target"].nunique().rename("mechanisms")
+        lines += ["## Connections", "",
+                  markdown_table(titled(counts.reset_index())), ""]
+    lines += ["## Executive Summaries", ""]
+    for e in extracts:
+        brief = relative_link(f"{PRODUCTS_DIR.as_posix()}/{EXECUTIVE_BRIEFS}/{e.code}.md",
+                              root, report_dir)
+        lines += [f"### [{e.code}]({brief}) - {e.name}", "", e.summary or MISSING_SUMMARY, ""]
+    return "\n".join(lines)
+
+
+def write_vector_report(
+    vector: str,
+    extracts: list[MechanismExtract],
+    report_dir: Path,
+    root: Path,
+    workers: int | None,
+    summary: SynthesisSummary,
+) -> bool:
+    """
+    Tables, figures and report.md of one vector (unchanged figures are kept).
+
+    Returns:
+        True if every figure rendered (or was unchanged)
+    """
+    tables = vector_tables(extracts)
+    tables_dir, figures_dir = report_dir / "tables", report_dir / "figures"
+    tables_dir.mkdir(parents=True, exist_ok=True)
+    for name, table in tables.items():
+        table.to_csv(tables_dir / f"{name}.csv", index=False)
+
+    specs = vector_figure_specs(tables, figures_dir)
+    manifest_path = figures_dir / "output_manifest.json"
+    results = render_figures(specs, workers=workers, strict=False,
+                             previous=manifest_fingerprints(manifest_path)) if specs else []
+    summary.figures_cached += sum(r.cached for r in results)
+    summary.figures_rendered += sum(not r.cached and not r.error for r in results)
+    summary.failed += sum(bool(r.error) for r in results)
+    for result in results:
+        if result.error:
+            print(f"  {vector}: {result.name} failed: {result.error}", file=sys.stderr)
+    if results:
+        figures_dir.mkdir(parents=True, exist_ok=True)
+        manifest = {"vector": vector,
+                    "figures": figure_manifest(results, relative_to=figures_dir)}
+        manifest_path.write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+
+    figure_files = {r.name: r.files for r in results if not r.error}
+    write_text(report_dir / "report.md",
+               report_markdown(vector, extracts, tables, figure_files, report_dir, root))
+    return not any(r.error for r in results)
+
+
+# =============================================================================
+# CROSS-MECHANISM PRODUCTS
+# =============================================================================
+
+def write_connection_analyses(links: list[dict], index: pd.DataFrame, out_dir: Path) -> None:
+    """Edge list, vector-to-vector link counts and the most-cited mechanisms."""
+    edges = pd.DataFrame(links, columns=["source", "target", "relation", "mentions"])
+    edges = edges.assign(source_vector=edges["source"].str[0], target_vector=edges["target"].str[0])
+    vector_links = (edges.groupby(["source_vector", "target_vector", "relation"])
+                    .size().rename("links").reset_index())
+    cited = (edges.groupby("target").agg(cited_by=("source", "nunique"), mentions=("mentions", "sum"))
+             .reset_index().rename(columns={"target": "code"})
+             .merge(index[["code", "mechanism"]], on="code", how="left")
+             .sort_values(["cited_by", "mentions"], ascending=False))
+
+    out_dir.mkdir(parents=True, exist_ok=True)
+    edges.to_csv(out_dir / "connections.csv", index=False)
+    vector_links.to_csv(out_dir / "vector_links.csv", index=False)
+    matrix = pd.crosstab(edges["source_vector"], edges["target_vector"])
+    lines = [
+        GENERATED_NOTE, "",
+        "# CONNECTION ANALYSIS", "",
+        f"{len(edges)} cited connections between {edges['source'].nunique()} mechanisms "
+        f"(from their connection_map/ documents).", "",
+    ]
+    if not edges.empty:
+        lines += ["## Vector-to-Vector Links", "",
+                  markdown_table(matrix.reset_index().rename(columns={"source_vector": "From \\ To"})), "",
+                  "## Most-Cited Mechanisms", "",
+                  markdown_table(titled(cited.head(MOST_CITED_ROWS)[
+                      ["code", "mechanism", "cited_by", "mentions"]])), ""]
+    write_text(out_dir / "connection_summary.md", "\n".join(lines))
+
+
+def write_intervention_assessments(index: pd.DataFrame, out_dir: Path) -> None:
+    """Mechanisms ranked by intervention difficulty (unscored ones listed last)."""
+    ranked = index.sort_values(["difficulty", "code"], ascending=[False, True], na_position="last")
+    out_dir.mkdir(parents=True, exist_ok=True)
+    ranked.to_csv(out_dir / "difficulty_scores.csv", index=False)
+    scored = ranked.dropna(subset=["difficulty"])
+    lines = [
+        GENERATED_NOTE, "",
+        "# INTERVENTION DIFFICULTY RANKING", "",
+        f"{len(scored)} of {len(ranked)} mechanisms have a difficulty score "
+        f"(intervention_assessment/difficulty_score.md).", "",
+    ]
+    if not scored.empty:
+        lines += [markdown_table(titled(scored.assign(confidence=scored["confidence"].map(stars))[
+            ["code", "mechanism", "vector", "difficulty", "status", "confidence"]
+        ]), floatfmt="{:g}"), ""]
+    write_text(out_dir / "difficulty_ranking.md", "\n".join(lines))
+
+
+# =============================================================================
+# BUILD
+# =============================================================================
+
+def synthesize(
+    root: Path,
+    vectors: list[str] | None = None,
+    force: bool = False,
+    workers: int | None = None,
+    quiet: bool = False,
+) -> SynthesisSummary:
+    """
+    Build every synthesis product, rewriting only those whose inputs changed.
+
+    Mechanisms stream through one vector at a time; only the small cached
+    extracts of the current vector (plus index rows and connection links for
+    the cross-mechanism products) are held in memory.
+
+    Args:
+        root: Repository root
+        vectors: Vectors whose reports and briefs are rebuilt (default: all)
+        force: Re-read every mechanism and rewrite every product
+        workers: Figure render processes
+        quiet: Suppress progress output
+
+    Returns:
+        SynthesisSummary
+    """
+    products = root / PRODUCTS_DIR
+    cache = ExtractCache(products / CACHE_DIRNAME)
+    previous_keys = {} if force else cache.product_keys()
+    keys: dict[str, str] = {}
+    summary = SynthesisSummary()
+    index_rows: list[dict] = []
+    links: list[dict] = []
+
+    def stale(product: str, key: str, path: Path) -> bool:
+        keys[product] = key
+        return previous_keys.get(product) != key or not path.exists()
+
+    def log(message: str) -> None:
+        if not quiet:
+            print(message)
+
+    extracts = iter_extracts(root, cache, force=force)
+    for vector, group in groupby(extracts, key=lambda item: item[0].vector):
+        members, member_keys = [], []
+        for extract, key, changed in group:
+            summary.mechanisms += 1
+            summary.extracted += changed
+            members.append(extract)
+            member_keys.append(key)
+            index_rows.append({"code": extract.code, "mechanism": extract.name,
+                               "vector": extract.vector_title, "difficulty": extract.difficulty,
+                               "status": extract.status, "confidence": extract.confidence})
+            links.extend(extract.connections)
+
+            if vectors and vector[0] not in vectors:
+                keys[f"brief:{extract.code}"] = previous_keys.get(f"brief:{extract.code}", "")
+                continue
+            brief_dir = products / EXECUTIVE_BRIEFS
+            brief_path = brief_dir / f"{extract.code}.md"
+            if stale(f"brief:{extract.code}", value_digest([REPORT_VERSION, key]), brief_path):
+                write_text(brief_path, brief_markdown(extract, root, brief_dir))
+                summary.written += 1
+            else:
+                summary.unchanged += 1
+
+        if vectors and vector[0] not in vectors:
+            keys[f"vector:{vector}"] = previous_keys.get(f"vector:{vector}", "")
+            continue
+        report_dir = products / VECTOR_REPORTS / vector
+        product, key = f"vector:{vector}", value_digest([REPORT_VERSION, member_keys])
+        if stale(product, key, report_dir / "report.md"):
+            if not write_vector_report(vector, members, report_dir, root, workers, summary):
+                # Not recorded as built, so the next run retries the failed figures
+                previous = previous_keys.get(product, "")
+                keys[product] = "" if previous == key else previous
+            summary.written += 1
+            log(f"  {vector}: report rebuilt ({len(members)} mechanisms)")
+        else:
+            summary.unchanged += 1
+
+    if not summary.mechanisms:
+        return summary
+
+    index = pd.DataFrame(index_rows)
+    connections_dir = products / CONNECTION_ANALYSES
+    if stale("connections", value_digest([REPORT_VERSION, links, index_rows]),
+             connections_dir / "connection_summary.md"):
+        write_connection_analyses(links, index, connections_dir)
+        summary.written += 1
+    else:
+        summary.unchanged += 1
+    interventions_dir = products / INTERVENTION_ASSESSMENTS
+    if stale("interventions", value_digest([REPORT_VERSION, index_rows]),
+             interventions_dir / "difficulty_ranking.md"):
+        write_intervention_assessments(index, interventions_dir)
+        summary.written += 1
+    else:
+        summary.unchanged += 1
+
+    cache.save_product_keys(keys)
+    return summary
+
+
+# =============================================================================
+# CLI INTERFACE
+# =============================================================================
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(
+        prog=PROGRAM_NAME,
+        description="Build Terminal Velocity vector reports, briefs and cross-mechanism analyses",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=f"""
+Examples:
+  %(prog)s
+  %(prog)s --vectors A F
+  %(prog)s --force
+
+{SIGNATURE}
+        """,
+    )
+    parser.add_argument(
+        "--vectors", "-V",
+        nargs="+",
+        choices=VECTOR_CODES,
+        default=None,
+        help="Vectors whose reports and briefs are rebuilt (default: all)",
+    )
+    parser.add_argument(
+        "--root",
+        type=Path,
+        default=DEFAULT_ROOT,
+        help="Repository root (default: parent of tools/)",
+    )
+    parser.add_argument(
+        "--force", "-f",
+        action="store_true",
+        help="Re-read every mechanism and rewrite every product",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Figure render processes (default: TV_RENDER_WORKERS or one per core)",
+    )
+    parser.add_argument(
+        "--quiet", "-q",
+        action="store_true",
+        help="Suppress all output except errors",
+    )
+    parser.add_argument(
+        "--version",
+        action="version",
+        version=f"%(prog)s {VERSION}",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Main entry point."""
+    args = parse_args(argv)
+    root = args.root.resolve()
+
+    start = time.perf_counter()
+    summary = synthesize(root, args.vectors, force=args.force, workers=args.workers,
+                         quiet=args.quiet)
+    if not summary.mechanisms:
+        print("No mechanism dossiers found", file=sys.stderr)
+        return 2
+    if not args.quiet:
+        print(f"\nMechanisms: {summary.mechanisms} ({summary.extracted} re-read, "
+              f"{summary.mechanisms - summary.extracted} cached)")
+        print(f"Products: {summary.written} written, {summary.unchanged} unchanged")
+        print(f"Figures: {summary.figures_rendered} rendered, {summary.figures_cached} unchanged"
+              + (f", {summary.failed} failed" if summary.failed else ""))
+        print(f"Wall time: {time.perf_counter() - start:.1f}s")
+    return 1 if summary.failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())